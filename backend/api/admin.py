@@ -1,5 +1,12 @@
 from django.contrib import admin
 
-from .models import APIToken
+from .models import APIToken, PersistedQuery
 
 admin.site.register(APIToken)
+
+
+@admin.register(PersistedQuery)
+class PersistedQueryAdmin(admin.ModelAdmin):
+    list_display = ("operation_name", "hash", "created")
+    search_fields = ("operation_name", "hash")
+    readonly_fields = ("hash", "operation_name", "query", "created", "modified")
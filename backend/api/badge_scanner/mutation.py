@@ -1,7 +1,8 @@
 from __future__ import annotations
-import tablib
+from datetime import datetime
 from api.helpers.ids import decode_hashid
-from django.core.files.base import ContentFile
+from django.db import transaction
+from django.utils import timezone
 
 import pretix
 import re
@@ -10,10 +11,11 @@ from api.context import Info
 
 from api.permissions import IsAuthenticated
 from badge_scanner import models
+from badge_scanner import tasks
 from conferences.models import Conference
 from users.models import User
 
-from .types import BadgeScan, BadgeScanExport
+from .types import BadgeScan, BadgeScanExport, BadgeScanExportFormat
 
 
 @strawberry.type
@@ -34,7 +36,16 @@ class ScanBadgeInput:
 
         match = self.url_regex.match(self.url)
 
-        return None if match else ScanError(message="URL is not valid")
+        if not match:
+            return ScanError(message="URL is not valid")
+
+        try:
+            decode_hashid(match.group(1))
+        except IndexError:
+            # The URL looks right but isn't one of our badges
+            return ScanError(message="URL is not valid")
+
+        return None
 
     @property
     def order_position_id(self) -> str:
@@ -45,6 +56,31 @@ class ScanBadgeInput:
         return str(decode_hashid(match.group(1)))
 
 
+@strawberry.input
+class OfflineBadgeScanInput:
+    url: str
+    scanned_at: datetime
+    notes: str = ""
+
+
+@strawberry.input
+class SyncBadgeScansInput:
+    conference_code: str
+    scans: list[OfflineBadgeScanInput]
+
+
+@strawberry.type
+class SyncBadgeScanError:
+    url: str
+    message: str
+
+
+@strawberry.type
+class SyncBadgeScansResult:
+    scans: list[BadgeScan]
+    errors: list[SyncBadgeScanError]
+
+
 @strawberry.input
 class UpdateBadgeScanInput:
     id: str
@@ -71,18 +107,105 @@ class BadgeScannerMutation:
 
         scanned_badge, _ = models.BadgeScan.objects.get_or_create(
             scanned_by_id=info.context.request.user.id,
-            scanned_user_id=user.id if user else None,
             badge_url=input.url,
             conference=conference,
-            attendee_name=order_position_data["attendee_name"],
-            attendee_email=order_position_data["attendee_email"],
             defaults={
+                "scanned_user_id": user.id if user else None,
+                "attendee_name": order_position_data["attendee_name"],
+                "attendee_email": order_position_data["attendee_email"],
                 "notes": "",
             },
         )
 
         return BadgeScan.from_db(scanned_badge)
 
+    @strawberry.mutation(permission_classes=[IsAuthenticated])
+    def sync_badge_scans(
+        self, info: Info, input: SyncBadgeScansInput
+    ) -> SyncBadgeScansResult | ScanError:
+        """
+        Saves the scans a scanner queued while offline. Scans of badges
+        that were already scanned are kept as they are.
+        """
+        conference = Conference.objects.filter(code=input.conference_code).first()
+
+        if not conference:
+            return ScanError(message="Conference not found")
+
+        errors = []
+        scans_by_url = {}
+
+        for scan in input.scans:
+            scan_input = ScanBadgeInput(url=scan.url, conference_code=conference.code)
+
+            if error := scan_input.validate():
+                errors.append(SyncBadgeScanError(url=scan.url, message=error.message))
+                continue
+
+            if timezone.is_naive(scan.scanned_at):
+                # Scans without an offset are in the time zone of the conference
+                scan.scanned_at = timezone.make_aware(
+                    scan.scanned_at, conference.timezone
+                )
+
+            # The first scan of a badge wins, as it would have online
+            if (
+                scan.url not in scans_by_url
+                or scan.scanned_at < scans_by_url[scan.url][1].scanned_at
+            ):
+                scans_by_url[scan.url] = (scan_input.order_position_id, scan)
+
+        order_positions = pretix.get_order_positions(
+            conference,
+            [order_position_id for order_position_id, _ in scans_by_url.values()],
+        )
+        users_ids = dict(
+            User.objects.filter(
+                email__in={
+                    order_position["attendee_email"]
+                    for order_position in order_positions.values()
+                }
+            ).values_list("email", "id")
+        )
+
+        now = timezone.now()
+        scanned_by_id = info.context.request.user.id
+        badge_scans = []
+
+        for url, (order_position_id, scan) in scans_by_url.items():
+            order_position = order_positions.get(order_position_id)
+
+            if not order_position:
+                errors.append(SyncBadgeScanError(url=url, message="Badge not found"))
+                continue
+
+            badge_scans.append(
+                models.BadgeScan(
+                    scanned_by_id=scanned_by_id,
+                    scanned_user_id=users_ids.get(order_position["attendee_email"]),
+                    badge_url=url,
+                    conference=conference,
+                    attendee_name=order_position["attendee_name"],
+                    attendee_email=order_position["attendee_email"],
+                    notes=scan.notes,
+                    # Clocks of the scanners can be ahead
+                    created=min(scan.scanned_at, now),
+                )
+            )
+
+        models.BadgeScan.objects.bulk_create(badge_scans, ignore_conflicts=True)
+
+        synced_scans = models.BadgeScan.objects.filter(
+            scanned_by_id=scanned_by_id,
+            conference=conference,
+            badge_url__in=[badge_scan.badge_url for badge_scan in badge_scans],
+        ).order_by("created")
+
+        return SyncBadgeScansResult(
+            scans=[BadgeScan.from_db(badge_scan) for badge_scan in synced_scans],
+            errors=errors,
+        )
+
     @strawberry.mutation(permission_classes=[IsAuthenticated])
     def update_badge_scan(
         self, info: Info, input: UpdateBadgeScanInput
@@ -100,31 +223,32 @@ class BadgeScannerMutation:
         return BadgeScan.from_db(badge_scan)
 
     @strawberry.mutation(permission_classes=[IsAuthenticated])
-    def export_badge_scans(self, info: Info, conference_code: str) -> BadgeScanExport:
+    def export_badge_scans(
+        self,
+        info: Info,
+        conference_code: str,
+        format: BadgeScanExportFormat = BadgeScanExportFormat.CSV,
+    ) -> BadgeScanExport:
+        """
+        Starts exporting the scans of the user in the background,
+        the client polls `badgeScanExport` until it is completed
+        """
         conference = Conference.objects.filter(code=conference_code).first()
 
         if conference is None:
             raise ValueError("Unable to find conference")
 
-        current_user_scans = models.BadgeScan.objects.filter(
-            scanned_by_id=info.context.request.user.id, conference__code=conference_code
-        )
-
-        data = tablib.Dataset(
-            headers=["Created", "Attendee Name", "Attendee Email", "Notes"]
-        )
-
-        for scan in current_user_scans:
-            data.append(
-                [scan.created, scan.attendee_name, scan.attendee_email, scan.notes]
-            )
-
-        csv_data = data.export("csv").encode("utf-8")
-
         badge_scan_export = models.BadgeScanExport.objects.create(
             conference_id=conference.id,
             requested_by_id=info.context.request.user.id,
-            file=ContentFile(csv_data, name="badge_scans.csv"),
+            format=format.value,
+        )
+
+        # The worker needs to find the export in the database
+        transaction.on_commit(
+            lambda: tasks.export_badge_scans.delay(
+                badge_scan_export_id=badge_scan_export.id
+            )
         )
 
         return BadgeScanExport.from_db(badge_scan_export)
@@ -7,7 +7,7 @@ from badge_scanner import models
 
 
 from api.types import Paginated
-from .types import BadgeScan
+from .types import BadgeScan, BadgeScanExport
 
 
 @strawberry.type
@@ -47,3 +47,16 @@ class BadgeScannerQuery:
             total_items=total_scans,
             page=page,
         )
+
+    @strawberry.field(permission_classes=[IsAuthenticated])
+    def badge_scan_export(
+        self, info: Info, id: strawberry.ID
+    ) -> BadgeScanExport | None:
+        badge_scan_export = models.BadgeScanExport.objects.filter(
+            id=id, requested_by_id=info.context.request.user.id
+        ).first()
+
+        if not badge_scan_export:
+            return None
+
+        return BadgeScanExport.from_db(badge_scan_export)
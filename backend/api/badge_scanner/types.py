@@ -31,13 +31,29 @@ class BadgeScan:
         )
 
 
+BadgeScanExportStatus = strawberry.enum(
+    models.BadgeScanExport.Status, name="BadgeScanExportStatus"
+)
+BadgeScanExportFormat = strawberry.enum(
+    models.BadgeScanExport.Format, name="BadgeScanExportFormat"
+)
+
+
 @strawberry.type
 class BadgeScanExport:
     id: strawberry.ID
-    url: str
+    status: BadgeScanExportStatus
+    format: BadgeScanExportFormat
+    # Available once the export is completed
+    url: str | None
 
     @classmethod
     def from_db(cls, db_scan_export: models.BadgeScanExport) -> BadgeScanExport:
         return BadgeScanExport(
-            id=strawberry.ID(str(db_scan_export.pk)), url=db_scan_export.file.url
+            id=strawberry.ID(str(db_scan_export.pk)),
+            status=BadgeScanExportStatus(db_scan_export.status),
+            format=BadgeScanExportFormat(db_scan_export.format),
+            url=db_scan_export.file.url
+            if db_scan_export.status == models.BadgeScanExport.Status.COMPLETED
+            else None,
         )
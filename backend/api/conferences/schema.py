@@ -1,6 +1,9 @@
 from api.context import Info
 import strawberry
 
+import pretix
+from api.helpers.selections import get_selected_fields
+
 from conferences.models import Conference
 
 from . import types
@@ -10,4 +13,18 @@ from . import types
 class ConferenceQuery:
     @strawberry.field
     def conference(self, info: Info, code: str) -> types.Conference:
-        return Conference.objects.prefetch_related("durations").get(code=code)
+        conference = Conference.objects.prefetch_related("durations").get(code=code)
+
+        selected_fields = {field.name: field for field in get_selected_fields(info)}
+
+        # The voucher is fetched while the tickets are resolved
+        if "voucher" in selected_fields and "tickets" in selected_fields:
+            pretix.prefetch(
+                (
+                    pretix.get_voucher,
+                    conference,
+                    selected_fields["voucher"].arguments["code"],
+                )
+            )
+
+        return conference
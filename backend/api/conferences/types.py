@@ -1,7 +1,4 @@
 from api.context import Info
-from django.db.models import Case, When, Value, IntegerField
-from django.db.models import Prefetch
-from participants.models import Participant as ParticipantModel
 from datetime import datetime
 from typing import List, Optional
 from api.participants.types import Participant
@@ -17,6 +14,7 @@ from api.hotels.types import HotelRoom
 from api.languages.types import Language
 from api.pretix.query import get_conference_tickets, get_voucher
 from api.pretix.types import TicketItem, Voucher
+from api.schedule.snapshot import get_schedule_snapshot, get_schedule_version
 from api.schedule.types import Room, ScheduleItem, ScheduleItemUser
 from api.sponsors.types import SponsorsByLevel
 from api.submissions.types import Submission, SubmissionType
@@ -90,17 +88,25 @@ class Keynote:
 
     @classmethod
     def from_django_model(cls, instance, info):
-        participants_data = info.context._participants_data
-        if not participants_data:
-            participants_data = {
-                participant.user_id: participant
-                for participant in ParticipantModel.objects.filter(
-                    user_id__in=instance.speakers.values_list("user_id"),
-                    conference_id=instance.conference_id,
-                ).all()
-            }
-
-        schedule_item = instance.schedule_items.all().first()
+        loaders = info.context.loaders
+        schedule_items = loaders.keynote_schedule_items.load(instance.id)
+        schedule_item = schedule_items[0] if schedule_items else None
+        speakers = []
+
+        for speaker in loaders.keynote_speakers.load(instance.id):
+            participant = loaders.participants.load(
+                (instance.conference_id, speaker.user_id)
+            )
+            speakers.append(
+                ScheduleItemUser(
+                    id=speaker.user_id,
+                    fullname=speaker.user.full_name,
+                    full_name=speaker.user.full_name,
+                    participant=Participant.from_model(participant)
+                    if participant
+                    else None,
+                )
+            )
 
         return cls(
             id=instance.id,
@@ -108,20 +114,12 @@ class Keynote:
             description=instance.description,
             slug=instance.slug,
             topic=Topic.from_django_model(instance.topic) if instance.topic else None,
-            speakers=[
-                ScheduleItemUser(
-                    id=speaker.user_id,
-                    fullname=speaker.user.full_name,
-                    full_name=speaker.user.full_name,
-                    participant=Participant.from_model(
-                        participants_data[speaker.user_id]
-                    ),
-                )
-                for speaker in instance.speakers.all()
-            ],
+            speakers=speakers,
             start=schedule_item.start if schedule_item else None,
             end=schedule_item.end if schedule_item else None,
-            rooms=schedule_item.rooms.all() if schedule_item else [],
+            rooms=loaders.schedule_item_rooms.load(schedule_item.id)
+            if schedule_item
+            else [],
             youtube_video_id=schedule_item.youtube_video_id if schedule_item else None,
         )
 
@@ -203,12 +201,16 @@ class Conference:
 
     @strawberry.field(permission_classes=[CanSeeSubmissions])
     def submissions(self, info: Info) -> Optional[List[Submission]]:
-        return self.submissions.filter(
-            status__in=(
-                SubmissionModel.STATUS.proposed,
-                SubmissionModel.STATUS.accepted,
-            )
-        ).select_related("audience_level", "duration", "type", "topic")
+        submissions = list(
+            self.submissions.filter(
+                status__in=(
+                    SubmissionModel.STATUS.proposed,
+                    SubmissionModel.STATUS.accepted,
+                )
+            ).select_related("audience_level", "duration", "type", "topic")
+        )
+        info.context.loaders.schedule_submissions(submissions)
+        return submissions
 
     @strawberry.field
     def events(self, info: Info) -> List[Event]:
@@ -242,9 +244,10 @@ class Conference:
 
     @strawberry.field
     def keynotes(self, info: Info) -> List[Keynote]:
-        return [
-            Keynote.from_django_model(keynote, info) for keynote in self.keynotes.all()
-        ]
+        keynotes = list(self.keynotes.select_related("topic"))
+        info.context.loaders.schedule_keynotes(keynote.id for keynote in keynotes)
+
+        return [Keynote.from_django_model(keynote, info) for keynote in keynotes]
 
     @strawberry.field
     def keynote(self, info: Info, slug: str) -> Optional[Keynote]:
@@ -253,7 +256,23 @@ class Conference:
 
     @strawberry.field
     def talks(self, info: Info) -> List[ScheduleItem]:
-        return self.schedule_items.filter(type=ScheduleItemModel.TYPES.submission).all()
+        talks = list(
+            self.schedule_items.filter(type=ScheduleItemModel.TYPES.submission)
+            .select_related(
+                "slot__day",
+                "language",
+                "audience_level",
+                "submission",
+                "submission__type",
+                "submission__duration",
+                "submission__audience_level",
+                "submission__topic",
+                "submission__speaker",
+            )
+            .prefetch_related("additional_speakers__user")
+        )
+        info.context.loaders.schedule_schedule_items(talks)
+        return talks
 
     @strawberry.field
     def talk(self, info: Info, slug: str) -> Optional[ScheduleItem]:
@@ -281,73 +300,29 @@ class Conference:
 
     @strawberry.field
     def days(self, info: Info) -> List[Day]:
-        days = list(
-            self.days.order_by("day")
-            .prefetch_related(
-                "slots",
-                "slots__day",
-                "slots__day__added_rooms",
-                "slots__day__added_rooms__room",
-                Prefetch(
-                    "slots__items",
-                    queryset=(
-                        ScheduleItemModel.objects.for_conference(self.id)
-                        .annotate(
-                            order=Case(
-                                When(type="custom", then=Value(1)),
-                                When(type="break", then=Value(1)),
-                                When(type="talk", then=Value(2)),
-                                When(type="panel", then=Value(3)),
-                                default=Value(4),
-                                output_field=IntegerField(),
-                            )
-                        )
-                        .order_by("order")
-                        .prefetch_related(
-                            "audience_level",
-                            "language",
-                            "rooms",
-                            "additional_speakers",
-                            "additional_speakers__user",
-                            "language",
-                            "submission",
-                            "submission__type",
-                            "submission__tags",
-                            "submission__duration",
-                            "submission__audience_level",
-                            "submission__speaker",
-                            "submission__languages",
-                            "submission__schedule_items",
-                            "keynote",
-                            "keynote__schedule_items",
-                            "keynote__schedule_items__rooms",
-                            "keynote__schedule_items__slot",
-                            "keynote__schedule_items__slot__day",
-                            "keynote__speakers",
-                            "keynote__speakers__user",
-                        )
-                    ),
-                ),
-            )
-            .all()
-        )
-        all_speakers = [
-            speaker.id
+        snapshot = get_schedule_snapshot(self)
+        loaders = info.context.loaders
+
+        for name, values in snapshot["loaders"].items():
+            getattr(loaders, name).prime_many(values)
+
+        days = snapshot["days"]
+        # Only the per user and live data (e.g. booked spots) is loaded
+        loaders.schedule_schedule_items(
+            item
             for day in days
             for slot in day.slots.all()
             for item in slot.items.all()
-            for speaker in item.speakers
-        ]
-        info.context._participants_data = {
-            participant.user_id: participant
-            for participant in ParticipantModel.objects.for_conference(self.id)
-            .filter(user_id__in=all_speakers)
-            .prefetch_related("user")
-            .all()
-        }
+        )
 
         return days
 
+    @strawberry.field
+    def schedule_version(self, info: Info) -> str:
+        """Changes every time the schedule is edited, clients can poll this
+        and fetch the days again only when it changes"""
+        return get_schedule_version(self.id)
+
     @strawberry.field
     def current_day(self, info: Info) -> Optional[Day]:
         start = timezone.now().replace(hour=0, minute=0, second=0)
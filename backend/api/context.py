@@ -1,9 +1,11 @@
 from dataclasses import dataclass
-from typing import Any, Dict, Optional
+from functools import cached_property
+from typing import Any, Optional
 
 from django.http.request import HttpRequest
 
-from voting.models.vote import Vote
+from api.dataloaders import DataLoaders
+from api.models import PersistedQuery
 
 
 @dataclass
@@ -11,8 +13,15 @@ class Context:
     request: HttpRequest
     response: Any
     _user_can_vote: Optional[bool] = None
-    _participants_data: Optional[Any] = None
-    _my_votes: Optional[Dict[int, Vote]] = None
+
+    @cached_property
+    def loaders(self) -> DataLoaders:
+        return DataLoaders(self.request)
+
+    @property
+    def persisted_query(self) -> Optional[PersistedQuery]:
+        # Set by the view when the client sent the hash of a registered query
+        return getattr(self.request, "persisted_query", None)
 
 
 @dataclass
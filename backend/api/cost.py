@@ -0,0 +1,216 @@
+from dataclasses import dataclass
+from typing import Any, Dict, Optional
+
+from django.conf import settings
+from django.core.cache import cache
+from graphql import (
+    DocumentNode,
+    FieldNode,
+    FragmentDefinitionNode,
+    FragmentSpreadNode,
+    GraphQLList,
+    GraphQLNonNull,
+    GraphQLSchema,
+    OperationDefinitionNode,
+    SelectionSetNode,
+    get_named_type,
+    value_from_ast_untyped,
+)
+
+# Every call to Pretix is an HTTP request that holds the worker until it answers
+PRETIX_COST = 100
+
+# Static cost of the fields that are expensive to resolve, by "Type.field".
+# Other fields cost 1 when they return an object and nothing otherwise.
+FIELD_COSTS: Dict[str, int] = {
+    "Conference.tickets": PRETIX_COST,
+    "Conference.voucher": PRETIX_COST,
+    "User.orders": PRETIX_COST,
+    "User.tickets": PRETIX_COST,
+    "User.conferenceRoles": PRETIX_COST,
+    "Query.order": PRETIX_COST,
+    "Query.ticketIdToUserHashid": PRETIX_COST,
+    "Mutation.createOrder": PRETIX_COST,
+    "Mutation.updateAttendeeTicket": PRETIX_COST,
+    "Mutation.scanBadge": PRETIX_COST,
+    "Mutation.syncBadgeScans": PRETIX_COST,
+    "Mutation.bookScheduleItem": PRETIX_COST,
+    "Conference.days": 10,
+    "Conference.talks": 10,
+    "Conference.keynotes": 10,
+}
+
+# Arguments limiting the size of the list returned by a field
+LIST_SIZE_ARGUMENTS = ("first", "last", "limit", "pageSize", "size")
+
+
+@dataclass
+class OperationCost:
+    cost: int
+    depth: int
+
+
+def get_operation_cost(
+    schema: GraphQLSchema,
+    document: DocumentNode,
+    operation_name: Optional[str] = None,
+    variables: Optional[Dict[str, Any]] = None,
+) -> OperationCost:
+    """
+    Statically computes the cost of the operation, without running it.
+
+    The cost of a field is its weight plus the cost of its selections,
+    multiplied by the size of the list it returns: the value of its
+    `first`/`limit` like argument or GRAPHQL_DEFAULT_LIST_SIZE.
+    """
+    operation = None
+    fragments = {}
+
+    for definition in document.definitions:
+        if isinstance(definition, FragmentDefinitionNode):
+            fragments[definition.name.value] = definition
+        elif isinstance(definition, OperationDefinitionNode):
+            if operation_name is None or (
+                definition.name and definition.name.value == operation_name
+            ):
+                operation = operation or definition
+
+    if operation is None:
+        return OperationCost(cost=0, depth=0)
+
+    root_type = schema.get_root_type(operation.operation)
+    return _get_selection_set_cost(
+        schema, operation.selection_set, root_type, fragments, variables or {}
+    )
+
+
+def _get_selection_set_cost(
+    schema: GraphQLSchema,
+    selection_set: SelectionSetNode,
+    parent_type,
+    fragments: Dict[str, FragmentDefinitionNode],
+    variables: Dict[str, Any],
+    visited_fragments: frozenset = frozenset(),
+) -> OperationCost:
+    total = OperationCost(cost=0, depth=0)
+
+    for selection in selection_set.selections:
+        if isinstance(selection, FieldNode):
+            selection_cost = _get_field_cost(
+                schema, selection, parent_type, fragments, variables, visited_fragments
+            )
+        else:
+            fragment_visited = visited_fragments
+
+            if isinstance(selection, FragmentSpreadNode):
+                name = selection.name.value
+
+                # Cycles are reported by the validation
+                if name in visited_fragments or name not in fragments:
+                    continue
+
+                fragment = fragments[name]
+                fragment_visited = visited_fragments | {name}
+            else:
+                fragment = selection
+
+            selection_cost = _get_selection_set_cost(
+                schema,
+                fragment.selection_set,
+                schema.get_type(fragment.type_condition.name.value)
+                if fragment.type_condition
+                else parent_type,
+                fragments,
+                variables,
+                fragment_visited,
+            )
+
+        total.cost += selection_cost.cost
+        total.depth = max(total.depth, selection_cost.depth)
+
+    return total
+
+
+def _get_field_cost(
+    schema: GraphQLSchema,
+    field: FieldNode,
+    parent_type,
+    fragments: Dict[str, FragmentDefinitionNode],
+    variables: Dict[str, Any],
+    visited_fragments: frozenset,
+) -> OperationCost:
+    name = field.name.value
+    field_definition = getattr(parent_type, "fields", {}).get(name)
+
+    # Introspection and unknown fields (reported by the validation)
+    if name.startswith("__") or field_definition is None:
+        return OperationCost(cost=0, depth=0)
+
+    weight = FIELD_COSTS.get(
+        f"{parent_type.name}.{name}", 1 if field.selection_set else 0
+    )
+
+    if not field.selection_set:
+        return OperationCost(cost=weight, depth=1)
+
+    selections = _get_selection_set_cost(
+        schema,
+        field.selection_set,
+        get_named_type(field_definition.type),
+        fragments,
+        variables,
+        visited_fragments,
+    )
+    list_size = _get_list_size(field, field_definition.type, variables)
+
+    return OperationCost(
+        cost=weight + list_size * selections.cost, depth=selections.depth + 1
+    )
+
+
+def _get_list_size(field: FieldNode, field_type, variables: Dict[str, Any]) -> int:
+    if isinstance(field_type, GraphQLNonNull):
+        field_type = field_type.of_type
+
+    if not isinstance(field_type, GraphQLList):
+        return 1
+
+    for argument in field.arguments:
+        if argument.name.value in LIST_SIZE_ARGUMENTS:
+            value = value_from_ast_untyped(argument.value, variables)
+
+            if isinstance(value, int) and value >= 0:
+                return value
+
+    return settings.GRAPHQL_DEFAULT_LIST_SIZE
+
+
+def get_client_key(request) -> str:
+    if request.user.is_authenticated:
+        return f"user:{request.user.id}"
+
+    return f"ip:{request.META.get('REMOTE_ADDR')}"
+
+
+def spend_cost_budget(client_key: str, cost: int) -> Optional[int]:
+    """
+    Charges the cost of an operation to the budget the client has in
+    the current window, returns the budget left or None when the
+    operation doesn't fit in it (and nothing is charged).
+    """
+    cache_key = f"graphql-cost-budget:{client_key}"
+    spent = cache.get(cache_key, 0)
+
+    if spent + cost > settings.GRAPHQL_COST_BUDGET:
+        return None
+
+    if cache.add(cache_key, cost, timeout=settings.GRAPHQL_COST_BUDGET_WINDOW):
+        spent = cost
+    else:
+        try:
+            spent = cache.incr(cache_key, cost)
+        except ValueError:
+            # The window expired in the meantime
+            spent = cost
+
+    return max(settings.GRAPHQL_COST_BUDGET - spent, 0)
@@ -0,0 +1,304 @@
+from collections import defaultdict
+from functools import cached_property
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Generic,
+    Hashable,
+    Iterable,
+    List,
+    Optional,
+    Tuple,
+    TypeVar,
+)
+
+from django.db.models import F, Q, QuerySet
+from django.http.request import HttpRequest
+
+from conferences.models import KeynoteSpeaker
+from helpers.stats import count_by
+from languages.models import Language
+from participants.models import Participant
+from schedule.models import (
+    DayRoomThroughModel,
+    Room,
+    ScheduleItem,
+    ScheduleItemAttendee,
+)
+from submissions.models import SubmissionTag
+from users.models import User
+from voting.models import Vote
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+
+class DataLoader(Generic[K, V]):
+    """
+    Request scoped batch loader.
+
+    Listing resolvers `schedule` the keys of every object they return,
+    then the first `load` fetches all the scheduled keys with a single
+    call to `batch_load_fn`, and the following ones are served from the cache.
+    """
+
+    def __init__(
+        self,
+        batch_load_fn: Callable[[List[K]], Dict[K, V]],
+        default: Callable[[], Optional[V]] = lambda: None,
+    ):
+        self.batch_load_fn = batch_load_fn
+        self.default = default
+        self._cache: Dict[K, V] = {}
+        # Dict used as an ordered set
+        self._scheduled: Dict[K, None] = {}
+
+    def schedule(self, keys: Iterable[K]):
+        for key in keys:
+            if key not in self._cache:
+                self._scheduled[key] = None
+
+    def load(self, key: K) -> V:
+        if key not in self._cache:
+            self.schedule([key])
+            keys = list(self._scheduled)
+            self._scheduled.clear()
+
+            results = self.batch_load_fn(keys)
+
+            for batch_key in keys:
+                self._cache[batch_key] = (
+                    results[batch_key] if batch_key in results else self.default()
+                )
+
+        return self._cache[key]
+
+    def load_many(self, keys: Iterable[K]) -> List[V]:
+        keys = list(keys)
+        self.schedule(keys)
+        return [self.load(key) for key in keys]
+
+    def load_scheduled(self) -> Dict[K, V]:
+        """Loads the scheduled keys now, returns everything loaded so far"""
+        if self._scheduled:
+            self.load(next(iter(self._scheduled)))
+
+        return dict(self._cache)
+
+    def prime_many(self, values: Dict[K, V]):
+        """Fills the cache with values loaded elsewhere"""
+        for key, value in values.items():
+            self._cache.setdefault(key, value)
+            self._scheduled.pop(key, None)
+
+
+def load_related(queryset: QuerySet, lookup: str) -> Callable[[List], Dict[Any, list]]:
+    """
+    Batch function returning the rows of `queryset` grouped by `lookup`,
+    works with foreign keys as well as (reverse) many to many relations.
+    """
+
+    def batch_load_fn(keys):
+        rows = defaultdict(list)
+
+        for row in queryset.filter(**{f"{lookup}__in": keys}).annotate(
+            loader_key=F(lookup)
+        ):
+            rows[row.loader_key].append(row)
+
+        return rows
+
+    return batch_load_fn
+
+
+def load_count(queryset: QuerySet, lookup: str) -> Callable[[List], Dict[Any, int]]:
+    def batch_load_fn(keys):
+        return count_by(queryset.filter(**{f"{lookup}__in": keys}), lookup)
+
+    return batch_load_fn
+
+
+class DataLoaders:
+    def __init__(self, request: HttpRequest):
+        self.request = request
+
+    @cached_property
+    def users(self) -> DataLoader[int, User]:
+        return DataLoader(User.objects.in_bulk)
+
+    @cached_property
+    def submission_languages(self) -> DataLoader[int, List[Language]]:
+        return DataLoader(
+            load_related(Language.objects.all(), "submission"), default=list
+        )
+
+    @cached_property
+    def submission_tags(self) -> DataLoader[int, List[SubmissionTag]]:
+        return DataLoader(
+            load_related(SubmissionTag.objects.all(), "submission"), default=list
+        )
+
+    @cached_property
+    def submission_schedule_items(self) -> DataLoader[int, List[ScheduleItem]]:
+        return DataLoader(
+            load_related(ScheduleItem.objects.all(), "submission"), default=list
+        )
+
+    @cached_property
+    def my_votes(self) -> DataLoader[int, Vote]:
+        def batch_load_fn(submission_ids):
+            return {
+                vote.submission_id: vote
+                for vote in Vote.objects.filter(
+                    user_id=self.request.user.id, submission_id__in=submission_ids
+                )
+            }
+
+        return DataLoader(batch_load_fn)
+
+    @cached_property
+    def schedule_item_rooms(self) -> DataLoader[int, List[Room]]:
+        # Sorted by id, so the first room is the one `.first()` would return
+        return DataLoader(
+            load_related(Room.objects.order_by("id"), "talks"), default=list
+        )
+
+    @cached_property
+    def schedule_item_attendees_count(self) -> DataLoader[int, int]:
+        return DataLoader(
+            load_count(ScheduleItemAttendee.objects.all(), "schedule_item_id"),
+            default=int,
+        )
+
+    @cached_property
+    def schedule_item_user_has_spot(self) -> DataLoader[int, bool]:
+        def batch_load_fn(schedule_item_ids):
+            return {
+                schedule_item_id: True
+                for schedule_item_id in ScheduleItemAttendee.objects.filter(
+                    user_id=self.request.user.id,
+                    schedule_item_id__in=schedule_item_ids,
+                ).values_list("schedule_item_id", flat=True)
+            }
+
+        return DataLoader(batch_load_fn, default=bool)
+
+    @cached_property
+    def slot_slido_urls(self) -> DataLoader[int, Dict[int, str]]:
+        """Slido url of each room of the day of a slot"""
+
+        def batch_load_fn(slot_ids):
+            urls = defaultdict(dict)
+
+            for slot_id, room_id, slido_url in DayRoomThroughModel.objects.filter(
+                day__slots__in=slot_ids
+            ).values_list("day__slots", "room_id", "slido_url"):
+                urls[slot_id][room_id] = slido_url
+
+            return urls
+
+        return DataLoader(batch_load_fn, default=dict)
+
+    @cached_property
+    def keynote_schedule_items(self) -> DataLoader[int, List[ScheduleItem]]:
+        load_schedule_items = load_related(
+            ScheduleItem.objects.select_related("slot__day").order_by("id"), "keynote"
+        )
+
+        def batch_load_fn(keynote_ids):
+            schedule_items = load_schedule_items(keynote_ids)
+
+            # Keynotes show the rooms of their first schedule item
+            self.schedule_item_rooms.schedule(
+                keynote_schedule_items[0].id
+                for keynote_schedule_items in schedule_items.values()
+            )
+            return schedule_items
+
+        return DataLoader(batch_load_fn, default=list)
+
+    @cached_property
+    def keynote_speakers(self) -> DataLoader[int, List[KeynoteSpeaker]]:
+        load_speakers = load_related(
+            KeynoteSpeaker.objects.select_related("user", "keynote"), "keynote"
+        )
+
+        def batch_load_fn(keynote_ids):
+            speakers = load_speakers(keynote_ids)
+
+            # The participant profile of the speakers is always needed next
+            self.participants.schedule(
+                (speaker.keynote.conference_id, speaker.user_id)
+                for keynote_speakers in speakers.values()
+                for speaker in keynote_speakers
+            )
+            return speakers
+
+        return DataLoader(batch_load_fn, default=list)
+
+    @cached_property
+    def participants(self) -> DataLoader[Tuple[int, int], Participant]:
+        """Participants by (conference id, user id)"""
+
+        def batch_load_fn(keys):
+            user_ids_by_conference = defaultdict(list)
+            for conference_id, user_id in keys:
+                user_ids_by_conference[conference_id].append(user_id)
+
+            filters = Q()
+            for conference_id, user_ids in user_ids_by_conference.items():
+                filters |= Q(conference_id=conference_id, user_id__in=user_ids)
+
+            return {
+                (participant.conference_id, participant.user_id): participant
+                for participant in Participant.objects.filter(filters).select_related(
+                    "user"
+                )
+            }
+
+        return DataLoader(batch_load_fn)
+
+    def schedule_submissions(self, submissions: Iterable):
+        submissions = list(submissions)
+        submission_ids = [submission.id for submission in submissions]
+
+        self.submission_languages.schedule(submission_ids)
+        self.submission_tags.schedule(submission_ids)
+        self.submission_schedule_items.schedule(submission_ids)
+        self.my_votes.schedule(submission_ids)
+        self.users.schedule(submission.speaker_id for submission in submissions)
+
+    def schedule_schedule_items(self, schedule_items: Iterable):
+        schedule_items = list(schedule_items)
+        schedule_item_ids = [schedule_item.id for schedule_item in schedule_items]
+
+        self.schedule_item_rooms.schedule(schedule_item_ids)
+        self.schedule_item_attendees_count.schedule(schedule_item_ids)
+        self.schedule_item_user_has_spot.schedule(schedule_item_ids)
+        self.slot_slido_urls.schedule(
+            schedule_item.slot_id
+            for schedule_item in schedule_items
+            if schedule_item.slot_id
+        )
+        self.schedule_keynotes(
+            schedule_item.keynote_id
+            for schedule_item in schedule_items
+            if schedule_item.keynote_id
+        )
+        self.schedule_submissions(
+            schedule_item.submission
+            for schedule_item in schedule_items
+            if schedule_item.submission_id
+        )
+        self.participants.schedule(
+            (schedule_item.conference_id, speaker.id)
+            for schedule_item in schedule_items
+            for speaker in schedule_item.speakers
+        )
+
+    def schedule_keynotes(self, keynote_ids: Iterable[int]):
+        keynote_ids = list(keynote_ids)
+
+        self.keynote_schedule_items.schedule(keynote_ids)
+        self.keynote_speakers.schedule(keynote_ids)
@@ -0,0 +1,311 @@
+import json
+import logging
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Tuple
+
+from django.conf import settings
+from django.db.models import QuerySet
+from graphql import DocumentNode, GraphQLError
+from graphql import ExecutionResult as GraphQLExecutionResult
+from strawberry.extensions import SchemaExtension
+from strawberry.schema.schema_converter import GraphQLCoreConverter
+from strawberry.schema.execute import parse_document, validate_document
+
+from api.cost import get_client_key, get_operation_cost, spend_cost_budget
+from api.persisted_queries import get_query_hash
+from helpers.metrics import (
+    RequestMetrics,
+    collect_metrics,
+    get_current_metrics,
+    record_cache_lookup,
+)
+from pretix import session as pretix_session
+
+logger = logging.getLogger(__name__)
+
+
+def _ms(seconds: float) -> float:
+    return round(seconds * 1000, 2)
+
+
+def _get_resolver_path(info) -> str:
+    # List indexes are dropped, so every item of a list adds up to the same path
+    return ".".join(key for key in info.path.as_list() if isinstance(key, str))
+
+
+def _has_resolver(info) -> bool:
+    """Whether the field has its own resolver, instead of reading an attribute"""
+    field = info.parent_type.fields.get(info.field_name)
+    definition = field and field.extensions.get(GraphQLCoreConverter.DEFINITION_BACKREF)
+    return definition is not None and definition.base_resolver is not None
+
+
+class OperationMetricsExtension(SchemaExtension):
+    """
+    Records SQL queries, DB time, outbound HTTP calls and resolver time
+    of every operation, overall and per resolver path. Only the fields with
+    their own resolver are timed, reading attributes is left untouched.
+
+    The report is logged as JSON (as a warning when the operation ran more
+    than GRAPHQL_METRICS_MAX_QUERIES queries) and, when
+    GRAPHQL_METRICS_IN_RESPONSE is on, returned in the response `extensions`.
+    """
+
+    metrics: RequestMetrics = None
+    report: Dict[str, Any] = None
+
+    def on_operation(self):
+        start = time.perf_counter()
+
+        with collect_metrics() as metrics:
+            self.metrics = metrics
+            yield
+
+        self.report = self._build_report(time.perf_counter() - start)
+        level = (
+            logging.WARNING
+            if self.report["sql"]["count"] > settings.GRAPHQL_METRICS_MAX_QUERIES
+            else logging.INFO
+        )
+        logger.log(level, "GraphQL operation metrics %s", json.dumps(self.report))
+
+    def resolve(self, _next, root, info, *args, **kwargs):
+        if self.metrics is None or not _has_resolver(info):
+            return _next(root, info, *args, **kwargs)
+
+        with self.metrics.scope(_get_resolver_path(info)):
+            result = _next(root, info, *args, **kwargs)
+
+            # Querysets are evaluated after the resolver returns,
+            # evaluating them here counts their query in the right path
+            if isinstance(result, QuerySet):
+                result = list(result)
+
+        return result
+
+    def get_results(self):
+        if not settings.GRAPHQL_METRICS_IN_RESPONSE or not self.report:
+            return {}
+
+        return {"metrics": self.report}
+
+    def _build_report(self, duration: float) -> Dict[str, Any]:
+        metrics = self.metrics
+
+        # Resolvers that don't run queries (most of the fields)
+        # are only interesting when they are slow
+        resolvers = sorted(
+            metrics.scopes.items(),
+            key=lambda item: (item[1]["sql"]["count"], item[1]["time"]),
+            reverse=True,
+        )[: settings.GRAPHQL_METRICS_MAX_RESOLVERS]
+
+        return {
+            "operation": self.execution_context.operation_name or "anonymous",
+            "duration": _ms(duration),
+            "sql": {
+                "count": metrics.sql["count"],
+                "time": _ms(metrics.sql["time"]),
+            },
+            "http": {
+                service: {"count": http["count"], "time": _ms(http["time"])}
+                for service, http in metrics.http.items()
+            },
+            "caches": dict(metrics.caches),
+            "cost": metrics.cost,
+            "resolvers": {
+                path: {
+                    "calls": scope["calls"],
+                    "time": _ms(scope["time"]),
+                    "sql_count": scope["sql"]["count"],
+                    "sql_time": _ms(scope["sql"]["time"]),
+                }
+                for path, scope in resolvers
+            },
+        }
+
+
+@dataclass
+class CachedDocument:
+    document: DocumentNode
+    # Validation rules -> errors
+    validation_errors: Dict[Tuple, List[GraphQLError]] = field(default_factory=dict)
+
+
+class DocumentCache:
+    """Thread safe LRU cache of parsed documents, keyed by the query hash"""
+
+    def __init__(self, maxsize: int):
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._entries: "OrderedDict[str, CachedDocument]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[CachedDocument]:
+        with self._lock:
+            entry = self._entries.get(key)
+
+            if entry is None:
+                self.misses += 1
+                return None
+
+            self.hits += 1
+            self._entries.move_to_end(key)
+            return entry
+
+    def set(self, key: str, entry: CachedDocument):
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self.hits = self.misses = 0
+
+    def info(self) -> Dict[str, Any]:
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / lookups, 4) if lookups else 0,
+            "size": len(self._entries),
+            "maxsize": self.maxsize,
+        }
+
+
+document_cache = DocumentCache(maxsize=settings.GRAPHQL_DOCUMENT_CACHE_SIZE)
+
+
+class DocumentCacheExtension(SchemaExtension):
+    """
+    Serves the parsed document, and its validation errors, of the queries
+    run recently from `document_cache` instead of parsing and validating
+    them against the schema on every request.
+
+    Persisted queries are keyed by the same hash they are registered with.
+    """
+
+    cache = document_cache
+    entry: Optional[CachedDocument] = None
+
+    def on_parse(self):
+        execution_context = self.execution_context
+        key = get_query_hash(execution_context.query)
+        entry = self.cache.get(key)
+        record_cache_lookup("graphql_document", hit=entry is not None)
+
+        if entry is None:
+            try:
+                entry = CachedDocument(
+                    parse_document(
+                        execution_context.query, **execution_context.parse_options
+                    )
+                )
+                self.cache.set(key, entry)
+            except GraphQLError:
+                # Parsed again, and reported, by the normal execution
+                pass
+
+        if entry is not None:
+            self.entry = entry
+            execution_context.graphql_document = entry.document
+
+        yield
+
+    def on_validate(self):
+        execution_context = self.execution_context
+
+        if self.entry is not None:
+            rules = tuple(execution_context.validation_rules)
+
+            if rules not in self.entry.validation_errors:
+                self.entry.validation_errors[rules] = validate_document(
+                    execution_context.schema._schema,
+                    self.entry.document,
+                    execution_context.validation_rules,
+                )
+
+            execution_context.errors = self.entry.validation_errors[rules]
+
+        yield
+
+
+class QueryCostExtension(SchemaExtension):
+    """
+    Rejects, before running them, the operations deeper than
+    GRAPHQL_MAX_QUERY_DEPTH or costing more than GRAPHQL_MAX_QUERY_COST
+    (see `api.cost`), and, when GRAPHQL_COST_BUDGET is set, the ones of
+    clients that already spent it in the last GRAPHQL_COST_BUDGET_WINDOW
+    seconds.
+
+    The cost is added to the operation metrics.
+    """
+
+    def on_execute(self):
+        execution_context = self.execution_context
+        operation_cost = get_operation_cost(
+            execution_context.schema._schema,
+            execution_context.graphql_document,
+            execution_context.operation_name,
+            execution_context.variables,
+        )
+
+        metrics = get_current_metrics()
+        if metrics is not None:
+            metrics.cost = operation_cost.cost
+
+        error = self._check_operation_cost(operation_cost.cost, operation_cost.depth)
+
+        if error is not None:
+            execution_context.result = GraphQLExecutionResult(
+                data=None,
+                errors=[
+                    GraphQLError(error, extensions={"code": "QUERY_TOO_EXPENSIVE"})
+                ],
+            )
+
+        yield
+
+    def _check_operation_cost(self, cost: int, depth: int) -> Optional[str]:
+        if depth > settings.GRAPHQL_MAX_QUERY_DEPTH:
+            return (
+                f"Query depth {depth} exceeds the maximum "
+                f"of {settings.GRAPHQL_MAX_QUERY_DEPTH}"
+            )
+
+        if cost > settings.GRAPHQL_MAX_QUERY_COST:
+            return (
+                f"Query cost {cost} exceeds the maximum "
+                f"of {settings.GRAPHQL_MAX_QUERY_COST}"
+            )
+
+        request = getattr(self.execution_context.context, "request", None)
+
+        if (
+            settings.GRAPHQL_COST_BUDGET
+            and request is not None
+            and spend_cost_budget(get_client_key(request), cost) is None
+        ):
+            return "Query cost budget exceeded, retry later"
+
+        return None
+
+
+class PretixRequestCacheExtension(SchemaExtension):
+    """
+    Shares the Pretix GET requests made while running the operation, so
+    fields asking Pretix for the same data only make one request and the
+    ones started in the background by `pretix.prefetch` are reused.
+    """
+
+    def on_operation(self):
+        with pretix_session.request_cache():
+            yield
@@ -0,0 +1,18 @@
+from typing import Iterable, Iterator, List
+
+from strawberry.types.nodes import SelectedField, Selection
+
+from api.context import Info
+
+
+def get_selected_fields(info: Info) -> List[SelectedField]:
+    """Fields selected on the value the resolver returns, fragments included"""
+    return list(_get_fields(info.selected_fields[0].selections))
+
+
+def _get_fields(selections: Iterable[Selection]) -> Iterator[SelectedField]:
+    for selection in selections:
+        if isinstance(selection, SelectedField):
+            yield selection
+        else:
+            yield from _get_fields(selection.selections)
@@ -0,0 +1,32 @@
+import json
+
+from django.core.management.base import BaseCommand, CommandError
+
+from api.persisted_queries import PersistedQueryMismatch, register_persisted_queries
+
+
+class Command(BaseCommand):
+    help = "Registers the persisted queries generated by the frontend codegen"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "file",
+            type=str,
+            help="Path to the persisted-queries.json generated by the frontend.",
+        )
+
+    def handle(self, file, *args, **options):
+        with open(file, "r") as f:
+            manifest = json.load(f)
+
+        try:
+            registered = register_persisted_queries(manifest)
+        except PersistedQueryMismatch as e:
+            raise CommandError(str(e)) from e
+
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Registered {registered} new persisted queries "
+                f"({len(manifest)} in the file)"
+            )
+        )
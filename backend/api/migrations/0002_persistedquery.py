@@ -0,0 +1,30 @@
+# Generated by Django 4.2.7 on 2026-10-18 18:16
+
+from django.db import migrations, models
+import django.utils.timezone
+import model_utils.fields
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='PersistedQuery',
+            fields=[
+                ('id', models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('created', model_utils.fields.AutoCreatedField(default=django.utils.timezone.now, editable=False, verbose_name='created')),
+                ('modified', model_utils.fields.AutoLastModifiedField(default=django.utils.timezone.now, editable=False, verbose_name='modified')),
+                ('hash', models.CharField(max_length=64, unique=True, verbose_name='hash')),
+                ('operation_name', models.CharField(max_length=255, verbose_name='operation name')),
+                ('query', models.TextField(verbose_name='query')),
+            ],
+            options={
+                'verbose_name': 'persisted query',
+                'verbose_name_plural': 'persisted queries',
+            },
+        ),
+    ]
@@ -1,4 +1,6 @@
 from django.db import models
+from django.utils.translation import gettext_lazy as _
+from model_utils.models import TimeStampedModel
 
 
 class APIToken(models.Model):
@@ -6,3 +8,22 @@ class APIToken(models.Model):
 
     def __str__(self):
         return self.token
+
+
+class PersistedQuery(TimeStampedModel):
+    """
+    A GraphQL operation of the frontend, registered from the codegen output.
+    Clients send the hash instead of the query, which allows sending queries
+    via GET so their responses can be cached.
+    """
+
+    hash = models.CharField(_("hash"), max_length=64, unique=True)
+    operation_name = models.CharField(_("operation name"), max_length=255)
+    query = models.TextField(_("query"))
+
+    class Meta:
+        verbose_name = _("persisted query")
+        verbose_name_plural = _("persisted queries")
+
+    def __str__(self):
+        return f"{self.operation_name} ({self.hash[:8]})"
@@ -0,0 +1,104 @@
+import functools
+import hashlib
+from typing import Any, Dict, Optional
+
+from api.models import PersistedQuery
+
+
+class PersistedQueryNotFound(Exception):
+    """The client sent the hash of a query that is not registered"""
+
+
+class PersistedQueryMismatch(Exception):
+    """The client sent a query with the hash of a different one"""
+
+
+def get_query_hash(query: str) -> str:
+    return hashlib.sha256(query.encode()).hexdigest()
+
+
+def get_requested_hash(data: Dict[str, Any]) -> Optional[str]:
+    """
+    Returns the hash sent in the `persistedQuery` extension
+    (as Apollo's persisted queries link does), if any
+    """
+    extensions = data.get("extensions") or {}
+
+    if not isinstance(extensions, dict):
+        return None
+
+    persisted_query = extensions.get("persistedQuery") or {}
+    return persisted_query.get("sha256Hash")
+
+
+@functools.lru_cache(maxsize=1024)
+def _get_registered_query(query_hash: str) -> PersistedQuery:
+    # Queries are never changed or removed once registered, so they can be
+    # kept for the life of the process. Missing ones raise and aren't cached.
+    return PersistedQuery.objects.get(hash=query_hash)
+
+
+def get_persisted_query(query_hash: str) -> Optional[PersistedQuery]:
+    try:
+        return _get_registered_query(query_hash)
+    except PersistedQuery.DoesNotExist:
+        return None
+
+
+def resolve_persisted_query(
+    query_hash: str, query: Optional[str]
+) -> Optional[PersistedQuery]:
+    """
+    Returns the registered query with the hash, raises `PersistedQueryNotFound`
+    when only the hash was sent and it is not registered.
+
+    Queries sent via POST together with their hash run as normal queries
+    when they are not registered, only the codegen output is registered.
+    The same goes for queries that don't match the hash: the text Apollo
+    sends on retry is printed at runtime and can differ from the codegen one.
+    Via GET the view refuses both.
+    """
+    if query is not None and get_query_hash(query) != query_hash:
+        return None
+
+    persisted_query = get_persisted_query(query_hash)
+
+    if persisted_query is None and query is None:
+        raise PersistedQueryNotFound()
+
+    return persisted_query
+
+
+def register_persisted_queries(manifest: Dict[str, Dict[str, str]]) -> int:
+    """
+    Registers the operations of a manifest generated by the frontend codegen
+    (`{operation name: {"hash": ..., "query": ...}}`), returns how many
+    operations were not registered yet.
+    """
+    persisted_queries = {}
+
+    for operation_name, operation in manifest.items():
+        query_hash = get_query_hash(operation["query"])
+
+        if query_hash != operation["hash"]:
+            raise PersistedQueryMismatch(
+                f"The hash of {operation_name} doesn't match its query"
+            )
+
+        persisted_queries[query_hash] = PersistedQuery(
+            hash=query_hash, operation_name=operation_name, query=operation["query"]
+        )
+
+    registered_hashes = set(
+        PersistedQuery.objects.filter(hash__in=persisted_queries).values_list(
+            "hash", flat=True
+        )
+    )
+    PersistedQuery.objects.bulk_create(
+        [
+            persisted_query
+            for query_hash, persisted_query in persisted_queries.items()
+            if query_hash not in registered_hashes
+        ]
+    )
+    return len(persisted_queries) - len(registered_hashes)
@@ -40,8 +40,10 @@ def get_user_tickets(
     if not tickets:
         return []
 
-    categories = pretix.get_categories(conference)
-    questions = pretix.get_questions(conference).values()
+    categories, questions = pretix.gather(
+        (pretix.get_categories, conference), (pretix.get_questions, conference)
+    )
+    questions = questions.values()
 
     return [
         AttendeeTicket.from_data(
@@ -81,7 +83,12 @@ def _is_ticket_available(item) -> bool:
 def get_conference_tickets(
     conference: Conference, language: str, show_unavailable_tickets: bool = False
 ) -> List[TicketItem]:
-    items = pretix.get_items(conference)
+    items, questions, categories, quotas = pretix.gather(
+        (pretix.get_items, conference),
+        (pretix.get_questions, conference),
+        (pretix.get_categories, conference),
+        (pretix.get_quotas, conference),
+    )
 
     # hide non active items and items that are hotels
     items = {
@@ -93,9 +100,7 @@ def get_conference_tickets(
     if not show_unavailable_tickets:
         items = {key: item for key, item in items.items() if _is_ticket_available(item)}
 
-    questions = pretix.get_questions(conference).values()
-    categories = pretix.get_categories(conference)
-    quotas = pretix.get_quotas(conference)
+    questions = questions.values()
 
     def sort_func(ticket):
         # Make gadgets and association appear at the end
@@ -0,0 +1,153 @@
+import functools
+import hashlib
+import uuid
+from typing import Any, Dict
+
+from django.apps import apps
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models import Case, IntegerField, Prefetch, Value, When
+
+from api.dataloaders import DataLoaders
+from helpers.metrics import record_cache_lookup
+from schedule.models import ScheduleItem
+
+SNAPSHOT_TIMEOUT = 60 * 60 * 24
+
+# Loaders whose values only change when the schedule is edited, loaded
+# when building the snapshot. The order matters: the keynote loaders
+# schedule the rooms and participants they need.
+SNAPSHOT_LOADERS = (
+    "keynote_schedule_items",
+    "keynote_speakers",
+    "schedule_item_rooms",
+    "slot_slido_urls",
+    "submission_languages",
+    "submission_tags",
+    "submission_schedule_items",
+    "participants",
+)
+
+
+def _version_cache_key(conference_id: int) -> str:
+    return f"schedule-snapshot:{conference_id}:version"
+
+
+@functools.cache
+def get_snapshot_format() -> str:
+    """
+    The snapshot pickles model instances, which can't be unpickled once the
+    fields of their models change. The deployed code and the fields of every
+    model are part of the cache key, so the pickles of a previous deploy
+    are never read.
+    """
+    fields = sorted(
+        f"{model._meta.label}.{field.attname}"
+        for model in apps.get_models()
+        for field in model._meta.concrete_fields
+    )
+    return hashlib.md5(
+        f"{settings.GITHASH}:{','.join(fields)}".encode()
+    ).hexdigest()[:12]
+
+
+def _snapshot_cache_key(conference_id: int, version: str) -> str:
+    return f"schedule-snapshot:{conference_id}:{get_snapshot_format()}:{version}"
+
+
+def get_schedule_version(conference_id: int) -> str:
+    return cache.get_or_set(
+        _version_cache_key(conference_id), lambda: uuid.uuid4().hex, timeout=None
+    )
+
+
+def invalidate_schedule_snapshot(conference_id: int):
+    """
+    Gives the schedule of the conference a new version, the snapshot
+    is rebuilt on the next request.
+
+    The version changes after the transaction commits, otherwise the
+    new snapshot could be built from the data before the change.
+    """
+
+    def bump_version():
+        cache.set(_version_cache_key(conference_id), uuid.uuid4().hex, timeout=None)
+
+    transaction.on_commit(bump_version)
+
+
+def build_schedule_snapshot(conference) -> Dict[str, Any]:
+    days = list(
+        conference.days.order_by("day").prefetch_related(
+            "added_rooms__room",
+            "slots",
+            "slots__day",
+            "slots__day__added_rooms",
+            "slots__day__added_rooms__room",
+            Prefetch(
+                "slots__items",
+                queryset=(
+                    ScheduleItem.objects.for_conference(conference.id)
+                    .annotate(
+                        order=Case(
+                            When(type="custom", then=Value(1)),
+                            When(type="break", then=Value(1)),
+                            When(type="talk", then=Value(2)),
+                            When(type="panel", then=Value(3)),
+                            default=Value(4),
+                            output_field=IntegerField(),
+                        )
+                    )
+                    .order_by("order")
+                    .prefetch_related(
+                        "conference",
+                        "audience_level",
+                        "language",
+                        "additional_speakers",
+                        "additional_speakers__user",
+                        "submission",
+                        "submission__type",
+                        "submission__duration",
+                        "submission__audience_level",
+                        "submission__topic",
+                        "submission__speaker",
+                        "keynote",
+                        "keynote__topic",
+                        "keynote__speakers",
+                        "keynote__speakers__user",
+                    )
+                ),
+            ),
+        )
+    )
+
+    loaders = DataLoaders(request=None)
+    loaders.schedule_schedule_items(
+        item for day in days for slot in day.slots.all() for item in slot.items.all()
+    )
+
+    return {
+        "days": days,
+        "loaders": {
+            name: getattr(loaders, name).load_scheduled() for name in SNAPSHOT_LOADERS
+        },
+    }
+
+
+def get_schedule_snapshot(conference) -> Dict[str, Any]:
+    """
+    Returns the days of the conference with everything the schedule
+    shows already loaded, rebuilding it only when the schedule changed
+    """
+    version = get_schedule_version(conference.id)
+    cache_key = _snapshot_cache_key(conference.id, version)
+    snapshot = cache.get(cache_key)
+    record_cache_lookup("schedule_snapshot", hit=snapshot is not None)
+
+    if snapshot is None:
+        snapshot = build_schedule_snapshot(conference)
+        cache.set(cache_key, snapshot, timeout=SNAPSHOT_TIMEOUT)
+
+    snapshot["version"] = version
+    return snapshot
@@ -0,0 +1,205 @@
+from datetime import date, datetime, time
+
+import pytest
+import pytz
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from api.schedule.snapshot import (
+    get_schedule_snapshot,
+    get_schedule_version,
+    get_snapshot_format,
+)
+from schedule.models import ScheduleItem
+
+pytestmark = pytest.mark.django_db
+
+
+DAYS_QUERY = """
+query($code: String!) {
+    conference(code: $code) {
+        scheduleVersion
+        days {
+            day
+            slots {
+                items {
+                    title
+                    rooms { name }
+                    spacesLeft
+                }
+            }
+        }
+    }
+}
+"""
+
+
+@pytest.fixture
+def schedule(conference_factory, day_factory, slot_factory, schedule_item_factory):
+    conference = conference_factory(
+        start=datetime(2020, 4, 2, tzinfo=pytz.UTC),
+        end=datetime(2020, 4, 2, tzinfo=pytz.UTC),
+    )
+    day = day_factory(conference=conference, day=date(2020, 4, 2))
+    schedule_item = schedule_item_factory(
+        conference=conference,
+        slot=slot_factory(day=day, hour=time(8, 45), duration=60),
+        type=ScheduleItem.TYPES.custom,
+        title="Opening",
+        attendees_total_capacity=10,
+    )
+    return conference, schedule_item
+
+
+def test_days_are_served_from_the_snapshot(
+    locmem_cache, graphql_client, schedule, django_capture_on_commit_callbacks
+):
+    conference, schedule_item = schedule
+
+    def query_days():
+        with CaptureQueriesContext(connection) as queries:
+            response = graphql_client.query(
+                DAYS_QUERY, variables={"code": conference.code}
+            )
+
+        assert not response.get("errors")
+        return response["data"]["conference"], len(queries)
+
+    first_response, queries_building_snapshot = query_days()
+    second_response, queries_from_snapshot = query_days()
+
+    assert second_response == first_response
+    assert queries_from_snapshot < queries_building_snapshot
+    assert first_response["days"][0]["slots"][0]["items"][0]["title"] == "Opening"
+
+    with django_capture_on_commit_callbacks(execute=True):
+        schedule_item.title = "Welcome"
+        schedule_item.save()
+
+    updated_response, _ = query_days()
+
+    assert updated_response["scheduleVersion"] != first_response["scheduleVersion"]
+    assert updated_response["days"][0]["slots"][0]["items"][0]["title"] == "Welcome"
+
+
+def test_schedule_version_changes_when_rooms_change(
+    locmem_cache, schedule, room_factory, django_capture_on_commit_callbacks
+):
+    conference, schedule_item = schedule
+    version = get_schedule_version(conference.id)
+
+    assert get_schedule_version(conference.id) == version
+
+    with django_capture_on_commit_callbacks(execute=True):
+        schedule_item.rooms.add(room_factory())
+
+    assert get_schedule_version(conference.id) != version
+
+
+def test_schedule_version_only_changes_after_commit(
+    locmem_cache, schedule, django_capture_on_commit_callbacks
+):
+    conference, schedule_item = schedule
+    version = get_schedule_version(conference.id)
+
+    with django_capture_on_commit_callbacks(execute=False) as callbacks:
+        slot = schedule_item.slot
+        slot.hour = time(9, 0)
+        slot.save()
+
+        assert get_schedule_version(conference.id) == version
+
+    for callback in callbacks:
+        callback()
+
+    assert get_schedule_version(conference.id) != version
+
+
+def test_schedule_version_changes_when_submission_languages_change(
+    locmem_cache,
+    schedule,
+    submission_factory,
+    language,
+    django_capture_on_commit_callbacks,
+):
+    conference, schedule_item = schedule
+    submission = submission_factory(conference=conference, languages=["en"])
+    version = get_schedule_version(conference.id)
+
+    with django_capture_on_commit_callbacks(execute=True):
+        submission.languages.add(language("it"))
+
+    assert get_schedule_version(conference.id) != version
+    version = get_schedule_version(conference.id)
+
+    with django_capture_on_commit_callbacks(execute=True):
+        language("en").submission_set.remove(submission)
+
+    assert get_schedule_version(conference.id) != version
+
+
+def test_schedule_version_changes_when_a_speaker_changes(
+    locmem_cache,
+    schedule,
+    submission_factory,
+    django_capture_on_commit_callbacks,
+):
+    conference, schedule_item = schedule
+    submission = submission_factory(conference=conference)
+    schedule_item.submission = submission
+    schedule_item.type = ScheduleItem.TYPES.talk
+    schedule_item.save()
+    version = get_schedule_version(conference.id)
+
+    speaker = submission.speaker
+    with django_capture_on_commit_callbacks(execute=True):
+        speaker.save(update_fields=["last_login"])
+
+    assert get_schedule_version(conference.id) == version
+
+    with django_capture_on_commit_callbacks(execute=True):
+        speaker.full_name = "Marco Acierno"
+        speaker.save()
+
+    assert get_schedule_version(conference.id) != version
+
+
+def test_schedule_version_changes_when_the_submissions_of_a_language_are_cleared(
+    locmem_cache,
+    schedule,
+    submission_factory,
+    language,
+    django_capture_on_commit_callbacks,
+):
+    conference, schedule_item = schedule
+    submission_factory(conference=conference, languages=["en"])
+    version = get_schedule_version(conference.id)
+
+    with django_capture_on_commit_callbacks(execute=True):
+        language("en").submission_set.clear()
+
+    assert get_schedule_version(conference.id) != version
+
+
+def test_snapshot_is_not_shared_between_deploys(
+    locmem_cache, settings, schedule, mocker
+):
+    conference, _ = schedule
+    build_schedule_snapshot = mocker.patch(
+        "api.schedule.snapshot.build_schedule_snapshot",
+        return_value={"days": [], "loaders": {}},
+    )
+
+    settings.GITHASH = "first-deploy"
+    get_snapshot_format.cache_clear()
+    get_schedule_snapshot(conference)
+    get_schedule_snapshot(conference)
+
+    assert build_schedule_snapshot.call_count == 1
+
+    settings.GITHASH = "second-deploy"
+    get_snapshot_format.cache_clear()
+    get_schedule_snapshot(conference)
+
+    assert build_schedule_snapshot.call_count == 2
+    get_snapshot_format.cache_clear()
@@ -1,6 +1,5 @@
 from api.context import Info
 from api.participants.types import Participant
-from participants.models import Participant as ParticipantModel
 from typing import TYPE_CHECKING
 from api.languages.types import Language
 from datetime import datetime
@@ -53,47 +52,47 @@ class ScheduleItem:
         return self.attendees_total_capacity is not None
 
     @strawberry.field
-    def has_spaces_left(self) -> bool:
+    def has_spaces_left(self, info: Info) -> bool:
         if self.attendees_total_capacity is None:
             return True
 
-        return self.attendees_total_capacity - self.attendees.count() > 0
+        attendees_count = info.context.loaders.schedule_item_attendees_count.load(
+            self.id
+        )
+        return self.attendees_total_capacity - attendees_count > 0
 
     @strawberry.field
-    def spaces_left(self) -> int:
+    def spaces_left(self, info: Info) -> int:
         if self.attendees_total_capacity is None:
             return 0
 
-        return self.attendees_total_capacity - self.attendees.count()
+        attendees_count = info.context.loaders.schedule_item_attendees_count.load(
+            self.id
+        )
+        return self.attendees_total_capacity - attendees_count
 
     @strawberry.field
     def user_has_spot(self, info) -> bool:
-        user_id = info.context.request.user.id
-        return self.attendees.filter(user_id=user_id).exists()
+        return info.context.loaders.schedule_item_user_has_spot.load(self.id)
 
     @strawberry.field
     def speakers(self, info: Info) -> list[ScheduleItemUser]:
         speakers = []
 
-        # TODO: Find a better solution
-        participants_data = info.context._participants_data
-        if not participants_data:
-            participants_data = {
-                participant.user_id: participant
-                for participant in ParticipantModel.objects.filter(
-                    user_id__in=[speaker.id for speaker in self.speakers],
-                    conference_id=self.conference_id,
-                )
-            }
+        participants = info.context.loaders.participants
+        participants.schedule(
+            (self.conference_id, speaker.id) for speaker in self.speakers
+        )
 
         for speaker in self.speakers:
+            participant = participants.load((self.conference_id, speaker.id))
             speakers.append(
                 ScheduleItemUser(
                     id=speaker.id,
                     fullname=speaker.fullname,
                     full_name=speaker.full_name,
-                    participant=Participant.from_model(participants_data[speaker.id])
-                    if speaker.id in participants_data
+                    participant=Participant.from_model(participant)
+                    if participant
                     else None,
                 )
             )
@@ -113,7 +112,7 @@ class ScheduleItem:
 
     @strawberry.field
     def rooms(self, info) -> list[Room]:
-        return self.rooms.all()
+        return info.context.loaders.schedule_item_rooms.load(self.id)
 
     @strawberry.field
     def image(self, info) -> str | None:
@@ -128,4 +127,5 @@ class ScheduleItem:
             return self.slido_url
 
         # For multi-room items we use the first room slido url
-        return self.slot.day.added_rooms.get(room_id=self.rooms.first().id).slido_url
+        first_room = info.context.loaders.schedule_item_rooms.load(self.id)[0]
+        return info.context.loaders.slot_slido_urls.load(self.slot_id)[first_room.id]
@@ -2,6 +2,12 @@ import strawberry
 
 from api.participants.mutations import ParticipantMutations
 from .users.mutations import UsersMutations
+from .extensions import (
+    DocumentCacheExtension,
+    OperationMetricsExtension,
+    PretixRequestCacheExtension,
+    QueryCostExtension,
+)
 from .blob.schema import BlobMutation
 from .blog.schema import BlogQuery
 from .checklist.query import ChecklistQuery
@@ -71,4 +77,10 @@ class Mutation(
 schema = strawberry.Schema(
     query=Query,
     mutation=Mutation,
+    extensions=[
+        OperationMetricsExtension,
+        DocumentCacheExtension,
+        QueryCostExtension,
+        PretixRequestCacheExtension,
+    ],
 )
@@ -3,6 +3,7 @@ import re
 from typing import Annotated, Union, Optional
 
 import strawberry
+from django.db import transaction
 from strawberry import ID
 from strawberry.types import Info
 
@@ -309,11 +310,12 @@ class SubmissionsMutations:
         instance.previous_talk_video = input.previous_talk_video
         instance.short_social_summary = input.short_social_summary
         languages = Language.objects.filter(code__in=input.languages).all()
-        instance.languages.set(languages)
 
-        instance.tags.set(input.tags)
-
-        instance.save()
+        # The schedule snapshot is invalidated once all the changes are committed
+        with transaction.atomic():
+            instance.languages.set(languages)
+            instance.tags.set(input.tags)
+            instance.save()
 
         speaker_photo = input.speaker_photo
         if verify_azure_storage_url(
@@ -367,19 +369,24 @@ class SubmissionsMutations:
 
         input.clean()
 
-        instance = SubmissionModel.objects.create(
-            speaker_id=request.user.id,
-            conference=conference,
-            title=LazyI18nString(input.title.to_dict()),
-            abstract=LazyI18nString(input.abstract.to_dict()),
-            topic_id=input.topic,
-            type_id=input.type,
-            duration_id=input.duration,
-            elevator_pitch=LazyI18nString(input.elevator_pitch.to_dict()),
-            notes=input.notes,
-            audience_level_id=input.audience_level,
-            short_social_summary=input.short_social_summary,
-        )
+        languages = Language.objects.filter(code__in=input.languages).all()
+
+        with transaction.atomic():
+            instance = SubmissionModel.objects.create(
+                speaker_id=request.user.id,
+                conference=conference,
+                title=LazyI18nString(input.title.to_dict()),
+                abstract=LazyI18nString(input.abstract.to_dict()),
+                topic_id=input.topic,
+                type_id=input.type,
+                duration_id=input.duration,
+                elevator_pitch=LazyI18nString(input.elevator_pitch.to_dict()),
+                notes=input.notes,
+                audience_level_id=input.audience_level,
+                short_social_summary=input.short_social_summary,
+            )
+            instance.languages.set(languages)
+            instance.tags.set(input.tags)
 
         speaker_photo = input.speaker_photo
         if verify_azure_storage_url(
@@ -392,11 +399,6 @@ class SubmissionsMutations:
                 ),
             )
 
-        languages = Language.objects.filter(code__in=input.languages).all()
-
-        instance.languages.set(languages)
-        instance.tags.set(input.tags)
-
         Participant.objects.update_or_create(
             user_id=request.user.id,
             conference=conference,
@@ -13,7 +13,9 @@ class CanSeeSubmissionRestrictedFields(BasePermission):
         if HasTokenPermission().has_permission(source, info):
             return True
 
-        if source.schedule_items.exists():  # pragma: no cover
+        if info.context.loaders.submission_schedule_items.load(
+            source.id
+        ):  # pragma: no cover
             return True
 
         conference = source.conference
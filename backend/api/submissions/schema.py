@@ -1,9 +1,10 @@
-import random
+import base64
 import typing
 from api.context import Info
 from api.submissions.permissions import CanSeeSubmissionRestrictedFields
 
 import strawberry
+from django.db.models import Exists, OuterRef, Q
 
 from api.permissions import CanSeeSubmissions, IsAuthenticated
 from api.types import Paginated
@@ -12,11 +13,28 @@ from submissions.models import (
     Submission as SubmissionModel,
     SubmissionTag as SubmissionTagModel,
 )
-from voting.models.vote import Vote
+
+from voting.models import Vote as VoteModel
 
 from .types import Submission, SubmissionTag
 
 
+def _encode_voting_cursor(submission: SubmissionModel) -> str:
+    return base64.urlsafe_b64encode(
+        f"{submission.voting_order}:{submission.id}".encode()
+    ).decode()
+
+
+def _decode_voting_cursor(cursor: str) -> typing.Tuple[str, int]:
+    try:
+        voting_order, submission_id = (
+            base64.urlsafe_b64decode(cursor.encode()).decode().split(":")
+        )
+        return voting_order, int(submission_id)
+    except ValueError as e:
+        raise ValueError("Invalid cursor") from e
+
+
 @strawberry.type
 class SubmissionsQuery:
     @strawberry.field
@@ -47,7 +65,14 @@ class SubmissionsQuery:
         audience_levels: typing.Optional[list[str]] = None,
         page: typing.Optional[int] = 1,
         page_size: typing.Optional[int] = 50,
+        after: typing.Optional[str] = None,
     ) -> typing.Optional[Paginated[Submission]]:
+        """
+        Submissions are in a random order that is always the same for the
+        same user. Pass the `endCursor` of a page as `after` to get the next
+        one, `page` still works for jumping to a page and is ignored
+        when `after` is given.
+        """
         if page_size > 150:
             raise ValueError("Page size cannot be greater than 150")
 
@@ -65,31 +90,38 @@ class SubmissionsQuery:
 
         info.context._user_can_vote = True
 
-        qs = (
-            conference.submissions.prefetch_related(
-                "type",
-                "duration",
-                "schedule_items",
-                "languages",
-                "audience_level",
-                "tags",
-            )
-            .order_by("id")
-            .filter(status=SubmissionModel.STATUS.proposed)
-        )
+        # Filters on relations use subqueries instead of joins,
+        # so the results don't need to be made distinct
+        qs = conference.submissions.select_related(
+            "type",
+            "duration",
+            "audience_level",
+            "topic",
+        ).filter(status=SubmissionModel.STATUS.proposed)
 
         if languages:
-            qs = qs.filter(languages__code__in=languages)
+            qs = qs.filter(
+                Exists(
+                    SubmissionModel.languages.through.objects.filter(
+                        submission_id=OuterRef("id"), language__code__in=languages
+                    )
+                )
+            )
 
         if tags:
-            qs = qs.filter(tags__id__in=tags)
+            qs = qs.filter(
+                Exists(
+                    SubmissionModel.tags.through.objects.filter(
+                        submission_id=OuterRef("id"), submissiontag_id__in=tags
+                    )
+                )
+            )
 
-        if voted:
-            qs = qs.filter(votes__user_id=request.user.id)
-        elif voted is not None:
-            qs = qs.exclude(
-                id__in=[s.id for s in qs.filter(votes__user_id=request.user.id)]
+        if voted is not None:
+            user_votes = VoteModel.objects.filter(
+                submission_id=OuterRef("id"), user_id=request.user.id
             )
+            qs = qs.filter(Exists(user_votes) if voted else ~Exists(user_votes))
 
         if types:
             qs = qs.filter(type__id__in=types)
@@ -97,27 +129,30 @@ class SubmissionsQuery:
         if audience_levels:
             qs = qs.filter(audience_level__id__in=audience_levels)
 
-        qs = qs.distinct()
         total_items = qs.count()
-
-        # Randomize the order of the submissions
-        user = info.context.request.user
-
-        submissions = list(qs[(page - 1) * page_size : page * page_size])
-        random.Random(user.id).shuffle(submissions)
-
-        info.context._my_votes = {
-            vote.submission_id: vote
-            for vote in Vote.objects.filter(
-                user_id=request.user.id, submission__in=submissions
+        qs = qs.order_for_voting(request.user.id)
+
+        if after:
+            # The cursor is where the page starts, no offset on top of it
+            page = 1
+            voting_order, submission_id = _decode_voting_cursor(after)
+            submissions = list(
+                qs.filter(
+                    Q(voting_order__gt=voting_order)
+                    | Q(voting_order=voting_order, id__gt=submission_id)
+                )[:page_size]
             )
-        }
+        else:
+            submissions = list(qs[(page - 1) * page_size : page * page_size])
+
+        info.context.loaders.schedule_submissions(submissions)
 
         return Paginated.paginate_list(
             items=submissions,
             page_size=page_size,
             total_items=total_items,
             page=page,
+            end_cursor=_encode_voting_cursor(submissions[-1]) if submissions else None,
         )
 
     @strawberry.field
@@ -1,4 +1,6 @@
 import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 
 pytestmark = pytest.mark.django_db
 
@@ -26,14 +28,101 @@ def test_returns_submissions_paginated(graphql_client, user, submission_factory)
     )
 
     assert not resp.get("errors")
-    assert resp["data"]["submissions"]["items"] == [{"id": submission.hashid}]
     assert resp["data"]["submissions"]["pageInfo"] == {"totalPages": 2, "totalItems": 2}
 
     resp_2 = graphql_client.query(
         query,
         variables={"code": submission.conference.code, "page": 2},
     )
-    assert resp_2["data"]["submissions"]["items"] == [{"id": submission_2.hashid}]
+
+    # Pages are slices of the same (random) order
+    assert resp["data"]["submissions"]["items"] + resp_2["data"]["submissions"][
+        "items"
+    ] in (
+        [{"id": submission.hashid}, {"id": submission_2.hashid}],
+        [{"id": submission_2.hashid}, {"id": submission.hashid}],
+    )
+
+
+def test_paginate_submissions_with_cursor(graphql_client, user, submission_factory):
+    graphql_client.force_login(user)
+
+    submission = submission_factory(speaker_id=user.id)
+    for _ in range(4):
+        submission_factory(conference=submission.conference)
+
+    query = """query Submissions($code: String!, $page: Int, $after: String) {
+        submissions(code: $code, page: $page, after: $after, pageSize: 2) {
+            pageInfo {
+                totalItems
+                endCursor
+            }
+            items {
+                id
+            }
+        }
+    }"""
+
+    pages = []
+    after = None
+
+    for page in range(1, 4):
+        resp = graphql_client.query(
+            query,
+            variables={"code": submission.conference.code, "after": after},
+        )
+        offset_resp = graphql_client.query(
+            query,
+            variables={"code": submission.conference.code, "page": page},
+        )
+
+        assert not resp.get("errors")
+        assert resp["data"]["submissions"]["pageInfo"]["totalItems"] == 5
+        assert (
+            resp["data"]["submissions"]["items"]
+            == (offset_resp["data"]["submissions"]["items"])
+        )
+
+        pages.append(resp["data"]["submissions"]["items"])
+        after = resp["data"]["submissions"]["pageInfo"]["endCursor"]
+
+    ids = [item["id"] for page in pages for item in page]
+
+    assert [len(page) for page in pages] == [2, 2, 1]
+    assert len(set(ids)) == 5
+
+
+def test_page_is_ignored_with_a_cursor(graphql_client, user, submission_factory):
+    graphql_client.force_login(user)
+
+    submission = submission_factory(speaker_id=user.id)
+    for _ in range(5):
+        submission_factory(conference=submission.conference)
+
+    query = """query Submissions($code: String!, $page: Int, $after: String) {
+        submissions(code: $code, page: $page, after: $after, pageSize: 2) {
+            pageInfo {
+                endCursor
+            }
+            items {
+                id
+            }
+        }
+    }"""
+    code = submission.conference.code
+
+    first_page = graphql_client.query(query, variables={"code": code})
+    after = first_page["data"]["submissions"]["pageInfo"]["endCursor"]
+    second_page = graphql_client.query(query, variables={"code": code, "page": 2})
+    resp = graphql_client.query(
+        query, variables={"code": code, "after": after, "page": 3}
+    )
+
+    assert not resp.get("errors")
+    assert (
+        resp["data"]["submissions"]["items"]
+        == second_page["data"]["submissions"]["items"]
+    )
 
 
 def test_page_size_cannot_be_less_than_1(graphql_client, user, submission_factory):
@@ -280,3 +369,44 @@ def test_filter_by_audience_level(
 
     assert not resp.get("errors")
     assert resp["data"]["submissions"]["items"] == [{"id": submission.hashid}]
+
+
+def test_submissions_run_a_constant_number_of_queries(
+    graphql_client, user, submission_factory, vote_factory, mock_has_ticket
+):
+    graphql_client.force_login(user)
+    submission = submission_factory(tags=["a", "b"])
+    conference = submission.conference
+    mock_has_ticket(conference)
+    vote_factory(user_id=user.id, submission=submission)
+
+    def query_submissions():
+        with CaptureQueriesContext(connection) as queries:
+            resp = graphql_client.query(
+                """query Submissions($code: String!) {
+                    submissions(code: $code) {
+                        items {
+                            id
+                            topic { name }
+                            type { name }
+                            languages { code }
+                            tags { name }
+                            scheduleItems { id }
+                            myVote { value }
+                            speaker { fullName }
+                        }
+                    }
+                }""",
+                variables={"code": conference.code},
+            )
+
+        assert not resp.get("errors")
+        return len(queries)
+
+    queries_with_one_submission = query_submissions()
+
+    for _ in range(3):
+        other_submission = submission_factory(conference=conference, tags=["c"])
+        vote_factory(user_id=user.id, submission=other_submission)
+
+    assert query_submissions() == queries_with_one_submission
@@ -8,8 +8,6 @@ from api.languages.types import Language
 from api.voting.types import VoteType
 from i18n.strings import LazyI18nString
 
-from voting.models import Vote
-
 from .permissions import CanSeeSubmissionPrivateFields, CanSeeSubmissionRestrictedFields
 from typing import TYPE_CHECKING, Annotated
 
@@ -82,7 +80,7 @@ class Submission:
     def schedule_items(
         self, info: Info
     ) -> List[Annotated["ScheduleItem", strawberry.lazy("api.schedule.types")]]:
-        return self.schedule_items.all()
+        return info.context.loaders.submission_schedule_items.load(self.id)
 
     @strawberry.field
     def multilingual_elevator_pitch(self, info: Info) -> Optional[MultiLingualString]:
@@ -115,10 +113,12 @@ class Submission:
         ):
             return None
 
+        speaker = info.context.loaders.users.load(self.speaker_id)
+
         return SubmissionSpeaker(
             id=self.speaker_id,
-            full_name=self.speaker.full_name,
-            gender=self.speaker.gender,
+            full_name=speaker.full_name,
+            gender=speaker.gender,
         )
 
     @strawberry.field
@@ -136,21 +136,15 @@ class Submission:
         if not request.user.is_authenticated:
             return None
 
-        if info.context._my_votes is not None:
-            return info.context._my_votes.get(self.id)
-
-        try:
-            return self.votes.get(user_id=request.user.id)
-        except Vote.DoesNotExist:
-            return None
+        return info.context.loaders.my_votes.load(self.id)
 
     @strawberry.field
     def languages(self, info) -> Optional[List[Language]]:
-        return self.languages.all()
+        return info.context.loaders.submission_languages.load(self.id)
 
     @strawberry.field
     def tags(self, info) -> Optional[List[SubmissionTag]]:
-        return self.tags.all()
+        return info.context.loaders.submission_tags.load(self.id)
 
 
 @strawberry.type
@@ -1,3 +1,4 @@
+import openpyxl
 import tablib
 from badge_scanner.models import BadgeScan, BadgeScanExport
 from users.tests.factories import UserFactory
@@ -9,9 +10,13 @@ pytestmark = pytest.mark.django_db
 def _export_badge_scans_mutation(graphql_client, variables):
     return graphql_client.query(
         """
-        mutation ExportBadgeScans($conferenceCode: String!) {
-            exportBadgeScans(conferenceCode: $conferenceCode) {
+        mutation ExportBadgeScans(
+            $conferenceCode: String!
+            $format: BadgeScanExportFormat! = CSV
+        ) {
+            exportBadgeScans(conferenceCode: $conferenceCode, format: $format) {
                 id
+                status
                 url
             }
         }
@@ -20,6 +25,22 @@ def _export_badge_scans_mutation(graphql_client, variables):
     )
 
 
+def _badge_scan_export_query(graphql_client, id):
+    return graphql_client.query(
+        """
+        query BadgeScanExport($id: ID!) {
+            badgeScanExport(id: $id) {
+                id
+                status
+                format
+                url
+            }
+        }
+        """,
+        variables={"id": id},
+    )
+
+
 def test_raises_an_error_when_user_is_not_authenticated(graphql_client, conference):
     resp = _export_badge_scans_mutation(
         graphql_client,
@@ -32,7 +53,9 @@ def test_raises_an_error_when_user_is_not_authenticated(graphql_client, conferen
     assert resp["errors"][0]["message"] == "User not logged in"
 
 
-def test_works_when_user_is_logged_in(user, graphql_client, conference):
+def test_works_when_user_is_logged_in(
+    user, graphql_client, conference, django_capture_on_commit_callbacks
+):
     graphql_client.force_login(user)
 
     badge_scan = BadgeScan.objects.create(
@@ -53,19 +76,32 @@ def test_works_when_user_is_logged_in(user, graphql_client, conference):
         notes="",
     )
 
-    resp = _export_badge_scans_mutation(
-        graphql_client,
-        variables={
-            "conferenceCode": conference.code,
-        },
-    )
+    with django_capture_on_commit_callbacks(execute=True):
+        resp = _export_badge_scans_mutation(
+            graphql_client,
+            variables={
+                "conferenceCode": conference.code,
+            },
+        )
 
     assert "errors" not in resp
 
     badge_scan_export = BadgeScanExport.objects.get()
 
-    assert resp["data"]["exportBadgeScans"]["id"] == str(badge_scan_export.id)
-    assert resp["data"]["exportBadgeScans"]["url"] == badge_scan_export.file.url
+    assert resp["data"]["exportBadgeScans"] == {
+        "id": str(badge_scan_export.id),
+        "status": "PENDING",
+        "url": None,
+    }
+
+    resp = _badge_scan_export_query(graphql_client, str(badge_scan_export.id))
+
+    assert resp["data"]["badgeScanExport"] == {
+        "id": str(badge_scan_export.id),
+        "status": "COMPLETED",
+        "format": "CSV",
+        "url": badge_scan_export.file.url,
+    }
 
     data = tablib.Dataset().load(badge_scan_export.file.read().decode("utf-8"))
 
@@ -78,3 +114,73 @@ def test_works_when_user_is_logged_in(user, graphql_client, conference):
     )
 
     assert len(data) == 1
+
+
+def test_export_as_xlsx(
+    user, graphql_client, conference, django_capture_on_commit_callbacks
+):
+    graphql_client.force_login(user)
+
+    BadgeScan.objects.create(
+        scanned_by_id=user.id,
+        scanned_user=UserFactory(),
+        badge_url="https://pycon.it/b/this-is-a-test",
+        attendee_name="Marco",
+        attendee_email="example@example.com",
+        conference=conference,
+        notes="Notes",
+    )
+
+    with django_capture_on_commit_callbacks(execute=True):
+        resp = _export_badge_scans_mutation(
+            graphql_client,
+            variables={"conferenceCode": conference.code, "format": "XLSX"},
+        )
+
+    assert "errors" not in resp
+
+    badge_scan_export = BadgeScanExport.objects.get()
+
+    assert badge_scan_export.status == BadgeScanExport.Status.COMPLETED
+    assert badge_scan_export.file.name.endswith(".xlsx")
+
+    sheet = openpyxl.load_workbook(badge_scan_export.file).active
+    rows = list(sheet.values)
+
+    assert rows[0] == ("Created", "Attendee Name", "Attendee Email", "Notes")
+    assert rows[1][1:] == ("Marco", "example@example.com", "Notes")
+    assert len(rows) == 2
+
+
+def test_cannot_see_exports_of_other_users(user, graphql_client, conference):
+    graphql_client.force_login(user)
+    badge_scan_export = BadgeScanExport.objects.create(
+        conference=conference, requested_by=UserFactory()
+    )
+
+    resp = _badge_scan_export_query(graphql_client, str(badge_scan_export.id))
+
+    assert resp["data"]["badgeScanExport"] is None
+
+
+def test_export_starts_after_the_commit(
+    user, graphql_client, conference, django_capture_on_commit_callbacks, mocker
+):
+    graphql_client.force_login(user)
+    export_badge_scans = mocker.patch(
+        "api.badge_scanner.mutation.tasks.export_badge_scans"
+    )
+
+    with django_capture_on_commit_callbacks() as callbacks:
+        _export_badge_scans_mutation(
+            graphql_client, variables={"conferenceCode": conference.code}
+        )
+
+        export_badge_scans.delay.assert_not_called()
+
+    assert len(callbacks) == 1
+    callbacks[0]()
+
+    export_badge_scans.delay.assert_called_once_with(
+        badge_scan_export_id=BadgeScanExport.objects.get().id
+    )
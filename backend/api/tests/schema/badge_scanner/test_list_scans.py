@@ -76,7 +76,7 @@ def test_can_paginate(user, graphql_client, conference):
         scanned_by_id=user.id,
         conference=conference,
         scanned_user=UserFactory(),
-        badge_url="https://foo.bar",
+        badge_url="https://foo.bar/a",
         notes="",
     )
 
@@ -84,7 +84,7 @@ def test_can_paginate(user, graphql_client, conference):
         scanned_by_id=user.id,
         conference=conference,
         scanned_user=UserFactory(),
-        badge_url="https://foo.bar",
+        badge_url="https://foo.bar/b",
         notes="",
     )
 
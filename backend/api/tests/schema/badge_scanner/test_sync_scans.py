@@ -0,0 +1,195 @@
+from datetime import datetime, timezone
+
+import pytest
+
+from api.helpers.ids import encode_hashid
+from badge_scanner.models import BadgeScan
+from users.tests.factories import UserFactory
+
+pytestmark = pytest.mark.django_db
+
+
+def _sync_badge_scans_mutation(graphql_client, variables):
+    return graphql_client.query(
+        """
+        mutation SyncBadgeScans($input: SyncBadgeScansInput!) {
+            syncBadgeScans(input: $input) {
+                __typename
+                ... on SyncBadgeScansResult {
+                    scans {
+                        attendee {
+                            fullName
+                            email
+                        }
+                        notes
+                        created
+                    }
+                    errors {
+                        url
+                        message
+                    }
+                }
+                ... on ScanError {
+                    message
+                }
+            }
+        }
+        """,
+        variables=variables,
+    )
+
+
+def test_sync_badge_scans(user, graphql_client, conference, mocker):
+    scanned_user = UserFactory.create(email="barko@marco.pizza")
+    graphql_client.force_login(user)
+    get_order_positions = mocker.patch(
+        "api.badge_scanner.mutation.pretix.get_order_positions",
+        return_value={
+            "1": {"attendee_name": "Barko", "attendee_email": "barko@marco.pizza"},
+            "2": {"attendee_name": "Other", "attendee_email": "other@example.org"},
+        },
+    )
+    BadgeScan.objects.create(
+        scanned_by=user,
+        conference=conference,
+        badge_url=f"https://pycon.it/b/{encode_hashid(2)}",
+        attendee_name="Other",
+        attendee_email="other@example.org",
+        notes="Scanned online",
+    )
+
+    resp = _sync_badge_scans_mutation(
+        graphql_client,
+        variables={
+            "input": {
+                "conferenceCode": conference.code,
+                "scans": [
+                    {
+                        "url": f"https://pycon.it/b/{encode_hashid(1)}",
+                        "scannedAt": "2023-05-25T10:00:00+00:00",
+                        "notes": "Likes Python",
+                    },
+                    {
+                        "url": f"https://pycon.it/b/{encode_hashid(1)}",
+                        "scannedAt": "2023-05-25T11:00:00+00:00",
+                    },
+                    {
+                        "url": f"https://pycon.it/b/{encode_hashid(2)}",
+                        "scannedAt": "2023-05-25T12:00:00+00:00",
+                        "notes": "Offline notes",
+                    },
+                    {
+                        "url": f"https://pycon.it/b/{encode_hashid(3)}",
+                        "scannedAt": "2023-05-25T12:00:00+00:00",
+                    },
+                    {"url": "https://foo.bar", "scannedAt": "2023-05-25T12:00:00"},
+                ],
+            }
+        },
+    )
+
+    assert "errors" not in resp
+    result = resp["data"]["syncBadgeScans"]
+    assert [scan["notes"] for scan in result["scans"]] == [
+        "Likes Python",
+        "Scanned online",
+    ]
+    assert result["errors"] == [
+        {"url": "https://foo.bar", "message": "URL is not valid"},
+        {"url": f"https://pycon.it/b/{encode_hashid(3)}", "message": "Badge not found"},
+    ]
+
+    get_order_positions.assert_called_once()
+    assert set(get_order_positions.call_args.args[1]) == {"1", "2", "3"}
+
+    offline_scan = BadgeScan.objects.get(badge_url__endswith=encode_hashid(1))
+    assert offline_scan.scanned_user_id == scanned_user.id
+    assert offline_scan.created == datetime(2023, 5, 25, 10, tzinfo=timezone.utc)
+    assert BadgeScan.objects.count() == 2
+
+
+def test_sync_badge_scans_requires_login(graphql_client, conference):
+    resp = _sync_badge_scans_mutation(
+        graphql_client,
+        variables={"input": {"conferenceCode": conference.code, "scans": []}},
+    )
+
+    assert resp["errors"][0]["message"] == "User not logged in"
+
+
+def test_sync_badge_scans_without_offset(
+    user, graphql_client, conference_factory, mocker
+):
+    conference = conference_factory(timezone="Europe/Rome")
+    graphql_client.force_login(user)
+    mocker.patch(
+        "api.badge_scanner.mutation.pretix.get_order_positions",
+        return_value={
+            "1": {"attendee_name": "Barko", "attendee_email": "barko@marco.pizza"},
+        },
+    )
+    url = f"https://pycon.it/b/{encode_hashid(1)}"
+
+    resp = _sync_badge_scans_mutation(
+        graphql_client,
+        variables={
+            "input": {
+                "conferenceCode": conference.code,
+                "scans": [
+                    {"url": url, "scannedAt": "2023-05-25T10:00:00+00:00"},
+                    {"url": url, "scannedAt": "2023-05-25T11:00:00"},
+                ],
+            }
+        },
+    )
+
+    assert "errors" not in resp
+    assert resp["data"]["syncBadgeScans"]["errors"] == []
+    # 11:00 in Rome is 09:00 UTC
+    assert BadgeScan.objects.get().created == datetime(
+        2023, 5, 25, 9, tzinfo=timezone.utc
+    )
+
+
+def test_sync_badge_scans_with_urls_that_are_not_badges(
+    user, graphql_client, conference, mocker
+):
+    graphql_client.force_login(user)
+    mocker.patch(
+        "api.badge_scanner.mutation.pretix.get_order_positions",
+        return_value={
+            "1": {"attendee_name": "Barko", "attendee_email": "barko@marco.pizza"},
+        },
+    )
+    url = f"https://pycon.it/b/{encode_hashid(1)}"
+
+    resp = _sync_badge_scans_mutation(
+        graphql_client,
+        variables={
+            "input": {
+                "conferenceCode": conference.code,
+                "scans": [
+                    {
+                        "url": "https://pycon.it/b/ABCD",
+                        "scannedAt": "2023-05-25T10:00:00",
+                    },
+                    {"url": url, "scannedAt": "2023-05-25T10:00:00+00:00"},
+                    {
+                        "url": "https://pycon.it/b/1234",
+                        "scannedAt": "2023-05-25T10:00:00",
+                    },
+                ],
+            }
+        },
+    )
+
+    assert "errors" not in resp
+    result = resp["data"]["syncBadgeScans"]
+    assert [scan["attendee"]["email"] for scan in result["scans"]] == [
+        "barko@marco.pizza"
+    ]
+    assert result["errors"] == [
+        {"url": "https://pycon.it/b/ABCD", "message": "URL is not valid"},
+        {"url": "https://pycon.it/b/1234", "message": "URL is not valid"},
+    ]
+    assert BadgeScan.objects.get().badge_url == url
@@ -1,8 +1,12 @@
 from datetime import date, datetime, time
 
 import pytz
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 from pytest import mark
 
+from schedule.models import DayRoomThroughModel, ScheduleItem
+
 
 @mark.django_db
 def test_get_days_with_configuration(
@@ -203,3 +207,77 @@ def test_filter_days_by_room_not_found(
 
     assert "errors" not in resp
     assert len(resp["data"]["conference"]["days"][0]["slots"]) == 0
+
+
+@mark.django_db
+def test_days_items_run_a_constant_number_of_queries(
+    conference_factory,
+    day_factory,
+    slot_factory,
+    graphql_client,
+    schedule_item_factory,
+    schedule_item_attendee_factory,
+    submission_factory,
+    room_factory,
+    user,
+):
+    graphql_client.force_login(user)
+    conference = conference_factory(
+        start=datetime(2020, 4, 2, tzinfo=pytz.UTC),
+        end=datetime(2020, 4, 2, tzinfo=pytz.UTC),
+    )
+    day = day_factory(conference=conference, day=date(2020, 4, 2))
+    room = room_factory()
+    DayRoomThroughModel.objects.create(day=day, room=room, slido_url="https://sli.do")
+
+    def add_talk(hour):
+        schedule_item = schedule_item_factory(
+            conference=conference,
+            slot=slot_factory(day=day, hour=hour, duration=60),
+            type=ScheduleItem.TYPES.talk,
+            submission=submission_factory(conference=conference),
+            rooms=[room],
+            attendees_total_capacity=10,
+        )
+        schedule_item_attendee_factory(schedule_item=schedule_item, user=user)
+
+    def query_days():
+        with CaptureQueriesContext(connection) as queries:
+            resp = graphql_client.query(
+                """
+                query($code: String!) {
+                    conference(code: $code) {
+                        days {
+                            slots {
+                                items {
+                                    title
+                                    rooms { name }
+                                    hasSpacesLeft
+                                    spacesLeft
+                                    userHasSpot
+                                    slidoUrl
+                                    speakers { fullName participant { bio } }
+                                    submission {
+                                        languages { code }
+                                        tags { name }
+                                        scheduleItems { id }
+                                    }
+                                }
+                            }
+                        }
+                    }
+                }
+                """,
+                variables={"code": conference.code},
+            )
+
+        assert "errors" not in resp
+        return len(queries)
+
+    add_talk(time(8, 45))
+    queries_with_one_item = query_days()
+
+    add_talk(time(9, 45))
+    add_talk(time(10, 45))
+
+    assert query_days() == queries_with_one_item
@@ -1,5 +1,7 @@
 import datetime
 import time_machine
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 from django.utils import timezone
 from pytest import mark
 
@@ -237,3 +239,100 @@ def test_keynote_schedule_info(
     assert keynote_data["end"] == "2023-10-10T10:30:00"
     assert keynote_data["youtubeVideoId"] == "abc123"
     assert [room["name"] for room in keynote_data["rooms"]] == ["Room 1", "Room 2"]
+
+
+@mark.django_db
+def test_keynotes_run_a_constant_number_of_queries(
+    conference_factory,
+    keynote_factory,
+    keynote_speaker_factory,
+    graphql_client,
+    topic_factory,
+    participant_factory,
+    schedule_item_factory,
+    room_factory,
+    slot_factory,
+    day_factory,
+):
+    conference = conference_factory()
+    day = day_factory(day=datetime.date(2023, 10, 10), conference=conference)
+
+    def add_keynote():
+        keynote = keynote_factory(conference=conference, topic=topic_factory())
+        speaker = keynote_speaker_factory(keynote=keynote)
+        participant_factory(user_id=speaker.user_id, conference_id=conference.id)
+        schedule_item_factory(
+            conference=conference,
+            type=ScheduleItem.TYPES.keynote,
+            keynote=keynote,
+            submission=None,
+            slot=slot_factory(day=day, hour="10:00", duration=30),
+            rooms=[room_factory()],
+        )
+
+    def query_keynotes():
+        with CaptureQueriesContext(connection) as queries:
+            resp = graphql_client.query(
+                """
+                query($code: String!) {
+                    conference(code: $code) {
+                        keynotes {
+                            title(language: "en")
+                            topic { name }
+                            start
+                            rooms { name }
+                            speakers { fullName participant { bio } }
+                        }
+                    }
+                }
+                """,
+                variables={"code": conference.code},
+            )
+
+        assert "errors" not in resp
+        return len(queries)
+
+    add_keynote()
+    queries_with_one_keynote = query_keynotes()
+
+    add_keynote()
+    add_keynote()
+
+    assert query_keynotes() == queries_with_one_keynote
+
+
+@mark.django_db
+def test_get_conference_keynotes_of_speaker_without_participant(
+    conference_factory, keynote_factory, keynote_speaker_factory, graphql_client
+):
+    conference = conference_factory()
+    keynote = keynote_factory(
+        conference=conference,
+        published=timezone.datetime(
+            1995, 12, 1, 5, 10, 3, tzinfo=datetime.timezone.utc
+        ),
+    )
+    speaker = keynote_speaker_factory(keynote=keynote)
+
+    resp = graphql_client.query(
+        """
+        query($code: String!) {
+            conference(code: $code) {
+                keynotes {
+                    speakers {
+                        id
+                        participant {
+                            bio
+                        }
+                    }
+                }
+            }
+        }
+        """,
+        variables={"code": conference.code},
+    )
+
+    assert "errors" not in resp
+    assert resp["data"]["conference"]["keynotes"][0]["speakers"] == [
+        {"id": str(speaker.user_id), "participant": None}
+    ]
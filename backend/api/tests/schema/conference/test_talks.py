@@ -1,3 +1,5 @@
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 from pytest import mark
 from schedule.models import ScheduleItem
 
@@ -24,3 +26,60 @@ def test_get_all_talks(conference_factory, schedule_item_factory, graphql_client
 
     assert "errors" not in resp
     assert resp["data"]["conference"]["talks"] == [{"title": item.title}]
+
+
+@mark.django_db
+def test_talks_run_a_constant_number_of_queries(
+    conference_factory,
+    schedule_item_factory,
+    submission_factory,
+    room_factory,
+    slot_factory,
+    day_factory,
+    graphql_client,
+):
+    conference = conference_factory()
+    day = day_factory(conference=conference)
+
+    def add_talk():
+        schedule_item_factory(
+            type=ScheduleItem.TYPES.submission,
+            conference=conference,
+            submission=submission_factory(conference=conference),
+            slot=slot_factory(day=day, hour="10:00", duration=30),
+            rooms=[room_factory()],
+        )
+
+    def query_talks():
+        with CaptureQueriesContext(connection) as queries:
+            resp = graphql_client.query(
+                """
+                query($code: String!) {
+                    conference(code: $code) {
+                        talks {
+                            title
+                            start
+                            end
+                            abstract
+                            rooms { name }
+                            hasSpacesLeft
+                            speakers { fullName participant { bio } }
+                            language { code }
+                            submission { languages { code } }
+                        }
+                    }
+                }
+                """,
+                variables={"code": conference.code},
+            )
+
+        assert "errors" not in resp
+        return len(queries)
+
+    add_talk()
+    queries_with_one_talk = query_talks()
+
+    add_talk()
+    add_talk()
+
+    assert query_talks() == queries_with_one_talk
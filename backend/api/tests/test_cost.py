@@ -0,0 +1,100 @@
+import pytest
+from graphql import parse
+
+from api.cost import get_operation_cost
+from api.schema import schema
+
+pytestmark = pytest.mark.django_db
+
+TICKETS_AND_DAYS_QUERY = """
+query($code: String!) {
+    conference(code: $code) {
+        tickets(language: "en") { id }
+        ...Days
+    }
+}
+
+fragment Days on Conference {
+    days {
+        day
+        slots { hour }
+    }
+}
+"""
+
+
+def test_operation_cost(settings):
+    settings.GRAPHQL_DEFAULT_LIST_SIZE = 10
+
+    operation_cost = get_operation_cost(
+        schema._schema, parse(TICKETS_AND_DAYS_QUERY), variables={"code": "code"}
+    )
+
+    # conference (1) + tickets (100 + 10 * 0) + days (10 + 10 * (slots (1 + 10 * 0)))
+    assert operation_cost.cost == 1 + 100 + 20
+    assert operation_cost.depth == 4
+
+
+def test_expensive_operations_are_rejected(
+    graphql_client, conference_factory, settings, mocker
+):
+    settings.GRAPHQL_MAX_QUERY_COST = 100
+    conference = conference_factory()
+    get_conference_tickets = mocker.patch(
+        "api.conferences.types.get_conference_tickets", return_value=[]
+    )
+
+    response = graphql_client.query(
+        TICKETS_AND_DAYS_QUERY, variables={"code": conference.code}
+    )
+
+    assert response["data"] is None
+    assert response["errors"][0]["message"] == (
+        "Query cost 121 exceeds the maximum of 100"
+    )
+    get_conference_tickets.assert_not_called()
+
+
+def test_deep_operations_are_rejected(graphql_client, conference_factory, settings):
+    settings.GRAPHQL_MAX_QUERY_DEPTH = 3
+    conference = conference_factory()
+
+    response = graphql_client.query(
+        TICKETS_AND_DAYS_QUERY, variables={"code": conference.code}
+    )
+
+    assert response["errors"][0]["message"] == (
+        "Query depth 4 exceeds the maximum of 3"
+    )
+
+
+def test_clients_over_their_budget_are_throttled(
+    graphql_client, conference_factory, settings, mocker, locmem_cache
+):
+    settings.GRAPHQL_COST_BUDGET = 150
+    conference = conference_factory()
+    mocker.patch("api.conferences.types.get_conference_tickets", return_value=[])
+
+    first = graphql_client.query(
+        TICKETS_AND_DAYS_QUERY, variables={"code": conference.code}
+    )
+    second = graphql_client.query(
+        TICKETS_AND_DAYS_QUERY, variables={"code": conference.code}
+    )
+
+    assert not first.get("errors")
+    assert second["errors"][0]["message"] == "Query cost budget exceeded, retry later"
+
+
+def test_operation_cost_in_metrics(
+    graphql_client, conference_factory, settings, mocker
+):
+    settings.GRAPHQL_METRICS_IN_RESPONSE = True
+    conference = conference_factory()
+    mocker.patch("api.conferences.types.get_conference_tickets", return_value=[])
+
+    response = graphql_client.query(
+        TICKETS_AND_DAYS_QUERY, variables={"code": conference.code}
+    )
+
+    assert response["extensions"]["metrics"]["cost"] == 121
@@ -0,0 +1,143 @@
+import json
+import logging
+
+import pytest
+
+from api import extensions
+from api.extensions import CachedDocument, DocumentCache, DocumentCacheExtension
+from helpers.metrics import record_http_call
+
+pytestmark = pytest.mark.django_db
+
+
+def test_operation_metrics_in_response(graphql_client, conference_factory, settings):
+    settings.GRAPHQL_METRICS_IN_RESPONSE = True
+    conference = conference_factory(topics=["Web", "Data"])
+
+    response = graphql_client.query(
+        """query Topics($code: String!) {
+            conference(code: $code) {
+                topics { name }
+            }
+        }""",
+        variables={"code": conference.code},
+    )
+
+    assert not response.get("errors")
+    metrics = response["extensions"]["metrics"]
+    assert metrics["operation"] == "Topics"
+    assert metrics["sql"]["count"] == sum(
+        resolver["sql_count"] for resolver in metrics["resolvers"].values()
+    )
+    assert metrics["resolvers"]["conference.topics"]["sql_count"] == 1
+    # Fields without a resolver are not timed
+    assert "conference.topics.name" not in metrics["resolvers"]
+
+
+def test_operation_metrics_not_in_response_by_default(
+    graphql_client, conference_factory, settings
+):
+    settings.GRAPHQL_METRICS_IN_RESPONSE = False
+    conference = conference_factory()
+
+    response = graphql_client.query(
+        """query($code: String!) { conference(code: $code) { code } }""",
+        variables={"code": conference.code},
+    )
+
+    assert "extensions" not in response
+
+
+def test_operation_metrics_record_http_calls(
+    graphql_client, conference_factory, settings, mocker
+):
+    settings.GRAPHQL_METRICS_IN_RESPONSE = True
+    conference = conference_factory()
+
+    def get_voucher(conference, code):
+        record_http_call("pretix", 0.01)
+        return None
+
+    mocker.patch("api.conferences.types.get_voucher", side_effect=get_voucher)
+
+    response = graphql_client.query(
+        """query($code: String!) {
+            conference(code: $code) { voucher(code: "ABC") { id } }
+        }""",
+        variables={"code": conference.code},
+    )
+
+    assert response["extensions"]["metrics"]["http"] == {
+        "pretix": {"count": 1, "time": 10.0}
+    }
+
+
+def test_operations_with_too_many_queries_are_logged_as_warnings(
+    graphql_client, conference_factory, settings, mocker
+):
+    settings.GRAPHQL_METRICS_MAX_QUERIES = 0
+    conference = conference_factory()
+    log = mocker.patch("api.extensions.logger.log")
+
+    graphql_client.query(
+        """query($code: String!) { conference(code: $code) { code } }""",
+        variables={"code": conference.code},
+    )
+
+    log.assert_called_once()
+    level, _, report = log.call_args.args
+    assert level == logging.WARNING
+    assert json.loads(report)["sql"]["count"] > 0
+
+
+def test_documents_are_parsed_once(
+    graphql_client, conference_factory, settings, mocker
+):
+    settings.GRAPHQL_METRICS_IN_RESPONSE = True
+    conference = conference_factory()
+    mocker.patch.object(DocumentCacheExtension, "cache", DocumentCache(maxsize=10))
+    parse_document = mocker.patch(
+        "api.extensions.parse_document", wraps=extensions.parse_document
+    )
+    validate_document = mocker.patch(
+        "api.extensions.validate_document", wraps=extensions.validate_document
+    )
+
+    responses = [
+        graphql_client.query(
+            """query($code: String!) { conference(code: $code) { code } }""",
+            variables={"code": conference.code},
+        )
+        for _ in range(3)
+    ]
+
+    assert parse_document.call_count == 1
+    assert validate_document.call_count == 1
+    assert all(
+        response["data"]["conference"]["code"] == conference.code
+        for response in responses
+    )
+    assert responses[0]["extensions"]["metrics"]["caches"]["graphql_document"] == {
+        "hits": 0,
+        "misses": 1,
+    }
+    assert responses[2]["extensions"]["metrics"]["caches"]["graphql_document"] == {
+        "hits": 1,
+        "misses": 0,
+    }
+    assert DocumentCacheExtension.cache.info()["hit_rate"] == round(2 / 3, 4)
+
+
+def test_document_cache_evicts_least_recently_used():
+    cache = DocumentCache(maxsize=2)
+    cache.set("a", CachedDocument(document=None))
+    cache.set("b", CachedDocument(document=None))
+
+    assert cache.get("a") is not None
+
+    cache.set("c", CachedDocument(document=None))
+
+    assert cache.get("b") is None
+    assert cache.get("a") is not None
+    assert cache.get("c") is not None
+    assert cache.info()["size"] == 2
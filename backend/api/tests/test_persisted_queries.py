@@ -0,0 +1,192 @@
+import json
+
+import pytest
+from django.core.management import call_command
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from api import extensions
+from api.extensions import DocumentCache, DocumentCacheExtension
+from api.models import PersistedQuery
+from api.persisted_queries import _get_registered_query, get_query_hash
+
+pytestmark = pytest.mark.django_db
+
+QUERY = """query ConferenceCode($code: String!) {
+  conference(code: $code) {
+    code
+  }
+}"""
+
+
+@pytest.fixture(autouse=True)
+def clear_registered_queries():
+    _get_registered_query.cache_clear()
+    yield
+    _get_registered_query.cache_clear()
+
+
+def _get(client, query_hash, variables, query=None, **headers):
+    params = {
+        "operationName": "ConferenceCode",
+        "variables": json.dumps(variables),
+        "extensions": json.dumps(
+            {"persistedQuery": {"version": 1, "sha256Hash": query_hash}}
+        ),
+    }
+
+    if query is not None:
+        params["query"] = query
+
+    return client.get("/graphql", params, HTTP_ACCEPT="*/*", **headers)
+
+
+@pytest.fixture
+def persisted_query():
+    return PersistedQuery.objects.create(
+        hash=get_query_hash(QUERY), operation_name="ConferenceCode", query=QUERY
+    )
+
+
+def test_register_persisted_queries_command(tmp_path, persisted_query):
+    other_query = "query Countries {\n  countries {\n    code\n  }\n}"
+    manifest = tmp_path / "persisted-queries.json"
+    manifest.write_text(
+        json.dumps(
+            {
+                "ConferenceCode": {"hash": persisted_query.hash, "query": QUERY},
+                "Countries": {
+                    "hash": get_query_hash(other_query),
+                    "query": other_query,
+                },
+            }
+        )
+    )
+
+    call_command("register_persisted_queries", str(manifest))
+
+    assert PersistedQuery.objects.count() == 2
+    assert PersistedQuery.objects.get(operation_name="Countries").hash == (
+        get_query_hash(other_query)
+    )
+
+
+def test_persisted_query_via_get_is_cacheable(client, conference, persisted_query):
+    response = _get(client, persisted_query.hash, {"code": conference.code})
+
+    assert response.status_code == 200
+    assert json.loads(response.content) == {
+        "data": {"conference": {"code": conference.code}}
+    }
+    assert "public" in response["Cache-Control"]
+    assert "max-age=60" in response["Cache-Control"]
+
+    not_modified = _get(
+        client,
+        persisted_query.hash,
+        {"code": conference.code},
+        HTTP_IF_NONE_MATCH=response["ETag"],
+    )
+
+    assert not_modified.status_code == 304
+
+
+def test_persisted_query_for_logged_user_is_private(
+    client, user, conference, persisted_query
+):
+    client.force_login(user)
+
+    response = _get(client, persisted_query.hash, {"code": conference.code})
+
+    assert response.status_code == 200
+    assert "private" in response["Cache-Control"]
+    assert "public" not in response["Cache-Control"]
+
+
+def test_unknown_persisted_query(client):
+    response = _get(client, get_query_hash(QUERY), {"code": "code"})
+
+    assert json.loads(response.content)["errors"][0]["message"] == (
+        "PersistedQueryNotFound"
+    )
+
+
+def test_queries_via_get_need_to_be_persisted(client, conference):
+    response = client.get(
+        "/graphql",
+        {"query": QUERY, "variables": json.dumps({"code": conference.code})},
+        HTTP_ACCEPT="*/*",
+    )
+
+    assert response.status_code == 400
+
+
+def test_queries_via_get_with_a_hash_need_to_be_persisted(client, conference):
+    response = _get(
+        client, get_query_hash(QUERY), {"code": conference.code}, query=QUERY
+    )
+
+    assert response.status_code == 400
+
+
+def test_queries_via_get_need_to_match_the_hash(client, conference, persisted_query):
+    query = QUERY.replace("code\n  }", "code\n    name\n  }")
+
+    response = _get(
+        client, persisted_query.hash, {"code": conference.code}, query=query
+    )
+
+    assert response.status_code == 400
+
+
+def test_persisted_query_is_read_once(client, conference, persisted_query):
+    _get(client, persisted_query.hash, {"code": conference.code})
+
+    with CaptureQueriesContext(connection) as queries:
+        response = _get(client, persisted_query.hash, {"code": conference.code})
+
+    assert response.status_code == 200
+    assert not [
+        query
+        for query in queries.captured_queries
+        if PersistedQuery._meta.db_table in query["sql"]
+    ]
+
+
+def test_persisted_query_is_parsed_once(client, conference, persisted_query, mocker):
+    mocker.patch.object(DocumentCacheExtension, "cache", DocumentCache(maxsize=10))
+    parse_document = mocker.patch(
+        "api.extensions.parse_document", wraps=extensions.parse_document
+    )
+
+    for _ in range(2):
+        response = _get(client, persisted_query.hash, {"code": conference.code})
+        assert json.loads(response.content)["data"]["conference"]["code"] == (
+            conference.code
+        )
+
+    assert parse_document.call_count == 1
+
+
+def test_retry_with_a_query_not_matching_the_hash(client, conference, persisted_query):
+    # e.g. the fragments printed in a different order than the codegen
+    query = QUERY.replace("code\n  }", "code\n    name\n  }")
+
+    response = client.post(
+        "/graphql",
+        {
+            "query": query,
+            "variables": {"code": conference.code},
+            "extensions": {
+                "persistedQuery": {"version": 1, "sha256Hash": persisted_query.hash}
+            },
+        },
+        content_type="application/json",
+    )
+
+    assert response.status_code == 200
+    assert json.loads(response.content)["data"]["conference"] == {
+        "code": conference.code,
+        "name": conference.name.localize("en"),
+    }
+    assert "public" not in response.get("Cache-Control", "")
@@ -1,5 +1,5 @@
 import math
-from typing import Generic, List, TypeVar
+from typing import Generic, List, Optional, TypeVar
 
 import strawberry
 
@@ -71,6 +71,8 @@ class PageInfo:
     total_pages: int
     total_items: int
     page_size: int
+    # Only set by the lists that support cursor pagination
+    end_cursor: Optional[str] = None
 
 
 @strawberry.type
@@ -80,13 +82,20 @@ class Paginated(Generic[ItemType]):
 
     @classmethod
     def paginate_list(
-        cls, *, items: List[ItemType], page_size: int, total_items: int, page: int
+        cls,
+        *,
+        items: List[ItemType],
+        page_size: int,
+        total_items: int,
+        page: int,
+        end_cursor: Optional[str] = None,
     ) -> "Paginated[ItemType]":
         return Paginated(
             page_info=PageInfo(
                 total_pages=math.ceil(total_items / page_size),
                 page_size=page_size,
                 total_items=total_items,
+                end_cursor=end_cursor,
             ),
             items=items,
         )
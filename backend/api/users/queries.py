@@ -1,14 +1,54 @@
 from strawberry.tools import create_type
 import strawberry
 
+import pretix
 from api.context import Info
+from api.helpers.selections import get_selected_fields
 from api.permissions import IsAuthenticated
 from api.users.types import User
+from conferences.models import Conference
+
+# Fields of User calling Pretix: the argument with the conference
+# code and the `pretix` function they call
+PRETIX_FIELDS = {
+    "orders": ("conference", "get_user_orders"),
+    "tickets": ("conference", "get_user_tickets"),
+    "conferenceRoles": ("conferenceCode", "get_user_tickets"),
+}
 
 
 @strawberry.field(permission_classes=[IsAuthenticated])
 def me(info: Info) -> User:
-    return User.from_django_model(info.context.request.user)
+    user = info.context.request.user
+    prefetch_pretix_calls(info, user)
+    return User.from_django_model(user)
+
+
+def prefetch_pretix_calls(info: Info, user):
+    """
+    Starts the Pretix calls of all the selected fields, so they run
+    concurrently instead of one after the other while resolving them
+    """
+    calls = {
+        (field.arguments.get(argument), function_name)
+        for field in get_selected_fields(info)
+        if field.name in PRETIX_FIELDS
+        for argument, function_name in [PRETIX_FIELDS[field.name]]
+    }
+
+    if len(calls) < 2:
+        return
+
+    conferences = Conference.objects.in_bulk(
+        {code for code, _ in calls}, field_name="code"
+    )
+    pretix.prefetch(
+        *(
+            (getattr(pretix, function_name), conferences[code], user.email)
+            for code, function_name in calls
+            if code in conferences
+        )
+    )
 
 
 UserQuery = create_type(
@@ -1,13 +1,118 @@
-from typing import Any
+from typing import Any, Optional
 
+from django.conf import settings
+from django.http import JsonResponse
 from django.http.request import HttpRequest
+from django.http.response import HttpResponse
+from django.utils.cache import (
+    get_conditional_response,
+    patch_cache_control,
+    set_response_etag,
+)
 from strawberry.django.views import GraphQLView as BaseGraphQLVew
+from strawberry.http import GraphQLHTTPResponse, GraphQLRequestData
+from strawberry.http.exceptions import HTTPException
 
 from api.context import Context
+from api.persisted_queries import (
+    PersistedQueryNotFound,
+    get_requested_hash,
+    resolve_persisted_query,
+)
 
 
 class GraphQLView(BaseGraphQLVew):
-    allow_queries_via_get = False
+    """
+    Besides normal queries sent via POST, accepts the hash of a persisted
+    query (sent via GET or POST, as Apollo's persisted queries link does).
+
+    Only persisted queries can be sent via GET: their successful responses
+    get an ETag and, for anonymous users, can be cached by shared caches.
+    """
 
     def get_context(self, request: HttpRequest, response: Any) -> Context:
         return Context(request=request, response=response)
+
+    def dispatch(self, request: HttpRequest, *args: Any, **kwargs: Any):
+        try:
+            return super().dispatch(request, *args, **kwargs)
+        except PersistedQueryNotFound:
+            # Tells the client to send the query again together with the hash
+            return JsonResponse(
+                {
+                    "errors": [
+                        {
+                            "message": "PersistedQueryNotFound",
+                            "extensions": {"code": "PERSISTED_QUERY_NOT_FOUND"},
+                        }
+                    ]
+                }
+            )
+
+    def should_render_graphql_ide(self, request) -> bool:
+        return super().should_render_graphql_ide(request) and (
+            "extensions" not in request.query_params
+        )
+
+    def parse_http_body(self, request) -> GraphQLRequestData:
+        request_data = super().parse_http_body(request)
+        query_hash = self._get_persisted_query_hash(request)
+
+        if query_hash is None:
+            if request.method == "GET":
+                raise HTTPException(400, "Only persisted queries can be sent via GET")
+
+            return request_data
+
+        persisted_query = resolve_persisted_query(query_hash, request_data.query)
+
+        if persisted_query is None and request.method == "GET":
+            # The query doesn't match the hash or isn't registered
+            raise HTTPException(400, "Only persisted queries can be sent via GET")
+
+        request.request.persisted_query = persisted_query
+
+        if persisted_query is not None:
+            request_data.query = persisted_query.query
+
+        return request_data
+
+    def _get_persisted_query_hash(self, request) -> Optional[str]:
+        if request.method == "GET":
+            extensions = request.query_params.get("extensions")
+            return get_requested_hash(
+                {"extensions": self.parse_json(extensions) if extensions else None}
+            )
+
+        if "application/json" in (request.content_type or ""):
+            return get_requested_hash(self.parse_json(request.body))
+
+        return None
+
+    def create_response(
+        self, response_data: GraphQLHTTPResponse, sub_response: HttpResponse
+    ) -> HttpResponse:
+        response = super().create_response(response_data, sub_response)
+        request = self.request
+
+        if (
+            request.method != "GET"
+            or getattr(request, "persisted_query", None) is None
+            or response_data.get("errors")
+            or response.status_code != 200
+        ):
+            return response
+
+        if request.user.is_authenticated:
+            patch_cache_control(response, private=True)
+        else:
+            patch_cache_control(
+                response,
+                public=True,
+                max_age=settings.GRAPHQL_PERSISTED_QUERIES_MAX_AGE,
+            )
+
+        set_response_etag(response)
+        return get_conditional_response(
+            request, etag=response.headers["ETag"], response=response
+        )
@@ -1,7 +1,11 @@
 import logging
-from typing import Any, Callable, Literal, Optional
+from typing import Any, Callable, List, Literal
+
+from django.db import transaction
 
 from association_membership.exceptions import WebhookError
+from pretix_mirror.handlers import pretix_order_changed
+from voting.handlers import invalidate_can_vote_on_order_change
 
 from .pretix.pretix_event_order_paid import pretix_event_order_paid
 from .stripe.handle_invoice_paid import handle_invoice_paid
@@ -9,36 +13,101 @@ from .stripe.handle_invoice_paid import handle_invoice_paid
 logger = logging.getLogger(__file__)
 
 
+# Keeps the local pretix mirror and what depends on it up to date
+ORDER_CHANGED_HANDLERS = [
+    pretix_order_changed,
+    invalidate_can_vote_on_order_change,
+]
+
+# Events ending with ".*" match every event starting with that prefix
 HANDLERS = {
     "stripe": {
-        "invoice.paid": handle_invoice_paid,
+        "invoice.paid": [handle_invoice_paid],
+    },
+    "pretix": {
+        # Memberships first, an error syncing the mirror shouldn't stop them
+        "pretix.event.order.paid": [
+            pretix_event_order_paid,
+            *ORDER_CHANGED_HANDLERS,
+        ],
+        **{
+            event: ORDER_CHANGED_HANDLERS
+            for event in [
+                "pretix.event.order.placed",
+                "pretix.event.order.placed.require_approval",
+                "pretix.event.order.approved",
+                "pretix.event.order.denied",
+                "pretix.event.order.canceled",
+                "pretix.event.order.reactivated",
+                "pretix.event.order.expired",
+                "pretix.event.order.modified",
+                "pretix.event.order.contact.changed",
+                "pretix.event.order.changed.*",
+                "pretix.event.order.refund.*",
+            ]
+        },
     },
-    "pretix": {"pretix.event.order.paid": pretix_event_order_paid},
 }
 
 
-def get_handler(
+def get_handlers(
     service: Literal["stripe", "pretix"], event: str
-) -> Optional[Callable[[Any], None]]:
-    return HANDLERS.get(service, {}).get(event, None)
+) -> List[Callable[[Any], None]]:
+    service_handlers = HANDLERS.get(service, {})
+
+    if event in service_handlers:
+        return service_handlers[event]
+
+    return next(
+        (
+            handlers
+            for name, handlers in service_handlers.items()
+            if name.endswith(".*") and event.startswith(name[:-1])
+        ),
+        [],
+    )
 
 
 def run_handler(
     service: Literal["stripe", "pretix", "crons"], event_name: str, payload: Any
 ):
-    handler = get_handler(service, event_name)
+    handlers = get_handlers(service, event_name)
 
-    if not handler:
+    if not handlers:
         logger.info("No handler found for event=%s and service=%s", event_name, service)
         return None
 
-    logger.info("Running handler for event_name=%s and service=%s", event_name, service)
-    try:
-        handler(payload)
-    except WebhookError as e:
-        logger.exception(
-            "Known error while handling event_name=%s and service=%s",
+    failed = None
+
+    for handler in handlers:
+        logger.info(
+            "Running handler=%s for event_name=%s and service=%s",
+            handler.__name__,
             event_name,
             service,
-            exc_info=e,
         )
+        try:
+            # A database error in one handler shouldn't break the next ones
+            with transaction.atomic():
+                handler(payload)
+        except WebhookError as e:
+            logger.exception(
+                "Known error while handling event_name=%s and service=%s",
+                event_name,
+                service,
+                exc_info=e,
+            )
+        except Exception as e:
+            # The other handlers still run, the webhook fails
+            # at the end so that it is sent again
+            logger.exception(
+                "Handler=%s failed for event_name=%s and service=%s",
+                handler.__name__,
+                event_name,
+                service,
+                exc_info=e,
+            )
+            failed = failed or e
+
+    if failed:
+        raise failed
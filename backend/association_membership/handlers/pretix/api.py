@@ -1,9 +1,9 @@
 from typing import Literal
 
-import requests
-
 from django.conf import settings
 
+from pretix import session
+
 METHODS = Literal["get"]
 
 
@@ -24,7 +24,7 @@ class PretixAPI:
         if qs:
             url = f"{url}?" + "&".join([f"{key}={value}" for key, value in qs.items()])
 
-        response = getattr(requests, method)(url, headers=headers)
+        response = session.request(method, url, headers=headers)
 
         response.raise_for_status()
         return response
@@ -0,0 +1,41 @@
+# Generated by Django 4.2.7 on 2026-10-18 18:46
+
+from django.db import migrations, models
+
+
+def merge_duplicated_scans(apps, schema_editor):
+    BadgeScan = apps.get_model("badge_scanner", "BadgeScan")
+    kept_scans = {}
+
+    for scan in BadgeScan.objects.order_by("created", "id"):
+        key = (scan.scanned_by_id, scan.conference_id, scan.badge_url)
+        kept_scan = kept_scans.setdefault(key, scan)
+
+        if kept_scan.id == scan.id:
+            continue
+
+        if scan.notes:
+            kept_scan.notes = "\n".join(
+                notes for notes in (kept_scan.notes, scan.notes) if notes
+            )
+            kept_scan.save(update_fields=["notes"])
+
+        scan.delete()
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('badge_scanner', '0007_remove_badgescan_scanned_by_id_and_more'),
+    ]
+
+    operations = [
+        migrations.RunPython(
+            merge_duplicated_scans,
+            reverse_code=migrations.RunPython.noop,
+        ),
+        migrations.AddConstraint(
+            model_name='badgescan',
+            constraint=models.UniqueConstraint(fields=('scanned_by', 'conference', 'badge_url'), name='badge_scanner_badgescan_unique_scan'),
+        ),
+    ]
@@ -0,0 +1,38 @@
+# Generated by Django 4.2.7 on 2026-10-18 18:48
+
+from django.db import migrations, models
+
+
+def mark_existing_exports_as_completed(apps, schema_editor):
+    # They were built in the request that created them
+    BadgeScanExport = apps.get_model("badge_scanner", "BadgeScanExport")
+    BadgeScanExport.objects.update(status="completed")
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('badge_scanner', '0008_badgescan_unique_scan'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='badgescanexport',
+            name='format',
+            field=models.CharField(choices=[('csv', 'CSV'), ('xlsx', 'XLSX')], default='csv', max_length=10, verbose_name='format'),
+        ),
+        migrations.AddField(
+            model_name='badgescanexport',
+            name='status',
+            field=models.CharField(choices=[('pending', 'Pending'), ('running', 'Running'), ('completed', 'Completed'), ('failed', 'Failed')], default='pending', max_length=20, verbose_name='status'),
+        ),
+        migrations.AlterField(
+            model_name='badgescanexport',
+            name='file',
+            field=models.FileField(blank=True, upload_to='badge_scan_exports', verbose_name='file'),
+        ),
+        migrations.RunPython(
+            mark_existing_exports_as_completed,
+            reverse_code=migrations.RunPython.noop,
+        ),
+    ]
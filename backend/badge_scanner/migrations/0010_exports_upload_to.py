@@ -0,0 +1,22 @@
+# Generated by Django 4.2.7 on 2026-10-18 19:39
+
+from django.db import migrations, models
+import helpers.models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("badge_scanner", "0009_badgescanexport_status_format"),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="badgescanexport",
+            name="file",
+            field=models.FileField(
+                blank=True,
+                upload_to=helpers.models._export_upload_to,
+                verbose_name="file",
+            ),
+        ),
+    ]
@@ -1,6 +1,7 @@
 from django.db import models
 from model_utils.models import TimeStampedModel
 from django.utils.translation import gettext_lazy as _
+from helpers.models import ExportModel
 
 
 class BadgeScan(TimeStampedModel):
@@ -33,8 +34,20 @@ class BadgeScan(TimeStampedModel):
         related_name="badge_scans",
     )
 
+    class Meta:
+        constraints = [
+            # Scanning the same badge again is the same scan,
+            # scanners that sync offline scans rely on it
+            models.UniqueConstraint(
+                fields=["scanned_by", "conference", "badge_url"],
+                name="badge_scanner_badgescan_unique_scan",
+            )
+        ]
+
+
+class BadgeScanExport(ExportModel):
+    EXPORTS_DIRECTORY = "badge_scan_exports"
 
-class BadgeScanExport(TimeStampedModel):
     conference = models.ForeignKey(
         "conferences.Conference",
         on_delete=models.CASCADE,
@@ -49,4 +62,3 @@ class BadgeScanExport(TimeStampedModel):
         verbose_name=_("Requested By"),
         related_name="+",
     )
-    file = models.FileField(_("file"), upload_to="badge_scan_exports")
@@ -0,0 +1,31 @@
+from badge_scanner.models import BadgeScan, BadgeScanExport
+from helpers.exports import run_export
+from pycon.celery import app
+
+EXPORT_HEADERS = ["Created", "Attendee Name", "Attendee Email", "Notes"]
+
+# Rows fetched from the database cursor at a time
+EXPORT_CHUNK_SIZE = 2000
+
+
+@app.task
+def export_badge_scans(*, badge_scan_export_id):
+    badge_scan_export = BadgeScanExport.objects.get(id=badge_scan_export_id)
+
+    rows = (
+        BadgeScan.objects.filter(
+            scanned_by_id=badge_scan_export.requested_by_id,
+            conference_id=badge_scan_export.conference_id,
+        )
+        .order_by("created")
+        .values_list("created", "attendee_name", "attendee_email", "notes")
+        .iterator(chunk_size=EXPORT_CHUNK_SIZE)
+    )
+
+    run_export(
+        badge_scan_export,
+        name="badge_scans",
+        title="Badge scans",
+        headers=EXPORT_HEADERS,
+        rows=rows,
+    )
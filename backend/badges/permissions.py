@@ -0,0 +1,28 @@
+from rest_framework import exceptions
+from rest_framework.authentication import BaseAuthentication
+from rest_framework.permissions import BasePermission
+
+from api.models import APIToken
+
+
+class BackendTokenAuthentication(BaseAuthentication):
+    """Same `X-Backend-Token` the services send to the GraphQL API"""
+
+    def authenticate(self, request):
+        token = request.headers.get("X-Backend-Token")
+
+        if not token:
+            return None
+
+        if not APIToken.objects.filter(token=token).exists():
+            raise exceptions.AuthenticationFailed("Invalid token.")
+
+        return ({"backend": True}, None)
+
+    def authenticate_header(self, request):
+        return "X-Backend-Token"
+
+
+class IsBackendAuthenticated(BasePermission):
+    def has_permission(self, request, view):
+        return isinstance(request.user, dict) and request.user["backend"]
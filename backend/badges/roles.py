@@ -2,13 +2,15 @@ from __future__ import annotations
 
 import strawberry
 from enum import Enum
-from typing import Dict, List, Set
+from itertools import islice
+from typing import Dict, Iterable, Iterator, List, Set, Tuple
 import pretix
 from conferences.models import Conference
-from schedule.models import ScheduleItem
-from django.core.cache import cache
+from schedule.models import ScheduleSpeaker
+from schedule.speakers import get_speakers_user_ids
 from badges.models import AttendeeConferenceRole
 from django.db.models import Q
+from users.models import User
 
 
 class Role(Enum):
@@ -26,6 +28,8 @@ class Role(Enum):
 
 ConferenceRole = strawberry.enum(Role, name="ConferenceRole")
 
+TICKETS_BATCH_SIZE = 500
+
 ROLES_PRIORITY = [
     Role.STAFF,
     Role.SPEAKER,
@@ -37,31 +41,14 @@ ROLES_PRIORITY = [
 
 
 def speakers_user_ids(conference: Conference) -> Set[int]:
-    cache_key = f"conference:{conference.id}:speakers_user_ids"
-
-    if cache.has_key(cache_key):
-        return cache.get(cache_key)
-
-    submission_speakers = list(
-        ScheduleItem.objects.filter(
-            conference=conference,
-        )
-        .values_list(
-            "submission__speaker_id",
-            flat=True,
-        )
-        .distinct()
-    )
-    additional_speakers = list(
-        ScheduleItem.objects.filter(
-            conference=conference, additional_speakers__user_id__isnull=False
-        )
-        .values_list("additional_speakers__user_id", flat=True)
-        .distinct()
+    # Keynoters are recognised by their voucher
+    return get_speakers_user_ids(
+        conference.id,
+        sources=[
+            ScheduleSpeaker.SOURCES.submission,
+            ScheduleSpeaker.SOURCES.additional_speaker,
+        ],
     )
-    items = set(submission_speakers + additional_speakers)
-    cache.set(cache_key, items, timeout=60 * 60 * 24 * 2)
-    return items
 
 
 def get_conference_roles_for_ticket_data(
@@ -120,15 +107,76 @@ def _get_roles(conference: Conference, user_id: int | None, ticket: dict) -> Lis
     )
 
 
+def get_conference_roles_for_tickets(
+    conference: Conference, tickets: Iterable[Dict]
+) -> Iterator[Tuple[Dict, List[Role]]]:
+    """
+    Resolves the roles of many tickets (order positions), yielding each
+    ticket with its roles in the same order.
+
+    Users, overrides and speakers are looked up once per batch of tickets
+    and vouchers once for the conference, instead of once per ticket.
+    """
+    vouchers = pretix.get_all_vouchers(conference)
+    speakers = speakers_user_ids(conference)
+
+    for batch in _batched(tickets, TICKETS_BATCH_SIZE):
+        emails = {ticket.get("attendee_email") for ticket in batch}
+        users_ids = dict(
+            User.objects.filter(email__in=emails).values_list("email", "id")
+        )
+        overrides = list(
+            AttendeeConferenceRole.objects.filter(
+                Q(order_position_id__in=[ticket["id"] for ticket in batch])
+                | Q(user_id__in=users_ids.values()),
+                conference=conference,
+            ).order_by("id")
+        )
+
+        for ticket in batch:
+            user_id = users_ids.get(ticket.get("attendee_email"))
+            manual_role = next(
+                (
+                    override
+                    for override in overrides
+                    if override.order_position_id == ticket["id"]
+                    or (user_id is not None and override.user_id == user_id)
+                ),
+                None,
+            )
+            roles = (
+                [Role(role) for role in manual_role.roles]
+                if manual_role
+                else _get_roles_from_ticket(user_id, ticket, vouchers, speakers)
+            )
+            yield ticket, sorted(roles, key=lambda role: ROLES_PRIORITY.index(role))
+
+
+def _batched(iterable: Iterable, size: int):
+    iterator = iter(iterable)
+
+    while batch := list(islice(iterator, size)):
+        yield batch
+
+
 def _calculate_roles(
     conference: Conference, user_id: int | None, ticket: dict
+) -> List[Role]:
+    return _get_roles_from_ticket(
+        user_id,
+        ticket,
+        vouchers=pretix.get_all_vouchers(conference),
+        speakers=speakers_user_ids(conference),
+    )
+
+
+def _get_roles_from_ticket(
+    user_id: int | None, ticket: dict, vouchers: Dict, speakers: Set[int]
 ) -> List[Role]:
     roles = [
         Role.ATTENDEE,
     ]
 
-    vouchers = pretix.get_all_vouchers(conference)
-
     if (voucher_id := ticket["voucher"]) and (voucher := vouchers.get(voucher_id)):
         tags = voucher["tag"].lower().split(",")
         voucher_code = voucher["code"].lower()
@@ -149,7 +197,7 @@ def _calculate_roles(
     # so we check if there is a schedule item where they are a speaker
     # this has the effect of tagging non-speakers as speakers if their ticket
     # was purchased by a speaker (I know only one case of this happening right now)
-    user_is_in_schedule_item = user_id and user_id in speakers_user_ids(conference)
+    user_is_in_schedule_item = user_id and user_id in speakers
     if Role.SPEAKER not in roles and user_is_in_schedule_item:
         roles.append(Role.SPEAKER)
 
@@ -0,0 +1,19 @@
+from rest_framework import serializers
+
+
+class OrderPositionSerializer(serializers.Serializer):
+    id = serializers.IntegerField(required=True)
+    voucher = serializers.IntegerField(required=True, allow_null=True)
+    # Not validated, a malformed email in Pretix shouldn't fail the whole request
+    attendee_email = serializers.CharField(
+        required=False, allow_null=True, allow_blank=True
+    )
+
+
+class ConferenceRolesSerializer(serializers.Serializer):
+    conference = serializers.CharField(required=True)
+    # Pretix order positions, when omitted all the admission
+    # positions of the paid orders of the conference are used
+    positions = serializers.ListField(
+        child=OrderPositionSerializer(), required=False, allow_empty=True
+    )
@@ -31,8 +31,9 @@ def test_get_all_speakers_user_ids(
         conference=schedule_item_1.conference,
         submission=submission_factory(),
     )
-    additional_speaker = schedule_item_additional_speaker_factory()
-    schedule_item_3.additional_speakers.add(additional_speaker)
+    additional_speaker = schedule_item_additional_speaker_factory(
+        scheduleitem=schedule_item_3
+    )
 
     schedule_item_different_conf = schedule_item_factory(
         type="talk",
@@ -0,0 +1,214 @@
+import json
+
+import pytest
+from django.conf import settings
+from django.urls import reverse
+
+from api.helpers.ids import encode_hashid
+from api.models import APIToken
+from badges.models import AttendeeConferenceRole
+from badges.roles import Role
+from users.tests.factories import UserFactory
+
+pytestmark = pytest.mark.django_db
+
+PRETIX_EVENT_URL = (
+    f"{settings.PRETIX_API}organizers/base-pretix-organizer-id/"
+    "events/base-pretix-event-id"
+)
+
+
+def _read_lines(response):
+    return [
+        json.loads(line)
+        for line in b"".join(response.streaming_content).decode().splitlines()
+    ]
+
+
+@pytest.fixture
+def backend_token():
+    return APIToken.objects.create(token="secret").token
+
+
+def test_conference_roles_need_a_token(rest_api_client, conference):
+    response = rest_api_client.post(
+        reverse("badges_conference_roles"), {"conference": conference.code}
+    )
+
+    assert response.status_code == 401
+
+
+def test_conference_roles_of_positions(
+    rest_api_client,
+    conference_factory,
+    requests_mock,
+    backend_token,
+    schedule_item_factory,
+    submission_factory,
+    django_assert_max_num_queries,
+):
+    conference = conference_factory()
+    submission = submission_factory(conference=conference)
+    schedule_item_factory(type="talk", conference=conference, submission=submission)
+    overridden_user = UserFactory()
+    AttendeeConferenceRole.objects.create(
+        user=overridden_user, conference=conference, roles=[Role.SPONSOR.value]
+    )
+    vouchers = requests_mock.get(
+        f"{PRETIX_EVENT_URL}/vouchers",
+        json={
+            "next": None,
+            "results": [{"id": 1, "code": "staff-123", "tag": ""}],
+        },
+    )
+    positions = [
+        {"id": 10, "attendee_email": "staff@example.org", "voucher": 1},
+        {"id": 11, "attendee_email": submission.speaker.email, "voucher": None},
+        {"id": 12, "attendee_email": overridden_user.email, "voucher": None},
+        {"id": 13, "attendee_email": None, "voucher": None},
+    ]
+
+    with django_assert_max_num_queries(6):
+        response = rest_api_client.post(
+            reverse("badges_conference_roles"),
+            {"conference": conference.code, "positions": positions},
+            HTTP_X_BACKEND_TOKEN=backend_token,
+        )
+        lines = _read_lines(response)
+
+    assert response.status_code == 200
+    assert response["Content-Type"] == "application/x-ndjson"
+    assert [(line["id"], line["role"]) for line in lines] == [
+        (10, "STAFF"),
+        (11, "SPEAKER"),
+        (12, "SPONSOR"),
+        (13, "ATTENDEE"),
+    ]
+    assert lines[0]["roles"] == ["STAFF", "ATTENDEE"]
+    assert lines[0]["ticket_hashid"] == encode_hashid(10)
+    assert vouchers.call_count == 1
+
+
+def test_conference_roles_pull_the_admission_positions(
+    rest_api_client, conference, requests_mock, backend_token
+):
+    requests_mock.get(
+        f"{PRETIX_EVENT_URL}/items",
+        json={
+            "next": None,
+            "results": [{"id": 1, "admission": True}, {"id": 2, "admission": False}],
+        },
+    )
+    requests_mock.get(
+        f"{PRETIX_EVENT_URL}/orderpositions",
+        json={
+            "next": None,
+            "count": 2,
+            "results": [
+                {
+                    "id": 1,
+                    "item": 1,
+                    "attendee_email": "a@example.org",
+                    "voucher": None,
+                },
+                {
+                    "id": 2,
+                    "item": 2,
+                    "attendee_email": "a@example.org",
+                    "voucher": None,
+                },
+            ],
+        },
+    )
+    requests_mock.get(
+        f"{PRETIX_EVENT_URL}/vouchers", json={"next": None, "results": []}
+    )
+
+    response = rest_api_client.post(
+        reverse("badges_conference_roles"),
+        {"conference": conference.code},
+        HTTP_X_BACKEND_TOKEN=backend_token,
+    )
+
+    assert [line["id"] for line in _read_lines(response)] == [1]
+
+
+@pytest.mark.parametrize(
+    "position",
+    [
+        {"attendee_email": "a@example.org", "voucher": None},
+        {"id": 1, "attendee_email": "a@example.org"},
+    ],
+)
+def test_conference_roles_of_invalid_positions(
+    rest_api_client, conference, backend_token, position
+):
+    response = rest_api_client.post(
+        reverse("badges_conference_roles"),
+        {"conference": conference.code, "positions": [position]},
+        HTTP_X_BACKEND_TOKEN=backend_token,
+    )
+
+    assert response.status_code == 400
+    assert "positions" in response.json()
+
+
+def test_conference_roles_pull_the_admission_items_of_every_page(
+    rest_api_client, conference, requests_mock, backend_token
+):
+    requests_mock.get(
+        f"{PRETIX_EVENT_URL}/items",
+        json={
+            "next": f"{PRETIX_EVENT_URL}/items?page=2",
+            "count": 2,
+            "results": [{"id": 1, "admission": False}],
+        },
+    )
+    requests_mock.get(
+        f"{PRETIX_EVENT_URL}/items?page=2",
+        json={"next": None, "count": 2, "results": [{"id": 2, "admission": True}]},
+    )
+    requests_mock.get(
+        f"{PRETIX_EVENT_URL}/orderpositions",
+        json={
+            "next": None,
+            "count": 2,
+            "results": [
+                {"id": 1, "item": 1, "attendee_email": None, "voucher": None},
+                {"id": 2, "item": 2, "attendee_email": None, "voucher": None},
+            ],
+        },
+    )
+    requests_mock.get(
+        f"{PRETIX_EVENT_URL}/vouchers", json={"next": None, "results": []}
+    )
+
+    response = rest_api_client.post(
+        reverse("badges_conference_roles"),
+        {"conference": conference.code},
+        HTTP_X_BACKEND_TOKEN=backend_token,
+    )
+
+    assert [line["id"] for line in _read_lines(response)] == [2]
+
+
+def test_conference_roles_of_positions_with_a_malformed_email(
+    rest_api_client, conference, requests_mock, backend_token
+):
+    requests_mock.get(
+        f"{PRETIX_EVENT_URL}/vouchers", json={"next": None, "results": []}
+    )
+
+    response = rest_api_client.post(
+        reverse("badges_conference_roles"),
+        {
+            "conference": conference.code,
+            "positions": [{"id": 1, "attendee_email": "not-an-email", "voucher": None}],
+        },
+        HTTP_X_BACKEND_TOKEN=backend_token,
+    )
+
+    assert response.status_code == 200
+    assert [(line["id"], line["role"]) for line in _read_lines(response)] == [
+        (1, "ATTENDEE")
+    ]
@@ -0,0 +1,7 @@
+from django.urls import path
+from badges.views import conference_roles
+
+
+urlpatterns = [
+    path("conference-roles", conference_roles, name="badges_conference_roles"),
+]
@@ -0,0 +1,70 @@
+import json
+
+from django.http import StreamingHttpResponse
+from rest_framework import status
+from rest_framework.decorators import (
+    api_view,
+    authentication_classes,
+    permission_classes,
+)
+from rest_framework.response import Response
+
+import pretix
+from api.helpers.ids import encode_hashid
+from badges.permissions import BackendTokenAuthentication, IsBackendAuthenticated
+from badges.roles import get_conference_roles_for_tickets
+from badges.serializers import ConferenceRolesSerializer
+from conferences.models import Conference
+
+
+def _get_admission_positions(conference: Conference):
+    admission_items = {
+        item["id"] for item in pretix.get_all_items(conference) if item["admission"]
+    }
+
+    return (
+        position
+        for position in pretix.get_all_order_positions(
+            conference, {"order__status": "p"}
+        )
+        if position["item"] in admission_items
+    )
+
+
+@api_view(["POST"])
+@permission_classes([IsBackendAuthenticated])
+@authentication_classes([BackendTokenAuthentication])
+def conference_roles(request):
+    """
+    Streams the role and ticket hashid of every order position as
+    newline delimited JSON, one position per line in the same order.
+    """
+    serializer = ConferenceRolesSerializer(data=request.data)
+    serializer.is_valid(raise_exception=True)
+    data = serializer.validated_data
+
+    conference = Conference.objects.filter(code=data["conference"]).first()
+
+    if not conference:
+        return Response(status=status.HTTP_404_NOT_FOUND)
+
+    positions = data.get("positions")
+
+    if positions is None:
+        positions = _get_admission_positions(conference)
+
+    def lines():
+        for position, roles in get_conference_roles_for_tickets(conference, positions):
+            yield (
+                json.dumps(
+                    {
+                        "id": position["id"],
+                        "role": roles[0].name,
+                        "roles": [role.name for role in roles],
+                        "ticket_hashid": encode_hashid(position["id"]),
+                    }
+                )
+                + "\n"
+            )
+
+    return StreamingHttpResponse(lines(), content_type="application/x-ndjson")
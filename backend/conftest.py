@@ -24,6 +24,7 @@ from languages.tests.factories import *  # noqa
 from newsletters.tests.factories import *  # noqa
 from participants.tests.factories import *  # noqa
 from pretix.tests.fixtures import *  # noqa
+from pretix_mirror.tests.fixtures import *  # noqa
 from reviews.tests.factories import *  # noqa
 from schedule.tests.factories import *  # noqa
 from sponsors.tests.factories import *  # noqa
@@ -55,6 +56,18 @@ def language():
     return lambda code: Language.objects.get(code=code)
 
 
+@pytest.fixture
+def locmem_cache(settings):
+    settings.CACHES = {
+        "default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}
+    }
+    from django.core.cache import cache
+
+    cache.clear()
+    yield cache
+    cache.clear()
+
+
 @pytest.fixture
 def http_client():
     return Client()
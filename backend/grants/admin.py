@@ -1,157 +1,34 @@
 from custom_admin.admin import validate_single_conference_selection
-from import_export.resources import ModelResource
 from datetime import timedelta
-from typing import Dict, List, Optional
 from countries.filters import CountryFilter
-from django.urls import path
+from django.urls import path, reverse
+from django.utils.safestring import mark_safe
 from django.template.response import TemplateResponse
-from django.db.models import Count, Sum
 from helpers.constants import GENDERS
 from django import forms
 from django.contrib import admin, messages
-from django.db.models.query import QuerySet
 from django.utils import timezone
 from import_export.admin import ExportMixin
-from import_export.fields import Field
 from django.utils.crypto import get_random_string
 from users.admin_mixins import ConferencePermissionMixin
 from countries import countries
+from grants.decisions import queue_grant_reply_emails
+from grants.exports import GrantResource
+from grants.summary import get_grants_summary
 from grants.tasks import (
+    export_grants,
     send_grant_reply_approved_email,
-    send_grant_reply_waiting_list_email,
     send_grant_reply_waiting_list_update_email,
-    send_grant_reply_rejected_email,
     send_grant_voucher_email,
 )
 from pretix import create_voucher
 from schedule.models import ScheduleItem
 from submissions.models import Submission
-from .models import Grant
+from .models import Grant, GrantExport
 from django.db.models import Exists, OuterRef
 
 from django.contrib.admin import SimpleListFilter
 
-EXPORT_GRANTS_FIELDS = (
-    "name",
-    "full_name",
-    "gender",
-    "occupation",
-    "grant_type",
-    "python_usage",
-    "been_to_other_events",
-    "interested_in_volunteering",
-    "needs_funds_for_travel",
-    "why",
-    "notes",
-    "travelling_from",
-    "conference__code",
-    "created",
-)
-
-
-class GrantResource(ModelResource):
-    search_field = "user_id"
-    age_group = Field()
-    email = Field()
-    has_sent_submission = Field()
-    submission_title = Field()
-    submission_tags = Field()
-    submission_admin_link = Field()
-    submission_pycon_link = Field()
-    grant_admin_link = Field()
-    USERS_SUBMISSIONS: Dict[int, List[Submission]] = {}
-
-    def dehydrate_email(self, obj: Grant):
-        if obj.user_id:
-            return obj.user.email
-
-        # old grants have email in the model.
-        return obj.email
-
-    def dehydrate_age_group(self, obj: Grant):
-        if not obj.age_group:
-            return ""
-
-        return Grant.AgeGroup(obj.age_group).label
-
-    def dehydrate_has_sent_submission(self, obj: Grant) -> str:
-        return "TRUE" if obj.user_id in self.USERS_SUBMISSIONS else "FALSE"
-
-    def _get_submissions(self, obj: Grant) -> Optional[List[Submission]]:
-        if not obj.user_id:
-            return
-
-        return self.USERS_SUBMISSIONS.get(obj.user_id)
-
-    def dehydrate_submission_title(self, obj: Grant):
-        submissions = self._get_submissions(obj)
-        if not submissions:
-            return
-
-        return "\n".join([s.title.localize("en") for s in submissions])
-
-    def dehydrate_submission_tags(self, obj: Grant):
-        submissions = self._get_submissions(obj)
-        if not submissions:
-            return
-
-        return "\n".join(
-            [
-                ", ".join(
-                    [
-                        f"{r.tag.name}: {r.rank} / {r.total_submissions_per_tag}"
-                        for r in s.rankings.all()
-                    ]
-                )
-                for s in submissions
-            ]
-        )
-
-    def dehydrate_submission_pycon_link(self, obj):
-        submissions = self.USERS_SUBMISSIONS.get(obj.user_id)
-        if not submissions:
-            return
-        return "\n".join(
-            [f"https://pycon.it/submission/{s.hashid}" for s in submissions]
-        )
-
-    def dehydrate_submission_admin_link(self, obj):
-        submissions = self.USERS_SUBMISSIONS.get(obj.user_id)
-        if not submissions:
-            return
-        return "\n".join(
-            [
-                f"https://admin.pycon.it/admin/submissions/submission/{s.id}/change/"
-                for s in submissions
-            ]
-        )
-
-    def dehydrate_grant_admin_link(self, obj: Grant):
-        return f"https://admin.pycon.it/admin/grants/grant/?q={'+'.join(obj.full_name.split(' '))}"  # noqa: E501
-
-    def before_export(self, queryset: QuerySet, *args, **kwargs):
-        super().before_export(queryset, *args, **kwargs)
-        conference_id = queryset.values_list("conference_id").first()
-
-        submissions = Submission.objects.prefetch_related(
-            "rankings__tag", "rankings__submission"
-        ).filter(
-            speaker_id__in=queryset.values_list("user_id", flat=True),
-            conference_id=conference_id,
-        )
-
-        self.USERS_SUBMISSIONS = {}
-        for submission in submissions:
-            self.USERS_SUBMISSIONS.setdefault(submission.speaker_id, [])
-            self.USERS_SUBMISSIONS[submission.speaker_id].append(submission)
-
-        return queryset
-
-    class Meta:
-        model = Grant
-        fields = EXPORT_GRANTS_FIELDS
-        export_order = EXPORT_GRANTS_FIELDS
-
 
 def _check_amounts_are_not_empty(grant: Grant, request):
     if grant.total_amount is None:
@@ -196,8 +73,14 @@ def send_reply_emails(modeladmin, request, queryset):
         )
         return
 
+    now = timezone.now()
+    applicant_reply_deadline = timezone.datetime(
+        now.year, now.month, now.day, 23, 59, 59
+    ) + timedelta(days=14)
+    approved_grants = []
+
     for grant in queryset:
-        if grant.status in (Grant.Status.approved,):
+        if grant.status == Grant.Status.approved:
             if grant.approved_type is None:
                 messages.error(
                     request,
@@ -208,24 +91,26 @@ def send_reply_emails(modeladmin, request, queryset):
             if not _check_amounts_are_not_empty(grant, request):
                 return
 
-            now = timezone.now()
-            grant.applicant_reply_deadline = timezone.datetime(
-                now.year, now.month, now.day, 23, 59, 59
-            ) + timedelta(days=14)
-            grant.save()
-            send_grant_reply_approved_email.delay(grant_id=grant.id, is_reminder=False)
+            grant.applicant_reply_deadline = applicant_reply_deadline
+            grant.modified = now
+            approved_grants.append(grant)
+
+    Grant.objects.bulk_update(
+        approved_grants, fields=["applicant_reply_deadline", "modified"]
+    )
+    queue_grant_reply_emails(grant.id for grant in queryset)
 
+    for grant in queryset:
+        if grant.status == Grant.Status.approved:
             messages.info(request, f"Sent Approved reply email to {grant.name}")
 
         if (
             grant.status == Grant.Status.waiting_list
             or grant.status == Grant.Status.waiting_list_maybe
         ):
-            send_grant_reply_waiting_list_email.delay(grant_id=grant.id)
             messages.info(request, f"Sent Waiting List reply email to {grant.name}")
 
         if grant.status == Grant.Status.rejected:
-            send_grant_reply_rejected_email.delay(grant_id=grant.id)
             messages.info(request, f"Sent Rejected reply email to {grant.name}")
 
 
@@ -326,6 +211,37 @@ def create_grant_vouchers_on_pretix(modeladmin, request, queryset):
     messages.success(request, f"{count} Vouchers created on Pretix!")
 
 
+def _queue_grants_export(request, queryset, format: GrantExport.Format):
+    grant_export = GrantExport.objects.create(
+        conference=queryset.first().conference,
+        requested_by=request.user,
+        grant_ids=list(queryset.values_list("id", flat=True)),
+        format=format,
+    )
+    export_grants.delay(grant_export_id=grant_export.id)
+
+    url = reverse("admin:grants_grantexport_change", args=(grant_export.id,))
+    messages.success(
+        request,
+        mark_safe(
+            f"Export of {len(grant_export.grant_ids)} grants started, "
+            f'<a href="{url}">download it here</a> when completed'
+        ),
+    )
+
+
+@admin.action(description="Export grants as CSV in background")
+@validate_single_conference_selection
+def export_grants_as_csv(modeladmin, request, queryset):
+    _queue_grants_export(request, queryset, GrantExport.Format.CSV)
+
+
+@admin.action(description="Export grants as XLSX in background")
+@validate_single_conference_selection
+def export_grants_as_xlsx(modeladmin, request, queryset):
+    _queue_grants_export(request, queryset, GrantExport.Format.XLSX)
+
+
 class GrantAdminForm(forms.ModelForm):
     class Meta:
         model = Grant
@@ -448,6 +364,8 @@ class GrantAdmin(ExportMixin, ConferencePermissionMixin, admin.ModelAdmin):
         send_reply_email_waiting_list_update,
         create_grant_vouchers_on_pretix,
         send_voucher_via_email,
+        export_grants_as_csv,
+        export_grants_as_xlsx,
         "delete_selected",
     ]
     autocomplete_fields = ("user",)
@@ -577,117 +495,22 @@ class GrantAdmin(ExportMixin, ConferencePermissionMixin, admin.ModelAdmin):
     def summary_view(self, request):
         """
         Custom view for summarizing Grant data in the Django admin.
-        Aggregates data by country and status, and applies request filters.
+        Aggregates data by country, gender and status, and applies request filters.
         """
-        statuses = Grant.Status.choices
-
-        filtered_grants, formatted_filters = self._filter_and_format_grants(request)
-
-        grants_by_country = filtered_grants.values(
-            "travelling_from", "status"
-        ).annotate(total=Count("id"))
-
-        (
-            country_stats,
-            status_totals,
-            totals_per_continent,
-        ) = self._aggregate_data_by_country(grants_by_country, statuses)
-        gender_stats = self._aggregate_data_by_gender(filtered_grants, statuses)
-        financial_summary, total_amount = self._aggregate_financial_data_by_status(
-            filtered_grants, statuses
-        )
-
-        sorted_country_stats = dict(
-            sorted(country_stats.items(), key=lambda x: (x[0][0], x[0][2]))
-        )
+        raw_filter_params, formatted_filters = self._filter_and_format_grants(request)
 
         context = {
-            "country_stats": sorted_country_stats,
-            "statuses": statuses,
+            **get_grants_summary(raw_filter_params),
+            "statuses": Grant.Status.choices,
             "genders": {code: name for code, name in GENDERS},
-            "financial_summary": financial_summary,
-            "total_amount": total_amount,
-            "total_grants": filtered_grants.count(),
-            "status_totals": status_totals,
-            "totals_per_continent": totals_per_continent,
-            "gender_stats": gender_stats,
             "filters": formatted_filters,
             **self.admin_site.each_context(request),
         }
         return TemplateResponse(request, "admin/grants/grant_summary.html", context)
 
-    def _aggregate_data_by_country(self, grants_by_country, statuses):
-        """
-        Aggregates grant data by country and status.
-        """
-
-        summary = {}
-        status_totals = {status[0]: 0 for status in statuses}
-        totals_per_continent = {}
-
-        for data in grants_by_country:
-            country = countries.get(code=data["travelling_from"])
-            continent = country.continent.name if country else "Unknown"
-            country_name = f"{country.name} {country.emoji}" if country else "Unknown"
-            country_code = country.code if country else "Unknown"
-            key = (continent, country_name, country_code)
-
-            if key not in summary:
-                summary[key] = {status[0]: 0 for status in statuses}
-
-            summary[key][data["status"]] += data["total"]
-            status_totals[data["status"]] += data["total"]
-
-            # Update continent totals
-            if continent not in totals_per_continent:
-                totals_per_continent[continent] = {status[0]: 0 for status in statuses}
-            totals_per_continent[continent][data["status"]] += data["total"]
-
-        return summary, status_totals, totals_per_continent
-
-    def _aggregate_data_by_gender(self, filtered_grants, statuses):
-        """
-        Aggregates grant data by gender and status.
-        """
-        gender_data = filtered_grants.values("gender", "status").annotate(
-            total=Count("id")
-        )
-        gender_summary = {
-            gender: {status[0]: 0 for status in statuses} for gender, _ in GENDERS
-        }
-        gender_summary[""] = {
-            status[0]: 0 for status in statuses
-        }  # For unspecified genders
-
-        for data in gender_data:
-            gender = data["gender"] if data["gender"] else ""
-            status = data["status"]
-            total = data["total"]
-            gender_summary[gender][status] += total
-
-        return gender_summary
-
-    def _aggregate_financial_data_by_status(self, filtered_grants, statuses):
-        """
-        Aggregates financial data (total amounts) by grant status.
-        """
-        financial_data = filtered_grants.values("status").annotate(
-            total_amount_sum=Sum("total_amount")
-        )
-        financial_summary = {status[0]: 0 for status in statuses}
-        overall_total = 0
-
-        for data in financial_data:
-            status = data["status"]
-            total_amount = data["total_amount_sum"] or 0
-            financial_summary[status] += total_amount
-            overall_total += total_amount
-
-        return financial_summary, overall_total
-
     def _filter_and_format_grants(self, request):
         """
-        Filters the Grant queryset based on request parameters and
+        Picks the Grant filters from the request parameters and
         formats the filter keys for display.
         """
         field_lookups = [
@@ -734,9 +557,25 @@ class GrantAdmin(ExportMixin, ConferencePermissionMixin, admin.ModelAdmin):
         }
         filter_params = {map_filter_key(k): v for k, v in raw_filter_params.items()}
 
-        filtered_grants = Grant.objects.filter(**raw_filter_params)
-
-        return filtered_grants, filter_params
+        return raw_filter_params, filter_params
 
     class Media:
         js = ["admin/js/jquery.init.js"]
+
+
+@admin.register(GrantExport)
+class GrantExportAdmin(ConferencePermissionMixin, admin.ModelAdmin):
+    list_display = ("conference", "requested_by", "format", "status", "created")
+    list_filter = ("conference", "status")
+    readonly_fields = (
+        "conference",
+        "requested_by",
+        "format",
+        "status",
+        "file",
+        "created",
+    )
+    exclude = ("grant_ids",)
+
+    def has_add_permission(self, request):
+        return False
@@ -1,5 +1,14 @@
 from django.apps import AppConfig
+from django.db.models.signals import post_delete, post_save
 
 
 class GrantsConfig(AppConfig):
     name = "grants"
+
+    def ready(self):
+        from grants.models import Grant
+
+        from . import signals
+
+        post_save.connect(signals.invalidate_conference_grants_summary, sender=Grant)
+        post_delete.connect(signals.invalidate_conference_grants_summary, sender=Grant)
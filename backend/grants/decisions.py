@@ -0,0 +1,78 @@
+from itertools import islice
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from celery import group
+from django.db import transaction
+from django.utils import timezone
+
+from grants.models import Grant, calculate_grant_amounts
+from grants.summary import invalidate_grants_summary
+from grants.tasks import send_grant_reply_emails
+
+# Grants whose reply emails are sent by the same task
+REPLY_EMAILS_CHUNK_SIZE = 50
+
+DECISION_FIELDS = [
+    "status",
+    "approved_type",
+    "country_type",
+    "ticket_amount",
+    "accommodation_amount",
+    "travel_amount",
+    "total_amount",
+    "modified",
+]
+
+
+def apply_grant_decisions(
+    conference, decisions: Dict[int, Tuple[str, Optional[str]]]
+) -> List[Grant]:
+    """
+    Sets the (status, approved type) decided for each grant of the conference,
+    recalculating the amounts of the newly approved ones, in a single update
+    """
+    grants = []
+
+    for grant in conference.grants.filter(id__in=decisions.keys()):
+        status, approved_type = decisions[grant.id]
+
+        if status not in Grant.REVIEW_SESSION_STATUSES_OPTIONS:
+            continue
+
+        grant.status = status
+        grant.approved_type = approved_type if status == Grant.Status.approved else None
+        grant._update_country_type()
+        grants.append(grant)
+
+    to_calculate = [grant for grant in grants if grant._should_calculate_amounts()]
+
+    for grant, amounts in zip(
+        to_calculate, calculate_grant_amounts(conference, to_calculate)
+    ):
+        grant._set_amounts(amounts)
+
+    now = timezone.now()
+
+    for grant in grants:
+        grant.modified = now
+
+    with transaction.atomic():
+        Grant.objects.bulk_update(grants, fields=DECISION_FIELDS)
+        # bulk_update doesn't send post_save
+        invalidate_grants_summary(conference.id)
+
+    for grant in grants:
+        grant._mark_as_saved()
+
+    return grants
+
+
+def queue_grant_reply_emails(grant_ids: Iterable[int]) -> None:
+    """Sends the reply emails of the grants as one group of chunked tasks"""
+    grant_ids = iter(grant_ids)
+    chunks = list(iter(lambda: list(islice(grant_ids, REPLY_EMAILS_CHUNK_SIZE)), []))
+
+    if not chunks:
+        return
+
+    group([send_grant_reply_emails.s(grant_ids=chunk) for chunk in chunks]).delay()
@@ -0,0 +1,152 @@
+from collections import defaultdict
+from itertools import islice
+from typing import List
+
+from django.db.models import QuerySet
+from import_export.fields import Field
+from import_export.resources import ModelResource
+
+from grants.models import Grant
+from submissions.models import Submission
+
+EXPORT_GRANTS_FIELDS = (
+    "name",
+    "full_name",
+    "gender",
+    "occupation",
+    "grant_type",
+    "python_usage",
+    "been_to_other_events",
+    "interested_in_volunteering",
+    "needs_funds_for_travel",
+    "why",
+    "notes",
+    "travelling_from",
+    "conference__code",
+    "created",
+)
+
+
+class GrantResource(ModelResource):
+    search_field = "user_id"
+    age_group = Field()
+    email = Field()
+    has_sent_submission = Field()
+    submission_title = Field()
+    submission_tags = Field()
+    submission_admin_link = Field()
+    submission_pycon_link = Field()
+    grant_admin_link = Field()
+
+    def dehydrate_email(self, obj: Grant):
+        if obj.user_id:
+            return obj.user.email
+
+        # old grants have email in the model.
+        return obj.email
+
+    def dehydrate_age_group(self, obj: Grant):
+        if not obj.age_group:
+            return ""
+
+        return Grant.AgeGroup(obj.age_group).label
+
+    def dehydrate_has_sent_submission(self, obj: Grant) -> str:
+        return "TRUE" if self._get_submissions(obj) else "FALSE"
+
+    def _get_submissions(self, obj: Grant) -> List[Submission]:
+        # Loaded by `iter_queryset` for each chunk of grants
+        return getattr(obj, "exported_submissions", [])
+
+    def dehydrate_submission_title(self, obj: Grant):
+        submissions = self._get_submissions(obj)
+        if not submissions:
+            return
+
+        return "\n".join([s.title.localize("en") for s in submissions])
+
+    def dehydrate_submission_tags(self, obj: Grant):
+        submissions = self._get_submissions(obj)
+        if not submissions:
+            return
+
+        return "\n".join(
+            [
+                ", ".join(
+                    [
+                        f"{r.tag.name}: {r.rank} / {r.total_submissions_per_tag}"
+                        for r in s.rankings.all()
+                    ]
+                )
+                for s in submissions
+            ]
+        )
+
+    def dehydrate_submission_pycon_link(self, obj):
+        submissions = self._get_submissions(obj)
+        if not submissions:
+            return
+        return "\n".join(
+            [f"https://pycon.it/submission/{s.hashid}" for s in submissions]
+        )
+
+    def dehydrate_submission_admin_link(self, obj):
+        submissions = self._get_submissions(obj)
+        if not submissions:
+            return
+        return "\n".join(
+            [
+                f"https://admin.pycon.it/admin/submissions/submission/{s.id}/change/"
+                for s in submissions
+            ]
+        )
+
+    def dehydrate_grant_admin_link(self, obj: Grant):
+        return f"https://admin.pycon.it/admin/grants/grant/?q={'+'.join(obj.full_name.split(' '))}"  # noqa: E501
+
+    def iter_queryset(self, queryset):
+        """
+        Streams the grants from a database cursor, loading the submissions
+        of each chunk of grants with a fixed number of queries
+        """
+        if not isinstance(queryset, QuerySet):
+            yield from queryset
+            return
+
+        chunk_size = self.get_chunk_size()
+        grants = queryset.select_related("user", "conference").iterator(
+            chunk_size=chunk_size
+        )
+
+        while chunk := list(islice(grants, chunk_size)):
+            _load_submissions(chunk)
+            yield from chunk
+
+    def get_export_rows(self, queryset):
+        """The exported values of each grant, without keeping them in memory"""
+        for grant in self.iter_queryset(queryset):
+            yield self.export_resource(grant)
+
+    class Meta:
+        model = Grant
+        fields = EXPORT_GRANTS_FIELDS
+        export_order = EXPORT_GRANTS_FIELDS
+        chunk_size = 500
+
+
+def _load_submissions(grants: List[Grant]):
+    submissions = Submission.objects.prefetch_related("rankings__tag").filter(
+        speaker_id__in={grant.user_id for grant in grants if grant.user_id},
+        conference_id__in={grant.conference_id for grant in grants},
+    )
+
+    submissions_by_speaker = defaultdict(list)
+    for submission in submissions:
+        submissions_by_speaker[
+            (submission.speaker_id, submission.conference_id)
+        ].append(submission)
+
+    for grant in grants:
+        grant.exported_submissions = submissions_by_speaker.get(
+            (grant.user_id, grant.conference_id), []
+        )
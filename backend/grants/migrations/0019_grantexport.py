@@ -0,0 +1,36 @@
+# Generated by Django 4.2.7 on 2026-10-18 19:21
+
+from django.conf import settings
+from django.db import migrations, models
+import django.db.models.deletion
+import django.utils.timezone
+import model_utils.fields
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('conferences', '0041_remove_conference_visa_application_form_link'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+        ('grants', '0018_grant_plain_thread_id'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='GrantExport',
+            fields=[
+                ('id', models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('created', model_utils.fields.AutoCreatedField(default=django.utils.timezone.now, editable=False, verbose_name='created')),
+                ('modified', model_utils.fields.AutoLastModifiedField(default=django.utils.timezone.now, editable=False, verbose_name='modified')),
+                ('grant_ids', models.JSONField(default=list, verbose_name='grant ids')),
+                ('status', models.CharField(choices=[('pending', 'Pending'), ('running', 'Running'), ('completed', 'Completed'), ('failed', 'Failed')], default='pending', max_length=20, verbose_name='status')),
+                ('format', models.CharField(choices=[('csv', 'CSV'), ('xlsx', 'XLSX')], default='csv', max_length=10, verbose_name='format')),
+                ('file', models.FileField(blank=True, upload_to='grant_exports', verbose_name='file')),
+                ('conference', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='grant_exports', to='conferences.conference', verbose_name='conference')),
+                ('requested_by', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='+', to=settings.AUTH_USER_MODEL, verbose_name='Requested By')),
+            ],
+            options={
+                'abstract': False,
+            },
+        ),
+    ]
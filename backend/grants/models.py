@@ -1,3 +1,6 @@
+from decimal import Decimal
+from typing import Iterable, List, NamedTuple
+
 from conferences.querysets import ConferenceQuerySetMixin
 from django.db import models
 from django.urls import reverse
@@ -6,6 +9,7 @@ from model_utils.models import TimeStampedModel
 
 from countries import countries
 from helpers.constants import GENDERS
+from helpers.models import ExportModel
 from users.models import User
 
 
@@ -243,59 +247,35 @@ class Grant(TimeStampedModel):
 
         super().save(*args, **kwargs)
 
-        self._original_approved_type = self.approved_type
-        self._original_country_type = self.country_type
-        self._original_status = self.status
+        self._mark_as_saved()
 
-    def _calculate_grant_amounts(self):
+    def _should_calculate_amounts(self):
         if self.status != Grant.Status.approved:
-            return
+            return False
 
-        if (
-            self._original_status == self.status
-            and self._original_approved_type == self.approved_type
-            and self._original_country_type == self.country_type
-        ):
+        return (
+            self._original_status != self.status
+            or self._original_approved_type != self.approved_type
+            or self._original_country_type != self.country_type
+        )
+
+    def _calculate_grant_amounts(self):
+        if not self._should_calculate_amounts():
             return
 
-        conference = self.conference
-        self.ticket_amount = conference.grants_default_ticket_amount or 0
-        self.accommodation_amount = 0
-        self.travel_amount = 0
+        (amounts,) = calculate_grant_amounts(self.conference, [self])
+        self._set_amounts(amounts)
 
-        default_accommodation_amount = (
-            conference.grants_default_accommodation_amount or 0
-        )
-        default_travel_from_italy_amount = (
-            conference.grants_default_travel_from_italy_amount or 0
-        )
-        default_travel_from_europe_amount = (
-            conference.grants_default_travel_from_europe_amount or 0
-        )
-        default_travel_from_extra_eu_amount = (
-            conference.grants_default_travel_from_extra_eu_amount or 0
-        )
+    def _set_amounts(self, amounts: "GrantAmounts"):
+        self.ticket_amount = amounts.ticket_amount
+        self.accommodation_amount = amounts.accommodation_amount
+        self.travel_amount = amounts.travel_amount
+        self.total_amount = amounts.total_amount
 
-        if self.approved_type in (
-            Grant.ApprovedType.ticket_accommodation,
-            Grant.ApprovedType.ticket_travel_accommodation,
-        ):
-            self.accommodation_amount = default_accommodation_amount
-
-        if self.approved_type in (
-            Grant.ApprovedType.ticket_travel_accommodation,
-            Grant.ApprovedType.ticket_travel,
-        ):
-            if self.country_type == Grant.CountryType.italy:
-                self.travel_amount = default_travel_from_italy_amount
-            elif self.country_type == Grant.CountryType.europe:
-                self.travel_amount = default_travel_from_europe_amount
-            elif self.country_type == Grant.CountryType.extra_eu:
-                self.travel_amount = default_travel_from_extra_eu_amount
-
-        self.total_amount = (
-            self.ticket_amount + self.accommodation_amount + self.travel_amount
-        )
+    def _mark_as_saved(self):
+        self._original_approved_type = self.approved_type
+        self._original_country_type = self.country_type
+        self._original_status = self.status
 
     def _update_country_type(self):
         if not self.travelling_from:
@@ -330,3 +310,74 @@ class Grant(TimeStampedModel):
             self.approved_type == Grant.ApprovedType.ticket_accommodation
             or self.approved_type == Grant.ApprovedType.ticket_travel_accommodation
         )
+
+
+class GrantExport(ExportModel):
+    EXPORTS_DIRECTORY = "grant_exports"
+
+    conference = models.ForeignKey(
+        "conferences.Conference",
+        on_delete=models.CASCADE,
+        verbose_name=_("conference"),
+        related_name="grant_exports",
+    )
+    requested_by = models.ForeignKey(
+        "users.User",
+        on_delete=models.CASCADE,
+        verbose_name=_("Requested By"),
+        related_name="+",
+    )
+    grant_ids = models.JSONField(_("grant ids"), default=list)
+
+    def __str__(self):
+        return f"Grants export of {self.conference} ({self.created:%Y-%m-%d %H:%M})"
+
+
+class GrantAmounts(NamedTuple):
+    ticket_amount: Decimal
+    accommodation_amount: Decimal
+    travel_amount: Decimal
+    total_amount: Decimal
+
+
+def calculate_grant_amounts(conference, grants: Iterable[Grant]) -> List[GrantAmounts]:
+    """
+    The amounts of the grants from the default amounts of the conference,
+    based on what was approved and where the grantees travel from
+    """
+    ticket_amount = conference.grants_default_ticket_amount or 0
+    default_accommodation_amount = conference.grants_default_accommodation_amount or 0
+    default_travel_amounts = {
+        Grant.CountryType.italy: (
+            conference.grants_default_travel_from_italy_amount or 0
+        ),
+        Grant.CountryType.europe: (
+            conference.grants_default_travel_from_europe_amount or 0
+        ),
+        Grant.CountryType.extra_eu: (
+            conference.grants_default_travel_from_extra_eu_amount or 0
+        ),
+    }
+
+    amounts = []
+
+    for grant in grants:
+        accommodation_amount = 0
+        travel_amount = 0
+
+        if grant.has_approved_accommodation():
+            accommodation_amount = default_accommodation_amount
+
+        if grant.has_approved_travel():
+            travel_amount = default_travel_amounts.get(grant.country_type, 0)
+
+        amounts.append(
+            GrantAmounts(
+                ticket_amount=ticket_amount,
+                accommodation_amount=accommodation_amount,
+                travel_amount=travel_amount,
+                total_amount=ticket_amount + accommodation_amount + travel_amount,
+            )
+        )
+
+    return amounts
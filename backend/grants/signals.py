@@ -0,0 +1,5 @@
+from grants.summary import invalidate_grants_summary
+
+
+def invalidate_conference_grants_summary(sender, instance, **kwargs):
+    invalidate_grants_summary(instance.conference_id)
@@ -0,0 +1,129 @@
+import hashlib
+import json
+import uuid
+from typing import Any, Dict
+
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models import Count, QuerySet, Sum
+
+from countries import countries
+from grants.models import Grant
+from helpers.constants import GENDERS
+from helpers.metrics import record_cache_lookup
+
+SUMMARY_TIMEOUT = 60 * 60 * 24
+
+# Version of the summaries not filtered by conference,
+# changed together with the version of every conference
+ALL_CONFERENCES = "all"
+
+
+def _version_cache_key(conference_id) -> str:
+    return f"grants-summary:{conference_id}:version"
+
+
+def _summary_cache_key(conference_id, version: str, filters: Dict[str, str]) -> str:
+    filters_hash = hashlib.sha256(
+        json.dumps(filters, sort_keys=True).encode()
+    ).hexdigest()
+    return f"grants-summary:{conference_id}:{version}:{filters_hash}"
+
+
+def get_grants_summary_version(conference_id) -> str:
+    return cache.get_or_set(
+        _version_cache_key(conference_id), lambda: uuid.uuid4().hex, timeout=None
+    )
+
+
+def invalidate_grants_summary(conference_id: int):
+    """
+    Gives the grants of the conference a new version, the summaries
+    are computed again on the next request.
+
+    The version changes after the transaction commits, otherwise the
+    new summary could be computed from the data before the change.
+    """
+
+    def bump_version():
+        cache.set_many(
+            {
+                _version_cache_key(conference_id): uuid.uuid4().hex,
+                _version_cache_key(ALL_CONFERENCES): uuid.uuid4().hex,
+            },
+            timeout=None,
+        )
+
+    transaction.on_commit(bump_version)
+
+
+def build_grants_summary(grants: QuerySet) -> Dict[str, Any]:
+    """
+    Counts and sums the grants by country, gender and status with a single
+    grouped query, then pivots the groups into every table of the summary
+    """
+    statuses = [status for status, _ in Grant.Status.choices]
+
+    def by_status():
+        return {status: 0 for status in statuses}
+
+    rows = (
+        grants.order_by()
+        .values_list("travelling_from", "gender", "status")
+        .annotate(count=Count("pk"), amount=Sum("total_amount"))
+    )
+
+    country_stats = {}
+    totals_per_continent = {}
+    status_totals = by_status()
+    gender_stats = {gender: by_status() for gender, _ in GENDERS}
+    # For unspecified genders
+    gender_stats[""] = by_status()
+    financial_summary = by_status()
+    total_amount = 0
+    total_grants = 0
+
+    for travelling_from, gender, status, count, amount in rows:
+        country = countries.get(code=travelling_from)
+        continent = country.continent.name if country else "Unknown"
+        country_name = f"{country.name} {country.emoji}" if country else "Unknown"
+        country_code = country.code if country else "Unknown"
+        key = (continent, country_name, country_code)
+
+        country_stats.setdefault(key, by_status())[status] += count
+        totals_per_continent.setdefault(continent, by_status())[status] += count
+        status_totals[status] += count
+        gender_stats[gender or ""][status] += count
+        financial_summary[status] += amount or 0
+        total_amount += amount or 0
+        total_grants += count
+
+    return {
+        "country_stats": dict(
+            sorted(country_stats.items(), key=lambda x: (x[0][0], x[0][2]))
+        ),
+        "status_totals": status_totals,
+        "totals_per_continent": totals_per_continent,
+        "gender_stats": gender_stats,
+        "financial_summary": financial_summary,
+        "total_amount": total_amount,
+        "total_grants": total_grants,
+    }
+
+
+def get_grants_summary(filters: Dict[str, str]) -> Dict[str, Any]:
+    """
+    The summary of the grants matching the admin filters, computed again
+    only when a grant of the filtered conference changed
+    """
+    conference_id = filters.get("conference__id__exact") or ALL_CONFERENCES
+    version = get_grants_summary_version(conference_id)
+    cache_key = _summary_cache_key(conference_id, version, filters)
+    summary = cache.get(cache_key)
+    record_cache_lookup("grants_summary", hit=summary is not None)
+
+    if summary is None:
+        summary = build_grants_summary(Grant.objects.filter(**filters))
+        cache.set(cache_key, summary, timeout=SUMMARY_TIMEOUT)
+
+    return summary
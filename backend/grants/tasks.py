@@ -6,7 +6,9 @@ from django.utils import timezone
 from pythonit_toolkit.emails.templates import EmailTemplate
 
 from users.models import User
-from grants.models import Grant
+from grants.exports import GrantResource
+from grants.models import Grant, GrantExport
+from helpers.exports import run_export
 from integrations import plain, slack
 from notifications.emails import send_email
 
@@ -91,6 +93,24 @@ def send_grant_reply_rejected_email(grant_id):
     logger.info("Email sent for Grant %s", grant.id)
 
 
+@app.task
+def send_grant_reply_emails(*, grant_ids):
+    """Sends the reply email matching the current status of each grant"""
+    for grant_id, status in Grant.objects.filter(id__in=grant_ids).values_list(
+        "id", "status"
+    ):
+        try:
+            if status == Grant.Status.approved:
+                send_grant_reply_approved_email(grant_id=grant_id, is_reminder=False)
+            elif status in (Grant.Status.waiting_list, Grant.Status.waiting_list_maybe):
+                send_grant_reply_waiting_list_email(grant_id=grant_id)
+            elif status == Grant.Status.rejected:
+                send_grant_reply_rejected_email(grant_id=grant_id)
+        except Exception:
+            # One failing email shouldn't stop the others in the chunk
+            logger.exception("Unable to send the reply email for Grant %s", grant_id)
+
+
 @app.task
 def notify_new_grant_reply_slack(*, grant_id, admin_url):
     grant = Grant.objects.get(id=grant_id)
@@ -173,6 +193,21 @@ def send_new_plain_chat(*, grant_id, message):
     grant.save()
 
 
+@app.task
+def export_grants(*, grant_export_id):
+    grant_export = GrantExport.objects.get(id=grant_export_id)
+    resource = GrantResource()
+    grants = Grant.objects.filter(id__in=grant_export.grant_ids).order_by("id")
+
+    run_export(
+        grant_export,
+        name="grants",
+        title="Grants",
+        headers=resource.get_export_headers(),
+        rows=resource.get_export_rows(grants),
+    )
+
+
 def _send_grant_waiting_list_email(grant_id, template):
     grant = Grant.objects.get(id=grant_id)
     reply_url = urljoin(settings.FRONTEND_URL, "/grants/reply/")
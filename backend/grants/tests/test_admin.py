@@ -3,6 +3,7 @@ from unittest.mock import call
 
 import time_machine
 import pytest
+from django.urls import reverse
 from django.utils import timezone
 
 from grants.admin import (
@@ -34,13 +35,13 @@ def test_send_reply_emails_with_grants_from_multiple_conferences_fails(
     grant3 = grant_factory(conference=conference2, status=Grant.Status.rejected)
     request = rf.get("/")
     mock_send_approved_email = mocker.patch(
-        "grants.admin.send_grant_reply_approved_email.delay"
+        "grants.tasks.send_grant_reply_approved_email"
     )
     mock_send_waiting_list_email = mocker.patch(
-        "grants.admin.send_grant_reply_waiting_list_email.delay"
+        "grants.tasks.send_grant_reply_waiting_list_email"
     )
     mock_send_rejected_email = mocker.patch(
-        "grants.admin.send_grant_reply_rejected_email.delay"
+        "grants.tasks.send_grant_reply_rejected_email"
     )
 
     send_reply_emails(
@@ -65,7 +66,7 @@ def test_send_reply_emails_approved_grant_missing_approved_type(
     grant = grant_factory(status=Grant.Status.approved, approved_type=None)
     request = rf.get("/")
     mock_send_approved_email = mocker.patch(
-        "grants.admin.send_grant_reply_approved_email.delay"
+        "grants.tasks.send_grant_reply_approved_email"
     )
 
     send_reply_emails(None, request=request, queryset=Grant.objects.all())
@@ -88,7 +89,7 @@ def test_send_reply_emails_approved_missing_amount(rf, grant_factory, mocker):
     grant.save()
     request = rf.get("/")
     mock_send_approved_email = mocker.patch(
-        "grants.admin.send_grant_reply_approved_email.delay"
+        "grants.tasks.send_grant_reply_approved_email"
     )
 
     send_reply_emails(None, request=request, queryset=Grant.objects.all())
@@ -111,7 +112,7 @@ def test_send_reply_emails_approved_set_deadline_in_fourteen_days(
     )
     request = rf.get("/")
     mock_send_approved_email = mocker.patch(
-        "grants.admin.send_grant_reply_approved_email.delay"
+        "grants.tasks.send_grant_reply_approved_email"
     )
 
     send_reply_emails(None, request=request, queryset=Grant.objects.all())
@@ -138,7 +139,7 @@ def test_send_reply_emails_waiting_list(rf, grant_factory, mocker):
     )
     request = rf.get("/")
     mock_send_waiting_list_email = mocker.patch(
-        "grants.admin.send_grant_reply_waiting_list_email.delay"
+        "grants.tasks.send_grant_reply_waiting_list_email"
     )
 
     send_reply_emails(None, request=request, queryset=Grant.objects.all())
@@ -156,7 +157,7 @@ def test_send_reply_emails_waiting_list_maybe(rf, grant_factory, mocker):
     )
     request = rf.get("/")
     mock_send_waiting_list_email = mocker.patch(
-        "grants.admin.send_grant_reply_waiting_list_email.delay"
+        "grants.tasks.send_grant_reply_waiting_list_email"
     )
 
     send_reply_emails(None, request=request, queryset=Grant.objects.all())
@@ -174,7 +175,7 @@ def test_send_reply_emails_rejected(rf, grant_factory, mocker):
     )
     request = rf.get("/")
     mock_send_rejected_email = mocker.patch(
-        "grants.admin.send_grant_reply_rejected_email.delay"
+        "grants.tasks.send_grant_reply_rejected_email"
     )
 
     send_reply_emails(None, request=request, queryset=Grant.objects.all())
@@ -504,3 +505,40 @@ def test_create_grant_vouchers_only_for_confirmed_grants(
     assert grant_1.voucher_code is None
     assert grant_2.pretix_voucher_id == 1
     assert grant_2.voucher_code == "GRANT-123ZYZ"
+
+
+def test_summary_view(admin_client, grant_factory, conference):
+    approved_grant = grant_factory(
+        conference=conference,
+        status=Grant.Status.approved,
+        gender="female",
+        travelling_from="IT",
+    )
+    other_approved_grant = grant_factory(
+        conference=conference,
+        status=Grant.Status.approved,
+        gender="male",
+        travelling_from="IT",
+    )
+    grant_factory(
+        conference=conference,
+        status=Grant.Status.rejected,
+        gender="",
+        travelling_from="FR",
+    )
+
+    response = admin_client.get(
+        reverse("admin:grants-summary"), {"conference__id__exact": conference.id}
+    )
+
+    assert response.status_code == 200
+    context = response.context
+    assert context["total_grants"] == 3
+    assert context["status_totals"][Grant.Status.approved] == 2
+    assert context["status_totals"][Grant.Status.rejected] == 1
+    assert context["totals_per_continent"]["Europe"][Grant.Status.approved] == 2
+    assert context["gender_stats"]["female"][Grant.Status.approved] == 1
+    assert context["gender_stats"][""][Grant.Status.rejected] == 1
+    expected_amount = approved_grant.total_amount + other_approved_grant.total_amount
+    assert context["financial_summary"][Grant.Status.approved] == expected_amount
+    assert context["total_amount"] == expected_amount
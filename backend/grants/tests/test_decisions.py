@@ -0,0 +1,77 @@
+from grants.decisions import apply_grant_decisions, queue_grant_reply_emails
+from grants.models import Grant
+from grants.tests.factories import GrantFactory
+from conferences.tests.factories import ConferenceFactory
+import pytest
+
+
+pytestmark = pytest.mark.django_db
+
+
+def test_apply_grant_decisions():
+    conference = ConferenceFactory(
+        grants_default_ticket_amount=100,
+        grants_default_accommodation_amount=200,
+        grants_default_travel_from_italy_amount=300,
+        grants_default_travel_from_europe_amount=400,
+        grants_default_travel_from_extra_eu_amount=500,
+    )
+    approved_grant = GrantFactory(
+        conference=conference, status=Grant.Status.pending, travelling_from="FR"
+    )
+    rejected_grant = GrantFactory(
+        conference=conference,
+        status=Grant.Status.pending,
+        approved_type=Grant.ApprovedType.ticket_only,
+    )
+    unchanged_grant = GrantFactory(conference=conference, status=Grant.Status.pending)
+    other_conference_grant = GrantFactory(status=Grant.Status.pending)
+
+    apply_grant_decisions(
+        conference,
+        {
+            approved_grant.id: (
+                Grant.Status.approved,
+                Grant.ApprovedType.ticket_travel_accommodation,
+            ),
+            rejected_grant.id: (
+                Grant.Status.rejected,
+                Grant.ApprovedType.ticket_only,
+            ),
+            unchanged_grant.id: (Grant.Status.confirmed, ""),
+            other_conference_grant.id: (Grant.Status.approved, ""),
+        },
+    )
+
+    approved_grant.refresh_from_db()
+    assert approved_grant.status == Grant.Status.approved
+    assert approved_grant.country_type == Grant.CountryType.europe
+    assert approved_grant.ticket_amount == 100
+    assert approved_grant.accommodation_amount == 200
+    assert approved_grant.travel_amount == 400
+    assert approved_grant.total_amount == 700
+
+    rejected_grant.refresh_from_db()
+    assert rejected_grant.status == Grant.Status.rejected
+    assert rejected_grant.approved_type is None
+
+    unchanged_grant.refresh_from_db()
+    assert unchanged_grant.status == Grant.Status.pending
+
+    other_conference_grant.refresh_from_db()
+    assert other_conference_grant.status == Grant.Status.pending
+
+
+def test_queue_grant_reply_emails_in_chunks(mocker):
+    mocker.patch("grants.decisions.REPLY_EMAILS_CHUNK_SIZE", 2)
+    mock_group = mocker.patch("grants.decisions.group")
+    mock_send_emails = mocker.patch("grants.decisions.send_grant_reply_emails")
+
+    queue_grant_reply_emails(iter([1, 2, 3, 4, 5]))
+
+    assert [call.kwargs for call in mock_send_emails.s.call_args_list] == [
+        {"grant_ids": [1, 2]},
+        {"grant_ids": [3, 4]},
+        {"grant_ids": [5]},
+    ]
+    mock_group.return_value.delay.assert_called_once()
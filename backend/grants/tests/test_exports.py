@@ -0,0 +1,89 @@
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from grants.admin import export_grants_as_xlsx
+from grants.exports import GrantResource
+from grants.models import Grant, GrantExport
+from grants.tasks import export_grants
+import pytest
+
+
+pytestmark = pytest.mark.django_db
+
+
+def _export_queries_count(queryset):
+    with CaptureQueriesContext(connection) as queries:
+        GrantResource().export(queryset=queryset)
+
+    return len(queries)
+
+
+def test_export_queries_dont_grow_with_the_grants(
+    grant_factory, submission_factory, conference
+):
+    for _ in range(3):
+        grant = grant_factory(conference=conference)
+        submission_factory(conference=conference, speaker=grant.user)
+
+    first_grant = Grant.objects.order_by("id").first()
+
+    assert _export_queries_count(
+        Grant.objects.filter(id=first_grant.id)
+    ) == _export_queries_count(Grant.objects.all())
+
+
+def test_export_grants(grant_factory, submission_factory, conference, admin_user):
+    grant = grant_factory(conference=conference, full_name="Marco Acierno")
+    submission = submission_factory(conference=conference, speaker=grant.user)
+    # Submissions of other conferences are not exported
+    other_submission = submission_factory(speaker=grant.user)
+    grant_without_submissions = grant_factory(conference=conference)
+    grant_export = GrantExport.objects.create(
+        conference=conference,
+        requested_by=admin_user,
+        grant_ids=[grant.id, grant_without_submissions.id],
+    )
+
+    export_grants(grant_export_id=grant_export.id)
+
+    grant_export.refresh_from_db()
+    assert grant_export.status == GrantExport.Status.COMPLETED
+
+    content = grant_export.file.read().decode()
+    rows = content.splitlines()
+    assert rows[0].startswith("name,full_name,")
+    assert "Marco Acierno" in content
+    assert f"https://pycon.it/submission/{submission.hashid}" in content
+    assert f"https://pycon.it/submission/{other_submission.hashid}" not in content
+    assert grant_without_submissions.full_name in content
+
+
+def test_export_grants_action(rf, grant_factory, conference, admin_user, mocker):
+    mocker.patch("grants.admin.messages")
+    mock_export = mocker.patch("grants.admin.export_grants")
+    grant = grant_factory(conference=conference)
+    request = rf.get("/")
+    request.user = admin_user
+
+    export_grants_as_xlsx(None, request=request, queryset=Grant.objects.all())
+
+    grant_export = GrantExport.objects.get()
+    assert grant_export.grant_ids == [grant.id]
+    assert grant_export.format == GrantExport.Format.XLSX
+    assert grant_export.status == GrantExport.Status.PENDING
+    mock_export.delay.assert_called_once_with(grant_export_id=grant_export.id)
+
+
+def test_export_grants_failure(grant_factory, conference, admin_user, mocker):
+    mocker.patch("helpers.exports.write_csv", side_effect=ValueError)
+    grant = grant_factory(conference=conference)
+    grant_export = GrantExport.objects.create(
+        conference=conference, requested_by=admin_user, grant_ids=[grant.id]
+    )
+
+    with pytest.raises(ValueError):
+        export_grants(grant_export_id=grant_export.id)
+
+    grant_export.refresh_from_db()
+    assert grant_export.status == GrantExport.Status.FAILED
+    assert not grant_export.file
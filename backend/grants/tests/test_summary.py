@@ -0,0 +1,56 @@
+from grants.decisions import apply_grant_decisions
+from grants.models import Grant
+from grants.summary import get_grants_summary
+import pytest
+
+
+pytestmark = pytest.mark.django_db
+
+
+def test_summary_is_cached_until_a_grant_changes(
+    locmem_cache,
+    grant_factory,
+    conference,
+    django_assert_num_queries,
+    django_capture_on_commit_callbacks,
+):
+    grant = grant_factory(
+        conference=conference, status=Grant.Status.pending, travelling_from="IT"
+    )
+    filters = {"conference__id__exact": str(conference.id)}
+
+    with django_assert_num_queries(1):
+        summary = get_grants_summary(filters)
+
+    assert summary["status_totals"][Grant.Status.pending] == 1
+
+    with django_assert_num_queries(0):
+        assert get_grants_summary(filters) == summary
+
+    with django_capture_on_commit_callbacks(execute=True):
+        grant.status = Grant.Status.rejected
+        grant.save()
+
+    summary = get_grants_summary(filters)
+    assert summary["status_totals"][Grant.Status.pending] == 0
+    assert summary["status_totals"][Grant.Status.rejected] == 1
+
+    with django_capture_on_commit_callbacks(execute=True):
+        apply_grant_decisions(conference, {grant.id: (Grant.Status.waiting_list, "")})
+
+    summary = get_grants_summary({})
+    assert summary["status_totals"][Grant.Status.waiting_list] == 1
+    assert summary["totals_per_continent"]["Europe"][Grant.Status.waiting_list] == 1
+
+
+def test_summary_is_cached_per_filters(locmem_cache, grant_factory, conference):
+    grant_factory(conference=conference, status=Grant.Status.approved)
+    grant_factory(conference=conference, status=Grant.Status.rejected)
+
+    approved_summary = get_grants_summary(
+        {"conference__id__exact": str(conference.id), "status__exact": "approved"}
+    )
+    summary = get_grants_summary({"conference__id__exact": str(conference.id)})
+
+    assert approved_summary["total_grants"] == 1
+    assert summary["total_grants"] == 2
@@ -14,6 +14,7 @@ from grants.tasks import (
     send_grant_reply_approved_email,
     send_grant_reply_rejected_email,
     send_grant_reply_waiting_list_email,
+    send_grant_reply_emails,
     send_new_plain_chat,
 )
 from grants.models import Grant
@@ -407,3 +408,30 @@ def test_send_new_plain_chat(mocker):
 
     grant.refresh_from_db()
     assert grant.plain_thread_id == "th_0123456789ABCDEFGHILMNOPQR"
+
+
+def test_send_grant_reply_emails(mocker):
+    approved_grant = GrantFactory(status=Grant.Status.approved)
+    waiting_list_grant = GrantFactory(status=Grant.Status.waiting_list_maybe)
+    rejected_grant = GrantFactory(status=Grant.Status.rejected)
+    pending_grant = GrantFactory(status=Grant.Status.pending)
+    mock_approved = mocker.patch(
+        "grants.tasks.send_grant_reply_approved_email",
+        side_effect=ValueError("Grant travel amount is set to Zero"),
+    )
+    mock_waiting_list = mocker.patch("grants.tasks.send_grant_reply_waiting_list_email")
+    mock_rejected = mocker.patch("grants.tasks.send_grant_reply_rejected_email")
+
+    send_grant_reply_emails(
+        grant_ids=[
+            approved_grant.id,
+            waiting_list_grant.id,
+            rejected_grant.id,
+            pending_grant.id,
+        ]
+    )
+
+    # A failing email doesn't stop the others
+    mock_approved.assert_called_once_with(grant_id=approved_grant.id, is_reminder=False)
+    mock_waiting_list.assert_called_once_with(grant_id=waiting_list_grant.id)
+    mock_rejected.assert_called_once_with(grant_id=rejected_grant.id)
@@ -0,0 +1,82 @@
+import csv
+import io
+import logging
+from datetime import datetime
+from tempfile import TemporaryFile
+from typing import Any, IO, Iterable, List
+
+from django.core.files import File
+from django.utils import timezone
+from openpyxl import Workbook
+
+from helpers.models import ExportModel
+
+logger = logging.getLogger(__name__)
+
+
+def write_csv(headers: List[str], rows: Iterable[List[Any]], file: IO[bytes]):
+    """Writes the rows to the binary file as they come"""
+    text_file = io.TextIOWrapper(file, encoding="utf-8", newline="")
+    writer = csv.writer(text_file)
+    writer.writerow(headers)
+    writer.writerows(rows)
+    text_file.flush()
+    # Leaves the underlying file open
+    text_file.detach()
+
+
+def _xlsx_value(value):
+    # Excel doesn't support timezones
+    if isinstance(value, datetime) and timezone.is_aware(value):
+        return timezone.localtime(value).replace(tzinfo=None)
+
+    return value
+
+
+def write_xlsx(
+    headers: List[str], rows: Iterable[List[Any]], file: IO[bytes], title: str
+):
+    """Writes the rows to the binary file as they come"""
+    # Write only workbooks keep the rows on disk instead of in memory
+    workbook = Workbook(write_only=True)
+    sheet = workbook.create_sheet(title)
+    sheet.append(headers)
+
+    for row in rows:
+        sheet.append([_xlsx_value(value) for value in row])
+
+    workbook.save(file)
+
+
+def run_export(
+    export: ExportModel,
+    *,
+    name: str,
+    title: str,
+    headers: List[str],
+    rows: Iterable[List[Any]],
+):
+    """
+    Writes the rows to the file of the export in its format, going through
+    the running and then completed (or failed) statuses
+    """
+    export.status = ExportModel.Status.RUNNING
+    export.save(update_fields=["status", "modified"])
+
+    try:
+        with TemporaryFile() as file:
+            if export.format == ExportModel.Format.XLSX:
+                write_xlsx(headers, rows, file, title=title)
+            else:
+                write_csv(headers, rows, file)
+
+            file.seek(0)
+            export.file.save(f"{name}.{export.format}", File(file), save=False)
+    except Exception:
+        logger.exception("Unable to write %s %s", export._meta.verbose_name, export.id)
+        export.status = ExportModel.Status.FAILED
+        export.save(update_fields=["status", "modified"])
+        raise
+
+    export.status = ExportModel.Status.COMPLETED
+    export.save(update_fields=["status", "file", "modified"])
@@ -0,0 +1,119 @@
+import time
+from collections import defaultdict
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Dict, Iterator, Optional
+
+from django.db import connections
+
+
+def _new_timing():
+    return {"count": 0, "time": 0.0}
+
+
+class RequestMetrics:
+    """
+    Collects the SQL queries and outbound HTTP calls made while handling
+    a request, optionally attributing them to the code that is running
+    (e.g. the GraphQL resolver path).
+    """
+
+    def __init__(self):
+        self.sql = _new_timing()
+        self.http: Dict[str, Dict] = defaultdict(_new_timing)
+        self.caches: Dict[str, Dict] = defaultdict(lambda: {"hits": 0, "misses": 0})
+        # Static cost of the GraphQL operation, see `api.cost`
+        self.cost: Optional[int] = None
+        self.current_scope: Optional[str] = None
+        self.scopes: Dict[str, Dict] = defaultdict(
+            lambda: {"calls": 0, "time": 0.0, "sql": _new_timing()}
+        )
+
+    def record_query(self, duration: float):
+        self.sql["count"] += 1
+        self.sql["time"] += duration
+
+        if self.current_scope is not None:
+            scope_sql = self.scopes[self.current_scope]["sql"]
+            scope_sql["count"] += 1
+            scope_sql["time"] += duration
+
+    def record_http_call(self, service: str, duration: float):
+        self.http[service]["count"] += 1
+        self.http[service]["time"] += duration
+
+    def record_cache_lookup(self, name: str, hit: bool):
+        self.caches[name]["hits" if hit else "misses"] += 1
+
+    @contextmanager
+    def scope(self, name: str) -> Iterator[None]:
+        previous_scope = self.current_scope
+        self.current_scope = name
+        start = time.perf_counter()
+
+        try:
+            yield
+        finally:
+            scope = self.scopes[name]
+            scope["calls"] += 1
+            scope["time"] += time.perf_counter() - start
+            self.current_scope = previous_scope
+
+
+_current_metrics: ContextVar[Optional[RequestMetrics]] = ContextVar(
+    "current_metrics", default=None
+)
+
+
+@contextmanager
+def collect_metrics() -> Iterator[RequestMetrics]:
+    metrics = RequestMetrics()
+    token = _current_metrics.set(metrics)
+
+    def execute_wrapper(execute, sql, params, many, context):
+        start = time.perf_counter()
+
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            metrics.record_query(time.perf_counter() - start)
+
+    try:
+        with _wrap_connections(execute_wrapper):
+            yield metrics
+    finally:
+        _current_metrics.reset(token)
+
+
+@contextmanager
+def _wrap_connections(execute_wrapper):
+    wrapped = []
+
+    try:
+        for connection in connections.all():
+            connection.execute_wrappers.append(execute_wrapper)
+            wrapped.append(connection)
+
+        yield
+    finally:
+        for connection in wrapped:
+            connection.execute_wrappers.remove(execute_wrapper)
+
+
+def get_current_metrics() -> Optional[RequestMetrics]:
+    return _current_metrics.get()
+
+
+def record_http_call(service: str, duration: float):
+    """Called by the clients of external services after every request"""
+    metrics = get_current_metrics()
+
+    if metrics is not None:
+        metrics.record_http_call(service, duration)
+
+
+def record_cache_lookup(name: str, hit: bool):
+    metrics = get_current_metrics()
+
+    if metrics is not None:
+        metrics.record_cache_lookup(name, hit)
@@ -1,5 +1,6 @@
 from django.db import models
 from django.utils.translation import gettext_lazy as _
+from model_utils.models import TimeStampedModel
 
 
 class GeoLocalizedModel(models.Model):
@@ -18,3 +19,38 @@ class GeoLocalizedModel(models.Model):
 
     class Meta:
         abstract = True
+
+
+def _export_upload_to(instance, filename):
+    return f"{instance.EXPORTS_DIRECTORY}/{filename}"
+
+
+class ExportModel(TimeStampedModel):
+    """
+    An abstract base class model for the files exported in the background,
+    written by `helpers.exports.run_export`. Subclasses set the directory
+    of the files in ``EXPORTS_DIRECTORY``.
+    """
+
+    EXPORTS_DIRECTORY = "exports"
+
+    class Status(models.TextChoices):
+        PENDING = "pending", _("Pending")
+        RUNNING = "running", _("Running")
+        COMPLETED = "completed", _("Completed")
+        FAILED = "failed", _("Failed")
+
+    class Format(models.TextChoices):
+        CSV = "csv", _("CSV")
+        XLSX = "xlsx", _("XLSX")
+
+    status = models.CharField(
+        _("status"), max_length=20, choices=Status.choices, default=Status.PENDING
+    )
+    format = models.CharField(
+        _("format"), max_length=10, choices=Format.choices, default=Format.CSV
+    )
+    file = models.FileField(_("file"), upload_to=_export_upload_to, blank=True)
+
+    class Meta:
+        abstract = True
@@ -0,0 +1,33 @@
+from typing import Any, Dict
+
+from django.db.models import Count, QuerySet, Sum
+
+
+def _group_by(queryset: QuerySet, fields, aggregate) -> Dict[Any, Any]:
+    # Clearing the ordering is needed, otherwise the fields
+    # of the default ordering end up in the GROUP BY
+    rows = queryset.order_by().values_list(*fields).annotate(aggregate)
+
+    if len(fields) == 1:
+        return {row[0]: row[1] for row in rows}
+
+    return {row[:-1]: row[-1] for row in rows}
+
+
+def count_by(queryset: QuerySet, *fields: str) -> Dict[Any, int]:
+    """
+    Counts the rows of the queryset grouped by the given fields
+    with a single query.
+
+    The result is keyed by the value of the field, or by a tuple of values
+    when grouping by more than one field. Groups without rows are missing.
+    """
+    return _group_by(queryset, fields, Count("pk"))
+
+
+def sum_by(queryset: QuerySet, field: str, *fields: str) -> Dict[Any, Any]:
+    """
+    Sums `field` over the rows of the queryset grouped by the given fields,
+    keyed like `count_by`.
+    """
+    return _group_by(queryset, fields, Sum(field))
@@ -2,12 +2,15 @@ from django.utils import timezone
 
 import enum
 import logging
+import time
 from typing import Literal, Optional
 
 import requests
 from django.conf import settings
 from requests.models import HTTPError, Response
 
+from helpers.metrics import record_http_call
+
 logger = logging.getLogger(__name__)
 
 
@@ -114,8 +117,13 @@ def call_flodesk_api(
         "Authorization": f"Basic {settings.FLODESK_API_KEY}",
     }
 
-    return getattr(requests, method.lower())(
-        f"{base_url}/{endpoint}",
-        json=json,
-        headers=headers,
-    )
+    start = time.perf_counter()
+
+    try:
+        return getattr(requests, method.lower())(
+            f"{base_url}/{endpoint}",
+            json=json,
+            headers=headers,
+        )
+    finally:
+        record_http_call("flodesk", time.perf_counter() - start)
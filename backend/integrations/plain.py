@@ -1,8 +1,10 @@
 import logging
+import time
 
 import requests
 from django.conf import settings
 
+from helpers.metrics import record_http_call
 from users.models import User
 
 logger = logging.getLogger(__name__)
@@ -24,6 +26,8 @@ def _raise_mutation_error(data, key: str):
 
 
 def _execute(query, variables):
+    start = time.perf_counter()
+
     try:
         response = requests.post(
             settings.PLAIN_API,
@@ -39,6 +43,8 @@ def _execute(query, variables):
     except requests.exceptions.HTTPError as e:
         data = e.response.json()
         raise PlainError(data["errors"][0]["message"]) from e
+    finally:
+        record_http_call("plain", time.perf_counter() - start)
 
 
 def create_customer(user: User) -> str:
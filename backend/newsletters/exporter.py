@@ -2,11 +2,9 @@ import dataclasses
 import typing
 from collections import defaultdict
 
-from django.db.models import Q
-
 from conferences.models import Conference
 from pretix import user_has_admission_ticket
-from schedule.models import ScheduleItem
+from schedule.models import ScheduleSpeaker
 from submissions.models import Submission
 from users.models import User
 
@@ -56,14 +54,18 @@ def convert_user_to_endpoint(user: User) -> Endpoint:
     submissions = Submission.objects.filter(speaker_id=user.id).values(
         "conference__code", "status"
     )
-    schedule_items = ScheduleItem.objects.filter(
-        Q(submission__speaker_id=user.id) | Q(additional_speakers__user_id=user.id)
-    ).values("conference__code", "title")
+    schedule_items = (
+        ScheduleSpeaker.objects.filter(user_id=user.id)
+        .values("schedule_item_id", "conference__code", "schedule_item__title")
+        .distinct()
+    )
 
     talks_by_conference: typing.DefaultDict[str, typing.List[str]] = defaultdict(list)
 
     for item in schedule_items:
-        talks_by_conference[item["conference__code"]].append(item["title"])
+        talks_by_conference[item["conference__code"]].append(
+            item["schedule_item__title"]
+        )
 
     return Endpoint(
         id=str(user.id),
@@ -1,23 +1,52 @@
 import logging
+import math
+from collections import deque
 from datetime import date
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterable, List, Optional, Set
 from urllib.parse import urljoin
 from django.utils.dateparse import parse_datetime
-import requests
 import strawberry
 from django.conf import settings
-from django.core.cache import cache
 from api.pretix.types import UpdateAttendeeTicketInput, Voucher
 from conferences.models.conference import Conference
 from hotels.models import BedLayout, HotelRoom
 from pretix.types import Category, Question, Quota
+from pretix_mirror import query as mirror
 import sentry_sdk
 
+from . import session
+from .caching import cache_pretix, invalidate_pretix_cache
 from .exceptions import PretixError
 
 logger = logging.getLogger(__file__)
 
 
+def gather(*calls) -> List[Any]:
+    """
+    Makes the `(function, *args)` calls concurrently,
+    returns their results in the same order
+    """
+    if session.in_executor():
+        # Waiting for other calls from the executor could use up its threads
+        return [func(*args) for func, *args in calls]
+
+    futures = [session.submit(func, *args) for func, *args in calls]
+    return [future.result() for future in futures]
+
+
+def prefetch(*calls):
+    """
+    Starts the `(function, *args)` calls in the background, so their
+    requests are already running, or done, when the same calls are
+    made later in the GraphQL operation (see `session.request_cache`)
+    """
+    if not session.has_request_cache():
+        return
+
+    for func, *args in calls:
+        session.submit(func, *args)
+
+
 def get_api_url(conference: Conference, endpoint: str) -> str:
     return urljoin(
         settings.PRETIX_API,
@@ -32,7 +61,7 @@ def _pretix_request(
     method="get",
     **kwargs,
 ):
-    return requests.request(
+    return session.request(
         method,
         url,
         params=qs or {},
@@ -116,9 +145,17 @@ def create_voucher(
         "quota": quota_id,
         "subevent": None,
     }
+    from pretix_mirror.sync import save_voucher
+
     response = pretix(conference, "vouchers/", method="post", json=payload)
     response.raise_for_status()
-    return response.json()
+    voucher = response.json()
+
+    # Roles and badges look the voucher up in the mirror and in the cache
+    save_voucher(conference, voucher)
+    invalidate_pretix_cache("all_vouchers", conference)
+
+    return voucher
 
 
 def get_order(conference: Conference, code: str):
@@ -138,24 +175,81 @@ def get_user_orders(conference: Conference, email: str):
     return response.json()
 
 
+def _fetch_page(conference: Conference, url: str, qs: Dict[str, Any]):
+    response = _pretix_request(conference, url, qs)
+    response.raise_for_status()
+    return response.json()
+
+
 def _get_paginated(
     conference: Conference, endpoint: str, qs: Optional[Dict[str, Any]] = None
 ):
+    """
+    Yields all the results of a paginated Pretix endpoint, in order.
+
+    The first page tells us how many results there are, so the remaining
+    pages are fetched concurrently while the caller consumes the earlier ones.
+    Only a bounded window of pages is kept in memory at any time.
+    """
     url = get_api_url(conference, endpoint)
+    qs = qs or {}
 
-    while url is not None:
-        response = requests.get(
-            url,
-            params=qs,
-            headers={"Authorization": f"Token {settings.PRETIX_API_TOKEN}"},
-        )
+    data = _fetch_page(conference, url, qs)
+    yield from data["results"]
+
+    page_size = len(data["results"])
+    count = data.get("count")
+
+    if not data.get("next"):
+        return
 
-        response.raise_for_status()
+    if not count or not page_size:
+        # We don't know how many pages there are,
+        # so the only option is to follow the next links
+        next_url = data["next"]
 
-        data = response.json()
-        url = data.get("next")
+        while next_url is not None:
+            data = _fetch_page(conference, next_url, qs)
+            next_url = data.get("next")
+            yield from data["results"]
 
-        yield from (order for order in data["results"])
+        return
+
+    total_pages = math.ceil(count / page_size)
+    pages = range(2, total_pages + 1)
+
+    if session.in_executor():
+        # Waiting for other calls from the executor could use up its threads
+        for page in pages:
+            yield from _fetch_page(conference, url, {**qs, "page": page})["results"]
+
+        return
+
+    pages = iter(pages)
+    in_flight = deque()
+
+    def submit_next_page():
+        page = next(pages, None)
+
+        if page is not None:
+            # Runs in the shared executor with the context of the caller,
+            # so the requests go through its request cache and metrics
+            in_flight.append(
+                session.submit(_fetch_page, conference, url, {**qs, "page": page})
+            )
+
+    try:
+        for _ in range(settings.PRETIX_PAGINATION_WORKERS):
+            submit_next_page()
+
+        while in_flight:
+            data = in_flight.popleft().result()
+            submit_next_page()
+            yield from data["results"]
+    finally:
+        # The caller stopped consuming the results
+        for future in in_flight:
+            future.cancel()
 
 
 def get_orders(conference: Conference):
@@ -172,34 +266,29 @@ def get_invoices(conference: Conference):
     return _get_paginated(conference, "invoices")
 
 
-def get_items(conference: Conference, params: Optional[Dict[str, Any]] = None):
-    response = pretix(conference, "items", params)
-    response.raise_for_status()
+def get_all_items(conference: Conference):
+    return _get_paginated(conference, "items")
 
-    data = response.json()
-    return {str(result["id"]): result for result in data["results"]}
 
+def get_all_quotas(conference: Conference):
+    return _get_paginated(conference, "quotas")
 
-def cache_pretix(name: str):
-    def factory(func):
-        def wrapper(*args, **kwargs):
-            conference = args[0]
-            cache_key = (
-                f"pretix:"
-                f"{conference.pretix_organizer_id}:{conference.pretix_event_id}:"
-                f"{name}"
-            )
 
-            if cache.has_key(cache_key):
-                return cache.get(cache_key)
+def get_all_questions(conference: Conference):
+    return _get_paginated(conference, "questions")
 
-            value = func(*args, **kwargs)
-            cache.set(cache_key, value, timeout=60 * 3)
-            return value
 
-        return wrapper
+def get_vouchers(conference: Conference):
+    return _get_paginated(conference, "vouchers")
 
-    return factory
+
+@cache_pretix(name="items")
+def get_items(conference: Conference, params: Optional[Dict[str, Any]] = None):
+    response = pretix(conference, "items", params)
+    response.raise_for_status()
+
+    data = response.json()
+    return {str(result["id"]): result for result in data["results"]}
 
 
 @cache_pretix(name="questions")
@@ -219,6 +308,8 @@ def get_categories(conference: Conference) -> Dict[str, Category]:
     return {str(result["id"]): result for result in data["results"]}
 
 
+# Availability changes with every order, keep it fresh
+@cache_pretix(name="quotas", soft_ttl=30, hard_ttl=60 * 5)
 def get_quotas(conference: Conference) -> Dict[str, Quota]:
     response = pretix(conference, "quotas", qs={"with_availability": "true"})
     response.raise_for_status()
@@ -487,6 +578,12 @@ def user_has_admission_ticket(
             "event_slug": event_slug,
         }
     ] + additional_events
+
+    has_ticket = mirror.user_has_admission_ticket(email, events)
+
+    if has_ticket is not None:
+        return has_ticket
+
     response = pretix(
         conference=Conference(
             pretix_organizer_id=event_organizer, pretix_event_id=event_slug
@@ -505,6 +602,62 @@ def user_has_admission_ticket(
     return data["user_has_admission_ticket"]
 
 
+def get_users_with_admission_ticket(
+    *,
+    emails: Optional[Iterable[str]] = None,
+    event_organizer: str,
+    event_slug: str,
+    additional_events: Optional[List[dict]] = None,
+) -> Set[str]:
+    """
+    Bulk version of `user_has_admission_ticket`.
+    Returns the lowercase emails that have a paid admission ticket
+    for any of the events, only among `emails` when they are given.
+    """
+    additional_events = additional_events or []
+    events = [
+        {
+            "organizer_slug": event_organizer,
+            "event_slug": event_slug,
+        }
+    ] + additional_events
+    if emails is not None:
+        emails = {email.lower() for email in emails}
+
+    mirrored_emails = mirror.users_with_admission_ticket(emails, events)
+
+    if mirrored_emails is not None:
+        return mirrored_emails
+
+    emails_with_ticket = set()
+
+    for event in events:
+        event_conference = Conference(
+            pretix_organizer_id=event["organizer_slug"],
+            pretix_event_id=event["event_slug"],
+        )
+        admission_items = _get_paginated(
+            event_conference, "items", {"admission": "true"}
+        )
+        admission_item_ids = ",".join(str(item["id"]) for item in admission_items)
+
+        if not admission_item_ids:
+            continue
+
+        positions = get_all_order_positions(
+            event_conference,
+            {"order__status": "p", "item__in": admission_item_ids},
+        )
+        emails_with_ticket.update(
+            attendee_email
+            for position in positions
+            if (attendee_email := (position["attendee_email"] or "").lower())
+            and (emails is None or attendee_email in emails)
+        )
+
+    return emails_with_ticket
+
+
 def get_user_tickets(conference: Conference, email: str):
     response = pretix(
         conference=conference,
@@ -520,9 +673,14 @@ def get_user_tickets(conference: Conference, email: str):
     return response.json()
 
 
-@cache_pretix(name="all_vouchers")
+@cache_pretix(name="all_vouchers", negative_ttl=30)
 def get_all_vouchers(conference: Conference):
-    vouchers = _get_paginated(conference, "vouchers")
+    mirrored_vouchers = mirror.get_all_vouchers(conference)
+
+    if mirrored_vouchers is not None:
+        return mirrored_vouchers
+
+    vouchers = get_vouchers(conference)
     vouchers_by_id = {voucher["id"]: voucher for voucher in vouchers}
     return vouchers_by_id
 
@@ -562,6 +720,10 @@ def update_ticket(conference: Conference, attendee_ticket: UpdateAttendeeTicketI
 
 
 def get_order_position(conference: Conference, id: str):
+    if order_position := mirror.get_order_position(conference, id):
+        return order_position
+
+    # The mirror can lag behind the webhooks, so we also ask pretix
     response = pretix(
         conference=conference,
         endpoint=f"orderpositions/{id}/",
@@ -571,3 +733,40 @@ def get_order_position(conference: Conference, id: str):
     response.raise_for_status()
 
     return response.json()
+
+
+def _get_order_position_or_none(conference: Conference, id: str) -> Optional[dict]:
+    response = pretix(
+        conference=conference,
+        endpoint=f"orderpositions/{id}/",
+        method="GET",
+    )
+
+    if response.status_code == 404:
+        return None
+
+    response.raise_for_status()
+
+    return response.json()
+
+
+def get_order_positions(conference: Conference, ids: Iterable[str]) -> Dict[str, dict]:
+    """
+    Returns the order positions with the ids that exist, by id.
+
+    Pretix can't filter positions by id, so the ones not in the mirror
+    are fetched concurrently, one request each.
+    """
+    ids = set(ids)
+    positions = mirror.get_order_positions(conference, ids) or {}
+    missing_ids = sorted(ids - positions.keys())
+
+    fetched_positions = gather(
+        *[(_get_order_position_or_none, conference, id) for id in missing_ids]
+    )
+
+    for id, position in zip(missing_ids, fetched_positions):
+        if position is not None:
+            positions[id] = position
+
+    return positions
@@ -0,0 +1,132 @@
+import functools
+import hashlib
+import logging
+import threading
+import time
+from typing import Optional
+
+from django.core.cache import cache
+from django.db import connections
+
+logger = logging.getLogger(__file__)
+
+# How long a worker is allowed to hold the refresh lock
+LOCK_TIMEOUT = 30
+
+# How long a worker waits for another worker to fill an empty cache
+# before giving up and fetching the value itself
+WAIT_FOR_REFRESH_TIMEOUT = 5
+WAIT_FOR_REFRESH_INTERVAL = 0.1
+
+
+def get_cache_key(name: str, conference, args, kwargs) -> str:
+    cache_key = (
+        f"pretix:"
+        f"{conference.pretix_organizer_id}:{conference.pretix_event_id}:"
+        f"{name}"
+    )
+
+    if args or kwargs:
+        arguments = repr((args, sorted(kwargs.items())))
+        cache_key += ":" + hashlib.md5(arguments.encode()).hexdigest()
+
+    return cache_key
+
+
+def invalidate_pretix_cache(name: str, conference, *args, **kwargs):
+    cache.delete(get_cache_key(name, conference, args, kwargs))
+
+
+def _is_empty(value) -> bool:
+    return value is None or value == {} or value == []
+
+
+def _store(cache_key: str, value, soft_ttl: int, hard_ttl: int, negative_ttl):
+    if negative_ttl is not None and _is_empty(value):
+        soft_ttl = hard_ttl = negative_ttl
+
+    cache.set(
+        cache_key,
+        {"value": value, "stale_at": time.time() + soft_ttl},
+        timeout=hard_ttl,
+    )
+
+
+def _refresh_in_background(refresh):
+    def run():
+        try:
+            refresh()
+        finally:
+            # The refresh can read the database (e.g. the pretix mirror), and
+            # nothing else closes the connections opened by this thread
+            connections.close_all()
+
+    threading.Thread(target=run, daemon=True).start()
+
+
+def cache_pretix(
+    name: str,
+    *,
+    soft_ttl: int = 60 * 3,
+    hard_ttl: Optional[int] = None,
+    negative_ttl: Optional[int] = None,
+):
+    """
+    Caches the result of a Pretix call per conference.
+
+    After `soft_ttl` seconds the value is stale: it is still served, but one
+    worker refreshes it in the background. After `hard_ttl` seconds the value
+    is dropped and the next call fetches it again. Only one worker at a time
+    fetches the value from Pretix, the others wait for it or serve the stale
+    copy. When `negative_ttl` is set, empty results are cached for that long.
+    """
+    hard_ttl = hard_ttl or soft_ttl * 10
+
+    def factory(func):
+        @functools.wraps(func)
+        def wrapper(conference, *args, **kwargs):
+            cache_key = get_cache_key(name, conference, args, kwargs)
+            lock_key = f"{cache_key}:lock"
+
+            def fetch():
+                try:
+                    value = func(conference, *args, **kwargs)
+                    _store(cache_key, value, soft_ttl, hard_ttl, negative_ttl)
+                    return value
+                finally:
+                    cache.delete(lock_key)
+
+            def refresh():
+                try:
+                    fetch()
+                except Exception:
+                    logger.exception("Unable to refresh pretix cache %s", cache_key)
+
+            entry = cache.get(cache_key)
+
+            if entry is not None:
+                if entry["stale_at"] <= time.time() and cache.add(
+                    lock_key, True, timeout=LOCK_TIMEOUT
+                ):
+                    _refresh_in_background(refresh)
+
+                return entry["value"]
+
+            if cache.add(lock_key, True, timeout=LOCK_TIMEOUT):
+                return fetch()
+
+            # Another worker is already fetching the value
+            deadline = time.monotonic() + WAIT_FOR_REFRESH_TIMEOUT
+
+            while time.monotonic() < deadline:
+                time.sleep(WAIT_FOR_REFRESH_INTERVAL)
+                entry = cache.get(cache_key)
+
+                if entry is not None:
+                    return entry["value"]
+
+            return func(conference, *args, **kwargs)
+
+        return wrapper
+
+    return factory
@@ -0,0 +1,247 @@
+import contextvars
+import logging
+import re
+import threading
+import time
+from collections import defaultdict
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import contextmanager
+from typing import Callable, Dict, Iterator, Optional
+from urllib.parse import urlparse
+
+import requests
+from django.conf import settings
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from helpers.metrics import record_http_call
+
+logger = logging.getLogger(__file__)
+
+RETRY_STATUS_CODES = (429, 500, 502, 503, 504)
+
+_IDENTIFIER_SEGMENT = re.compile(r"^[A-Z0-9]+$")
+
+_session: Optional[requests.Session] = None
+_session_lock = threading.Lock()
+
+_executor: Optional[ThreadPoolExecutor] = None
+
+# (url, params) -> response of the GET requests made by the current operation
+_request_cache: contextvars.ContextVar[Optional[Dict]] = contextvars.ContextVar(
+    "pretix_request_cache", default=None
+)
+_request_cache_lock = threading.Lock()
+
+_in_executor: contextvars.ContextVar[bool] = contextvars.ContextVar(
+    "pretix_in_executor", default=False
+)
+
+_stats_lock = threading.Lock()
+_stats: Dict[str, Dict[str, float]] = defaultdict(
+    lambda: {"count": 0, "errors": 0, "total_time": 0.0, "max_time": 0.0}
+)
+
+
+def _build_session() -> requests.Session:
+    retry = Retry(
+        total=settings.PRETIX_HTTP_MAX_RETRIES,
+        backoff_factor=settings.PRETIX_HTTP_BACKOFF_FACTOR,
+        status_forcelist=RETRY_STATUS_CODES,
+        respect_retry_after_header=True,
+        # Let the callers decide what to do with the last response,
+        # they already check for 404s and call `raise_for_status`
+        raise_on_status=False,
+    )
+    adapter = HTTPAdapter(
+        pool_connections=settings.PRETIX_HTTP_POOL_CONNECTIONS,
+        pool_maxsize=settings.PRETIX_HTTP_POOL_SIZE,
+        max_retries=retry,
+    )
+
+    session = requests.Session()
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+def get_session() -> requests.Session:
+    """
+    Returns the Pretix HTTP session shared by the whole process,
+    so that connections to Pretix are kept alive and reused
+    """
+    global _session
+
+    if _session is None:
+        with _session_lock:
+            if _session is None:
+                _session = _build_session()
+
+    return _session
+
+
+def close_session():
+    global _session
+
+    with _session_lock:
+        if _session is not None:
+            _session.close()
+
+        _session = None
+
+
+def get_executor() -> ThreadPoolExecutor:
+    """
+    Returns the threads running Pretix calls concurrently,
+    as many as the connections the session keeps to Pretix
+    """
+    global _executor
+
+    if _executor is None:
+        with _session_lock:
+            if _executor is None:
+                _executor = ThreadPoolExecutor(
+                    max_workers=settings.PRETIX_HTTP_POOL_SIZE,
+                    thread_name_prefix="pretix",
+                )
+
+    return _executor
+
+
+def submit(func: Callable, *args, **kwargs) -> Future:
+    # The call runs in the context of the caller, so its requests
+    # are recorded in the caller metrics and use its request cache
+    context = contextvars.copy_context()
+    return get_executor().submit(context.run, _run_in_executor, func, args, kwargs)
+
+
+def _run_in_executor(func: Callable, args, kwargs):
+    _in_executor.set(True)
+    return func(*args, **kwargs)
+
+
+def in_executor() -> bool:
+    return _in_executor.get()
+
+
+@contextmanager
+def request_cache() -> Iterator[None]:
+    """
+    Inside the block GET requests with the same url and params are only
+    made once (until a request changes something), and callers asking for
+    a request already in flight (e.g. started in the background by
+    `pretix.prefetch`) wait for its response.
+    """
+    token = _request_cache.set({})
+
+    try:
+        yield
+    finally:
+        _request_cache.reset(token)
+
+
+def has_request_cache() -> bool:
+    return _request_cache.get() is not None
+
+
+def get_timeout():
+    return (settings.PRETIX_HTTP_CONNECT_TIMEOUT, settings.PRETIX_HTTP_READ_TIMEOUT)
+
+
+def get_metric_name(method: str, url: str) -> str:
+    path = urlparse(url).path
+    base_path = urlparse(settings.PRETIX_API).path
+
+    if path.startswith(base_path):
+        path = path[len(base_path) :]
+
+    segments = [segment for segment in path.split("/") if segment]
+
+    # organizers/<organizer>/events/<event>/... is the same for every call
+    if segments[:1] == ["organizers"] and segments[2:3] == ["events"]:
+        segments = segments[4:]
+
+    segments = [
+        "{id}" if _IDENTIFIER_SEGMENT.match(segment) else segment
+        for segment in segments
+    ]
+    return f"{method.upper()} {'/'.join(segments)}"
+
+
+def request(method: str, url: str, **kwargs) -> requests.Response:
+    cache = _request_cache.get()
+
+    if cache is None:
+        return _send(method, url, **kwargs)
+
+    if method.upper() != "GET":
+        # What was read before the change could be stale now
+        with _request_cache_lock:
+            cache.clear()
+
+        return _send(method, url, **kwargs)
+
+    cache_key = (url, repr(sorted((kwargs.get("params") or {}).items())))
+
+    with _request_cache_lock:
+        future = cache.get(cache_key)
+        in_flight = future is not None
+
+        if not in_flight:
+            future = cache[cache_key] = Future()
+
+    if in_flight:
+        return future.result()
+
+    try:
+        response = _send(method, url, **kwargs)
+    except BaseException as e:
+        future.set_exception(e)
+        raise
+
+    future.set_result(response)
+    return response
+
+
+def _send(method: str, url: str, **kwargs) -> requests.Response:
+    kwargs.setdefault("timeout", get_timeout())
+    metric_name = get_metric_name(method, url)
+    start = time.perf_counter()
+    response = None
+
+    try:
+        response = get_session().request(method, url, **kwargs)
+        return response
+    finally:
+        duration = time.perf_counter() - start
+        failed = response is None or response.status_code >= 500
+        _record(metric_name, duration, failed)
+        record_http_call("pretix", duration)
+
+        logger.debug(
+            "Pretix request %s took %.2fms (status: %s)",
+            metric_name,
+            duration * 1000,
+            response.status_code if response is not None else "error",
+        )
+
+
+def _record(metric_name: str, duration: float, failed: bool):
+    with _stats_lock:
+        stats = _stats[metric_name]
+        stats["count"] += 1
+        stats["total_time"] += duration
+        stats["max_time"] = max(stats["max_time"], duration)
+
+        if failed:
+            stats["errors"] += 1
+
+
+def get_request_stats() -> Dict[str, Dict[str, float]]:
+    with _stats_lock:
+        return {name: dict(stats) for name, stats in _stats.items()}
+
+
+def reset_request_stats():
+    with _stats_lock:
+        _stats.clear()
@@ -0,0 +1,119 @@
+from unittest.mock import Mock
+
+import pytest
+import time_machine
+from django.core.cache import cache
+
+from pretix.caching import _refresh_in_background, cache_pretix, get_cache_key
+
+pytestmark = pytest.mark.django_db
+
+
+@pytest.fixture(autouse=True)
+def refresh_synchronously(locmem_cache, mocker):
+    mocker.patch("pretix.caching._refresh_in_background", side_effect=lambda fn: fn())
+
+
+def test_caches_value(conference):
+    fetch = Mock(return_value={"1": "value"})
+    cached = cache_pretix(name="test")(fetch)
+
+    assert cached(conference) == {"1": "value"}
+    assert cached(conference) == {"1": "value"}
+    assert fetch.call_count == 1
+
+
+def test_extra_arguments_are_part_of_the_key(conference):
+    fetch = Mock(side_effect=lambda conference, params=None: params)
+    cached = cache_pretix(name="test")(fetch)
+
+    assert cached(conference, params={"a": 1}) == {"a": 1}
+    assert cached(conference, params={"a": 2}) == {"a": 2}
+    assert cached(conference, params={"a": 1}) == {"a": 1}
+    assert fetch.call_count == 2
+
+
+def test_stale_value_is_served_while_refreshing(conference):
+    fetch = Mock(side_effect=["old", "new"])
+    cached = cache_pretix(name="test", soft_ttl=60, hard_ttl=600)(fetch)
+
+    with time_machine.travel("2023-01-01 10:00:00", tick=False):
+        assert cached(conference) == "old"
+
+    with time_machine.travel("2023-01-01 10:02:00", tick=False):
+        assert cached(conference) == "old"
+        assert fetch.call_count == 2
+        assert cached(conference) == "new"
+
+
+def test_stale_value_is_refreshed_only_by_one_worker(conference, mocker):
+    refresh = mocker.patch("pretix.caching._refresh_in_background")
+    fetch = Mock(return_value="value")
+    cached = cache_pretix(name="test", soft_ttl=60, hard_ttl=600)(fetch)
+
+    with time_machine.travel("2023-01-01 10:00:00", tick=False):
+        cached(conference)
+
+    with time_machine.travel("2023-01-01 10:02:00", tick=False):
+        cached(conference)
+        cached(conference)
+        cached(conference)
+
+    assert refresh.call_count == 1
+
+
+def test_failed_refresh_keeps_stale_value(conference):
+    fetch = Mock(side_effect=["old", ValueError("pretix is down")])
+    cached = cache_pretix(name="test", soft_ttl=60, hard_ttl=600)(fetch)
+
+    with time_machine.travel("2023-01-01 10:00:00", tick=False):
+        cached(conference)
+
+    with time_machine.travel("2023-01-01 10:02:00", tick=False):
+        assert cached(conference) == "old"
+
+
+def test_waits_for_another_worker_filling_the_cache(conference, mocker):
+    cache_key = get_cache_key("test", conference, (), {})
+    cache.add(f"{cache_key}:lock", True)
+    mocker.patch("pretix.caching.WAIT_FOR_REFRESH_INTERVAL", 0)
+    fetch = Mock(return_value="mine")
+
+    def other_worker_fills_cache(seconds):
+        cache.set(cache_key, {"value": "theirs", "stale_at": 1e12})
+
+    mocker.patch("pretix.caching.time.sleep", side_effect=other_worker_fills_cache)
+
+    cached = cache_pretix(name="test")(fetch)
+
+    assert cached(conference) == "theirs"
+    assert fetch.call_count == 0
+
+
+def test_empty_results_use_negative_ttl(conference):
+    fetch = Mock(side_effect=[{}, {"1": "voucher"}])
+    cached = cache_pretix(name="test", soft_ttl=600, negative_ttl=10)(fetch)
+
+    with time_machine.travel("2023-01-01 10:00:00", tick=False):
+        assert cached(conference) == {}
+
+    with time_machine.travel("2023-01-01 10:00:05", tick=False):
+        assert cached(conference) == {}
+
+    with time_machine.travel("2023-01-01 10:00:30", tick=False):
+        assert cached(conference) == {"1": "voucher"}
+
+
+def test_background_refresh_closes_its_connections(mocker):
+    thread = mocker.patch("pretix.caching.threading.Thread")
+    connections = mocker.patch("pretix.caching.connections")
+    refresh = Mock(side_effect=ValueError)
+
+    _refresh_in_background(refresh)
+    run = thread.call_args.kwargs["target"]
+
+    with pytest.raises(ValueError):
+        run()
+
+    refresh.assert_called_once()
+    connections.close_all.assert_called_once()
@@ -1,7 +1,10 @@
 import pytest
 from django.test import override_settings
 
-from pretix import get_invoices
+from requests import HTTPError
+
+from helpers.metrics import collect_metrics
+from pretix import get_all_order_positions, get_invoices, get_orders
 
 
 @override_settings(PRETIX_API="https://pretix/api/")
@@ -15,3 +18,100 @@ def test_gets_invoices(conference, requests_mock):
     invoices = get_invoices(conference)
 
     assert list(invoices) == []
+
+
+@override_settings(PRETIX_API="https://pretix/api/", PRETIX_PAGINATION_WORKERS=2)
+@pytest.mark.django_db
+def test_fetches_remaining_pages_using_the_count(conference, requests_mock):
+    base_url = "https://pretix/api/organizers/base-pretix-organizer-id/events/base-pretix-event-id/orderpositions"
+    requests_mock.get(
+        base_url,
+        json={
+            "count": 7,
+            "next": f"{base_url}?page=2",
+            "results": [{"id": 1}, {"id": 2}],
+        },
+    )
+
+    for page in range(2, 5):
+        requests_mock.get(
+            f"{base_url}?page={page}",
+            json={
+                "count": 7,
+                "next": None,
+                "results": [
+                    {"id": id} for id in range(page * 2 - 1, min(page * 2, 7) + 1)
+                ],
+            },
+        )
+
+    positions = list(get_all_order_positions(conference, {"item__in": "1,2"}))
+
+    assert [position["id"] for position in positions] == [1, 2, 3, 4, 5, 6, 7]
+    assert requests_mock.call_count == 4
+    assert all(
+        request.qs["item__in"] == ["1,2"] for request in requests_mock.request_history
+    )
+    assert sorted(
+        request.qs.get("page", ["1"])[0] for request in requests_mock.request_history
+    ) == ["1", "2", "3", "4"]
+
+
+@override_settings(PRETIX_API="https://pretix/api/", PRETIX_PAGINATION_WORKERS=2)
+@pytest.mark.django_db
+def test_remaining_pages_are_fetched_in_the_context_of_the_caller(
+    conference, requests_mock
+):
+    base_url = "https://pretix/api/organizers/base-pretix-organizer-id/events/base-pretix-event-id/orderpositions"
+    requests_mock.get(
+        base_url,
+        json={"count": 3, "next": f"{base_url}?page=2", "results": [{"id": 1}]},
+    )
+
+    for page in range(2, 4):
+        requests_mock.get(
+            f"{base_url}?page={page}",
+            json={"count": 3, "next": None, "results": [{"id": page}]},
+        )
+
+    with collect_metrics() as metrics:
+        positions = list(get_all_order_positions(conference))
+
+    assert [position["id"] for position in positions] == [1, 2, 3]
+    assert metrics.http["pretix"]["count"] == 3
+
+
+@override_settings(PRETIX_API="https://pretix/api/")
+@pytest.mark.django_db
+def test_follows_next_links_when_count_is_missing(conference, requests_mock):
+    base_url = "https://pretix/api/organizers/base-pretix-organizer-id/events/base-pretix-event-id/orders"
+    requests_mock.get(
+        base_url,
+        json={"next": f"{base_url}?cursor=abc", "results": [{"code": "A"}]},
+    )
+    requests_mock.get(
+        f"{base_url}?cursor=abc",
+        json={"next": None, "results": [{"code": "B"}]},
+    )
+
+    orders = list(get_orders(conference))
+
+    assert orders == [{"code": "A"}, {"code": "B"}]
+
+
+@override_settings(PRETIX_API="https://pretix/api/")
+@pytest.mark.django_db
+def test_page_errors_are_raised(conference, requests_mock):
+    base_url = "https://pretix/api/organizers/base-pretix-organizer-id/events/base-pretix-event-id/orders"
+    requests_mock.get(
+        base_url,
+        json={"count": 2, "next": f"{base_url}?page=2", "results": [{"code": "A"}]},
+    )
+    requests_mock.get(f"{base_url}?page=2", status_code=403)
+
+    orders = get_orders(conference)
+
+    assert next(orders) == {"code": "A"}
+
+    with pytest.raises(HTTPError):
+        next(orders)
@@ -0,0 +1,184 @@
+import threading
+
+import pytest
+from django.test import override_settings
+
+from pretix import create_voucher, gather, get_orders, get_voucher, prefetch
+from pretix.session import (
+    close_session,
+    get_metric_name,
+    get_request_stats,
+    get_session,
+    request_cache,
+    reset_request_stats,
+)
+
+VOUCHER_URL = "https://pretix/api/organizers/base-pretix-organizer-id/events/base-pretix-event-id/extended-vouchers/CODE/"
+
+pytestmark = pytest.mark.django_db
+
+
+@pytest.fixture(autouse=True)
+def _reset_session():
+    close_session()
+    reset_request_stats()
+    yield
+    close_session()
+    reset_request_stats()
+
+
+def test_session_is_shared():
+    assert get_session() is get_session()
+
+
+@override_settings(
+    PRETIX_HTTP_POOL_SIZE=25,
+    PRETIX_HTTP_MAX_RETRIES=5,
+    PRETIX_HTTP_BACKOFF_FACTOR=0.5,
+)
+def test_session_is_configured_from_settings():
+    adapter = get_session().get_adapter("https://pretix/api/")
+
+    assert adapter._pool_maxsize == 25
+    assert adapter.max_retries.total == 5
+    assert adapter.max_retries.backoff_factor == 0.5
+    assert 429 in adapter.max_retries.status_forcelist
+    assert 503 in adapter.max_retries.status_forcelist
+    assert "POST" not in adapter.max_retries.allowed_methods
+
+
+@override_settings(
+    PRETIX_API="https://pretix/api/",
+    PRETIX_HTTP_CONNECT_TIMEOUT=2,
+    PRETIX_HTTP_READ_TIMEOUT=15,
+)
+def test_requests_have_a_timeout(conference, requests_mock):
+    requests_mock.get(
+        "https://pretix/api/organizers/base-pretix-organizer-id/events/base-pretix-event-id/extended-vouchers/CODE/",
+        status_code=404,
+    )
+
+    get_voucher(conference, "CODE")
+
+    assert requests_mock.last_request.timeout == (2, 15)
+
+
+@override_settings(PRETIX_API="https://pretix/api/")
+def test_pagination_reuses_the_shared_session(conference, requests_mock, mocker):
+    base_url = "https://pretix/api/organizers/base-pretix-organizer-id/events/base-pretix-event-id/orders"
+    requests_mock.get(
+        base_url,
+        json={"next": f"{base_url}?page=2", "results": [{"code": "A"}]},
+    )
+    requests_mock.get(
+        f"{base_url}?page=2",
+        json={"next": None, "results": [{"code": "B"}]},
+    )
+    session_request = mocker.spy(get_session(), "request")
+
+    orders = list(get_orders(conference))
+
+    assert orders == [{"code": "A"}, {"code": "B"}]
+    assert session_request.call_count == 2
+
+
+@override_settings(PRETIX_API="https://pretix/api/")
+def test_records_latency_per_endpoint(conference, requests_mock):
+    requests_mock.get(
+        "https://pretix/api/organizers/base-pretix-organizer-id/events/base-pretix-event-id/extended-vouchers/CODE1/",
+        status_code=404,
+    )
+    requests_mock.get(
+        "https://pretix/api/organizers/base-pretix-organizer-id/events/base-pretix-event-id/extended-vouchers/CODE2/",
+        status_code=500,
+    )
+
+    get_voucher(conference, "CODE1")
+
+    with pytest.raises(Exception):
+        get_voucher(conference, "CODE2")
+
+    stats = get_request_stats()["GET extended-vouchers/{id}"]
+    assert stats["count"] == 2
+    assert stats["errors"] == 1
+    assert stats["total_time"] >= stats["max_time"] > 0
+
+
+@override_settings(PRETIX_API="https://pretix/api/")
+def test_metric_name():
+    assert (
+        get_metric_name(
+            "get",
+            "https://pretix/api/organizers/org/events/event/orders/ABC12/",
+        )
+        == "GET orders/{id}"
+    )
+    assert (
+        get_metric_name(
+            "post",
+            "https://pretix/api/organizers/org/events/event/tickets/attendee-has-ticket/",
+        )
+        == "POST tickets/attendee-has-ticket"
+    )
+    assert (
+        get_metric_name(
+            "post",
+            "https://pretix/api/orders/ABC12/update_invoice_information/",
+        )
+        == "POST orders/{id}/update_invoice_information"
+    )
+
+
+@override_settings(PRETIX_API="https://pretix/api/")
+def test_request_cache_shares_get_requests(conference, requests_mock):
+    requests_mock.get(VOUCHER_URL, status_code=404)
+
+    with request_cache():
+        get_voucher(conference, "CODE")
+        get_voucher(conference, "CODE")
+
+    assert requests_mock.call_count == 1
+
+    get_voucher(conference, "CODE")
+
+    assert requests_mock.call_count == 2
+
+
+@override_settings(PRETIX_API="https://pretix/api/")
+def test_prefetched_requests_are_reused(conference, requests_mock):
+    requests_mock.get(VOUCHER_URL, status_code=404)
+
+    with request_cache():
+        prefetch((get_voucher, conference, "CODE"))
+
+        assert get_voucher(conference, "CODE") is None
+
+    assert requests_mock.call_count == 1
+
+
+def test_gather_makes_the_calls_concurrently():
+    # Each call waits for the other one, so they only
+    # complete when they run at the same time
+    barrier = threading.Barrier(2, timeout=5)
+
+    def call(value):
+        barrier.wait()
+        return value
+
+    assert gather((call, 1), (call, 2)) == [1, 2]
+
+
+@override_settings(PRETIX_API="https://pretix/api/")
+def test_request_cache_is_cleared_by_changes(conference, requests_mock):
+    requests_mock.get(VOUCHER_URL, status_code=404)
+    requests_mock.post(
+        "https://pretix/api/organizers/base-pretix-organizer-id/events/base-pretix-event-id/vouchers/",
+        json={},
+    )
+
+    with request_cache():
+        get_voucher(conference, "CODE")
+        create_voucher(conference, "CODE", "", "", 1, "set", "10")
+        get_voucher(conference, "CODE")
+
+    assert requests_mock.call_count == 3
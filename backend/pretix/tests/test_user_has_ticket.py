@@ -1,6 +1,6 @@
 from pytest import mark
 
-from pretix import user_has_admission_ticket
+from pretix import get_users_with_admission_ticket, user_has_admission_ticket
 
 pytestmark = mark.django_db
 
@@ -35,3 +35,37 @@ def test_user_has_admission_ticket(
             }
         ],
     }
+
+
+def test_get_users_with_admission_ticket(settings, conference_factory, requests_mock):
+    settings.PRETIX_API = "http://localhost:9090/"
+    conference = conference_factory()
+    base_url = f"{settings.PRETIX_API}organizers/{conference.pretix_organizer_id}/events/{conference.pretix_event_id}"
+
+    requests_mock.get(
+        f"{base_url}/items?admission=true",
+        json={"count": 2, "next": None, "results": [{"id": 1}, {"id": 2}]},
+    )
+    requests_mock.get(
+        f"{base_url}/orderpositions?order__status=p&item__in=1,2",
+        json={
+            "count": 3,
+            "next": None,
+            "results": [
+                {"attendee_email": "Nina@fake-work-email.ca"},
+                {"attendee_email": "other@example.org"},
+                {"attendee_email": None},
+            ],
+        },
+    )
+
+    assert get_users_with_admission_ticket(
+        emails=["nina@fake-work-email.ca", "marco@example.org"],
+        event_organizer=conference.pretix_organizer_id,
+        event_slug=conference.pretix_event_id,
+    ) == {"nina@fake-work-email.ca"}
+    assert get_users_with_admission_ticket(
+        event_organizer=conference.pretix_organizer_id,
+        event_slug=conference.pretix_event_id,
+    ) == {"nina@fake-work-email.ca", "other@example.org"}
+    assert requests_mock.call_count == 4
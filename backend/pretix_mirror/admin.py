@@ -0,0 +1,10 @@
+from django.contrib import admin
+
+from .models import PretixSyncState
+
+
+@admin.register(PretixSyncState)
+class PretixSyncStateAdmin(admin.ModelAdmin):
+    list_display = ("conference", "last_full_sync_at", "last_catalog_sync_at")
+    readonly_fields = ("last_full_sync_at", "last_catalog_sync_at")
+    autocomplete_fields = ("conference",)
@@ -0,0 +1,28 @@
+import logging
+
+from conferences.models import Conference
+from pretix_mirror.sync import sync_order
+
+logger = logging.getLogger(__file__)
+
+
+def pretix_order_changed(payload):
+    organizer = payload["organizer"]
+    event = payload["event"]
+    order_code = payload["code"]
+
+    conference = Conference.objects.filter(
+        pretix_organizer_id=organizer, pretix_event_id=event
+    ).first()
+
+    if not conference:
+        logger.info(
+            "Ignoring order_code=%s change for organizer=%s event=%s "
+            "because there isn't a conference for it",
+            order_code,
+            organizer,
+            event,
+        )
+        return
+
+    sync_order(conference, order_code)
@@ -0,0 +1,30 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from conferences.models import Conference
+from pretix_mirror.sync import sync_conference
+
+
+class Command(BaseCommand):
+    help = "Mirrors the Pretix orders, vouchers, items, quotas and questions locally"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "conference_code",
+            type=str,
+            help="Code of the conference to sync.",
+        )
+
+    def handle(self, conference_code, *args, **options):
+        conference = Conference.objects.filter(code=conference_code).first()
+
+        if not conference:
+            raise CommandError(f"Conference {conference_code} not found")
+
+        if not conference.pretix_organizer_id or not conference.pretix_event_id:
+            raise CommandError(f"Conference {conference_code} is not linked to pretix")
+
+        total_orders = sync_conference(conference)
+
+        self.stdout.write(
+            self.style.SUCCESS(f"Synced {total_orders} orders for {conference_code}")
+        )
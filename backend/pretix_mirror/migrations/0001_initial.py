@@ -0,0 +1,151 @@
+# Generated by Django 4.2.7 on 2026-10-18 17:23
+
+from django.db import migrations, models
+import django.db.models.deletion
+import django.utils.timezone
+import model_utils.fields
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+        ('conferences', '0041_remove_conference_visa_application_form_link'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='PretixOrder',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('code', models.CharField(max_length=16, verbose_name='code')),
+                ('status', models.CharField(choices=[('n', 'Pending'), ('p', 'Paid'), ('e', 'Expired'), ('c', 'Canceled')], max_length=1, verbose_name='status')),
+                ('email', models.EmailField(blank=True, default='', max_length=254, verbose_name='email')),
+                ('data', models.JSONField(verbose_name='data')),
+                ('updated_at', models.DateTimeField(auto_now=True, verbose_name='updated at')),
+                ('conference', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='+', to='conferences.conference', verbose_name='conference')),
+            ],
+        ),
+        migrations.CreateModel(
+            name='PretixSyncState',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('created', model_utils.fields.AutoCreatedField(default=django.utils.timezone.now, editable=False, verbose_name='created')),
+                ('modified', model_utils.fields.AutoLastModifiedField(default=django.utils.timezone.now, editable=False, verbose_name='modified')),
+                ('last_full_sync_at', models.DateTimeField(null=True, verbose_name='last full sync at')),
+                ('last_catalog_sync_at', models.DateTimeField(null=True, verbose_name='last catalog sync at')),
+                ('conference', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, related_name='pretix_sync_state', to='conferences.conference', verbose_name='conference')),
+            ],
+            options={
+                'abstract': False,
+            },
+        ),
+        migrations.CreateModel(
+            name='PretixQuota',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('pretix_id', models.IntegerField(verbose_name='pretix id')),
+                ('data', models.JSONField(verbose_name='data')),
+                ('updated_at', models.DateTimeField(auto_now=True, verbose_name='updated at')),
+                ('conference', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='+', to='conferences.conference', verbose_name='conference')),
+            ],
+            options={
+                'abstract': False,
+            },
+        ),
+        migrations.CreateModel(
+            name='PretixQuestion',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('pretix_id', models.IntegerField(verbose_name='pretix id')),
+                ('data', models.JSONField(verbose_name='data')),
+                ('updated_at', models.DateTimeField(auto_now=True, verbose_name='updated at')),
+                ('conference', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='+', to='conferences.conference', verbose_name='conference')),
+            ],
+            options={
+                'abstract': False,
+            },
+        ),
+        migrations.CreateModel(
+            name='PretixOrderPosition',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('pretix_id', models.IntegerField(verbose_name='pretix id')),
+                ('data', models.JSONField(verbose_name='data')),
+                ('updated_at', models.DateTimeField(auto_now=True, verbose_name='updated at')),
+                ('item_id', models.IntegerField(verbose_name='item id')),
+                ('voucher_id', models.IntegerField(blank=True, null=True, verbose_name='voucher id')),
+                ('attendee_email', models.CharField(blank=True, default='', max_length=254, verbose_name='attendee email')),
+                ('attendee_name', models.CharField(blank=True, default='', max_length=2048, verbose_name='attendee name')),
+                ('conference', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='+', to='conferences.conference', verbose_name='conference')),
+                ('order', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='positions', to='pretix_mirror.pretixorder', verbose_name='order')),
+            ],
+            options={
+                'abstract': False,
+            },
+        ),
+        migrations.CreateModel(
+            name='PretixItem',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('pretix_id', models.IntegerField(verbose_name='pretix id')),
+                ('data', models.JSONField(verbose_name='data')),
+                ('updated_at', models.DateTimeField(auto_now=True, verbose_name='updated at')),
+                ('admission', models.BooleanField(default=False, verbose_name='admission')),
+                ('active', models.BooleanField(default=True, verbose_name='active')),
+                ('conference', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='+', to='conferences.conference', verbose_name='conference')),
+            ],
+            options={
+                'abstract': False,
+            },
+        ),
+        migrations.CreateModel(
+            name='PretixVoucher',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('pretix_id', models.IntegerField(verbose_name='pretix id')),
+                ('data', models.JSONField(verbose_name='data')),
+                ('updated_at', models.DateTimeField(auto_now=True, verbose_name='updated at')),
+                ('code', models.CharField(max_length=255, verbose_name='code')),
+                ('tag', models.CharField(blank=True, default='', max_length=255, verbose_name='tag')),
+                ('conference', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='+', to='conferences.conference', verbose_name='conference')),
+            ],
+            options={
+                'abstract': False,
+                'indexes': [models.Index(fields=['conference', 'code'], name='pretix_mirr_confere_294955_idx')],
+            },
+        ),
+        migrations.AddConstraint(
+            model_name='pretixvoucher',
+            constraint=models.UniqueConstraint(fields=('conference', 'pretix_id'), name='pretix_mirror_pretixvoucher_unique_pretix_id'),
+        ),
+        migrations.AddConstraint(
+            model_name='pretixquota',
+            constraint=models.UniqueConstraint(fields=('conference', 'pretix_id'), name='pretix_mirror_pretixquota_unique_pretix_id'),
+        ),
+        migrations.AddConstraint(
+            model_name='pretixquestion',
+            constraint=models.UniqueConstraint(fields=('conference', 'pretix_id'), name='pretix_mirror_pretixquestion_unique_pretix_id'),
+        ),
+        migrations.AddIndex(
+            model_name='pretixorderposition',
+            index=models.Index(fields=['conference', 'attendee_email'], name='pretix_mirr_confere_d23b7f_idx'),
+        ),
+        migrations.AddConstraint(
+            model_name='pretixorderposition',
+            constraint=models.UniqueConstraint(fields=('conference', 'pretix_id'), name='pretix_mirror_pretixorderposition_unique_pretix_id'),
+        ),
+        migrations.AddConstraint(
+            model_name='pretixorder',
+            constraint=models.UniqueConstraint(fields=('conference', 'code'), name='pretix_mirror_pretixorder_unique_code'),
+        ),
+        migrations.AddIndex(
+            model_name='pretixitem',
+            index=models.Index(fields=['conference', 'admission'], name='pretix_mirr_confere_c9bbc7_idx'),
+        ),
+        migrations.AddConstraint(
+            model_name='pretixitem',
+            constraint=models.UniqueConstraint(fields=('conference', 'pretix_id'), name='pretix_mirror_pretixitem_unique_pretix_id'),
+        ),
+    ]
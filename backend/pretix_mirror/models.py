@@ -0,0 +1,122 @@
+from django.db import models
+from django.utils.translation import gettext_lazy as _
+from model_utils.models import TimeStampedModel
+
+
+class PretixSyncState(TimeStampedModel):
+    """
+    Marks a conference as mirrored locally. Until the first full sync
+    has completed, the Pretix client keeps querying Pretix directly.
+    """
+
+    conference = models.OneToOneField(
+        "conferences.Conference",
+        on_delete=models.CASCADE,
+        verbose_name=_("conference"),
+        related_name="pretix_sync_state",
+    )
+    last_full_sync_at = models.DateTimeField(_("last full sync at"), null=True)
+    last_catalog_sync_at = models.DateTimeField(_("last catalog sync at"), null=True)
+
+    def __str__(self):
+        return f"Pretix sync state for {self.conference}"
+
+
+class PretixMirrorModel(models.Model):
+    conference = models.ForeignKey(
+        "conferences.Conference",
+        on_delete=models.CASCADE,
+        verbose_name=_("conference"),
+        related_name="+",
+    )
+    pretix_id = models.IntegerField(_("pretix id"))
+    data = models.JSONField(_("data"))
+    updated_at = models.DateTimeField(_("updated at"), auto_now=True)
+
+    class Meta:
+        abstract = True
+        constraints = [
+            models.UniqueConstraint(
+                fields=["conference", "pretix_id"],
+                name="%(app_label)s_%(class)s_unique_pretix_id",
+            )
+        ]
+
+
+class PretixItem(PretixMirrorModel):
+    admission = models.BooleanField(_("admission"), default=False)
+    active = models.BooleanField(_("active"), default=True)
+
+    class Meta(PretixMirrorModel.Meta):
+        indexes = [
+            models.Index(fields=["conference", "admission"]),
+        ]
+
+
+class PretixQuota(PretixMirrorModel):
+    pass
+
+
+class PretixQuestion(PretixMirrorModel):
+    pass
+
+
+class PretixVoucher(PretixMirrorModel):
+    code = models.CharField(_("code"), max_length=255)
+    tag = models.CharField(_("tag"), max_length=255, blank=True, default="")
+
+    class Meta(PretixMirrorModel.Meta):
+        indexes = [
+            models.Index(fields=["conference", "code"]),
+        ]
+
+
+class PretixOrder(models.Model):
+    class Status(models.TextChoices):
+        PENDING = "n", _("Pending")
+        PAID = "p", _("Paid")
+        EXPIRED = "e", _("Expired")
+        CANCELED = "c", _("Canceled")
+
+    conference = models.ForeignKey(
+        "conferences.Conference",
+        on_delete=models.CASCADE,
+        verbose_name=_("conference"),
+        related_name="+",
+    )
+    code = models.CharField(_("code"), max_length=16)
+    status = models.CharField(_("status"), max_length=1, choices=Status.choices)
+    email = models.EmailField(_("email"), blank=True, default="")
+    data = models.JSONField(_("data"))
+    updated_at = models.DateTimeField(_("updated at"), auto_now=True)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=["conference", "code"],
+                name="pretix_mirror_pretixorder_unique_code",
+            )
+        ]
+
+
+class PretixOrderPosition(PretixMirrorModel):
+    order = models.ForeignKey(
+        PretixOrder,
+        on_delete=models.CASCADE,
+        verbose_name=_("order"),
+        related_name="positions",
+    )
+    item_id = models.IntegerField(_("item id"))
+    voucher_id = models.IntegerField(_("voucher id"), null=True, blank=True)
+    # Always stored lowercase, so lookups can use the index
+    attendee_email = models.CharField(
+        _("attendee email"), max_length=254, blank=True, default=""
+    )
+    attendee_name = models.CharField(
+        _("attendee name"), max_length=2048, blank=True, default=""
+    )
+
+    class Meta(PretixMirrorModel.Meta):
+        indexes = [
+            models.Index(fields=["conference", "attendee_email"]),
+        ]
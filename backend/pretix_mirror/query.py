@@ -0,0 +1,143 @@
+from typing import Dict, Iterable, List, Optional, Set
+
+from django.db.models import Exists, OuterRef, Q
+
+from pretix_mirror.models import (
+    PretixItem,
+    PretixOrder,
+    PretixOrderPosition,
+    PretixSyncState,
+    PretixVoucher,
+)
+
+# All the functions in this module return None when the data
+# is not mirrored locally, so the callers can ask Pretix instead.
+
+
+def _get_mirrored_conference_ids(events: List[dict]) -> Optional[List[int]]:
+    events_filter = Q()
+
+    for event in events:
+        events_filter |= Q(
+            conference__pretix_organizer_id=event["organizer_slug"],
+            conference__pretix_event_id=event["event_slug"],
+        )
+
+    states = PretixSyncState.objects.filter(
+        events_filter, last_full_sync_at__isnull=False
+    ).values_list(
+        "conference_id",
+        "conference__pretix_organizer_id",
+        "conference__pretix_event_id",
+    )
+
+    mirrored_events = {(organizer, event) for _, organizer, event in states}
+    requested_events = {
+        (event["organizer_slug"], event["event_slug"]) for event in events
+    }
+
+    if mirrored_events != requested_events:
+        return None
+
+    return [conference_id for conference_id, _, _ in states]
+
+
+def _is_mirrored(conference) -> bool:
+    return (
+        _get_mirrored_conference_ids(
+            [
+                {
+                    "organizer_slug": conference.pretix_organizer_id,
+                    "event_slug": conference.pretix_event_id,
+                }
+            ]
+        )
+        is not None
+    )
+
+
+def _admission_positions(conference_ids: List[int]):
+    admission_items = PretixItem.objects.filter(
+        conference_id=OuterRef("conference_id"),
+        pretix_id=OuterRef("item_id"),
+        admission=True,
+    )
+
+    return PretixOrderPosition.objects.filter(
+        Exists(admission_items),
+        conference_id__in=conference_ids,
+        order__status=PretixOrder.Status.PAID,
+    )
+
+
+def user_has_admission_ticket(email: str, events: List[dict]) -> Optional[bool]:
+    conference_ids = _get_mirrored_conference_ids(events)
+
+    if conference_ids is None:
+        return None
+
+    return (
+        _admission_positions(conference_ids)
+        .filter(attendee_email=email.lower())
+        .exists()
+    )
+
+
+def users_with_admission_ticket(
+    emails: Optional[Iterable[str]], events: List[dict]
+) -> Optional[Set[str]]:
+    conference_ids = _get_mirrored_conference_ids(events)
+
+    if conference_ids is None:
+        return None
+
+    positions = _admission_positions(conference_ids).exclude(attendee_email="")
+
+    if emails is not None:
+        positions = positions.filter(
+            attendee_email__in={email.lower() for email in emails}
+        )
+
+    return set(positions.values_list("attendee_email", flat=True))
+
+
+def get_order_position(conference, id: str) -> Optional[dict]:
+    if not _is_mirrored(conference):
+        return None
+
+    return (
+        PretixOrderPosition.objects.filter(
+            conference__pretix_organizer_id=conference.pretix_organizer_id,
+            conference__pretix_event_id=conference.pretix_event_id,
+            pretix_id=id,
+        )
+        .values_list("data", flat=True)
+        .first()
+    )
+
+
+def get_order_positions(conference, ids: Iterable[str]) -> Optional[Dict[str, dict]]:
+    """The mirrored positions by id, the ones not mirrored yet are missing"""
+    if not _is_mirrored(conference):
+        return None
+
+    return {
+        str(pretix_id): data
+        for pretix_id, data in PretixOrderPosition.objects.filter(
+            conference__pretix_organizer_id=conference.pretix_organizer_id,
+            conference__pretix_event_id=conference.pretix_event_id,
+            pretix_id__in=list(ids),
+        ).values_list("pretix_id", "data")
+    }
+
+
+def get_all_vouchers(conference) -> Optional[Dict[int, dict]]:
+    if not _is_mirrored(conference):
+        return None
+
+    return dict(
+        PretixVoucher.objects.filter(
+            conference__pretix_organizer_id=conference.pretix_organizer_id,
+            conference__pretix_event_id=conference.pretix_event_id,
+        ).values_list("pretix_id", "data")
+    )
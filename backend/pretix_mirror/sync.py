@@ -0,0 +1,212 @@
+import logging
+from itertools import islice
+from typing import Callable, Dict, Iterable, List, Type
+
+from django.db import transaction
+from django.utils import timezone
+
+import pretix
+from conferences.models import Conference
+from pretix_mirror.models import (
+    PretixItem,
+    PretixMirrorModel,
+    PretixOrder,
+    PretixOrderPosition,
+    PretixQuestion,
+    PretixQuota,
+    PretixSyncState,
+    PretixVoucher,
+)
+
+logger = logging.getLogger(__file__)
+
+BATCH_SIZE = 500
+
+
+def _batched(iterable: Iterable, size: int):
+    iterator = iter(iterable)
+
+    while batch := list(islice(iterator, size)):
+        yield batch
+
+
+def _sync_catalog_model(
+    model: Type[PretixMirrorModel],
+    conference: Conference,
+    rows: Iterable[dict],
+    get_fields: Callable[[dict], Dict] = lambda row: {},
+):
+    seen_ids = []
+
+    with transaction.atomic():
+        for batch in _batched(rows, BATCH_SIZE):
+            objects = [
+                model(
+                    conference=conference,
+                    pretix_id=row["id"],
+                    data=row,
+                    **get_fields(row),
+                )
+                for row in batch
+            ]
+            model.objects.bulk_create(
+                objects,
+                update_conflicts=True,
+                unique_fields=["conference", "pretix_id"],
+                update_fields=[
+                    "data",
+                    "updated_at",
+                    *get_fields(batch[0]).keys(),
+                ],
+            )
+            seen_ids.extend(row["id"] for row in batch)
+
+        model.objects.filter(conference=conference).exclude(
+            pretix_id__in=seen_ids
+        ).delete()
+
+    return len(seen_ids)
+
+
+def sync_catalog(conference: Conference):
+    """
+    Items, quotas, questions and vouchers don't send webhooks,
+    so they are refreshed as a whole.
+    """
+    _sync_catalog_model(
+        PretixItem,
+        conference,
+        pretix.get_all_items(conference),
+        lambda item: {"admission": item["admission"], "active": item["active"]},
+    )
+    _sync_catalog_model(PretixQuota, conference, pretix.get_all_quotas(conference))
+    _sync_catalog_model(
+        PretixQuestion, conference, pretix.get_all_questions(conference)
+    )
+    _sync_catalog_model(
+        PretixVoucher,
+        conference,
+        pretix.get_vouchers(conference),
+        lambda voucher: {"code": voucher["code"], "tag": voucher["tag"] or ""},
+    )
+
+    PretixSyncState.objects.update_or_create(
+        conference=conference,
+        defaults={"last_catalog_sync_at": timezone.now()},
+    )
+
+
+def save_voucher(conference: Conference, voucher: dict):
+    """
+    Vouchers created through the API are saved right away instead of
+    waiting for the next catalog sync.
+    """
+    if not PretixSyncState.objects.filter(
+        conference=conference, last_full_sync_at__isnull=False
+    ).exists():
+        return
+
+    PretixVoucher.objects.update_or_create(
+        conference=conference,
+        pretix_id=voucher["id"],
+        defaults={
+            "data": voucher,
+            "code": voucher["code"],
+            "tag": voucher["tag"] or "",
+        },
+    )
+
+
+def save_orders(conference: Conference, orders: List[dict]):
+    with transaction.atomic():
+        PretixOrder.objects.bulk_create(
+            [
+                PretixOrder(
+                    conference=conference,
+                    code=order["code"],
+                    status=order["status"],
+                    email=order["email"] or "",
+                    data=order,
+                )
+                for order in orders
+            ],
+            update_conflicts=True,
+            unique_fields=["conference", "code"],
+            update_fields=["status", "email", "data", "updated_at"],
+        )
+
+        order_ids = dict(
+            PretixOrder.objects.filter(
+                conference=conference, code__in=[order["code"] for order in orders]
+            ).values_list("code", "id")
+        )
+        positions = [
+            PretixOrderPosition(
+                conference=conference,
+                order_id=order_ids[order["code"]],
+                pretix_id=position["id"],
+                item_id=position["item"],
+                voucher_id=position["voucher"],
+                attendee_email=(position["attendee_email"] or "").lower(),
+                attendee_name=position["attendee_name"] or "",
+                data=position,
+            )
+            for order in orders
+            for position in order["positions"]
+        ]
+        PretixOrderPosition.objects.bulk_create(
+            positions,
+            update_conflicts=True,
+            unique_fields=["conference", "pretix_id"],
+            update_fields=[
+                "order",
+                "item_id",
+                "voucher_id",
+                "attendee_email",
+                "attendee_name",
+                "data",
+                "updated_at",
+            ],
+        )
+
+        # Positions can be removed from an order (e.g. canceled or changed)
+        PretixOrderPosition.objects.filter(order_id__in=order_ids.values()).exclude(
+            pretix_id__in=[position.pretix_id for position in positions]
+        ).delete()
+
+
+def sync_orders(conference: Conference):
+    total = 0
+
+    for batch in _batched(pretix.get_orders(conference), BATCH_SIZE):
+        save_orders(conference, batch)
+        total += len(batch)
+
+    return total
+
+
+def sync_order(conference: Conference, code: str):
+    order = pretix.get_order(conference, code)
+
+    if order is None:
+        # Orders can only be deleted when in test mode, but keep the mirror honest
+        PretixOrder.objects.filter(conference=conference, code=code).delete()
+        return
+
+    save_orders(conference, [order])
+
+
+def sync_conference(conference: Conference):
+    sync_catalog(conference)
+    total_orders = sync_orders(conference)
+
+    PretixSyncState.objects.filter(conference=conference).update(
+        last_full_sync_at=timezone.now()
+    )
+
+    logger.info(
+        "Synced total_orders=%s from pretix for conference=%s",
+        total_orders,
+        conference.code,
+    )
+    return total_orders
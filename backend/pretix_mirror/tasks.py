@@ -0,0 +1,23 @@
+import logging
+
+from pretix_mirror.models import PretixSyncState
+from pretix_mirror.sync import sync_catalog
+from pycon.celery import app
+
+logger = logging.getLogger(__file__)
+
+
+@app.task
+def sync_pretix_catalogs():
+    states = PretixSyncState.objects.filter(
+        last_full_sync_at__isnull=False
+    ).select_related("conference")
+
+    for state in states:
+        try:
+            sync_catalog(state.conference)
+        except Exception:
+            logger.exception(
+                "Unable to sync pretix catalog of conference=%s",
+                state.conference.code,
+            )
@@ -0,0 +1,25 @@
+import pytest
+
+
+@pytest.fixture
+def pretix_order_data():
+    def wrapper(code="ABC12", status="p", positions=None):
+        return {
+            "code": code,
+            "status": status,
+            "email": "Buyer@example.org",
+            "positions": positions
+            if positions is not None
+            else [
+                {
+                    "id": 1,
+                    "order": code,
+                    "item": 10,
+                    "voucher": None,
+                    "attendee_name": "Marco",
+                    "attendee_email": "Marco@example.org",
+                }
+            ],
+        }
+
+    return wrapper
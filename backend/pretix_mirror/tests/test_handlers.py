@@ -0,0 +1,95 @@
+import pytest
+from django.test import override_settings
+
+from association_membership.handlers import HANDLERS, run_handler
+from pretix_mirror.models import PretixOrder
+
+pytestmark = pytest.mark.django_db
+
+
+@override_settings(PRETIX_API="https://pretix/api/")
+@pytest.mark.parametrize(
+    "action",
+    [
+        "pretix.event.order.placed",
+        "pretix.event.order.canceled",
+        "pretix.event.order.changed.item",
+        "pretix.event.order.refund.created.externally",
+    ],
+)
+def test_order_webhooks_update_the_mirror(
+    conference, requests_mock, pretix_order_data, action
+):
+    requests_mock.get(
+        "https://pretix/api/organizers/base-pretix-organizer-id/events/base-pretix-event-id/orders/ABC12/",
+        json=pretix_order_data(status="c"),
+    )
+
+    run_handler(
+        "pretix",
+        action,
+        {
+            "organizer": conference.pretix_organizer_id,
+            "event": conference.pretix_event_id,
+            "code": "ABC12",
+            "action": action,
+        },
+    )
+
+    order = PretixOrder.objects.get(conference=conference, code="ABC12")
+    assert order.status == PretixOrder.Status.CANCELED
+
+
+def test_order_webhook_for_unknown_event_is_ignored(requests_mock):
+    run_handler(
+        "pretix",
+        "pretix.event.order.placed",
+        {"organizer": "unknown", "event": "unknown", "code": "ABC12"},
+    )
+
+    assert not requests_mock.called
+    assert not PretixOrder.objects.exists()
+
+
+@override_settings(PRETIX_API="https://pretix/api/")
+def test_paid_order_is_handled_even_if_the_mirror_fails(
+    conference, requests_mock, mocker
+):
+    pretix_api = mocker.patch(
+        "association_membership.handlers.pretix.pretix_event_order_paid.PretixAPI"
+    )
+    pretix_api.return_value.get_order_data.return_value = {"status": "n"}
+    requests_mock.get(
+        "https://pretix/api/organizers/base-pretix-organizer-id/events/base-pretix-event-id/orders/ABC12/",
+        status_code=500,
+    )
+
+    with pytest.raises(Exception):
+        run_handler(
+            "pretix",
+            "pretix.event.order.paid",
+            {
+                "organizer": conference.pretix_organizer_id,
+                "event": conference.pretix_event_id,
+                "code": "ABC12",
+                "action": "pretix.event.order.paid",
+            },
+        )
+
+    pretix_api.return_value.get_order_data.assert_called_once_with("ABC12")
+
+
+def test_order_handlers_run_even_if_one_fails(mocker):
+    failing_handler = mocker.Mock(side_effect=ValueError, __name__="failing")
+    other_handler = mocker.Mock(__name__="other")
+    mocker.patch.dict(
+        HANDLERS["pretix"],
+        {"pretix.event.order.placed": [failing_handler, other_handler]},
+    )
+    payload = {"action": "pretix.event.order.placed"}
+
+    with pytest.raises(ValueError):
+        run_handler("pretix", "pretix.event.order.placed", payload)
+
+    failing_handler.assert_called_once_with(payload)
+    other_handler.assert_called_once_with(payload)
@@ -0,0 +1,128 @@
+import pytest
+from django.utils import timezone
+
+from pretix import (
+    get_all_vouchers,
+    get_order_position,
+    get_order_positions,
+    user_has_admission_ticket,
+)
+from pretix_mirror.models import PretixItem, PretixSyncState, PretixVoucher
+from pretix_mirror.sync import save_orders
+
+pytestmark = pytest.mark.django_db
+
+
+@pytest.fixture
+def mirrored_conference(conference, pretix_order_data):
+    PretixSyncState.objects.create(
+        conference=conference, last_full_sync_at=timezone.now()
+    )
+    PretixItem.objects.create(
+        conference=conference, pretix_id=10, admission=True, data={}
+    )
+    save_orders(conference, [pretix_order_data()])
+    return conference
+
+
+@pytest.mark.parametrize(
+    "email,status,has_ticket",
+    [
+        ("marco@example.org", "p", True),
+        ("MARCO@example.org", "p", True),
+        ("marco@example.org", "n", False),
+        ("other@example.org", "p", False),
+    ],
+)
+def test_user_has_admission_ticket_uses_mirror(
+    mirrored_conference, requests_mock, pretix_order_data, email, status, has_ticket
+):
+    save_orders(mirrored_conference, [pretix_order_data(status=status)])
+
+    assert (
+        user_has_admission_ticket(
+            email=email,
+            event_organizer=mirrored_conference.pretix_organizer_id,
+            event_slug=mirrored_conference.pretix_event_id,
+        )
+        is has_ticket
+    )
+    assert not requests_mock.called
+
+
+def test_non_admission_items_are_not_tickets(mirrored_conference, requests_mock):
+    PretixItem.objects.filter(pretix_id=10).update(admission=False)
+
+    assert not user_has_admission_ticket(
+        email="marco@example.org",
+        event_organizer=mirrored_conference.pretix_organizer_id,
+        event_slug=mirrored_conference.pretix_event_id,
+    )
+    assert not requests_mock.called
+
+
+def test_user_has_admission_ticket_falls_back_to_pretix_for_other_events(
+    mirrored_conference, requests_mock, settings
+):
+    requests_mock.post(
+        f"{settings.PRETIX_API}organizers/{mirrored_conference.pretix_organizer_id}/events/{mirrored_conference.pretix_event_id}/tickets/attendee-has-ticket/",
+        json={"user_has_admission_ticket": True},
+    )
+
+    assert user_has_admission_ticket(
+        email="other@example.org",
+        event_organizer=mirrored_conference.pretix_organizer_id,
+        event_slug=mirrored_conference.pretix_event_id,
+        additional_events=[{"organizer_slug": "other", "event_slug": "other"}],
+    )
+    assert requests_mock.called
+
+
+def test_get_order_position_uses_mirror(mirrored_conference, requests_mock):
+    position = get_order_position(mirrored_conference, "1")
+
+    assert position["attendee_email"] == "Marco@example.org"
+    assert not requests_mock.called
+
+
+def test_get_order_position_falls_back_to_pretix(
+    mirrored_conference, requests_mock, settings
+):
+    requests_mock.get(
+        f"{settings.PRETIX_API}organizers/{mirrored_conference.pretix_organizer_id}/events/{mirrored_conference.pretix_event_id}/orderpositions/2/",
+        json={"id": 2, "attendee_email": "new@example.org"},
+    )
+
+    position = get_order_position(mirrored_conference, "2")
+
+    assert position["attendee_email"] == "new@example.org"
+
+
+def test_get_order_positions_fetches_the_missing_ones_from_pretix(
+    mirrored_conference, requests_mock, settings
+):
+    event_url = f"{settings.PRETIX_API}organizers/{mirrored_conference.pretix_organizer_id}/events/{mirrored_conference.pretix_event_id}"
+    requests_mock.get(
+        f"{event_url}/orderpositions/2/",
+        json={"id": 2, "attendee_email": "new@example.org"},
+    )
+    requests_mock.get(f"{event_url}/orderpositions/3/", status_code=404)
+
+    positions = get_order_positions(mirrored_conference, ["1", "2", "3"])
+
+    assert positions["1"]["attendee_email"] == "Marco@example.org"
+    assert positions["2"]["attendee_email"] == "new@example.org"
+    assert "3" not in positions
+    assert requests_mock.call_count == 2
+
+
+def test_get_all_vouchers_uses_mirror(mirrored_conference, requests_mock):
+    PretixVoucher.objects.create(
+        conference=mirrored_conference,
+        pretix_id=5,
+        code="STAFF-1",
+        data={"id": 5, "code": "STAFF-1"},
+    )
+
+    assert get_all_vouchers(mirrored_conference) == {5: {"id": 5, "code": "STAFF-1"}}
+    assert not requests_mock.called
@@ -0,0 +1,139 @@
+import pytest
+from django.core.management import call_command
+from django.test import override_settings
+from django.utils import timezone
+
+import pretix
+
+from pretix_mirror.models import (
+    PretixItem,
+    PretixOrder,
+    PretixOrderPosition,
+    PretixSyncState,
+    PretixVoucher,
+)
+from pretix_mirror.sync import save_orders, sync_order
+
+pytestmark = pytest.mark.django_db
+
+BASE_URL = (
+    "https://pretix/api/organizers/base-pretix-organizer-id/events/base-pretix-event-id"
+)
+
+
+def _mock_list(requests_mock, endpoint, results):
+    requests_mock.get(
+        f"{BASE_URL}/{endpoint}",
+        json={"count": len(results), "next": None, "results": results},
+    )
+
+
+@override_settings(PRETIX_API="https://pretix/api/")
+def test_sync_command_mirrors_conference(
+    conference_factory, requests_mock, pretix_order_data
+):
+    conference = conference_factory(code="pycon2024")
+    _mock_list(
+        requests_mock,
+        "items",
+        [{"id": 10, "admission": True, "active": True}],
+    )
+    _mock_list(requests_mock, "quotas", [{"id": 1}])
+    _mock_list(requests_mock, "questions", [{"id": 1}])
+    _mock_list(
+        requests_mock,
+        "vouchers",
+        [{"id": 5, "code": "STAFF-1", "tag": None}],
+    )
+    _mock_list(requests_mock, "orders", [pretix_order_data()])
+
+    call_command("sync_pretix_mirror", "pycon2024")
+
+    assert PretixSyncState.objects.get(conference=conference).last_full_sync_at
+    assert PretixItem.objects.get(conference=conference, pretix_id=10).admission
+    assert PretixVoucher.objects.get(conference=conference, pretix_id=5).tag == ""
+
+    order = PretixOrder.objects.get(conference=conference, code="ABC12")
+    assert order.status == PretixOrder.Status.PAID
+    assert order.positions.get().attendee_email == "marco@example.org"
+
+
+@override_settings(PRETIX_API="https://pretix/api/")
+def test_catalog_sync_removes_deleted_objects(conference, requests_mock):
+    PretixItem.objects.create(conference=conference, pretix_id=99, data={})
+
+    _mock_list(requests_mock, "items", [{"id": 10, "admission": True, "active": True}])
+    _mock_list(requests_mock, "quotas", [])
+    _mock_list(requests_mock, "questions", [])
+    _mock_list(requests_mock, "vouchers", [])
+    _mock_list(requests_mock, "orders", [])
+
+    call_command("sync_pretix_mirror", conference.code)
+
+    assert list(
+        PretixItem.objects.filter(conference=conference).values_list(
+            "pretix_id", flat=True
+        )
+    ) == [10]
+
+
+def test_save_orders_updates_existing_order(conference, pretix_order_data):
+    save_orders(conference, [pretix_order_data(status="n")])
+    save_orders(
+        conference,
+        [
+            pretix_order_data(
+                status="p",
+                positions=[
+                    {
+                        "id": 2,
+                        "order": "ABC12",
+                        "item": 11,
+                        "voucher": 5,
+                        "attendee_name": None,
+                        "attendee_email": None,
+                    }
+                ],
+            )
+        ],
+    )
+
+    order = PretixOrder.objects.get(conference=conference, code="ABC12")
+    assert order.status == PretixOrder.Status.PAID
+    assert list(order.positions.values_list("pretix_id", "voucher_id")) == [(2, 5)]
+    assert PretixOrderPosition.objects.count() == 1
+
+
+@override_settings(PRETIX_API="https://pretix/api/")
+def test_sync_order_removes_deleted_order(conference, requests_mock, pretix_order_data):
+    save_orders(conference, [pretix_order_data()])
+    requests_mock.get(f"{BASE_URL}/orders/ABC12/", status_code=404)
+
+    sync_order(conference, "ABC12")
+
+    assert not PretixOrder.objects.exists()
+    assert not PretixOrderPosition.objects.exists()
+
+
+@override_settings(PRETIX_API="https://pretix/api/")
+def test_created_voucher_is_mirrored_right_away(
+    conference, requests_mock, locmem_cache
+):
+    PretixSyncState.objects.create(
+        conference=conference, last_full_sync_at=timezone.now()
+    )
+    requests_mock.post(
+        f"{BASE_URL}/vouchers/",
+        json={"id": 7, "code": "GRANT-1", "tag": "grants"},
+    )
+
+    assert pretix.get_all_vouchers(conference) == {}
+
+    pretix.create_voucher(conference, "GRANT-1", "", "grants", 1, "set", "0")
+
+    assert PretixVoucher.objects.get(conference=conference, pretix_id=7).code == (
+        "GRANT-1"
+    )
+    assert pretix.get_all_vouchers(conference) == {
+        7: {"id": 7, "code": "GRANT-1", "tag": "grants"}
+    }
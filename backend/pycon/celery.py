@@ -23,8 +23,13 @@ def setup_periodic_tasks(sender, **kwargs):
             check_association_membership_subscriptions,
         )
 
+        from pretix_mirror.tasks import sync_pretix_catalogs
+        from voting.tasks import WARM_UP_BEFORE_VOTING, warm_up_can_vote_caches
+
         add = sender.add_periodic_task
 
         add(timedelta(minutes=5), check_association_membership_subscriptions)
+        add(timedelta(minutes=10), sync_pretix_catalogs)
+        add(WARM_UP_BEFORE_VOTING, warm_up_can_vote_caches)
     except Exception:
         logger.exception("setup_periodic_tasks")
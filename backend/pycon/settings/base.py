@@ -119,6 +119,7 @@ INSTALLED_APPS = [
     "badges.apps.BadgesConfig",
     "google_api.apps.GoogleApiConfig",
     "association_membership.apps.AssociationMembershipConfig",
+    "pretix_mirror.apps.PretixMirrorConfig",
     "rest_framework",
     "integrations.apps.IntegrationsConfig",
 ]
@@ -235,6 +236,14 @@ IMAGEKIT_DEFAULT_FILE_STORAGE = env(
 if PRETIX_API:
     PRETIX_API_TOKEN = env("PRETIX_API_TOKEN")
 
+PRETIX_HTTP_POOL_CONNECTIONS = env.int("PRETIX_HTTP_POOL_CONNECTIONS", default=4)
+PRETIX_HTTP_POOL_SIZE = env.int("PRETIX_HTTP_POOL_SIZE", default=10)
+PRETIX_HTTP_CONNECT_TIMEOUT = env.float("PRETIX_HTTP_CONNECT_TIMEOUT", default=3.05)
+PRETIX_HTTP_READ_TIMEOUT = env.float("PRETIX_HTTP_READ_TIMEOUT", default=20)
+PRETIX_HTTP_MAX_RETRIES = env.int("PRETIX_HTTP_MAX_RETRIES", default=3)
+PRETIX_HTTP_BACKOFF_FACTOR = env.float("PRETIX_HTTP_BACKOFF_FACTOR", default=0.3)
+PRETIX_PAGINATION_WORKERS = env.int("PRETIX_PAGINATION_WORKERS", default=4)
+
 SIMULATE_PRETIX_DB = True
 
 LOGGING = {
@@ -259,9 +268,39 @@ LOGGING = {
             "propagate": False,
         },
         "qinspect": {"handlers": ["console"], "level": "DEBUG", "propagate": True},
+        "api.extensions": {
+            "handlers": ["console"],
+            "level": env("GRAPHQL_METRICS_LOG_LEVEL", default="WARNING"),
+            "propagate": False,
+        },
     },
 }
 
+# Operations running more queries than this are logged as warnings
+GRAPHQL_METRICS_MAX_QUERIES = env.int("GRAPHQL_METRICS_MAX_QUERIES", default=50)
+# How many resolver paths are included in the report, most queries first
+GRAPHQL_METRICS_MAX_RESOLVERS = env.int("GRAPHQL_METRICS_MAX_RESOLVERS", default=20)
+GRAPHQL_METRICS_IN_RESPONSE = env.bool("GRAPHQL_METRICS_IN_RESPONSE", default=False)
+
+# How many parsed and validated GraphQL documents each process keeps
+GRAPHQL_DOCUMENT_CACHE_SIZE = env.int("GRAPHQL_DOCUMENT_CACHE_SIZE", default=512)
+
+# Limits of the operations, see `api.cost`
+GRAPHQL_MAX_QUERY_DEPTH = env.int("GRAPHQL_MAX_QUERY_DEPTH", default=15)
+GRAPHQL_MAX_QUERY_COST = env.int("GRAPHQL_MAX_QUERY_COST", default=50000)
+# Assumed size of the lists without a `first`/`limit` like argument
+GRAPHQL_DEFAULT_LIST_SIZE = env.int("GRAPHQL_DEFAULT_LIST_SIZE", default=10)
+# Cost each client (user or IP address) can spend in a window of seconds,
+# disabled by default as the anonymous server side requests of the frontend
+# all come from the same IP address
+GRAPHQL_COST_BUDGET = env.int("GRAPHQL_COST_BUDGET", default=0)
+GRAPHQL_COST_BUDGET_WINDOW = env.int("GRAPHQL_COST_BUDGET_WINDOW", default=60)
+
+# How long shared caches can keep the anonymous responses of persisted queries
+GRAPHQL_PERSISTED_QUERIES_MAX_AGE = env.int(
+    "GRAPHQL_PERSISTED_QUERIES_MAX_AGE", default=60
+)
+
 QUERY_INSPECT_ENABLED = DEBUG
 QUERY_INSPECT_LOG_QUERIES = True
 QUERY_INSPECT_LOG_TRACEBACKS = True
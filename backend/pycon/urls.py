@@ -25,6 +25,7 @@ urlpatterns = [
     path("cms-documents/", include(wagtaildocs_urls)),
     path("", include("association_membership.urls")),
     path("integrations/", include("integrations.urls")),
+    path("badges/", include("badges.urls")),
     path("sponsors/", include("sponsors.urls")),
 ] + static(settings.MEDIA_URL, document_root=settings.MEDIA_ROOT)
 
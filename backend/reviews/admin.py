@@ -1,25 +1,36 @@
-from django.contrib.postgres.expressions import ArraySubquery
-from django.db.models.expressions import ExpressionWrapper
 from django.db.models import FloatField
-from django.db.models.functions import Cast
+from django.db.models.functions import Cast, NullIf
 from users.admin_mixins import ConferencePermissionMixin
 from django.core.exceptions import PermissionDenied
-from django.db.models import Q, Exists
 import urllib.parse
+from collections import defaultdict
 from typing import List, Optional
 
 from django import forms
 from django.contrib import admin, messages
-from django.db.models import Count, F, OuterRef, Prefetch, Subquery, Sum
+from django.db.models import (
+    Case,
+    F,
+    Prefetch,
+    When,
+    prefetch_related_objects,
+)
 from django.http.request import HttpRequest
 from django.shortcuts import redirect
 from django.template.response import TemplateResponse
 from django.urls import path, reverse
 from django.utils.safestring import mark_safe
 
+from grants.decisions import apply_grant_decisions
 from grants.models import Grant
 from participants.models import Participant
 from reviews.models import AvailableScoreOption, ReviewSession, UserReview
+from reviews.queue import (
+    build_review_queue,
+    get_next_item_id,
+    get_normalized_score,
+    get_reviewer_stats,
+)
 from submissions.models import Submission, SubmissionTag
 from users.models import User
 
@@ -34,6 +45,39 @@ class AvailableScoreOptionInline(admin.TabularInline):
         return super().get_readonly_fields(request, obj)
 
 
+def _items_with_scores(queue_items, field: str, review_session: ReviewSession):
+    """
+    The proposals or grants of the queue items, with the scores
+    of the session aggregated in the queue
+    """
+    reviewer_stats = get_reviewer_stats(review_session)
+    items = []
+
+    for queue_item in queue_items:
+        item = getattr(queue_item, field)
+        item.score = queue_item.score
+        item.vote_count = queue_item.votes_received
+        item.score_variance = queue_item.score_variance
+        items.append(item)
+
+    prefetch_related_objects(
+        items,
+        Prefetch(
+            "userreview_set",
+            queryset=UserReview.objects.select_related("user", "score").filter(
+                review_session_id=review_session.id
+            ),
+        ),
+    )
+
+    for item in items:
+        item.normalized_score = get_normalized_score(
+            item.userreview_set.all(), reviewer_stats
+        )
+
+    return items
+
+
 def get_all_tags():
     # todo improve :)
     return SubmissionTag.objects.values_list("id", "name")
@@ -261,27 +305,14 @@ class ReviewSessionAdmin(ConferencePermissionMixin, admin.ModelAdmin):
                 if key.startswith("approvedtype-")
             }
 
-            grants = list(
-                review_session.conference.grants.filter(id__in=decisions.keys()).all()
+            apply_grant_decisions(
+                review_session.conference,
+                {
+                    grant_id: (decision, approved_type_decisions.get(grant_id, ""))
+                    for grant_id, decision in decisions.items()
+                },
             )
 
-            for grant in grants:
-                decision = decisions[grant.id]
-                if decision not in Grant.REVIEW_SESSION_STATUSES_OPTIONS:
-                    continue
-
-                approved_type = approved_type_decisions.get(grant.id, "")
-
-                grant.status = decision
-                grant.approved_type = (
-                    approved_type if decision == Grant.Status.approved else None
-                )
-
-            for grant in grants:
-                # save each to make sure we re-calculate the grants amounts
-                # TODO: move the amount calculation in a separate function maybe?
-                grant.save(update_fields=["status", "approved_type"])
-
             messages.success(
                 request, "Decisions saved. Check the Grants Summary for more info."
             )
@@ -295,64 +326,35 @@ class ReviewSessionAdmin(ConferencePermissionMixin, admin.ModelAdmin):
                 )
             )
 
-        items = (
-            review_session.conference.grants.annotate(
-                total_score=Cast(
-                    Sum(
-                        "userreview__score__numeric_value",
-                        filter=Q(userreview__review_session_id=review_session_id),
-                    ),
-                    output_field=FloatField(),
-                ),
-                vote_count=Cast(
-                    Count(
-                        "userreview",
-                        filter=Q(userreview__review_session_id=review_session_id),
-                    ),
-                    output_field=FloatField(),
-                ),
-                score=ExpressionWrapper(
-                    F("total_score") / F("vote_count"),
-                    output_field=FloatField(),
-                ),
-                has_sent_a_proposal=Exists(
-                    Submission.objects.non_cancelled().filter(
-                        speaker_id=OuterRef("user_id"),
-                        conference_id=review_session.conference_id,
-                    )
-                ),
-                proposals_ids=ArraySubquery(
-                    Submission.objects.non_cancelled()
-                    .filter(
-                        speaker_id=OuterRef("user_id"),
-                        conference_id=review_session.conference_id,
-                    )
-                    .values("id")
-                ),
-            )
-            .order_by(F("score").desc(nulls_last=True))
-            .prefetch_related(
-                Prefetch(
-                    "userreview_set",
-                    queryset=UserReview.objects.prefetch_related(
-                        "user", "score"
-                    ).filter(review_session_id=review_session_id),
-                ),
-                "user",
+        build_review_queue(review_session)
+        queue_items = (
+            review_session.queue_items.annotate(
+                score=Cast("score_sum", output_field=FloatField())
+                / NullIf(Cast("votes_received", output_field=FloatField()), 0.0)
             )
-            .all()
+            .select_related("grant", "grant__user")
+            .order_by(F("score").desc(nulls_last=True), "grant_id")
         )
+        items = _items_with_scores(queue_items, "grant", review_session)
 
         proposals = {
             submission.id: submission
             for submission in Submission.objects.non_cancelled()
             .filter(
                 conference_id=review_session.conference_id,
-                speaker_id__in=items.values_list("user_id"),
+                speaker_id__in=[item.user_id for item in items],
             )
             .prefetch_related("rankings", "rankings__tag")
         }
 
+        proposals_ids = defaultdict(list)
+        for submission in proposals.values():
+            proposals_ids[submission.speaker_id].append(submission.id)
+
+        for item in items:
+            item.proposals_ids = proposals_ids[item.user_id]
+            item.has_sent_a_proposal = bool(item.proposals_ids)
+
         context = dict(
             self.admin_site.each_context(request),
             request=request,
@@ -412,42 +414,30 @@ class ReviewSessionAdmin(ConferencePermissionMixin, admin.ModelAdmin):
                 )
             )
 
-        items = (
-            Submission.objects.for_conference(review_session.conference_id)
-            .non_cancelled()
+        build_review_queue(review_session)
+        queue_items = (
+            review_session.queue_items.filter(
+                proposal__status__in=Submission.NON_CANCELLED_STATUSES
+            )
             .annotate(
-                score=Subquery(
-                    UserReview.objects.select_related("score")
-                    .filter(
-                        review_session_id=review_session_id,
-                        proposal_id=OuterRef("id"),
-                    )
-                    .values("proposal_id")
-                    .annotate(score=Sum("score__numeric_value"))
-                    .values("score")
+                score=Case(
+                    When(votes_received=0, then=None),
+                    default=F("score_sum"),
                 )
             )
-            .order_by(F("score").desc(nulls_last=True))
-            .prefetch_related(
-                Prefetch(
-                    "userreview_set",
-                    queryset=UserReview.objects.prefetch_related(
-                        "user", "score"
-                    ).filter(review_session_id=review_session_id),
-                ),
-                "duration",
-                "audience_level",
-                "languages",
-                "speaker",
-                "tags",
-                "type",
-                "rankings",
-                "rankings__tag",
+            .select_related(
+                "proposal",
+                "proposal__duration",
+                "proposal__audience_level",
+                "proposal__speaker",
+                "proposal__type",
             )
-            .all()
+            .order_by(F("score").desc(nulls_last=True), "proposal_id")
         )
+        items = _items_with_scores(queue_items, "proposal", review_session)
+        prefetch_related_objects(items, "languages", "tags", "rankings__tag")
 
-        speakers_ids = items.values_list("speaker_id", flat=True)
+        speakers_ids = [item.speaker_id for item in items]
 
         grants = {
             str(grant.user_id): grant
@@ -727,50 +717,9 @@ def get_next_to_review_item_id(
     exclude: List[int] = None,
     seen: List[int] = None,
 ) -> Optional[int]:
-    exclude = exclude or []
-    seen = seen or []
-    already_reviewed = UserReview.objects.filter(
-        user_id=user.id,
-        review_session_id=review_session.id,
+    return get_next_item_id(
+        review_session,
+        user,
+        skip_ids=[skip_item, *(seen or [])],
+        exclude_tags=exclude or [],
     )
-
-    if review_session.is_proposals_review:
-        already_reviewed_ids = already_reviewed.values_list("proposal_id", flat=True)
-        skip_item_array = [skip_item] if skip_item else []
-        seen_items_to_ignore = list(already_reviewed_ids) + skip_item_array + seen
-        qs = (
-            Submission.objects.non_cancelled()
-            .for_conference(review_session.conference_id)
-            .annotate(
-                votes_received=Count(
-                    "userreview",
-                    filter=Q(userreview__review_session_id=review_session.id),
-                )
-            )
-            .order_by("votes_received", "?")
-        )
-
-        if seen_items_to_ignore:
-            qs = qs.exclude(id__in=seen_items_to_ignore)
-
-        if exclude:
-            qs = qs.exclude(tags__in=exclude)
-
-        unvoted_item = qs.first()
-    elif review_session.is_grants_review:
-        already_reviewed_ids = already_reviewed.values_list("grant_id", flat=True)
-        unvoted_item = (
-            review_session.conference.grants.annotate(
-                votes_received=Count(
-                    "userreview",
-                    filter=Q(userreview__review_session_id=review_session.id),
-                )
-            )
-            .exclude(
-                id__in=list(already_reviewed_ids) + [skip_item] + seen,
-            )
-            .order_by("votes_received", "?")
-            .first()
-        )
-
-    return unvoted_item.id if unvoted_item else None
@@ -1,6 +1,19 @@
 from django.apps import AppConfig
+from django.db.models.signals import post_delete, post_save
 
 
 class ReviewsConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "reviews"
+
+    def ready(self):
+        from grants.models import Grant
+        from reviews.models import UserReview
+        from submissions.models import Submission
+
+        from . import signals
+
+        post_save.connect(signals.user_review_saved, sender=UserReview)
+        post_delete.connect(signals.user_review_deleted, sender=UserReview)
+        post_save.connect(signals.add_submission_to_review_queues, sender=Submission)
+        post_save.connect(signals.add_grant_to_review_queues, sender=Grant)
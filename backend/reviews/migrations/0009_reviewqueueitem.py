@@ -0,0 +1,55 @@
+# Generated by Django 4.2.7 on 2026-10-18 18:57
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('grants', '0018_grant_plain_thread_id'),
+        ('submissions', '0024_submission_conference_status_index'),
+        ('reviews', '0008_alter_reviewsession_options'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ReviewQueueItem',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('votes_received', models.PositiveIntegerField(default=0)),
+                ('position', models.BigIntegerField()),
+            ],
+        ),
+        migrations.AddIndex(
+            model_name='userreview',
+            index=models.Index(fields=['review_session', 'user'], name='reviews_use_review__84f2ee_idx'),
+        ),
+        migrations.AddField(
+            model_name='reviewqueueitem',
+            name='grant',
+            field=models.ForeignKey(null=True, on_delete=django.db.models.deletion.CASCADE, related_name='+', to='grants.grant'),
+        ),
+        migrations.AddField(
+            model_name='reviewqueueitem',
+            name='proposal',
+            field=models.ForeignKey(null=True, on_delete=django.db.models.deletion.CASCADE, related_name='+', to='submissions.submission'),
+        ),
+        migrations.AddField(
+            model_name='reviewqueueitem',
+            name='review_session',
+            field=models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='queue_items', to='reviews.reviewsession'),
+        ),
+        migrations.AddIndex(
+            model_name='reviewqueueitem',
+            index=models.Index(fields=['review_session', 'votes_received', 'position'], name='reviews_rev_review__74025c_idx'),
+        ),
+        migrations.AddConstraint(
+            model_name='reviewqueueitem',
+            constraint=models.UniqueConstraint(fields=('review_session', 'proposal'), name='reviews_reviewqueueitem_unique_proposal'),
+        ),
+        migrations.AddConstraint(
+            model_name='reviewqueueitem',
+            constraint=models.UniqueConstraint(fields=('review_session', 'grant'), name='reviews_reviewqueueitem_unique_grant'),
+        ),
+    ]
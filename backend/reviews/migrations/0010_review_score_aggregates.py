@@ -0,0 +1,97 @@
+# Generated by Django 4.2.7 on 2026-10-18 19:03
+
+from django.conf import settings
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+def rebuild_aggregates(apps, schema_editor):
+    ReviewQueueItem = apps.get_model("reviews", "ReviewQueueItem")
+    ReviewerStats = apps.get_model("reviews", "ReviewerStats")
+    UserReview = apps.get_model("reviews", "UserReview")
+
+    # Queues are built again with their scores the next time they are used
+    ReviewQueueItem.objects.all().delete()
+
+    score = models.F("score__numeric_value")
+    ReviewerStats.objects.bulk_create(
+        [
+            ReviewerStats(
+                review_session_id=row["review_session_id"],
+                user_id=row["user_id"],
+                reviews_count=row["reviews_count"],
+                score_sum=row["score_sum"],
+                score_squares_sum=row["score_squares_sum"],
+            )
+            for row in UserReview.objects.values("review_session_id", "user_id")
+            .order_by()
+            .annotate(
+                reviews_count=models.Count("id"),
+                score_sum=models.Sum(score),
+                score_squares_sum=models.Sum(score * score),
+            )
+        ]
+    )
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+        ("reviews", "0009_reviewqueueitem"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="reviewqueueitem",
+            name="score_squares_sum",
+            field=models.IntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name="reviewqueueitem",
+            name="score_sum",
+            field=models.IntegerField(default=0),
+        ),
+        migrations.CreateModel(
+            name="ReviewerStats",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("reviews_count", models.PositiveIntegerField(default=0)),
+                ("score_sum", models.IntegerField(default=0)),
+                ("score_squares_sum", models.IntegerField(default=0)),
+                (
+                    "review_session",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="reviewer_stats",
+                        to="reviews.reviewsession",
+                    ),
+                ),
+                (
+                    "user",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="+",
+                        to=settings.AUTH_USER_MODEL,
+                    ),
+                ),
+            ],
+        ),
+        migrations.AddConstraint(
+            model_name="reviewerstats",
+            constraint=models.UniqueConstraint(
+                fields=("review_session", "user"),
+                name="reviews_reviewerstats_unique_user",
+            ),
+        ),
+        migrations.RunPython(
+            rebuild_aggregates, reverse_code=migrations.RunPython.noop
+        ),
+    ]
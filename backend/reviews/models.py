@@ -1,3 +1,5 @@
+import math
+
 from django.db import models
 from django.utils.translation import gettext_lazy as _
 from model_utils.models import TimeStampedModel
@@ -138,3 +140,119 @@ class UserReview(TimeStampedModel):
             return self.proposal
 
         return self.grant
+
+    class Meta:
+        indexes = [
+            models.Index(fields=["review_session", "user"]),
+        ]
+
+
+class ReviewQueueItem(models.Model):
+    """
+    An item to review in a review session, with the reviews it received
+    so far. Kept up to date by the signals in `reviews.signals`, see
+    `reviews.queue` for how items are handed out.
+    """
+
+    review_session = models.ForeignKey(
+        ReviewSession, on_delete=models.CASCADE, related_name="queue_items"
+    )
+    proposal = models.ForeignKey(
+        "submissions.Submission",
+        on_delete=models.CASCADE,
+        null=True,
+        related_name="+",
+    )
+    grant = models.ForeignKey(
+        "grants.Grant",
+        on_delete=models.CASCADE,
+        null=True,
+        related_name="+",
+    )
+    votes_received = models.PositiveIntegerField(default=0)
+    score_sum = models.IntegerField(default=0)
+    score_squares_sum = models.IntegerField(default=0)
+    # Random at first, then the time the item was last handed out:
+    # items with the same votes go round-robin between reviewers
+    position = models.BigIntegerField()
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=["review_session", "proposal"],
+                name="reviews_reviewqueueitem_unique_proposal",
+            ),
+            models.UniqueConstraint(
+                fields=["review_session", "grant"],
+                name="reviews_reviewqueueitem_unique_grant",
+            ),
+        ]
+        indexes = [
+            models.Index(fields=["review_session", "votes_received", "position"]),
+        ]
+
+    @property
+    def item_id(self):
+        return self.proposal_id or self.grant_id
+
+    @property
+    def mean_score(self):
+        return _mean(self.votes_received, self.score_sum)
+
+    @property
+    def score_variance(self):
+        return _variance(self.votes_received, self.score_sum, self.score_squares_sum)
+
+
+class ReviewerStats(models.Model):
+    """
+    The scores a reviewer gave in a review session, used to normalize
+    the scores of reviewers that are stricter or more generous than others
+    """
+
+    review_session = models.ForeignKey(
+        ReviewSession, on_delete=models.CASCADE, related_name="reviewer_stats"
+    )
+    user = models.ForeignKey("users.User", on_delete=models.CASCADE, related_name="+")
+    reviews_count = models.PositiveIntegerField(default=0)
+    score_sum = models.IntegerField(default=0)
+    score_squares_sum = models.IntegerField(default=0)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=["review_session", "user"],
+                name="reviews_reviewerstats_unique_user",
+            ),
+        ]
+
+    @property
+    def mean_score(self):
+        return _mean(self.reviews_count, self.score_sum)
+
+    @property
+    def score_variance(self):
+        return _variance(self.reviews_count, self.score_sum, self.score_squares_sum)
+
+    def normalize(self, score: int) -> float:
+        """How many standard deviations the score is from the reviewer's mean"""
+        variance = self.score_variance
+
+        if not variance:
+            return 0.0
+
+        return (score - self.mean_score) / math.sqrt(variance)
+
+
+def _mean(count: int, total: int):
+    if not count:
+        return None
+
+    return total / count
+
+
+def _variance(count: int, total: int, squares_total: int):
+    if not count:
+        return None
+
+    return max(squares_total / count - (total / count) ** 2, 0.0)
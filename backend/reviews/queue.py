@@ -0,0 +1,225 @@
+import random
+import time
+from typing import Dict, Iterable, Optional
+
+from django.db import transaction
+from django.db.models import Count, Exists, F, OuterRef, Q, Sum
+from django.db.models.functions import Coalesce
+
+from grants.models import Grant
+from reviews.models import ReviewerStats, ReviewQueueItem, ReviewSession, UserReview
+from submissions.models import Submission
+from users.models import User
+
+# Initial positions are below any timestamp in milliseconds, so items
+# never handed out come before the ones handed out already
+INITIAL_POSITIONS = 2**31
+
+
+def _item_field(review_session: ReviewSession) -> str:
+    return "proposal" if review_session.is_proposals_review else "grant"
+
+
+def _now_position() -> int:
+    return int(time.time() * 1000)
+
+
+def _score_aggregates(prefix: str = "", **filters) -> dict:
+    score = F(f"{prefix}score__numeric_value")
+    filter_ = Q(**{f"{prefix}{name}": value for name, value in filters.items()})
+
+    return {
+        "votes_received": Count(f"{prefix}id", filter=filter_),
+        "score_sum": Coalesce(Sum(score, filter=filter_), 0),
+        "score_squares_sum": Coalesce(Sum(score * score, filter=filter_), 0),
+    }
+
+
+def build_review_queue(review_session: ReviewSession) -> None:
+    """
+    Adds the items of the conference missing from the queue of the session,
+    with the reviews they already received
+    """
+    field = _item_field(review_session)
+
+    if review_session.is_proposals_review:
+        items = Submission.objects.for_conference(review_session.conference_id)
+    else:
+        items = Grant.objects.filter(conference_id=review_session.conference_id)
+
+    items = (
+        items.exclude(
+            Exists(
+                ReviewQueueItem.objects.filter(
+                    review_session_id=review_session.id,
+                    **{f"{field}_id": OuterRef("id")},
+                )
+            )
+        )
+        .annotate(
+            **_score_aggregates("userreview__", review_session_id=review_session.id)
+        )
+        .values("id", "votes_received", "score_sum", "score_squares_sum")
+    )
+
+    ReviewQueueItem.objects.bulk_create(
+        [
+            ReviewQueueItem(
+                review_session=review_session,
+                position=random.randrange(INITIAL_POSITIONS),
+                votes_received=item["votes_received"],
+                score_sum=item["score_sum"],
+                score_squares_sum=item["score_squares_sum"],
+                **{f"{field}_id": item["id"]},
+            )
+            for item in items
+        ],
+        ignore_conflicts=True,
+    )
+
+
+def add_to_review_queues(conference_id: int, **item) -> None:
+    """Adds a new proposal or grant to the queues already built"""
+    session_type = (
+        ReviewSession.SessionType.PROPOSALS
+        if "proposal_id" in item
+        else ReviewSession.SessionType.GRANTS
+    )
+
+    ReviewQueueItem.objects.bulk_create(
+        [
+            ReviewQueueItem(
+                review_session_id=review_session_id,
+                position=random.randrange(INITIAL_POSITIONS),
+                **item,
+            )
+            for review_session_id in ReviewSession.objects.filter(
+                conference_id=conference_id,
+                session_type=session_type,
+                queue_items__isnull=False,
+            )
+            .values_list("id", flat=True)
+            .distinct()
+        ],
+        ignore_conflicts=True,
+    )
+
+
+def update_review_aggregates(user_review: UserReview, create: bool = True) -> None:
+    """
+    Recomputes the scores of the item and of the reviewer of the review.
+
+    `create` is False when the review is deleted, as the session and
+    its aggregates could be getting deleted as well.
+    """
+    item_reviews = UserReview.objects.filter(
+        review_session_id=user_review.review_session_id,
+        proposal_id=user_review.proposal_id,
+        grant_id=user_review.grant_id,
+    )
+    ReviewQueueItem.objects.filter(
+        review_session_id=user_review.review_session_id,
+        proposal_id=user_review.proposal_id,
+        grant_id=user_review.grant_id,
+    ).update(**item_reviews.aggregate(**_score_aggregates()))
+
+    reviewer_reviews = UserReview.objects.filter(
+        review_session_id=user_review.review_session_id,
+        user_id=user_review.user_id,
+    ).aggregate(**_score_aggregates())
+    reviewer_stats = {
+        "reviews_count": reviewer_reviews["votes_received"],
+        "score_sum": reviewer_reviews["score_sum"],
+        "score_squares_sum": reviewer_reviews["score_squares_sum"],
+    }
+
+    if create:
+        ReviewerStats.objects.update_or_create(
+            review_session_id=user_review.review_session_id,
+            user_id=user_review.user_id,
+            defaults=reviewer_stats,
+        )
+    else:
+        ReviewerStats.objects.filter(
+            review_session_id=user_review.review_session_id,
+            user_id=user_review.user_id,
+        ).update(**reviewer_stats)
+
+
+def get_reviewer_stats(review_session: ReviewSession) -> Dict[int, ReviewerStats]:
+    return {
+        reviewer_stats.user_id: reviewer_stats
+        for reviewer_stats in review_session.reviewer_stats.all()
+    }
+
+
+def get_normalized_score(
+    user_reviews: Iterable[UserReview], reviewer_stats: Dict[int, ReviewerStats]
+) -> Optional[float]:
+    """
+    The mean of the scores of the reviews, each normalized against the
+    other scores given by its reviewer
+    """
+    normalized_scores = [
+        reviewer_stats[user_review.user_id].normalize(user_review.score.numeric_value)
+        for user_review in user_reviews
+        if user_review.user_id in reviewer_stats
+    ]
+
+    if not normalized_scores:
+        return None
+
+    return sum(normalized_scores) / len(normalized_scores)
+
+
+def get_next_item_id(
+    review_session: ReviewSession,
+    user: User,
+    skip_ids: Iterable[int] = (),
+    exclude_tags: Iterable[int] = (),
+) -> Optional[int]:
+    """
+    Hands out the item with the fewest reviews the user hasn't reviewed yet.
+
+    The queue is walked in index order, and the item handed out goes after
+    the others with the same reviews, so reviewers working at the same time
+    get different items.
+    """
+    if not review_session.queue_items.exists():
+        build_review_queue(review_session)
+
+    field = _item_field(review_session)
+    reviewed_by_user = UserReview.objects.filter(
+        review_session_id=review_session.id,
+        user_id=user.id,
+        **{f"{field}_id": OuterRef(f"{field}_id")},
+    )
+
+    queue = (
+        review_session.queue_items.filter(~Exists(reviewed_by_user))
+        .exclude(**{f"{field}_id__in": [id_ for id_ in skip_ids if id_]})
+        .order_by("votes_received", "position")
+    )
+
+    if review_session.is_proposals_review:
+        queue = queue.filter(proposal__status__in=Submission.NON_CANCELLED_STATUSES)
+
+        if exclude_tags:
+            queue = queue.exclude(
+                Exists(
+                    Submission.tags.through.objects.filter(
+                        submission_id=OuterRef("proposal_id"),
+                        submissiontag_id__in=exclude_tags,
+                    )
+                )
+            )
+
+    with transaction.atomic():
+        item = queue.select_for_update(skip_locked=True, of=("self",)).first()
+
+        if not item:
+            return None
+
+        ReviewQueueItem.objects.filter(id=item.id).update(position=_now_position())
+
+    return getattr(item, f"{field}_id")
@@ -0,0 +1,19 @@
+from reviews.queue import add_to_review_queues, update_review_aggregates
+
+
+def user_review_saved(sender, instance, **kwargs):
+    update_review_aggregates(instance)
+
+
+def user_review_deleted(sender, instance, **kwargs):
+    update_review_aggregates(instance, create=False)
+
+
+def add_submission_to_review_queues(sender, instance, created, **kwargs):
+    if created:
+        add_to_review_queues(instance.conference_id, proposal_id=instance.id)
+
+
+def add_grant_to_review_queues(sender, instance, created, **kwargs):
+    if created:
+        add_to_review_queues(instance.conference_id, grant_id=instance.id)
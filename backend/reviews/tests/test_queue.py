@@ -0,0 +1,143 @@
+import pytest
+
+from conferences.tests.factories import ConferenceFactory
+from reviews.models import ReviewerStats, ReviewQueueItem, ReviewSession
+from reviews.queue import get_next_item_id, get_normalized_score
+from reviews.tests.factories import (
+    AvailableScoreOptionFactory,
+    ReviewSessionFactory,
+    UserReviewFactory,
+)
+from submissions.models import Submission
+from submissions.tests.factories import SubmissionFactory
+from users.tests.factories import UserFactory
+
+pytestmark = pytest.mark.django_db
+
+
+@pytest.fixture
+def proposals_review_session():
+    review_session = ReviewSessionFactory(
+        conference=ConferenceFactory(),
+        session_type=ReviewSession.SessionType.PROPOSALS,
+    )
+    AvailableScoreOptionFactory(review_session=review_session, numeric_value=0)
+    return review_session
+
+
+def test_reviewers_at_the_same_time_get_different_items(proposals_review_session):
+    conference = proposals_review_session.conference
+    submissions = {SubmissionFactory(conference=conference).id for _ in range(2)}
+
+    first = get_next_item_id(proposals_review_session, UserFactory())
+    second = get_next_item_id(proposals_review_session, UserFactory())
+
+    assert {first, second} == submissions
+
+
+def test_queue_counts_the_reviews(proposals_review_session):
+    conference = proposals_review_session.conference
+    submission = SubmissionFactory(conference=conference)
+    other_submission = SubmissionFactory(conference=conference)
+    reviewer = UserFactory()
+
+    get_next_item_id(proposals_review_session, reviewer)
+    user_review = UserReviewFactory(
+        review_session=proposals_review_session,
+        proposal=submission,
+        user=UserFactory(),
+        score=proposals_review_session.availablescoreoption_set.get(),
+    )
+
+    item = ReviewQueueItem.objects.get(proposal=submission)
+    assert item.votes_received == 1
+
+    # The item with fewer reviews comes first
+    assert get_next_item_id(proposals_review_session, reviewer) == (other_submission.id)
+
+    user_review.delete()
+    item.refresh_from_db()
+    assert item.votes_received == 0
+
+
+def test_new_and_cancelled_submissions(proposals_review_session):
+    conference = proposals_review_session.conference
+    submission = SubmissionFactory(conference=conference)
+    reviewer = UserFactory()
+
+    assert get_next_item_id(proposals_review_session, reviewer) == submission.id
+
+    submission.status = Submission.STATUS.cancelled
+    submission.save()
+    new_submission = SubmissionFactory(conference=conference)
+
+    assert get_next_item_id(proposals_review_session, reviewer) == (new_submission.id)
+    assert (
+        get_next_item_id(
+            proposals_review_session, reviewer, skip_ids=[new_submission.id]
+        )
+        is None
+    )
+
+
+def test_queue_aggregates_the_scores(proposals_review_session):
+    conference = proposals_review_session.conference
+    submission = SubmissionFactory(conference=conference)
+    other_submission = SubmissionFactory(conference=conference)
+    strict_reviewer, reviewer = UserFactory(), UserFactory()
+    scores = {
+        numeric_value: AvailableScoreOptionFactory(
+            review_session=proposals_review_session, numeric_value=numeric_value
+        )
+        for numeric_value in (1, 2)
+    }
+    scores[0] = proposals_review_session.availablescoreoption_set.get(numeric_value=0)
+
+    get_next_item_id(proposals_review_session, reviewer)
+    strict_review = UserReviewFactory(
+        review_session=proposals_review_session,
+        proposal=submission,
+        user=strict_reviewer,
+        score=scores[2],
+    )
+    UserReviewFactory(
+        review_session=proposals_review_session,
+        proposal=other_submission,
+        user=strict_reviewer,
+        score=scores[0],
+    )
+    UserReviewFactory(
+        review_session=proposals_review_session,
+        proposal=submission,
+        user=reviewer,
+        score=scores[2],
+    )
+
+    strict_review.score = scores[1]
+    strict_review.save()
+
+    item = ReviewQueueItem.objects.get(proposal=submission)
+    assert item.votes_received == 2
+    assert item.score_sum == 3
+    assert item.mean_score == 1.5
+    assert item.score_variance == 0.25
+
+    reviewer_stats = {
+        stats.user_id: stats
+        for stats in ReviewerStats.objects.filter(
+            review_session=proposals_review_session
+        )
+    }
+    assert reviewer_stats[strict_reviewer.id].reviews_count == 2
+    assert reviewer_stats[strict_reviewer.id].mean_score == 0.5
+    # A single score can't tell how strict the reviewer is
+    assert reviewer_stats[reviewer.id].normalize(2) == 0.0
+    assert get_normalized_score(submission.userreview_set.all(), reviewer_stats) == (
+        0.5
+    )
+
+    strict_review.delete()
+
+    item.refresh_from_db()
+    assert (item.votes_received, item.score_sum, item.score_squares_sum) == (1, 2, 4)
+    assert ReviewerStats.objects.get(user=strict_reviewer).reviews_count == 1
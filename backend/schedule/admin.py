@@ -32,6 +32,7 @@ from video_upload.workflows.batch_multiple_schedule_items_video_upload import (
 )
 from temporal.sdk import start_workflow
 from schedule.forms import EmailSpeakersForm
+from api.schedule.snapshot import invalidate_schedule_snapshot
 
 from .models import (
     Day,
@@ -165,7 +166,12 @@ def send_schedule_invitation_to_uninvited(modeladmin, request, queryset):
 @admin.action(description="Mark as Confirmed")
 @validate_single_conference_selection
 def mark_as_confirmed_action(modeladmin, request, queryset):
+    conference_ids = set(queryset.values_list("conference_id", flat=True))
     queryset.update(status=ScheduleItem.STATUS.confirmed)
+
+    # update() doesn't send signals
+    for conference_id in conference_ids:
+        invalidate_schedule_snapshot(conference_id)
     messages.add_message(request, messages.INFO, "Marked as confirmed")
 
 
@@ -1,5 +1,64 @@
 from django.apps import AppConfig
+from django.db.models.signals import m2m_changed, post_delete, post_save
 
 
 class ScheduleConfig(AppConfig):
     name = "schedule"
+
+    def ready(self):
+        from conferences.models import Keynote, KeynoteSpeaker
+        from participants.models import Participant
+        from schedule.models import (
+            Day,
+            DayRoomThroughModel,
+            Room,
+            ScheduleItem,
+            ScheduleItemAdditionalSpeaker,
+            Slot,
+        )
+        from submissions.models import Submission
+        from users.models import User
+
+        from . import signals
+
+        handlers = [
+            (signals.invalidate_conference_schedule, ScheduleItem),
+            (signals.invalidate_conference_schedule, Day),
+            (signals.invalidate_conference_schedule, Keynote),
+            (signals.invalidate_conference_schedule, Submission),
+            (signals.invalidate_conference_schedule, Participant),
+            (signals.invalidate_slot_schedule, Slot),
+            (signals.invalidate_day_room_schedule, DayRoomThroughModel),
+            (
+                signals.invalidate_additional_speaker_schedule,
+                ScheduleItemAdditionalSpeaker,
+            ),
+            (signals.invalidate_keynote_speaker_schedule, KeynoteSpeaker),
+            (signals.invalidate_room_schedule, Room),
+        ]
+
+        for handler, sender in handlers:
+            post_save.connect(handler, sender=sender)
+            post_delete.connect(handler, sender=sender)
+
+        post_save.connect(
+            signals.index_schedule_item_speakers_on_save, sender=ScheduleItem
+        )
+        post_save.connect(signals.index_submission_speakers, sender=Submission)
+        post_save.connect(
+            signals.index_additional_speaker, sender=ScheduleItemAdditionalSpeaker
+        )
+        post_delete.connect(
+            signals.unindex_additional_speaker, sender=ScheduleItemAdditionalSpeaker
+        )
+        post_save.connect(signals.index_keynote_speaker, sender=KeynoteSpeaker)
+        post_delete.connect(signals.unindex_keynote_speaker, sender=KeynoteSpeaker)
+
+        post_save.connect(signals.invalidate_user_schedule, sender=User)
+
+        for through in (
+            ScheduleItem.rooms.through,
+            Submission.languages.through,
+            Submission.tags.through,
+        ):
+            m2m_changed.connect(signals.invalidate_m2m_schedule, sender=through)
@@ -0,0 +1,88 @@
+# Generated by Django 4.2.7 on 2026-10-18 18:38
+
+from django.conf import settings
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+def index_schedule_speakers(apps, schema_editor):
+    ScheduleItem = apps.get_model("schedule", "ScheduleItem")
+    ScheduleItemAdditionalSpeaker = apps.get_model(
+        "schedule", "ScheduleItemAdditionalSpeaker"
+    )
+    KeynoteSpeaker = apps.get_model("conferences", "KeynoteSpeaker")
+    ScheduleSpeaker = apps.get_model("schedule", "ScheduleSpeaker")
+
+    speakers = set()
+
+    for item in ScheduleItem.objects.filter(submission__isnull=False).values(
+        "id", "conference_id", "submission__speaker_id"
+    ):
+        speakers.add(
+            (item["conference_id"], item["id"], item["submission__speaker_id"], "submission")
+        )
+
+    for speaker in ScheduleItemAdditionalSpeaker.objects.values(
+        "scheduleitem_id", "scheduleitem__conference_id", "user_id"
+    ):
+        speakers.add(
+            (
+                speaker["scheduleitem__conference_id"],
+                speaker["scheduleitem_id"],
+                speaker["user_id"],
+                "additional_speaker",
+            )
+        )
+
+    keynote_items = ScheduleItem.objects.filter(keynote__isnull=False).values(
+        "id", "conference_id", "keynote_id"
+    )
+    for item in keynote_items:
+        for user_id in KeynoteSpeaker.objects.filter(
+            keynote_id=item["keynote_id"], user__isnull=False
+        ).values_list("user_id", flat=True):
+            speakers.add((item["conference_id"], item["id"], user_id, "keynote"))
+
+    ScheduleSpeaker.objects.bulk_create(
+        [
+            ScheduleSpeaker(
+                conference_id=conference_id,
+                schedule_item_id=schedule_item_id,
+                user_id=user_id,
+                source=source,
+            )
+            for conference_id, schedule_item_id, user_id, source in speakers
+        ]
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('conferences', '0041_remove_conference_visa_application_form_link'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+        ('schedule', '0051_scheduleitem_plain_thread_id'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ScheduleSpeaker',
+            fields=[
+                ('id', models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('source', models.CharField(choices=[('submission', 'Submission speaker'), ('additional_speaker', 'Additional speaker'), ('keynote', 'Keynote speaker')], max_length=20, verbose_name='source')),
+                ('conference', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='+', to='conferences.conference', verbose_name='conference')),
+                ('schedule_item', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='indexed_speakers', to='schedule.scheduleitem', verbose_name='schedule item')),
+                ('user', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='+', to=settings.AUTH_USER_MODEL, verbose_name='user')),
+            ],
+            options={
+                'verbose_name': 'Schedule speaker',
+                'verbose_name_plural': 'Schedule speakers',
+                'indexes': [models.Index(fields=['conference', 'user'], name='schedule_sc_confere_7c2dbd_idx')],
+                'unique_together': {('schedule_item', 'user', 'source')},
+            },
+        ),
+        migrations.RunPython(
+            index_schedule_speakers,
+            reverse_code=migrations.RunPython.noop,
+        ),
+    ]
@@ -366,6 +366,47 @@ class ScheduleItemAdditionalSpeaker(models.Model):
         db_table = "schedule_scheduleitem_additional_speakers"
 
 
+class ScheduleSpeaker(models.Model):
+    """
+    Index of the users speaking in the schedule items of a conference,
+    kept up to date by the signals in `schedule.signals`. Additional
+    speakers moved with `additional_speakers.add()` need `bulk=False`,
+    otherwise they are moved with an update that sends no signals.
+    """
+
+    SOURCES = Choices(
+        ("submission", _("Submission speaker")),
+        ("additional_speaker", _("Additional speaker")),
+        ("keynote", _("Keynote speaker")),
+    )
+
+    conference = models.ForeignKey(
+        "conferences.Conference",
+        on_delete=models.CASCADE,
+        verbose_name=_("conference"),
+        related_name="+",
+    )
+    schedule_item = models.ForeignKey(
+        ScheduleItem,
+        on_delete=models.CASCADE,
+        verbose_name=_("schedule item"),
+        related_name="indexed_speakers",
+    )
+    user = models.ForeignKey(
+        "users.User",
+        on_delete=models.CASCADE,
+        verbose_name=_("user"),
+        related_name="+",
+    )
+    source = models.CharField(_("source"), max_length=20, choices=SOURCES)
+
+    class Meta:
+        verbose_name = _("Schedule speaker")
+        verbose_name_plural = _("Schedule speakers")
+        unique_together = ("schedule_item", "user", "source")
+        indexes = [models.Index(fields=["conference", "user"])]
+
+
 class ScheduleItemAttendee(TimeStampedModel):
     schedule_item = models.ForeignKey(
         ScheduleItem,
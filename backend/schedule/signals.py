@@ -0,0 +1,129 @@
+from django.db.models import Q
+
+from api.schedule.snapshot import invalidate_schedule_snapshot
+from schedule.models import Day, ScheduleItem, ScheduleSpeaker
+from schedule.speakers import index_schedule_item_speakers, index_speakers
+
+
+def invalidate_conference_schedule(sender, instance, **kwargs):
+    """For models with a `conference` (schedule items, days, keynotes,
+    submissions and participants)"""
+    invalidate_schedule_snapshot(instance.conference_id)
+
+
+def invalidate_slot_schedule(sender, instance, **kwargs):
+    invalidate_schedule_snapshot(instance.day.conference_id)
+
+
+def invalidate_day_room_schedule(sender, instance, **kwargs):
+    invalidate_schedule_snapshot(instance.day.conference_id)
+
+
+def invalidate_additional_speaker_schedule(sender, instance, **kwargs):
+    invalidate_schedule_snapshot(instance.scheduleitem.conference_id)
+
+
+def invalidate_keynote_speaker_schedule(sender, instance, **kwargs):
+    invalidate_schedule_snapshot(instance.keynote.conference_id)
+
+
+def invalidate_room_schedule(sender, instance, **kwargs):
+    for conference_id in (
+        Day.objects.filter(added_rooms__room=instance)
+        .values_list("conference_id", flat=True)
+        .distinct()
+    ):
+        invalidate_schedule_snapshot(conference_id)
+
+
+def invalidate_m2m_schedule(sender, instance, action, reverse, model, pk_set, **kwargs):
+    """For the many to many fields of models with a `conference`
+    (the rooms of schedule items, the languages and tags of submissions)"""
+    if reverse and action == "pre_clear":
+        # e.g. room.talks.clear(), the cleared objects are only known before
+        pk_set = _get_related_pks(sender, instance, model)
+    elif not action.startswith("post_") or (reverse and action == "post_clear"):
+        return
+
+    if not reverse:
+        invalidate_schedule_snapshot(instance.conference_id)
+        return
+
+    # e.g. room.talks was changed
+    for conference_id in (
+        model.objects.filter(id__in=pk_set or ())
+        .values_list("conference_id", flat=True)
+        .distinct()
+    ):
+        invalidate_schedule_snapshot(conference_id)
+
+
+def _get_related_pks(through, instance, model):
+    instance_field, model_field = (
+        next(
+            field
+            for field in through._meta.fields
+            if field.is_relation and field.related_model == related_model
+        )
+        for related_model in (instance._meta.concrete_model, model)
+    )
+    return set(
+        through.objects.filter(**{instance_field.name: instance}).values_list(
+            model_field.attname, flat=True
+        )
+    )
+
+
+def invalidate_user_schedule(sender, instance, **kwargs):
+    """The names of the speakers are part of the schedule"""
+    if kwargs.get("update_fields") == frozenset({"last_login"}):
+        return
+
+    for conference_id in (
+        ScheduleSpeaker.objects.filter(user_id=instance.id)
+        .values_list("conference_id", flat=True)
+        .distinct()
+    ):
+        invalidate_schedule_snapshot(conference_id)
+
+
+def index_schedule_item_speakers_on_save(sender, instance, **kwargs):
+    index_schedule_item_speakers(instance.id)
+
+
+def index_submission_speakers(sender, instance, **kwargs):
+    index_speakers(ScheduleItem.objects.filter(submission_id=instance.id))
+
+
+def index_additional_speaker(sender, instance, **kwargs):
+    # The speaker could have been moved from another schedule item
+    index_speakers(
+        ScheduleItem.objects.filter(
+            Q(id=instance.scheduleitem_id)
+            | Q(
+                indexed_speakers__user_id=instance.user_id,
+                indexed_speakers__source=ScheduleSpeaker.SOURCES.additional_speaker,
+            )
+        ).distinct()
+    )
+
+
+def unindex_additional_speaker(sender, instance, **kwargs):
+    # Only removes rows, the schedule item could be getting deleted too
+    ScheduleSpeaker.objects.filter(
+        schedule_item_id=instance.scheduleitem_id,
+        user_id=instance.user_id,
+        source=ScheduleSpeaker.SOURCES.additional_speaker,
+    ).delete()
+
+
+def index_keynote_speaker(sender, instance, **kwargs):
+    index_speakers(ScheduleItem.objects.filter(keynote_id=instance.keynote_id))
+
+
+def unindex_keynote_speaker(sender, instance, **kwargs):
+    ScheduleSpeaker.objects.filter(
+        schedule_item__keynote_id=instance.keynote_id,
+        user_id=instance.user_id,
+        source=ScheduleSpeaker.SOURCES.keynote,
+    ).delete()
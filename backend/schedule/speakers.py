@@ -0,0 +1,77 @@
+from typing import Iterable, Optional, Set
+
+from django.db import transaction
+
+from conferences.models import KeynoteSpeaker
+from schedule.models import ScheduleItem, ScheduleItemAdditionalSpeaker, ScheduleSpeaker
+
+
+def get_speakers_user_ids(
+    conference_id: int, sources: Optional[Iterable[str]] = None
+) -> Set[int]:
+    speakers = ScheduleSpeaker.objects.filter(conference_id=conference_id)
+
+    if sources is not None:
+        speakers = speakers.filter(source__in=sources)
+
+    return set(speakers.values_list("user_id", flat=True))
+
+
+def index_schedule_item_speakers(schedule_item_id: int) -> None:
+    """
+    Replaces the speakers indexed for the schedule item with its
+    current submission, additional and keynote speakers
+    """
+    schedule_item = (
+        ScheduleItem.objects.filter(id=schedule_item_id)
+        .values("conference_id", "submission__speaker_id", "keynote_id")
+        .first()
+    )
+
+    with transaction.atomic():
+        ScheduleSpeaker.objects.filter(schedule_item_id=schedule_item_id).delete()
+
+        if schedule_item is None:
+            return
+
+        speakers = set()
+
+        if schedule_item["submission__speaker_id"]:
+            speakers.add(
+                (
+                    schedule_item["submission__speaker_id"],
+                    ScheduleSpeaker.SOURCES.submission,
+                )
+            )
+
+        speakers.update(
+            (user_id, ScheduleSpeaker.SOURCES.additional_speaker)
+            for user_id in ScheduleItemAdditionalSpeaker.objects.filter(
+                scheduleitem_id=schedule_item_id
+            ).values_list("user_id", flat=True)
+        )
+
+        if schedule_item["keynote_id"]:
+            speakers.update(
+                (user_id, ScheduleSpeaker.SOURCES.keynote)
+                for user_id in KeynoteSpeaker.objects.filter(
+                    keynote_id=schedule_item["keynote_id"], user__isnull=False
+                ).values_list("user_id", flat=True)
+            )
+
+        ScheduleSpeaker.objects.bulk_create(
+            [
+                ScheduleSpeaker(
+                    conference_id=schedule_item["conference_id"],
+                    schedule_item_id=schedule_item_id,
+                    user_id=user_id,
+                    source=source,
+                )
+                for user_id, source in speakers
+            ]
+        )
+
+
+def index_speakers(schedule_items) -> None:
+    for schedule_item_id in schedule_items.values_list("id", flat=True):
+        index_schedule_item_speakers(schedule_item_id)
@@ -84,7 +84,8 @@ class ScheduleItemFactory(DjangoModelFactory):
         self.additional_speakers.set(
             ScheduleItemAdditionalSpeakerFactory.simple_generate_batch(
                 create, size, **kwargs
-            )
+            ),
+            bulk=False,
         )
 
     @classmethod
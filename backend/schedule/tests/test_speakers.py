@@ -0,0 +1,103 @@
+import pytest
+
+from schedule.models import ScheduleSpeaker
+from schedule.speakers import get_speakers_user_ids
+
+pytestmark = pytest.mark.django_db
+
+
+def test_speakers_are_indexed_when_added(
+    schedule_item_factory,
+    submission_factory,
+    schedule_item_additional_speaker_factory,
+    keynote_speaker_factory,
+):
+    schedule_item = schedule_item_factory(type="talk", submission=submission_factory())
+    additional_speaker = schedule_item_additional_speaker_factory(
+        scheduleitem=schedule_item
+    )
+    keynote_speaker = keynote_speaker_factory(
+        keynote__conference=schedule_item.conference
+    )
+    keynote_item = schedule_item_factory(
+        type="keynote",
+        conference=schedule_item.conference,
+        submission=None,
+        keynote=keynote_speaker.keynote,
+    )
+    late_keynote_speaker = keynote_speaker_factory(keynote=keynote_speaker.keynote)
+
+    assert get_speakers_user_ids(schedule_item.conference_id) == {
+        schedule_item.submission.speaker_id,
+        additional_speaker.user_id,
+        keynote_speaker.user_id,
+        late_keynote_speaker.user_id,
+    }
+    assert get_speakers_user_ids(
+        schedule_item.conference_id, sources=[ScheduleSpeaker.SOURCES.keynote]
+    ) == {keynote_speaker.user_id, late_keynote_speaker.user_id}
+    assert set(keynote_item.indexed_speakers.values_list("user_id", flat=True)) == {
+        keynote_speaker.user_id,
+        late_keynote_speaker.user_id,
+    }
+
+
+def test_speakers_are_removed_from_the_index(
+    schedule_item_factory,
+    submission_factory,
+    schedule_item_additional_speaker_factory,
+    keynote_speaker_factory,
+):
+    schedule_item = schedule_item_factory(type="talk", submission=submission_factory())
+    additional_speaker = schedule_item_additional_speaker_factory(
+        scheduleitem=schedule_item
+    )
+    keynote_speaker = keynote_speaker_factory(
+        keynote__conference=schedule_item.conference
+    )
+    schedule_item_factory(
+        type="keynote",
+        conference=schedule_item.conference,
+        submission=None,
+        keynote=keynote_speaker.keynote,
+    )
+
+    additional_speaker.delete()
+    keynote_speaker.delete()
+
+    assert get_speakers_user_ids(schedule_item.conference_id) == {
+        schedule_item.submission.speaker_id
+    }
+
+    schedule_item.delete()
+
+    assert get_speakers_user_ids(schedule_item.conference_id) == set()
+
+
+def test_changing_the_speaker_of_a_submission_updates_the_index(
+    schedule_item_factory, submission_factory, user_factory
+):
+    schedule_item = schedule_item_factory(type="talk", submission=submission_factory())
+    new_speaker = user_factory()
+
+    schedule_item.submission.speaker = new_speaker
+    schedule_item.submission.save()
+
+    assert get_speakers_user_ids(schedule_item.conference_id) == {new_speaker.id}
+
+
+def test_speakers_added_through_the_schedule_item_are_indexed(
+    schedule_item_factory, submission_factory, schedule_item_additional_speaker_factory
+):
+    schedule_item = schedule_item_factory(type="talk", submission=submission_factory())
+    additional_speaker = schedule_item_additional_speaker_factory()
+    previous_schedule_item = additional_speaker.scheduleitem
+
+    schedule_item.additional_speakers.add(additional_speaker, bulk=False)
+
+    assert additional_speaker.user_id in get_speakers_user_ids(
+        schedule_item.conference_id
+    )
+    assert not previous_schedule_item.indexed_speakers.filter(
+        user_id=additional_speaker.user_id
+    ).exists()
@@ -0,0 +1,17 @@
+# Generated by Django 4.2.7 on 2026-10-18 18:55
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('submissions', '0023_remove_submission_speaker_id_and_more'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='submission',
+            index=models.Index(fields=['conference', 'status'], name='submissions_confere_2bd225_idx'),
+        ),
+    ]
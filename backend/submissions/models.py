@@ -196,6 +196,12 @@ class Submission(TimeStampedModel):
             f"<{self.conference.code}>"
         )
 
+    class Meta:
+        indexes = [
+            # Voting lists the proposed submissions of a conference
+            models.Index(fields=["conference", "status"]),
+        ]
+
 
 class SubmissionType(models.Model):
     name = models.CharField(max_length=100, unique=True)
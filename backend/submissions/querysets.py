@@ -1,6 +1,8 @@
 from api.helpers.ids import decode_hashid
 from conferences.querysets import ConferenceQuerySetMixin
 from django.db import models
+from django.db.models import CharField, Value
+from django.db.models.functions import MD5, Cast, Concat
 
 
 class SubmissionQuerySet(ConferenceQuerySetMixin, models.QuerySet):
@@ -12,3 +14,24 @@ class SubmissionQuerySet(ConferenceQuerySetMixin, models.QuerySet):
 
     def accepted(self):
         return self.filter(status=self.model.STATUS.accepted)
+
+    def order_for_voting(self, user_id: int):
+        """
+        Annotates `voting_order` and orders by it: the MD5 of the user and
+        submission ids gives a random order of the submissions that is
+        different for every user but always the same for the same user,
+        so it can be paginated.
+
+        No index can serve the hash: every page computes it for the
+        submissions left by the filters and sorts them, the cursor only
+        saves the offset.
+        """
+        return self.annotate(
+            voting_order=MD5(
+                Concat(
+                    Value(f"{user_id}:"),
+                    Cast("id", output_field=CharField()),
+                    output_field=CharField(),
+                )
+            )
+        ).order_by("voting_order", "id")
@@ -1,6 +1,7 @@
 from pytest import mark
 
 from i18n.strings import LazyI18nString
+from submissions.models import Submission
 
 
 @mark.django_db
@@ -14,3 +15,33 @@ def test_slug_is_not_regenerated_when_changing_title(submission_factory):
     submission.refresh_from_db()
 
     assert submission.slug == "hello"
+
+
+@mark.django_db
+def test_voting_order_is_different_for_every_user(submission_factory):
+    submission = submission_factory()
+    for _ in range(19):
+        submission_factory(conference=submission.conference)
+
+    ids = sorted(
+        Submission.objects.filter(conference=submission.conference).values_list(
+            "id", flat=True
+        )
+    )
+
+    def voting_order(user_id):
+        return list(
+            Submission.objects.filter(conference=submission.conference)
+            .order_for_voting(user_id)
+            .values_list("id", flat=True)
+        )
+
+    order_1 = voting_order(1)
+    order_7 = voting_order(7)
+
+    assert sorted(order_1) == ids
+    assert sorted(order_7) == ids
+    assert order_1 != ids
+    assert order_7 != ids
+    assert order_1 != order_7
+    assert voting_order(1) == order_1
@@ -1,14 +1,23 @@
 from dal_admin_filters import AutocompleteFilter
 from django import forms
 from django.contrib import admin
-from django.urls import reverse
+from django.template.response import TemplateResponse
+from django.urls import path, reverse
 from django.utils.html import format_html
 from import_export.admin import ExportMixin
 from import_export.fields import Field
 from import_export.resources import ModelResource
 from import_export.widgets import DecimalWidget
 
+from conferences.models import Conference
+from submissions.models import Submission
 from voting.models import RankRequest, RankStat, RankSubmission, Vote
+from voting.strategies import (
+    DEFAULT_STRATEGY,
+    RANKING_STRATEGIES,
+    get_live_ranking,
+    strategy_choices,
+)
 
 
 class SubmissionFilter(AutocompleteFilter):
@@ -219,7 +228,7 @@ class RankSubmissionAdmin(ExportMixin, admin.ModelAdmin):
 
 @admin.register(RankRequest)
 class RankRequestAdmin(admin.ModelAdmin):
-    list_display = ("conference", "created", "is_public", "view_rank")
+    list_display = ("conference", "created", "is_public", "strategy", "view_rank")
 
     @admin.display(
         description="View",
@@ -232,6 +241,73 @@ class RankRequestAdmin(admin.ModelAdmin):
             url=reverse("admin:voting_ranksubmission_changelist"),
         )
 
+    def get_urls(self):
+        urls = super().get_urls()
+        custom_urls = [
+            path(
+                "live/",
+                self.admin_site.admin_view(self.live_ranking_view),
+                name="voting-live-ranking",
+            ),
+        ]
+        return custom_urls + urls
+
+    def live_ranking_view(self, request):
+        """
+        Shows the ranking of a conference as votes arrive,
+        with the selected strategies side by side.
+        """
+        conferences = Conference.objects.order_by("-start")
+        conference = (
+            conferences.filter(id=request.GET.get("conference")).first()
+            if request.GET.get("conference", "").isdigit()
+            else conferences.first()
+        )
+        # The headers and the cells of the table both follow this order
+        selected_strategies = list(
+            dict.fromkeys(
+                name
+                for name in request.GET.getlist("strategy")
+                if name in RANKING_STRATEGIES
+            )
+        ) or [DEFAULT_STRATEGY]
+
+        tags = []
+        if conference:
+            rankings = [
+                get_live_ranking(conference, name) for name in selected_strategies
+            ]
+            titles = {
+                submission.id: submission.title.localize("en")
+                for submission in Submission.objects.filter(conference=conference).only(
+                    "id", "title"
+                )
+            }
+
+            for tag_rankings in zip(*rankings):
+                tag = tag_rankings[0][0]
+                rows = [
+                    [
+                        (titles.get(rank["submission_id"]), rank["score"])
+                        for rank in ranks
+                    ]
+                    for ranks in zip(*(ranks for _, ranks in tag_rankings))
+                ]
+                tags.append((tag, rows))
+
+        context = {
+            "conference": conference,
+            "conferences": conferences,
+            "strategies": strategy_choices(),
+            "selected_strategies": selected_strategies,
+            "columns": [
+                (name, RANKING_STRATEGIES[name].label) for name in selected_strategies
+            ],
+            "tags": tags,
+            **self.admin_site.each_context(request),
+        }
+        return TemplateResponse(request, "admin/voting/live_ranking.html", context)
+
 
 @admin.register(RankStat)
 class RankStatAdmin(admin.ModelAdmin):
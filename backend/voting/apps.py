@@ -1,4 +1,5 @@
 from django.apps import AppConfig
+from django.db.models.signals import post_delete, post_save
 
 
 class VotingConfig(AppConfig):
@@ -6,3 +7,15 @@ class VotingConfig(AppConfig):
 
     def ready(self):
         import api.voting.converter  # noqa
+        from association_membership.models import Membership
+        from submissions.models import Submission
+        from voting.models import Vote
+
+        from . import signals
+
+        post_save.connect(signals.invalidate_member_can_vote, sender=Membership)
+        post_delete.connect(signals.invalidate_member_can_vote, sender=Membership)
+        post_save.connect(signals.invalidate_speaker_can_vote, sender=Submission)
+        post_delete.connect(signals.invalidate_speaker_can_vote, sender=Submission)
+        post_save.connect(signals.update_live_ranking, sender=Vote)
+        post_delete.connect(signals.remove_from_live_ranking, sender=Vote)
@@ -0,0 +1,70 @@
+from typing import Set
+
+from django.db.models import Q
+
+import pretix
+from conferences.models import Conference
+from pretix_mirror.models import PretixOrder
+from users.models import User
+from voting.helpers import invalidate_can_vote_cache
+from voting.models import IncludedEvent
+
+
+def _get_order_emails(organizer: str, event: str, code: str) -> Set[str]:
+    # Runs after the mirror has been updated with the latest order data
+    order = (
+        PretixOrder.objects.filter(
+            conference__pretix_organizer_id=organizer,
+            conference__pretix_event_id=event,
+            code=code,
+        )
+        .prefetch_related("positions")
+        .first()
+    )
+
+    if order:
+        return {order.email} | {
+            position.attendee_email for position in order.positions.all()
+        }
+
+    # Orders of the included voting events aren't mirrored, nor are the ones
+    # the mirror couldn't sync, so they are asked to pretix
+    is_voting_event = (
+        Conference.objects.filter(
+            pretix_organizer_id=organizer, pretix_event_id=event
+        ).exists()
+        or IncludedEvent.objects.filter(
+            pretix_organizer_id=organizer, pretix_event_id=event
+        ).exists()
+    )
+
+    if not is_voting_event:
+        return set()
+
+    order_data = pretix.get_order(
+        Conference(pretix_organizer_id=organizer, pretix_event_id=event), code
+    )
+
+    if not order_data:
+        return set()
+
+    return {order_data["email"] or ""} | {
+        position["attendee_email"] or "" for position in order_data["positions"]
+    }
+
+
+def invalidate_can_vote_on_order_change(payload):
+    emails = _get_order_emails(payload["organizer"], payload["event"], payload["code"])
+    emails.discard("")
+
+    if not emails:
+        return
+
+    emails_filter = Q()
+
+    for email in emails:
+        emails_filter |= Q(email__iexact=email)
+
+    invalidate_can_vote_cache(
+        User.objects.filter(emails_filter).values_list("id", flat=True)
+    )
@@ -1,20 +1,49 @@
+import uuid
+from typing import Dict, Iterable, List, Optional, Set
+
+from django.core.cache import cache
+
 from conferences.models import Conference
-from pretix import user_has_admission_ticket
+from pretix import get_users_with_admission_ticket, user_has_admission_ticket
 from users.models import User
 from submissions.models import Submission
 from association_membership.models import Membership
 
+CAN_VOTE_CACHE_TIMEOUT = 60 * 15
 
-def check_if_user_can_vote(user: User, conference: Conference):
-    # User is staff
-    if user.is_staff:
-        return True
 
-    # User is a speaker
-    if Submission.objects.filter(speaker_id=user.id, conference=conference).exists():
-        return True
+def _can_vote_version_key(user_id: int) -> str:
+    return f"voting:can-vote:{user_id}:version"
+
+
+def _can_vote_cache_key(user_id: int, version: str, conference_id: int) -> str:
+    return f"voting:can-vote:{user_id}:{version}:{conference_id}"
+
 
-    additional_events = [
+def _get_can_vote_versions(user_ids: Iterable[int]) -> Dict[int, str]:
+    """
+    The version of the cached eligibility of each user, all the conferences
+    of a user are invalidated together by giving them a new version
+    """
+    version_keys = {_can_vote_version_key(user_id): user_id for user_id in user_ids}
+    versions = cache.get_many(version_keys.keys())
+
+    for version_key in version_keys.keys() - versions.keys():
+        version = uuid.uuid4().hex
+
+        # Keeps the version set in the meantime by an invalidation, if any
+        if not cache.add(version_key, version, timeout=None):
+            version = cache.get(version_key, version)
+
+        versions[version_key] = version
+
+    return {
+        version_keys[version_key]: version for version_key, version in versions.items()
+    }
+
+
+def _get_additional_events(conference: Conference) -> List[dict]:
+    return [
         {
             "organizer_slug": included_voting_event.pretix_organizer_id,
             "event_slug": included_voting_event.pretix_event_id,
@@ -22,13 +51,37 @@ def check_if_user_can_vote(user: User, conference: Conference):
         for included_voting_event in conference.included_voting_events.all()
     ]
 
+
+def check_if_user_can_vote(user: User, conference: Conference):
+    # User is staff
+    if user.is_staff:
+        return True
+
+    version = _get_can_vote_versions([user.id])[user.id]
+    cache_key = _can_vote_cache_key(user.id, version, conference.id)
+    can_vote = cache.get(cache_key)
+
+    if can_vote is not None:
+        return can_vote
+
+    can_vote = _check_if_user_can_vote(user, conference)
+
+    cache.set(cache_key, can_vote, timeout=CAN_VOTE_CACHE_TIMEOUT)
+    return can_vote
+
+
+def _check_if_user_can_vote(user: User, conference: Conference) -> bool:
+    # User is a speaker
+    if Submission.objects.filter(speaker_id=user.id, conference=conference).exists():
+        return True
+
     # User has admission ticket for the current conference
     # or for an included voting event
     if user_has_admission_ticket(
         email=user.email,
         event_organizer=conference.pretix_organizer_id,
         event_slug=conference.pretix_event_id,
-        additional_events=additional_events,
+        additional_events=_get_additional_events(conference),
     ):
         return True
 
@@ -39,5 +92,81 @@ def check_if_user_can_vote(user: User, conference: Conference):
     return False
 
 
+def get_emails_with_admission_ticket(
+    conference: Conference, emails: Optional[Iterable[str]] = None
+) -> Set[str]:
+    """
+    The lowercase emails with an admission ticket that lets them vote
+    in the conference, all of them when `emails` is not given
+    """
+    return get_users_with_admission_ticket(
+        emails=emails,
+        event_organizer=conference.pretix_organizer_id,
+        event_slug=conference.pretix_event_id,
+        additional_events=_get_additional_events(conference),
+    )
+
+
+def check_if_users_can_vote(
+    users: Iterable[User],
+    conference: Conference,
+    timeout: int = CAN_VOTE_CACHE_TIMEOUT,
+    emails_with_ticket: Optional[Set[str]] = None,
+) -> Dict[int, bool]:
+    """
+    Resolves the voting eligibility of many users at once
+    and stores it in the cache, e.g. to warm it up before voting opens.
+    Pass `emails_with_ticket` to check many batches against the same tickets.
+    """
+    users = list(users)
+    user_ids = [user.id for user in users]
+
+    speaker_ids = set(
+        Submission.objects.filter(
+            conference=conference, speaker_id__in=user_ids
+        ).values_list("speaker_id", flat=True)
+    )
+    member_ids = set(
+        Membership.objects.active()
+        .filter(user_id__in=user_ids)
+        .values_list("user_id", flat=True)
+    )
+    if emails_with_ticket is None:
+        emails_with_ticket = get_emails_with_admission_ticket(
+            conference, [user.email for user in users]
+        )
+
+    results = {
+        user.id: user.is_staff
+        or user.id in speaker_ids
+        or user.id in member_ids
+        or user.email.lower() in emails_with_ticket
+        for user in users
+    }
+
+    versions = _get_can_vote_versions(user_ids)
+    cache.set_many(
+        {
+            _can_vote_cache_key(user_id, versions[user_id], conference.id): can_vote
+            for user_id, can_vote in results.items()
+        },
+        timeout=timeout,
+    )
+
+    return results
+
+
+def invalidate_can_vote_cache(user_ids: Iterable[int]):
+    """
+    Gives the users a new version, the eligibility cached with the previous
+    one (even if written after this call by a check already running) is
+    never read again
+    """
+    cache.set_many(
+        {_can_vote_version_key(user_id): uuid.uuid4().hex for user_id in user_ids},
+        timeout=None,
+    )
+
+
 def user_is_python_italia_member(user_id: int) -> bool:
     return Membership.objects.active().of_user(user_id).exists()
@@ -0,0 +1,18 @@
+# Generated by Django 4.2.7 on 2026-10-18 17:40
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('voting', '0019_alter_vote_unique_together_vote_user_and_more'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='rankrequest',
+            name='strategy',
+            field=models.CharField(choices=[('users_most_voted', 'Weighted by votes given per tag'), ('mean', 'Plain mean'), ('bayesian_average', 'Bayesian average'), ('borda', 'Borda count')], default='users_most_voted', max_length=50, verbose_name='strategy'),
+        ),
+    ]
@@ -1,15 +1,20 @@
 from typing import Any, Dict, List, Tuple, TypedDict
 
 from django.db import models
-from django.db.models import Count
-from django.db.models.functions import Sqrt
 from django.utils.translation import gettext_lazy as _
 from model_utils.fields import AutoCreatedField
 
 from conferences.models import Conference
 from helpers.constants import GENDERS
+from helpers.stats import count_by
 from users.models import User
-from submissions.models import Submission
+from voting.strategies import (
+    DEFAULT_STRATEGY,
+    UsersMostVotedStrategy,
+    VoteMatrix,
+    get_strategy_class,
+    strategy_choices,
+)
 
 
 class RankStat(models.Model):
@@ -51,6 +56,12 @@ class RankRequest(models.Model):
 
     created = AutoCreatedField(_("created"))
     is_public = models.BooleanField(_("is_public"))
+    strategy = models.CharField(
+        _("strategy"),
+        max_length=50,
+        choices=strategy_choices(),
+        default=DEFAULT_STRATEGY,
+    )
 
     def __str__(self):
         return (
@@ -71,95 +82,22 @@ class RankRequest(models.Model):
         self.build_stats()
 
     def build_ranking(self, conference: Conference):
-        """Builds the ranking
-
-        P. S. maybe we should make some *Strategy* in order to have all
-        available and run different strategies...
+        """Builds the ranking with the strategy of this request
 
-        :return: list of dictionary ordered by score descending
-        [{
+        :return: list of (tag, ranked submissions) ordered by score descending
+        [({"tags__id": tag.id, "tags__name": tag.name, "total": 10}, [{
             "submission_id": submission.id,
-            "submission__topic_id": submission.topic_id,
             "score": score
         },
         ...
-        ]
+        ]), ...]
         """
-
-        return RankRequest.users_most_voted_based(conference)
+        strategy = get_strategy_class(self.strategy)
+        return strategy(VoteMatrix.load(conference)).rank()
 
     @staticmethod
     def users_most_voted_based(conference) -> List[Tuple[Dict[str, Any], List[Rank]]]:
-        """Builds the ranking based on the votes each user has gived
-        This algorithm rewards users who have given more votes. If a user
-        votes many submissions, it means that he cares about his choices so
-        he must be rewarded by weighing his votes more.
-
-        P. S. maybe we should make some *Strategy* in order to have all
-        available and run different strategies...
-
-        """
-
-        from voting.models import Vote
-
-        submissions = Submission.objects.prefetch_related("tags").filter(
-            conference=conference, status=Submission.STATUS.proposed
-        )
-
-        tags = (
-            submissions.values("tags__id", "tags__name")
-            .annotate(total=Count("tags"))
-            .order_by("-total", "tags__name")
-        )
-
-        votes = Vote.objects.filter(submission__conference=conference)
-
-        users_weight = RankRequest.get_users_weights(votes)
-        rankings = []
-        for tag in tags:
-            tag_submissions = submissions.filter(tags__id=tag["tags__id"])
-
-            tag_ranking: List[Rank] = []
-            for submission in tag_submissions:
-                submission_votes = votes.filter(submission=submission)
-
-                if submission_votes:
-                    vote_info = {}
-                    for vote in submission_votes:
-                        vote_info[vote.id] = {
-                            "normalised_vote": vote.value
-                            * users_weight[(vote.user_id, tag["tags__id"])],
-                            "scale_factor": users_weight[
-                                (vote.user_id, tag["tags__id"])
-                            ],
-                        }
-                    score = sum(
-                        [v["normalised_vote"] for v in vote_info.values()]
-                    ) / sum([v["scale_factor"] for v in vote_info.values()])
-                else:
-                    score = 0
-
-                rank: Rank = {
-                    "submission_id": submission.id,
-                    "score": score,
-                }
-                tag_ranking.append(rank)
-                tag_ranking = sorted(
-                    tag_ranking, key=lambda k: k["score"], reverse=True
-                )
-
-            rankings.append((tag, tag_ranking))
-        return rankings
-
-    @staticmethod
-    def get_users_weights(votes):
-        queryset = votes.values("submission__tags", "user_id").annotate(
-            weight=Sqrt(Count("submission__tags"))
-        )
-        return {
-            (weight["user_id"], weight["submission__tags"]): weight["weight"]
-            for weight in queryset
-        }
+        return UsersMostVotedStrategy(VoteMatrix.load(conference)).rank()
 
     def save_rank_submissions(
         self, ranked_submissions_by_tag: List[Tuple[Dict[str, Any], List[Rank]]]
@@ -168,106 +106,98 @@ class RankRequest(models.Model):
         from the score
         """
 
-        for tag, submissions in ranked_submissions_by_tag:
-            for index, rank in enumerate(submissions):
-                RankSubmission.objects.create(
+        RankSubmission.objects.bulk_create(
+            [
+                RankSubmission(
                     rank_request=self,
-                    submission=Submission.objects.get(pk=rank["submission_id"]),
+                    submission_id=rank["submission_id"],
                     rank=index + 1,
                     score=rank["score"],
                     total_submissions_per_tag=tag["total"],
                     tag_id=tag["tags__id"],
                 )
+                for tag, submissions in ranked_submissions_by_tag
+                for index, rank in enumerate(submissions)
+            ],
+            batch_size=1000,
+        )
 
     def build_stats(self):
-        submissions = self.rank_submissions.all()
-        if not submissions:
+        rank_submissions = self.rank_submissions.all()
+
+        # Every submission has a type, so this also tells
+        # if there is anything to count
+        by_type = count_by(rank_submissions, "submission__type_id")
+        if not by_type:
             return
 
-        # N. of submissions
-        RankStat.objects.create(
-            name="Submissions",
-            type=RankStat.Type.SUBMISSIONS,
-            value=submissions.count(),
-            rank_request=self,
+        speakers_by_gender = count_by(
+            User.objects.filter(
+                id__in=rank_submissions.values("submission__speaker_id")
+            ),
+            "gender",
         )
 
-        # N. of speakers
-        distinct_speakers = (
-            RankRequest.objects.filter(conference=self.conference)
-            .values("rank_submissions__submission__speaker_id")
-            .distinct()
-        )
-        RankStat.objects.create(
-            name="Speakers",
-            type=RankStat.Type.SPEAKERS,
-            value=distinct_speakers.count(),
-            rank_request=self,
-        )
-
-        # Gender
-        speaker_ids = [
-            i["rank_submissions__submission__speaker_id"] for i in distinct_speakers
+        stats = [
+            RankStat(
+                name="Submissions",
+                type=RankStat.Type.SUBMISSIONS,
+                value=sum(by_type.values()),
+                rank_request=self,
+            ),
+            RankStat(
+                name="Speakers",
+                type=RankStat.Type.SPEAKERS,
+                value=sum(speakers_by_gender.values()),
+                rank_request=self,
+            ),
         ]
 
-        def filter_by_gender(user):
-            return user.gender == key
-
-        speakers_users = User.objects.filter(id__in=speaker_ids)
-
-        for key, value in GENDERS:
-            count = len(list(filter(filter_by_gender, speakers_users)))
-
-            RankStat.objects.create(
+        stats += [
+            RankStat(
                 name=f"{value}",
                 type=RankStat.Type.GENDER,
-                value=count,
+                value=speakers_by_gender.get(key, 0),
                 rank_request=self,
             )
+            for key, value in GENDERS
+        ]
 
-        # N. submissions by SubmissionType
-        for submission_type in self.conference.submission_types.all():
-            count = submissions.filter(submission__type=submission_type).count()
-
-            RankStat.objects.create(
-                name=f"{submission_type.name}",
-                type=RankStat.Type.SUBMISSION_TYPE,
-                value=count,
-                rank_request=self,
-            )
-
-        # N. submissions by Audience Level
-        for audience_level in self.conference.audience_levels.all():
-            count = submissions.filter(
-                submission__audience_level=audience_level
-            ).count()
-
-            RankStat.objects.create(
-                name=f"{audience_level.name}",
-                type=RankStat.Type.AUDIENCE_LEVEL,
-                value=count,
-                rank_request=self,
-            )
+        groups = [
+            (
+                RankStat.Type.SUBMISSION_TYPE,
+                self.conference.submission_types.all(),
+                by_type,
+            ),
+            (
+                RankStat.Type.AUDIENCE_LEVEL,
+                self.conference.audience_levels.all(),
+                count_by(rank_submissions, "submission__audience_level_id"),
+            ),
+            (
+                RankStat.Type.LANGUAGE,
+                self.conference.languages.all(),
+                count_by(rank_submissions, "submission__languages"),
+            ),
+            (
+                RankStat.Type.TOPIC,
+                self.conference.topics.all(),
+                count_by(rank_submissions, "submission__topic_id"),
+            ),
+        ]
 
-        # N. submissions by Language
-        for language in self.conference.languages.all():
-            count = submissions.filter(submission__languages=language).count()
-            RankStat.objects.create(
-                name=f"{language.name}",
-                type=RankStat.Type.LANGUAGE,
-                value=count,
-                rank_request=self,
-            )
+        for stat_type, options, counts in groups:
+            stats += [
+                RankStat(
+                    name=f"{name}",
+                    type=stat_type,
+                    value=counts.get(id, 0),
+                    rank_request=self,
+                )
+                for id, name in options.values_list("id", "name")
+            ]
 
-        # N. submissions by Topic
-        for topic in self.conference.topics.all():
-            count = submissions.filter(submission__topic=topic).count()
-            RankStat.objects.create(
-                name=f"{topic.name}",
-                type=RankStat.Type.TOPIC,
-                value=count,
-                rank_request=self,
-            )
+        RankStat.objects.bulk_create(stats)
 
 
 class RankSubmission(models.Model):
@@ -0,0 +1,18 @@
+from voting.helpers import invalidate_can_vote_cache
+from voting.strategies import record_vote
+
+
+def invalidate_member_can_vote(sender, instance, **kwargs):
+    invalidate_can_vote_cache([instance.user_id])
+
+
+def invalidate_speaker_can_vote(sender, instance, **kwargs):
+    invalidate_can_vote_cache([instance.speaker_id])
+
+
+def update_live_ranking(sender, instance, **kwargs):
+    record_vote(instance)
+
+
+def remove_from_live_ranking(sender, instance, **kwargs):
+    record_vote(instance, deleted=True)
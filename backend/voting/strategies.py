@@ -0,0 +1,369 @@
+import abc
+import inspect
+import math
+import threading
+from collections import defaultdict
+from typing import Any, Dict, List, Optional, Tuple, Type
+
+from django.utils import timezone
+
+from conferences.models import Conference
+from submissions.models import Submission
+
+# Rankings are lists of (tag, ranked submissions) sorted by score descending:
+# [({"tags__id": 1, "tags__name": "Web", "total": 2}, [
+#     {"submission_id": 10, "score": 3.5},
+#     {"submission_id": 11, "score": 2.0},
+# ]), ...]
+Ranking = List[Tuple[Dict[str, Any], List[Dict[str, Any]]]]
+
+# submission_id -> vote value
+Ballot = Dict[int, int]
+
+
+class VoteMatrix:
+    """In memory view of the votes of a conference, grouped by user and tag.
+
+    The strategies attached to the matrix are notified every time
+    a vote changes, so they can update their scores incrementally.
+    """
+
+    def __init__(
+        self,
+        conference_id: int,
+        submission_tags: Dict[int, List[int]],
+        tag_names: Dict[int, str],
+        proposed_submission_ids: List[int],
+    ):
+        self.conference_id = conference_id
+        self.submission_tags = submission_tags
+        self.tag_names = tag_names
+        self.votes: Dict[Tuple[int, int], int] = {}
+        self.ballots: Dict[Tuple[int, Optional[int]], Ballot] = defaultdict(dict)
+        self.strategies: Dict[str, "RankingStrategy"] = {}
+        self.loaded_at = timezone.now()
+        self.lock = threading.RLock()
+
+        self.submissions_by_tag: Dict[Optional[int], List[int]] = defaultdict(list)
+        for submission_id in sorted(proposed_submission_ids):
+            for tag_id in self.get_tags(submission_id):
+                self.submissions_by_tag[tag_id].append(submission_id)
+
+    @classmethod
+    def load(cls, conference: Conference) -> "VoteMatrix":
+        from voting.models import Vote
+
+        submission_tags = defaultdict(list)
+        tag_names = {}
+
+        for submission_id, tag_id, tag_name in Submission.tags.through.objects.filter(
+            submission__conference=conference
+        ).values_list("submission_id", "submissiontag_id", "submissiontag__name"):
+            submission_tags[submission_id].append(tag_id)
+            tag_names[tag_id] = tag_name
+
+        proposed_submission_ids = Submission.objects.filter(
+            conference=conference, status=Submission.STATUS.proposed
+        ).values_list("id", flat=True)
+
+        matrix = cls(
+            conference.id, submission_tags, tag_names, list(proposed_submission_ids)
+        )
+
+        for user_id, submission_id, value in (
+            Vote.objects.filter(submission__conference=conference)
+            .order_by("id")
+            .values_list("user_id", "submission_id", "value")
+        ):
+            matrix.set_vote(user_id, submission_id, value)
+
+        return matrix
+
+    def get_tags(self, submission_id: int) -> List[Optional[int]]:
+        # Submissions without tags are ranked together under the `None` tag
+        return self.submission_tags.get(submission_id) or [None]
+
+    def get_tags_info(self) -> List[Dict[str, Any]]:
+        return sorted(
+            (
+                {
+                    "tags__id": tag_id,
+                    "tags__name": self.tag_names.get(tag_id),
+                    # Untagged submissions are not counted, as `Count("tags")` did
+                    "total": len(tag_submissions) if tag_id is not None else 0,
+                }
+                for tag_id, tag_submissions in self.submissions_by_tag.items()
+            ),
+            key=lambda tag: (-tag["total"], tag["tags__name"] or ""),
+        )
+
+    def set_vote(self, user_id: int, submission_id: int, value: Optional[int]):
+        """Adds, changes or (with value=None) removes a vote"""
+        with self.lock:
+            if self.votes.get((user_id, submission_id)) == value:
+                return
+
+            if value is None:
+                del self.votes[(user_id, submission_id)]
+            else:
+                self.votes[(user_id, submission_id)] = value
+
+            for tag_id in self.get_tags(submission_id):
+                ballot = self.ballots[(user_id, tag_id)]
+                old_ballot = dict(ballot)
+
+                if value is None:
+                    ballot.pop(submission_id, None)
+                else:
+                    ballot[submission_id] = value
+
+                for strategy in self.strategies.values():
+                    strategy.ballot_changed(tag_id, old_ballot, ballot)
+
+    def get_strategy(self, name: str) -> "RankingStrategy":
+        with self.lock:
+            if name not in self.strategies:
+                self.strategies[name] = get_strategy_class(name)(self)
+
+            return self.strategies[name]
+
+
+class RankingStrategy(abc.ABC):
+    """A strategy scores a submission by adding up the contribution of each
+    user's ballot (their votes on the submissions with the same tag).
+
+    Subclasses implement `ballot_scores` and optionally `score`.
+    """
+
+    name: str
+    label: str
+
+    def __init__(self, matrix: VoteMatrix):
+        self.matrix = matrix
+        # (tag_id, submission_id) -> [numerator, denominator, votes count]
+        self.totals: Dict[Tuple[Optional[int], int], List[float]] = defaultdict(
+            lambda: [0.0, 0.0, 0]
+        )
+
+        for (_, tag_id), ballot in matrix.ballots.items():
+            self._apply(tag_id, ballot, 1)
+
+    @abc.abstractmethod
+    def ballot_scores(self, ballot: Ballot) -> Dict[int, Tuple[float, float]]:
+        """Returns the (numerator, denominator) each submission
+        in the ballot gets from it"""
+
+    def score(self, tag_id: Optional[int], numerator: float, denominator: float):
+        return numerator / denominator
+
+    def ballot_changed(self, tag_id: Optional[int], old_ballot: Ballot, ballot: Ballot):
+        self._apply(tag_id, old_ballot, -1)
+        self._apply(tag_id, ballot, 1)
+
+    def _apply(self, tag_id: Optional[int], ballot: Ballot, sign: int):
+        if not ballot:
+            return
+
+        for submission_id, (numerator, denominator) in self.ballot_scores(
+            ballot
+        ).items():
+            totals = self.totals[(tag_id, submission_id)]
+            totals[0] += sign * numerator
+            totals[1] += sign * denominator
+            totals[2] += sign
+
+    def rank(self) -> Ranking:
+        with self.matrix.lock:
+            rankings = []
+
+            for tag in self.matrix.get_tags_info():
+                tag_id = tag["tags__id"]
+                tag_ranking = []
+
+                for submission_id in self.matrix.submissions_by_tag[tag_id]:
+                    numerator, denominator, count = self.totals.get(
+                        (tag_id, submission_id), (0, 0, 0)
+                    )
+                    tag_ranking.append(
+                        {
+                            "submission_id": submission_id,
+                            "score": self.score(tag_id, numerator, denominator)
+                            if count
+                            else 0,
+                        }
+                    )
+
+                tag_ranking.sort(key=lambda rank: rank["score"], reverse=True)
+                rankings.append((tag, tag_ranking))
+
+            return rankings
+
+
+RANKING_STRATEGIES: Dict[str, Type[RankingStrategy]] = {}
+
+
+def register_strategy(cls: Type[RankingStrategy]) -> Type[RankingStrategy]:
+    if inspect.isabstract(cls):
+        raise TypeError(f"Ranking strategy {cls.name} doesn't implement ballot_scores")
+
+    RANKING_STRATEGIES[cls.name] = cls
+    return cls
+
+
+def get_strategy_class(name: str) -> Type[RankingStrategy]:
+    matching_strategy = RANKING_STRATEGIES.get(name)
+    assert matching_strategy, f"Ranking strategy {name} not found in registry"
+    return matching_strategy
+
+
+def strategy_choices():
+    return [(name, cls.label) for name, cls in RANKING_STRATEGIES.items()]
+
+
+@register_strategy
+class UsersMostVotedStrategy(RankingStrategy):
+    """This algorithm rewards users who have given more votes. If a user
+    votes many submissions, it means that he cares about his choices so
+    he must be rewarded by weighing his votes more.
+    The weight is the square root of how many submissions with
+    that tag the user voted."""
+
+    name = "users_most_voted"
+    label = "Weighted by votes given per tag"
+
+    def ballot_scores(self, ballot):
+        weight = math.sqrt(len(ballot))
+        return {
+            submission_id: (value * weight, weight)
+            for submission_id, value in ballot.items()
+        }
+
+
+@register_strategy
+class MeanStrategy(RankingStrategy):
+    name = "mean"
+    label = "Plain mean"
+
+    def ballot_scores(self, ballot):
+        return {submission_id: (value, 1) for submission_id, value in ballot.items()}
+
+
+@register_strategy
+class BayesianAverageStrategy(MeanStrategy):
+    """Pulls the mean of submissions with few votes towards the mean
+    of the tag, so a single enthusiastic vote doesn't top the ranking"""
+
+    name = "bayesian_average"
+    label = "Bayesian average"
+
+    def __init__(self, matrix: VoteMatrix):
+        # tag_id -> (mean, confidence), computed again by every `rank`
+        self._tag_priors: Dict[Optional[int], Tuple[float, float]] = {}
+        super().__init__(matrix)
+
+    def rank(self) -> Ranking:
+        with self.matrix.lock:
+            self._tag_priors = self._get_tag_priors()
+            return super().rank()
+
+    def _get_tag_priors(self):
+        tag_totals = defaultdict(lambda: [0.0, 0.0])
+
+        for (tag_id, _), (numerator, denominator, _) in self.totals.items():
+            tag_totals[tag_id][0] += numerator
+            tag_totals[tag_id][1] += denominator
+
+        priors = {}
+        for tag_id, (numerator, denominator) in tag_totals.items():
+            tag_submissions = len(self.matrix.submissions_by_tag.get(tag_id, ())) or 1
+            priors[tag_id] = (
+                numerator / denominator if denominator else 0,
+                denominator / tag_submissions,
+            )
+
+        return priors
+
+    def score(self, tag_id, numerator, denominator):
+        mean, confidence = self._tag_priors.get(tag_id, (0, 0))
+        return (confidence * mean + numerator) / (confidence + denominator)
+
+
+@register_strategy
+class BordaStrategy(RankingStrategy):
+    """Each ballot gives a submission one point for every submission the
+    user rated lower, and half a point for every other one rated the same.
+
+    The score is the mean points per ballot, the total grows with the
+    ballots and wouldn't fit the score of the ranking."""
+
+    name = "borda"
+    label = "Borda count"
+
+    def ballot_scores(self, ballot):
+        values = sorted(ballot.values())
+        scores = {}
+
+        for submission_id, value in ballot.items():
+            lower = sum(1 for other in values if other < value)
+            ties = sum(1 for other in values if other == value) - 1
+            scores[submission_id] = (lower + ties / 2, 1)
+
+        return scores
+
+
+DEFAULT_STRATEGY = UsersMostVotedStrategy.name
+
+
+_live_matrices: Dict[int, VoteMatrix] = {}
+_live_matrices_lock = threading.Lock()
+
+
+def get_live_matrix(conference: Conference) -> VoteMatrix:
+    """Returns the vote matrix of the conference kept in this process.
+
+    Votes sent to this process are applied as they arrive (see `record_vote`),
+    the ones sent to other processes are caught up on every call.
+    """
+    from voting.models import Vote
+
+    with _live_matrices_lock:
+        matrix = _live_matrices.get(conference.id)
+
+        submissions_changed = (
+            matrix is not None
+            and Submission.objects.filter(
+                conference=conference, modified__gte=matrix.loaded_at
+            ).exists()
+        )
+
+        if matrix is None or submissions_changed:
+            matrix = _live_matrices[conference.id] = VoteMatrix.load(conference)
+            return matrix
+
+    with matrix.lock:
+        caught_up_at = timezone.now()
+
+        for user_id, submission_id, value in Vote.objects.filter(
+            submission__conference=conference, modified__gte=matrix.loaded_at
+        ).values_list("user_id", "submission_id", "value"):
+            matrix.set_vote(user_id, submission_id, value)
+
+        matrix.loaded_at = caught_up_at
+
+    return matrix
+
+
+def get_live_ranking(conference: Conference, strategy: str) -> Ranking:
+    return get_live_matrix(conference).get_strategy(strategy).rank()
+
+
+def record_vote(vote, deleted: bool = False):
+    if not _live_matrices:
+        return
+
+    matrix = _live_matrices.get(vote.submission.conference_id)
+
+    if matrix is not None:
+        matrix.set_vote(
+            vote.user_id, vote.submission_id, None if deleted else vote.value
+        )
@@ -0,0 +1,64 @@
+import logging
+from datetime import timedelta
+from itertools import islice
+
+from django.utils import timezone
+
+from conferences.models import Conference, Deadline
+from pycon.celery import app
+from users.models import User
+from voting.helpers import check_if_users_can_vote, get_emails_with_admission_ticket
+
+logger = logging.getLogger(__file__)
+
+# How long before voting opens the eligibility cache is warmed up,
+# the task runs as often
+WARM_UP_BEFORE_VOTING = timedelta(hours=1)
+# The warmed up eligibility needs to last until voting opens and then
+# through its first, busiest, hour
+WARM_UP_CACHE_TIMEOUT = 60 * 60 * 2
+
+BATCH_SIZE = 1000
+
+
+@app.task
+def warm_up_can_vote_caches():
+    """Warms up the eligibility cache of the conferences whose voting opens soon"""
+    now = timezone.now()
+    conference_ids = Conference.objects.filter(
+        deadlines__type=Deadline.TYPES.voting,
+        deadlines__start__gt=now,
+        deadlines__start__lte=now + WARM_UP_BEFORE_VOTING,
+    ).values_list("id", flat=True)
+
+    for conference_id in conference_ids:
+        warm_up_can_vote_cache.delay(conference_id=conference_id)
+
+
+@app.task
+def warm_up_can_vote_cache(*, conference_id: int):
+    conference = Conference.objects.get(id=conference_id)
+    users = (
+        User.objects.filter(is_active=True, is_staff=False)
+        .order_by("id")
+        .iterator(chunk_size=BATCH_SIZE)
+    )
+    # Downloading the tickets once instead of once per batch
+    emails_with_ticket = get_emails_with_admission_ticket(conference)
+    total = 0
+
+    while batch := list(islice(users, BATCH_SIZE)):
+        total += len(
+            check_if_users_can_vote(
+                batch,
+                conference,
+                timeout=WARM_UP_CACHE_TIMEOUT,
+                emails_with_ticket=emails_with_ticket,
+            )
+        )
+
+    logger.info(
+        "Warmed up can vote cache of total=%s users for conference=%s",
+        total,
+        conference.code,
+    )
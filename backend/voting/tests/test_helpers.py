@@ -4,7 +4,12 @@ from association_membership.tests.factories import (
 import pytest
 from association_membership.enums import MembershipStatus
 
-from voting.helpers import check_if_user_can_vote
+from association_membership.handlers import run_handler
+from voting.helpers import (
+    check_if_user_can_vote,
+    check_if_users_can_vote,
+    invalidate_can_vote_cache,
+)
 
 pytestmark = pytest.mark.django_db
 
@@ -69,3 +74,176 @@ def test_user_can_vote_if_has_ticket_for_a_previous_conference(
     )
 
     assert check_if_user_can_vote(user, conference) is True
+
+
+def test_can_vote_is_cached_per_conference(
+    user, conference_factory, mocker, locmem_cache
+):
+    admission_ticket_mock = mocker.patch(
+        "voting.helpers.user_has_admission_ticket", return_value=True
+    )
+    conference = conference_factory()
+    other_conference = conference_factory()
+
+    assert check_if_user_can_vote(user, conference) is True
+    assert check_if_user_can_vote(user, conference) is True
+    assert admission_ticket_mock.call_count == 1
+
+    admission_ticket_mock.return_value = False
+
+    assert check_if_user_can_vote(user, other_conference) is False
+    assert check_if_user_can_vote(user, conference) is True
+    assert admission_ticket_mock.call_count == 2
+
+
+def test_membership_changes_invalidate_can_vote(user, conference, mocker, locmem_cache):
+    mocker.patch("voting.helpers.user_has_admission_ticket", return_value=False)
+
+    assert check_if_user_can_vote(user, conference) is False
+
+    MembershipFactory(user=user, status=MembershipStatus.ACTIVE)
+
+    assert check_if_user_can_vote(user, conference) is True
+
+
+def test_sending_a_submission_invalidates_can_vote(
+    user, conference, submission_factory, mocker, locmem_cache
+):
+    mocker.patch("voting.helpers.user_has_admission_ticket", return_value=False)
+
+    assert check_if_user_can_vote(user, conference) is False
+
+    submission_factory(speaker_id=user.id, conference=conference)
+
+    assert check_if_user_can_vote(user, conference) is True
+
+
+def test_order_webhook_invalidates_can_vote(
+    user, conference, mocker, locmem_cache, pretix_order_data, requests_mock, settings
+):
+    has_ticket_mock = mocker.patch(
+        "voting.helpers.user_has_admission_ticket", return_value=False
+    )
+
+    assert check_if_user_can_vote(user, conference) is False
+
+    has_ticket_mock.return_value = True
+    order_data = pretix_order_data()
+    order_data["positions"][0]["attendee_email"] = user.email.upper()
+    base_url = f"{settings.PRETIX_API}organizers/{conference.pretix_organizer_id}/events/{conference.pretix_event_id}"
+    requests_mock.get(f"{base_url}/orders/{order_data['code']}/", json=order_data)
+    requests_mock.get(f"{base_url}/categories/", json={"results": []})
+
+    run_handler(
+        "pretix",
+        "pretix.event.order.paid",
+        {
+            "organizer": conference.pretix_organizer_id,
+            "event": conference.pretix_event_id,
+            "code": order_data["code"],
+            "action": "pretix.event.order.paid",
+        },
+    )
+
+    assert check_if_user_can_vote(user, conference) is True
+
+
+def test_order_webhook_of_an_included_event_invalidates_can_vote(
+    user,
+    conference,
+    mocker,
+    locmem_cache,
+    pretix_order_data,
+    requests_mock,
+    settings,
+    included_event_factory,
+):
+    included_event_factory(
+        conference=conference,
+        pretix_organizer_id="organizer-slug",
+        pretix_event_id="event-slug",
+    )
+    has_ticket_mock = mocker.patch(
+        "voting.helpers.user_has_admission_ticket", return_value=False
+    )
+
+    assert check_if_user_can_vote(user, conference) is False
+
+    has_ticket_mock.return_value = True
+    order_data = pretix_order_data()
+    order_data["positions"][0]["attendee_email"] = user.email.upper()
+    requests_mock.get(
+        f"{settings.PRETIX_API}organizers/organizer-slug/events/event-slug/"
+        f"orders/{order_data['code']}/",
+        json=order_data,
+    )
+
+    run_handler(
+        "pretix",
+        "pretix.event.order.placed",
+        {
+            "organizer": "organizer-slug",
+            "event": "event-slug",
+            "code": order_data["code"],
+            "action": "pretix.event.order.placed",
+        },
+    )
+
+    assert check_if_user_can_vote(user, conference) is True
+
+
+def test_check_if_users_can_vote_in_bulk(
+    conference, submission_factory, user_factory, mocker, locmem_cache
+):
+    speaker = user_factory()
+    member = user_factory()
+    attendee = user_factory(email="Attendee@example.org")
+    nobody = user_factory()
+    submission_factory(speaker_id=speaker.id, conference=conference)
+    MembershipFactory(user=member, status=MembershipStatus.ACTIVE)
+    bulk_mock = mocker.patch(
+        "voting.helpers.get_users_with_admission_ticket",
+        return_value={"attendee@example.org"},
+    )
+    single_mock = mocker.patch("voting.helpers.user_has_admission_ticket")
+
+    results = check_if_users_can_vote([speaker, member, attendee, nobody], conference)
+
+    assert results == {
+        speaker.id: True,
+        member.id: True,
+        attendee.id: True,
+        nobody.id: False,
+    }
+    assert bulk_mock.call_count == 1
+
+    # The results are now cached
+    assert check_if_user_can_vote(attendee, conference) is True
+    assert check_if_user_can_vote(nobody, conference) is False
+    assert not single_mock.called
+
+
+def test_invalidation_is_not_overwritten_by_a_running_check(
+    user, conference_factory, mocker, locmem_cache
+):
+    conference = conference_factory()
+    other_conference = conference_factory()
+    has_ticket_mock = mocker.patch(
+        "voting.helpers.user_has_admission_ticket", return_value=False
+    )
+    assert check_if_user_can_vote(user, other_conference) is False
+
+    def order_paid_during_the_check(**kwargs):
+        # e.g. the order webhook is handled while pretix is being called
+        invalidate_can_vote_cache([user.id])
+        return False
+
+    has_ticket_mock.side_effect = order_paid_during_the_check
+
+    assert check_if_user_can_vote(user, conference) is False
+
+    has_ticket_mock.side_effect = None
+    has_ticket_mock.return_value = True
+
+    assert check_if_user_can_vote(user, conference) is True
+    assert check_if_user_can_vote(user, other_conference) is True
@@ -0,0 +1,258 @@
+from decimal import Decimal
+
+import pytest
+from django.urls import reverse
+
+from users.models import User
+from voting.models import RankRequest, Vote
+from voting.strategies import (
+    RANKING_STRATEGIES,
+    RankingStrategy,
+    VoteMatrix,
+    _live_matrices,
+    get_live_ranking,
+    register_strategy,
+)
+
+pytestmark = pytest.mark.django_db
+
+
+@pytest.fixture(autouse=True)
+def clear_live_matrices():
+    _live_matrices.clear()
+    yield
+    _live_matrices.clear()
+
+
+def _scores(rankings):
+    return [
+        (
+            tag["tags__id"],
+            [(rank["submission_id"], pytest.approx(rank["score"])) for rank in ranks],
+        )
+        for tag, ranks in rankings
+    ]
+
+
+@pytest.mark.parametrize("strategy", RANKING_STRATEGIES.keys())
+def test_incremental_updates_match_a_fresh_load(
+    strategy, submission_factory, user_factory, vote_factory, conference
+):
+    submission_1 = submission_factory(conference=conference, tags=["A"])
+    submission_2 = submission_factory(conference=conference, tags=["A", "B"])
+    submission_3 = submission_factory(conference=conference, tags=["B"])
+    user_1 = user_factory()
+    user_2 = user_factory()
+
+    vote_factory(user=user_1, submission=submission_1, value=4)
+    vote_factory(user=user_1, submission=submission_2, value=1)
+    vote_factory(user=user_2, submission=submission_2, value=3)
+    vote_3 = vote_factory(user=user_2, submission=submission_3, value=2)
+
+    matrix = VoteMatrix.load(conference)
+    live_strategy = matrix.get_strategy(strategy)
+    live_strategy.rank()
+
+    matrix.set_vote(user_1.id, submission_3.id, 3)
+    matrix.set_vote(user_2.id, submission_2.id, 1)
+    matrix.set_vote(user_2.id, submission_3.id, None)
+
+    vote_factory(user=user_1, submission=submission_3, value=3)
+    vote_3.delete()
+    Vote.objects.filter(user=user_2, submission=submission_2).update(value=1)
+
+    fresh_strategy = VoteMatrix.load(conference).get_strategy(strategy)
+
+    assert _scores(live_strategy.rank()) == _scores(fresh_strategy.rank())
+
+
+def test_mean_strategy(submission_factory, user_factory, vote_factory, conference):
+    submission_1 = submission_factory(conference=conference, tags=["A"])
+    submission_2 = submission_factory(conference=conference, tags=["A"])
+    user_1 = user_factory()
+    user_2 = user_factory()
+
+    vote_factory(user=user_1, submission=submission_1, value=1)
+    vote_factory(user=user_1, submission=submission_2, value=4)
+    vote_factory(user=user_2, submission=submission_1, value=3)
+
+    rankings = VoteMatrix.load(conference).get_strategy("mean").rank()
+
+    assert [(rank["submission_id"], rank["score"]) for rank in rankings[0][1]] == [
+        (submission_2.id, 4),
+        (submission_1.id, 2),
+    ]
+
+
+def test_bayesian_average_pulls_scores_towards_the_tag_mean(
+    submission_factory, user_factory, vote_factory, conference
+):
+    submission_1 = submission_factory(conference=conference, tags=["A"])
+    submission_2 = submission_factory(conference=conference, tags=["A"])
+    user_1 = user_factory()
+    user_2 = user_factory()
+    user_3 = user_factory()
+
+    vote_factory(user=user_1, submission=submission_1, value=4)
+    vote_factory(user=user_1, submission=submission_2, value=3)
+    vote_factory(user=user_2, submission=submission_2, value=3)
+    vote_factory(user=user_3, submission=submission_2, value=3)
+
+    rankings = VoteMatrix.load(conference).get_strategy("bayesian_average").rank()
+
+    # tag mean = 13 / 4, confidence = 4 votes / 2 submissions
+    assert [(rank["submission_id"], rank["score"]) for rank in rankings[0][1]] == [
+        (submission_1.id, pytest.approx((2 * 13 / 4 + 4) / 3)),
+        (submission_2.id, pytest.approx((2 * 13 / 4 + 9) / 5)),
+    ]
+
+
+def test_borda_strategy(submission_factory, user_factory, vote_factory, conference):
+    submission_1 = submission_factory(conference=conference, tags=["A"])
+    submission_2 = submission_factory(conference=conference, tags=["A"])
+    submission_3 = submission_factory(conference=conference, tags=["A"])
+    user_1 = user_factory()
+    user_2 = user_factory()
+
+    vote_factory(user=user_1, submission=submission_1, value=4)
+    vote_factory(user=user_1, submission=submission_2, value=1)
+    vote_factory(user=user_1, submission=submission_3, value=1)
+    vote_factory(user=user_2, submission=submission_2, value=2)
+    vote_factory(user=user_2, submission=submission_3, value=3)
+
+    rankings = VoteMatrix.load(conference).get_strategy("borda").rank()
+
+    assert [(rank["submission_id"], rank["score"]) for rank in rankings[0][1]] == [
+        (submission_1.id, 2),
+        (submission_3.id, 0.75),
+        (submission_2.id, 0.25),
+    ]
+
+
+def test_live_ranking_picks_up_new_votes(
+    submission_factory, user_factory, vote_factory, conference
+):
+    submission_1 = submission_factory(conference=conference, tags=["A"])
+    submission_2 = submission_factory(conference=conference, tags=["A"])
+    user = user_factory()
+
+    vote_factory(user=user, submission=submission_1, value=2)
+    ranking = get_live_ranking(conference, "mean")
+
+    assert [rank["submission_id"] for rank in ranking[0][1]] == [
+        submission_1.id,
+        submission_2.id,
+    ]
+
+    vote = vote_factory(user=user, submission=submission_2, value=4)
+    ranking = get_live_ranking(conference, "mean")
+
+    assert [rank["submission_id"] for rank in ranking[0][1]] == [
+        submission_2.id,
+        submission_1.id,
+    ]
+
+    vote.delete()
+    ranking = get_live_ranking(conference, "mean")
+
+    assert [(rank["submission_id"], rank["score"]) for rank in ranking[0][1]] == [
+        (submission_1.id, 2),
+        (submission_2.id, 0),
+    ]
+
+
+def test_rank_request_uses_the_selected_strategy(
+    submission_factory, user_factory, vote_factory, conference
+):
+    submission_1 = submission_factory(conference=conference, tags=["A"])
+    submission_2 = submission_factory(conference=conference, tags=["A"])
+    user = user_factory()
+
+    vote_factory(user=user, submission=submission_1, value=4)
+    vote_factory(user=user, submission=submission_2, value=1)
+
+    rank_request = RankRequest.objects.create(
+        conference=conference, is_public=False, strategy="borda"
+    )
+
+    assert list(
+        rank_request.rank_submissions.order_by("rank").values_list(
+            "submission_id", "score"
+        )
+    ) == [(submission_1.id, 1), (submission_2.id, 0)]
+
+
+def test_borda_rank_request_with_many_ballots(submission_factory, conference):
+    submissions = [
+        submission_factory(conference=conference, tags=["A"]) for _ in range(3)
+    ]
+    users = User.objects.bulk_create(
+        [User(email=f"voter-{index}@example.org") for index in range(501)]
+    )
+    Vote.objects.bulk_create(
+        [
+            Vote(user=user, submission=submission, value=value)
+            for user in users
+            for submission, value in zip(submissions, (4, 1, 1))
+        ]
+    )
+
+    # 1002 points in total for the first submission
+    rank_request = RankRequest.objects.create(
+        conference=conference, is_public=False, strategy="borda"
+    )
+
+    assert list(
+        rank_request.rank_submissions.order_by("rank").values_list(
+            "submission_id", "score"
+        )
+    ) == [
+        (submissions[0].id, 2),
+        (submissions[1].id, Decimal("0.5")),
+        (submissions[2].id, Decimal("0.5")),
+    ]
+
+
+def test_live_ranking_admin_view(
+    admin_client, submission_factory, user_factory, vote_factory, conference
+):
+    submission = submission_factory(conference=conference, tags=["A"])
+    vote_factory(user=user_factory(), submission=submission, value=3)
+
+    response = admin_client.get(
+        reverse("admin:voting-live-ranking"),
+        {"conference": conference.id, "strategy": ["mean", "borda"]},
+    )
+
+    assert response.status_code == 200
+    assert response.context["selected_strategies"] == ["mean", "borda"]
+    assert submission.title.localize("en") in response.content.decode()
+
+
+def test_live_ranking_admin_view_columns_follow_the_selected_strategies(
+    admin_client, submission_factory, user_factory, vote_factory, conference
+):
+    submission = submission_factory(conference=conference, tags=["A"])
+    vote_factory(user=user_factory(), submission=submission, value=3)
+
+    for strategies in (["mean", "borda"], ["borda", "mean", "borda"]):
+        response = admin_client.get(
+            reverse("admin:voting-live-ranking"),
+            {"conference": conference.id, "strategy": strategies},
+        )
+
+        names = list(dict.fromkeys(strategies))
+        assert response.context["selected_strategies"] == names
+        assert [name for name, _ in response.context["columns"]] == names
+        assert len(response.context["tags"][0][1][0]) == len(names)
+
+
+def test_strategies_without_ballot_scores_cannot_be_registered():
+    with pytest.raises(TypeError):
+
+        @register_strategy
+        class IncompleteStrategy(RankingStrategy):
+            name = "incomplete"
+            label = "Incomplete"
+
+    assert "incomplete" not in RANKING_STRATEGIES
@@ -1,6 +1,8 @@
+import math
+
 import pytest
 
-from voting.models import RankRequest
+from voting.models import RankRequest, RankStat
 
 pytestmark = pytest.mark.django_db
 
@@ -58,3 +60,115 @@ def test_tag_count_should_remain_the_same(
     assert ranking.rank_submissions.filter(tag=polenta).count() == 6
     assert ranking.rank_submissions.filter(tag=sushi).count() == 3
     assert ranking.rank_submissions.filter(tag=pizza).count() == 6
+
+
+def test_scores_are_weighted_by_how_many_votes_users_gave_per_tag(
+    submission_factory,
+    submission_tag_factory,
+    user_factory,
+    vote_factory,
+    conference,
+    django_assert_max_num_queries,
+):
+    tag_a = submission_tag_factory(name="A")
+    tag_b = submission_tag_factory(name="B")
+    submission_1 = submission_factory(conference=conference, tags=["A"])
+    submission_2 = submission_factory(conference=conference, tags=["A", "B"])
+    submission_3 = submission_factory(conference=conference, tags=["B"])
+    untagged_submission = submission_factory(conference=conference, tags=[])
+    user_1 = user_factory()
+    user_2 = user_factory()
+
+    vote_factory(user=user_1, submission=submission_1, value=4)
+    vote_factory(user=user_1, submission=submission_2, value=1)
+    vote_factory(user=user_2, submission=submission_2, value=3)
+    vote_factory(user=user_2, submission=submission_3, value=2)
+
+    with django_assert_max_num_queries(3):
+        rankings = RankRequest.users_most_voted_based(conference)
+
+    sqrt_2 = math.sqrt(2)
+    assert [
+        (
+            tag["tags__id"],
+            tag["total"],
+            [(rank["submission_id"], pytest.approx(rank["score"])) for rank in ranks],
+        )
+        for tag, ranks in rankings
+    ] == [
+        (
+            tag_a.id,
+            2,
+            [
+                (submission_1.id, 4),
+                (submission_2.id, (1 * sqrt_2 + 3) / (sqrt_2 + 1)),
+            ],
+        ),
+        (
+            tag_b.id,
+            2,
+            [
+                (submission_2.id, (1 + 3 * sqrt_2) / (1 + sqrt_2)),
+                (submission_3.id, 2),
+            ],
+        ),
+        (None, 0, [(untagged_submission.id, 0)]),
+    ]
+
+
+def test_build_stats(
+    submission_factory,
+    conference_factory,
+    user_factory,
+    django_assert_max_num_queries,
+):
+    conference = conference_factory(
+        submission_types=["Talk", "Workshop"],
+        audience_levels=["Beginner", "Advanced"],
+        languages=["en", "it"],
+        topics=["Web", "Data"],
+    )
+    speaker = user_factory(gender="female")
+    other_speaker = user_factory(gender="male")
+
+    submission_factory(
+        conference=conference,
+        speaker=speaker,
+        custom_submission_type="Talk",
+        custom_audience_level="Beginner",
+        languages=["en", "it"],
+        topic=conference.topics.get(name="Web"),
+        tags=["A", "B"],
+    )
+    submission_factory(
+        conference=conference,
+        speaker=other_speaker,
+        custom_submission_type="Talk",
+        custom_audience_level="Advanced",
+        languages=["en"],
+        topic=conference.topics.get(name="Web"),
+        tags=["A"],
+    )
+
+    ranking = RankRequest.objects.create(conference=conference, is_public=True)
+    ranking.stats.all().delete()
+
+    with django_assert_max_num_queries(11):
+        ranking.build_stats()
+
+    stats = {(stat.type, stat.name): stat.value for stat in ranking.stats.all()}
+
+    # Submissions are counted once per tag they are ranked in
+    assert stats[(RankStat.Type.SUBMISSIONS, "Submissions")] == 3
+    assert stats[(RankStat.Type.SPEAKERS, "Speakers")] == 2
+    assert stats[(RankStat.Type.GENDER, "Female")] == 1
+    assert stats[(RankStat.Type.GENDER, "Male")] == 1
+    assert stats[(RankStat.Type.GENDER, "Other")] == 0
+    assert stats[(RankStat.Type.SUBMISSION_TYPE, "Talk")] == 3
+    assert stats[(RankStat.Type.SUBMISSION_TYPE, "Workshop")] == 0
+    assert stats[(RankStat.Type.AUDIENCE_LEVEL, "Beginner")] == 2
+    assert stats[(RankStat.Type.AUDIENCE_LEVEL, "Advanced")] == 1
+    assert stats[(RankStat.Type.LANGUAGE, "English")] == 3
+    assert stats[(RankStat.Type.LANGUAGE, "Italian")] == 2
+    assert stats[(RankStat.Type.TOPIC, "Web")] == 3
+    assert stats[(RankStat.Type.TOPIC, "Data")] == 0
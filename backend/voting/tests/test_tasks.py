@@ -0,0 +1,85 @@
+from datetime import timedelta
+
+import pytest
+from django.utils import timezone
+
+from voting.helpers import check_if_user_can_vote
+from voting.tasks import warm_up_can_vote_cache, warm_up_can_vote_caches
+
+pytestmark = pytest.mark.django_db
+
+
+def test_warm_up_the_conferences_whose_voting_opens_soon(
+    conference_factory, deadline_factory, mocker
+):
+    mock_warm_up = mocker.patch("voting.tasks.warm_up_can_vote_cache")
+    now = timezone.now()
+    opening_soon = conference_factory()
+    deadline_factory(
+        conference=opening_soon,
+        type="voting",
+        start=now + timedelta(minutes=30),
+        end=now + timedelta(days=7),
+    )
+    already_open = conference_factory()
+    deadline_factory(
+        conference=already_open,
+        type="voting",
+        start=now - timedelta(minutes=30),
+        end=now + timedelta(days=7),
+    )
+    opening_later = conference_factory()
+    deadline_factory(
+        conference=opening_later,
+        type="voting",
+        start=now + timedelta(days=1),
+        end=now + timedelta(days=7),
+    )
+
+    warm_up_can_vote_caches()
+
+    mock_warm_up.delay.assert_called_once_with(conference_id=opening_soon.id)
+
+
+def test_warm_up_can_vote_cache(conference, user_factory, mocker, locmem_cache):
+    attendee = user_factory(email="attendee@example.org")
+    nobody = user_factory()
+    bulk_mock = mocker.patch(
+        "voting.helpers.get_users_with_admission_ticket",
+        return_value={"attendee@example.org"},
+    )
+    single_mock = mocker.patch("voting.helpers.user_has_admission_ticket")
+
+    warm_up_can_vote_cache(conference_id=conference.id)
+
+    bulk_mock.assert_called_once_with(
+        emails=None,
+        event_organizer=conference.pretix_organizer_id,
+        event_slug=conference.pretix_event_id,
+        additional_events=[],
+    )
+    assert check_if_user_can_vote(attendee, conference) is True
+    assert check_if_user_can_vote(nobody, conference) is False
+    assert not single_mock.called
+
+
+def test_warm_up_can_vote_cache_downloads_the_tickets_once(
+    conference, user_factory, mocker, locmem_cache
+):
+    mocker.patch("voting.tasks.BATCH_SIZE", 1)
+    attendees = [
+        user_factory(email="attendee@example.org"),
+        user_factory(email="other@example.org"),
+        user_factory(),
+    ]
+    bulk_mock = mocker.patch(
+        "voting.helpers.get_users_with_admission_ticket",
+        return_value={"attendee@example.org", "other@example.org"},
+    )
+
+    warm_up_can_vote_cache(conference_id=conference.id)
+
+    assert bulk_mock.call_count == 1
+    assert [
+        check_if_user_can_vote(attendee, conference) for attendee in attendees
+    ] == [True, True, False]
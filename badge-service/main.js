@@ -27,31 +27,33 @@ const getAllQuestions = async () => {
   return response.results;
 };
 
-const getConferenceRoleForTicketData = async (orderPosition) => {
-  const request = await fetch("https://beri.python.it/graphql", {
+const getConferenceRoles = async (orderPositions) => {
+  const request = await fetch("https://beri.python.it/badges/conference-roles", {
     method: "POST",
     headers: {
       "Content-Type": "application/json",
       "X-Backend-Token": process.env.BERI_API_TOKEN,
     },
     body: JSON.stringify({
-      query: `query ConferenceRole($ticketData: String!, $conferenceCode: String!) {
-          conferenceRoleForTicketData(
-            rawTicketData: $ticketData
-            conferenceCode: $conferenceCode
-          ) {
-            role
-            ticketHashid
-          }
-        }`,
-      variables: {
-        ticketData: JSON.stringify(orderPosition),
-        conferenceCode: "pycon2023",
-      },
+      conference: "pycon2023",
+      positions: orderPositions.map(({ id, attendee_email, voucher }) => ({
+        id,
+        attendee_email,
+        voucher,
+      })),
     }),
   });
-  const response = await request.json();
-  return response.data.conferenceRoleForTicketData;
+  const response = await request.text();
+  const roles = new Map();
+
+  for (const line of response.split("\n")) {
+    if (line) {
+      const { id, role, ticket_hashid } = JSON.parse(line);
+      roles.set(id, { role, ticketHashid: ticket_hashid });
+    }
+  }
+
+  return roles;
 };
 
 const getAllOrderPositions = async () => {
@@ -94,6 +96,9 @@ const createEmptyBadgeOrderPositions = () => {
   ];
 
   const questions = await getAllQuestions();
+  const conferenceRoles = await getConferenceRoles(
+    allOrderPositions.filter((orderPosition) => !orderPosition.empty),
+  );
 
   const pronounsQuestion = questions.find((q) => q.identifier === "SMZHLTGP");
   const taglineQuestion = questions.find((q) => q.identifier === "83HY8DTB");
@@ -141,8 +146,7 @@ const createEmptyBadgeOrderPositions = () => {
     const tagline =
       answers.find((a) => a.question === taglineQuestion.id)?.answer ?? "";
 
-    const { role, ticketHashid } =
-      await getConferenceRoleForTicketData(orderPosition);
+    const { role, ticketHashid } = conferenceRoles.get(orderPosition.id);
     return {
       name: orderPosition.attendee_name,
       pronouns,
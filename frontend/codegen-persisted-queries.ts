@@ -0,0 +1,56 @@
+// @ts-ignore
+const { createHash } = require("crypto");
+const { Kind, print, visit } = require("graphql");
+const { addTypenameToDocument } = require("@apollo/client/utilities");
+
+module.exports = {
+  plugin: (schema, documents) => {
+    const fragments = {};
+    const operations = [];
+
+    for (const doc of documents) {
+      for (const definition of doc.document.definitions) {
+        if (definition.kind === Kind.FRAGMENT_DEFINITION) {
+          fragments[definition.name.value] = definition;
+        } else if (definition.kind === Kind.OPERATION_DEFINITION) {
+          operations.push(definition);
+        }
+      }
+    }
+
+    const manifest = {};
+
+    for (const operation of operations) {
+      // The query the backend runs needs the __typename fields
+      // the Apollo cache adds to the documents it sends
+      const query = print(
+        addTypenameToDocument({
+          kind: Kind.DOCUMENT,
+          definitions: [operation, ...collectFragments(operation, fragments)],
+        }),
+      );
+
+      manifest[operation.name.value] = {
+        hash: createHash("sha256").update(query).digest("hex"),
+        query,
+      };
+    }
+
+    return JSON.stringify(manifest, null, 2);
+  },
+};
+
+const collectFragments = (definition, fragments, collected = new Map()) => {
+  visit(definition, {
+    FragmentSpread(node) {
+      const name = node.name.value;
+
+      if (!collected.has(name)) {
+        collected.set(name, fragments[name]);
+        collectFragments(fragments[name], fragments, collected);
+      }
+    },
+  });
+
+  return [...collected.values()];
+};
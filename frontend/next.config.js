@@ -12,6 +12,7 @@ const {
   API_URL_SERVER,
   CMS_HOSTNAME,
   CMS_ADMIN_HOST = "admin.pycon.it",
+  PERSISTED_QUERIES_ENABLED = "false",
 } = process.env;
 
 module.exports = withSentryConfig({
@@ -82,6 +83,7 @@ module.exports = withSentryConfig({
     API_URL: API_URL,
     conferenceCode: CONFERENCE_CODE || "pycon-demo",
     cmsHostname: CMS_HOSTNAME,
+    persistedQueriesEnabled: PERSISTED_QUERIES_ENABLED,
     NEXT_PUBLIC_SOCIAL_CARD_SERVICE:
       NEXT_PUBLIC_SOCIAL_CARD_SERVICE ||
       "https://socialcards.python.it/api/card",
@@ -5,10 +5,13 @@ import {
   InMemoryCache,
 } from "@apollo/client";
 import { onError } from "@apollo/client/link/error";
+import { createPersistedQueryLink } from "@apollo/client/link/persisted-queries";
+import { getOperationName } from "@apollo/client/utilities";
 import { GraphQLError } from "graphql";
 
 import { setLoginState } from "../components/profile/hooks";
 import introspectionQueryResultData from "../generated/fragment-types.json";
+import persistedQueries from "../generated/persisted-queries.json";
 
 const isUserLoggedOut = (graphErrors: readonly GraphQLError[]) =>
   !!graphErrors.find(
@@ -39,6 +42,22 @@ const errorLink = onError(({ graphQLErrors, networkError, operation }) => {
   }
 });
 
+// Operations registered in the backend are sent by hash, and queries
+// via GET, so the responses for anonymous users can be cached.
+// Only enabled once the operations of this build are registered
+// (`manage.py register_persisted_queries src/generated/persisted-queries.json`),
+// otherwise every operation is sent twice
+const persistedQueriesLink = ApolloLink.split(
+  (operation) =>
+    process.env.persistedQueriesEnabled === "true" &&
+    operation.operationName in persistedQueries,
+  createPersistedQueryLink({
+    useGETForHashedQueries: true,
+    generateHash: (document) =>
+      persistedQueries[getOperationName(document)].hash,
+  }),
+);
+
 const createHttpLink = (serverCookies: Record<string, string>) => {
   const isServer = typeof window === "undefined";
   const cookieHeader = isServer
@@ -70,7 +89,11 @@ const createHttpLink = (serverCookies: Record<string, string>) => {
 export const createClient = ({ serverCookies = null } = {}) => {
   return new ApolloClient({
     ssrMode: typeof window === "undefined",
-    link: ApolloLink.from([errorLink, createHttpLink(serverCookies)]),
+    link: ApolloLink.from([
+      errorLink,
+      persistedQueriesLink,
+      createHttpLink(serverCookies),
+    ]),
     cache: new InMemoryCache({
       possibleTypes: introspectionQueryResultData.possibleTypes,
       typePolicies: {
@@ -1,32 +1,78 @@
 import { Button } from "@python-italia/pycon-styleguide";
+import { useState } from "react";
 import { FormattedMessage } from "react-intl";
 
-import { useExportBadgeScansMutation } from "~/types";
+import {
+  BadgeScanExportStatus,
+  useBadgeScanExportLazyQuery,
+  useExportBadgeScansMutation,
+} from "~/types";
 
 import { Alert } from "../alert";
 
+// Exports run in the background, this is how often we check if it's ready
+const POLL_INTERVAL = 2000;
+
+const wait = (ms: number) => new Promise((resolve) => setTimeout(resolve, ms));
+
 export const ExportBadgeScansButton = () => {
-  const [exportBadges, { loading, error }] = useExportBadgeScansMutation({
+  const [exporting, setExporting] = useState(false);
+  const [error, setError] = useState<string | null>(null);
+  const [exportBadges] = useExportBadgeScansMutation({
     variables: {
       conferenceCode: process.env.conferenceCode,
     },
   });
+  const [fetchExport] = useBadgeScanExportLazyQuery({
+    fetchPolicy: "network-only",
+  });
 
   const handleExport = async () => {
-    const { data } = await exportBadges();
-
-    const link = document.createElement("a");
-    link.download = "badge_scans.csv";
-    link.href = data.exportBadgeScans.url;
-    document.body.appendChild(link);
-    link.click();
-    document.body.removeChild(link);
+    setExporting(true);
+    setError(null);
+
+    try {
+      const { data } = await exportBadges();
+      let badgeScanExport = data.exportBadgeScans;
+
+      while (badgeScanExport?.status !== BadgeScanExportStatus.Completed) {
+        if (
+          !badgeScanExport ||
+          badgeScanExport.status === BadgeScanExportStatus.Failed
+        ) {
+          throw new Error("The export failed");
+        }
+
+        await wait(POLL_INTERVAL);
+
+        const { data: exportData, error: exportError } = await fetchExport({
+          variables: { id: badgeScanExport.id },
+        });
+
+        if (exportError) {
+          throw exportError;
+        }
+
+        badgeScanExport = exportData.badgeScanExport;
+      }
+
+      const link = document.createElement("a");
+      link.download = "badge_scans.csv";
+      link.href = badgeScanExport.url;
+      document.body.appendChild(link);
+      link.click();
+      document.body.removeChild(link);
+    } catch (e) {
+      setError(e.message);
+    } finally {
+      setExporting(false);
+    }
   };
 
   return (
     <div>
-      <Button onClick={handleExport} disabled={loading}>
-        {loading ? (
+      <Button onClick={handleExport} disabled={exporting}>
+        {exporting ? (
           <FormattedMessage id="profile.sponsorSection.loading" />
         ) : (
           <FormattedMessage id="profile.sponsorSection.badgeScansExport" />
@@ -35,10 +81,7 @@ export const ExportBadgeScansButton = () => {
 
       {error && (
         <Alert sx={{ mb: 4 }} variant="alert">
-          <FormattedMessage
-            id="global.tryAgain"
-            values={{ error: error.message }}
-          />
+          <FormattedMessage id="global.tryAgain" values={{ error }} />
         </Alert>
       )}
     </div>